@@ -40,81 +40,346 @@ const scatterColors = {
     4: 'rgba(16,185,129,0.7)',
 };
 // ═══════════════════════════════════════════════════════════════════════════════
-// PERSONA CLASSIFICATION — Strict score-first rules aligned to cluster averages:
-//   Cluster  │ Avg Score │ Avg Attendance │ Definition
-//   ─────────┼───────────┼────────────────┼───────────────────────────────────
-//   0 DA     │  70.03    │   89.83 %      │ Current top performer
-//   1 CW     │  68.37    │   89.03 %      │ Reliable, consistent, solid attend.
-//   2 PC     │  68.23    │   88.14 %      │ Capable but coasting
-//   3 SL     │  64.55    │   69.03 %      │ Struggling — low score & attend.
-//   4 PB     │  65.84    │   69.76 %      │ High prev score, low current output
+// RULES — risk and persona evaluators generated from ANALYTICS.rules, the
+// RISK_RULES / PERSONA_RULES tables in preprocess.py (edit the rules there).
+// Evaluators take a student keyed by CSV column (Exam_Score, …) or by roster
+// field (score, …).
 // ═══════════════════════════════════════════════════════════════════════════════
 
-function resolvePersona(s, kmeansId) {
-    const score = s.score ?? s.Exam_Score ?? 0;
-    const attend = s.attend ?? s.Attendance ?? 0;
-    const motiv = s.motiv ?? s.Motivation_Level ?? 'Medium';
-    const hours = s.hours ?? s.Hours_Studied ?? 20;
-    const prev = s.prev ?? s.Previous_Scores ?? 70;
-
-    // ══════════════════════════════════════════════════════════
-    // HARD SCORE GATES — applied BEFORE per-cluster logic
-    // A student's current exam score is the primary truth signal.
-    // ══════════════════════════════════════════════════════════
-
-    // Score < 63 → never a Driven Achiever or Consistent Worker
-    if (score < 63) {
-        if (prev >= 78) return 4; // Potential Bloomer (had strong past, slipped)
-        return 3;                 // Struggling Learner
-    }
-
-    // Score 63–69 → cannot be Driven Achiever (cluster avg is 70.03)
-    if (score < 70) {
-        // High attendance saves them to Consistent Worker
-        if (attend >= 85) return 1; // Consistent Worker
-        // Was once good (high prev) but now underperforming
-        if (prev >= 80 && score < prev - 8) return 4; // Potential Bloomer
-        // Typical mid-range
-        if (attend >= 75) return 2; // Passive Coaster
-        // Low attendance → struggling
-        if (attend < 72) return 3; // Struggling Learner
-        return 2; // Passive Coaster (default mid-range)
-    }
+// rules_spec() of preprocess.py, for data.js files built before it was shipped
+// (kept in sync by tests/test_rules.py)
+const DEFAULT_RULES = {
+    "risk": {
+        "points": [
+            {"column": "Attendance", "below": [[70.0, 2], [80.0, 1]]},
+            {"column": "Motivation_Level", "levels": {"Low": 2, "Medium": 1}},
+            {"column": "Exam_Score", "below": [[62.0, 2], [67.0, 1]]},
+            {"column": "Internet_Access", "levels": {"No": 1}},
+            {"column": "Learning_Disabilities", "levels": {"Yes": 1}},
+            {"column": "Hours_Studied", "below": [[10.0, 1]]},
+            {"column": "Peer_Influence", "levels": {"Negative": 1}}
+        ],
+        "labels": [5, 3, 0]
+    },
+    "risk_levels": ["High", "Medium", "Low"],
+    "persona": [
+        {"when": [["Exam_Score", "<", 63], ["Previous_Scores", ">=", 78]], "persona": 4},
+        {"when": [["Exam_Score", "<", 63]], "persona": 3},
+        {"when": [["Exam_Score", "<", 70], ["Attendance", ">=", 85]], "persona": 1},
+        {"when": [["Exam_Score", "<", 70], ["Previous_Scores", ">=", 80], ["Exam_Score", "<", ["Previous_Scores", -8]]], "persona": 4},
+        {"when": [["Exam_Score", "<", 70], ["Attendance", ">=", 75]], "persona": 2},
+        {"when": [["Exam_Score", "<", 70], ["Attendance", "<", 72]], "persona": 3},
+        {"when": [["Exam_Score", "<", 70]], "persona": 2},
+        {"when": [["Exam_Score", "<", 75], ["Attendance", ">=", 82]], "persona": 0},
+        {"when": [["Exam_Score", "<", 75], ["Attendance", ">=", 72]], "persona": 1},
+        {"when": [["Exam_Score", "<", 75], ["Previous_Scores", ">=", 78]], "persona": 4},
+        {"when": [["Exam_Score", "<", 75]], "persona": 3},
+        {"when": [], "persona": 0}
+    ],
+    "fields": {"Gender": "gender", "School_Type": "school", "Exam_Score": "score", "Attendance": "attend", "Hours_Studied": "hours", "Motivation_Level": "motiv", "risk_label": "risk", "risk_score": "risk_score", "persona": "persona", "Internet_Access": "internet", "Tutoring_Sessions": "tutor", "Previous_Scores": "prev", "Learning_Disabilities": "disability", "Peer_Influence": "peer"}
+};
 
-    // Score 70–74 → can be Driven Achiever only with solid attendance
-    if (score < 75) {
-        if (attend >= 82) return 0; // Driven Achiever
-        if (attend >= 72) return 1; // Consistent Worker
-        if (prev >= 78) return 4; // Potential Bloomer (dropping in)
-        return 3;                   // Struggling Learner
+function compileRules(rules) {
+    const get = col => `(s[${JSON.stringify(col)}] ?? s[${JSON.stringify(rules.fields[col] ?? col)}])`;
+    const test = ([col, op, bound]) =>
+        `${get(col)} ${op} ${Array.isArray(bound) ? `(${get(bound[0])} + ${bound[1]})` : bound}`;
+
+    const risk = ['let r = 0, v;'];
+    for (const rule of rules.risk.points) {
+        risk.push(`v = ${get(rule.column)};`);
+        const cases = rule.below
+            ? rule.below.map(([bound, pts]) => `if (v < ${bound}) r += ${pts};`)
+            : Object.entries(rule.levels).map(([level, pts]) => `if (v === ${JSON.stringify(level)}) r += ${pts};`);
+        risk.push(cases.join(' else '));
     }
+    risk.push('return r;');
+    const level = rules.risk.labels.map((min, i) => `if (r >= ${min}) return ${i};`);
+    const persona = rules.persona.map(r =>
+        r.when.length ? `if (${r.when.map(test).join(' && ')}) return ${r.persona};` : `return ${r.persona};`);
 
-    // Score ≥ 75 → Driven Achiever (regardless of other factors)
-    return 0;
+    return {
+        levels: rules.risk_levels,
+        riskScore: new Function('s', risk.join('\n')),
+        riskLevel: new Function('r', level.join('\n')), // index into levels
+        persona: new Function('s', persona.join('\n'))
+    };
 }
 
+const RULES = compileRules(ANALYTICS.rules || DEFAULT_RULES);
+const RISK_TEXT = { High: 'High Risk', Medium: 'Medium Risk', Low: 'Low' }; // as shown and exported
+
 // ═══════════════════════════════════════════════════════════════════════════════
 // FILTERING LOGIC — in a real implementation we'd re-run analytics on filtered
 // data. Here we use pre-computed global stats and filter the scatter/risk table.
 // ═══════════════════════════════════════════════════════════════════════════════
 
-/** Filter scatter data by current state */
+/** Filter scatter data by current state (older builds have no school/gender/motiv on points) */
 function filteredScatter() {
     return ANALYTICS.scatter.filter(r => {
-        const ok_school = state.school === 'All'; // scatter has no school field — skip
-        return true; // scatter is a sample; we render it as-is for performance
+        if (state.school !== 'All' && r.school && r.school !== state.school) return false;
+        if (state.gender !== 'All' && r.gender && r.gender !== state.gender) return false;
+        if (state.motiv !== 'All' && r.motiv && r.motiv !== state.motiv) return false;
+        return true;
     });
 }
 
+// ── Filtered view ────────────────────────────────────────────────────────────
+// KPI and chart panels read from VIEW: ANALYTICS itself when no filter is set,
+// otherwise the same fields recomputed exactly from the data cube.
+let VIEW = ANALYTICS;
+
+const cubeMean = (total, count) => count ? Math.round(total / count * 100) / 100 : 0;
+
+function cubeView() {
+    const filters = { school: state.school, gender: state.gender, motiv: state.motiv };
+    if (Object.values(filters).every(v => v === 'All')) return ANALYTICS;
+    const cube = ANALYTICS.cube;
+    if (!cube) return { ...ANALYTICS, kpis: { ...ANALYTICS.kpis, total: estimateCount() } };
+
+    const dims = Object.keys(cube.dims);
+    const nd = dims.length;
+    const ns = cube.sums.length;
+    const want = dims.map(d => (filters[d] && filters[d] !== 'All') ? cube.dims[d].indexOf(filters[d]) : null);
+    const group = () => ({ count: 0, sums: new Array(ns).fill(0) });
+    const total = group();
+    const by = {};
+    dims.forEach(d => { by[d] = cube.dims[d].map(group); });
+    const hists = Object.entries(cube.histograms).map(([name, h]) => ({
+        name, ...h, counts: new Array(h.labels.length).fill(0), scores: new Array(h.labels.length).fill(0)
+    }));
+    const pDim = dims.indexOf('persona');
+    const rDim = dims.indexOf('risk');
+    const high = cube.dims.risk.indexOf('High');
+    const personaHigh = new Array(cube.dims.persona.length).fill(0);
+
+    for (const cell of cube.cells) {
+        if (want.some((w, i) => w !== null && cell[i] !== w)) continue;
+        const count = cell[nd];
+        const add = g => {
+            g.count += count;
+            for (let j = 0; j < ns; j++) g.sums[j] += cell[nd + 1 + j];
+        };
+        add(total);
+        dims.forEach((d, i) => add(by[d][cell[i]]));
+        if (cell[rDim] === high) personaHigh[cell[pDim]] += count;
+        let off = nd + 1 + ns;
+        hists.forEach(h => {
+            const n = h.labels.length;
+            for (let b = 0; b < n; b++) h.counts[b] += cell[off + b];
+            off += n;
+            if (h.score) {
+                for (let b = 0; b < n; b++) h.scores[b] += cell[off + b];
+                off += n;
+            }
+        });
+    }
+
+    const S = name => cube.sums.indexOf(name);
+    const avgs = (g, fields) => {
+        const out = { count: g.count };
+        fields.forEach(f => { out[`avg_${f}`] = cubeMean(g.sums[S(f)], g.count); });
+        return out;
+    };
+    const byLevel = (d, fields, allowed) => {
+        const out = {};
+        cube.dims[d].forEach((lvl, i) => {
+            const g = by[d][i];
+            if (!g.count) return;
+            const key = !allowed || allowed.includes(lvl) ? lvl : 'Other';
+            const acc = out[key] || (out[key] = group());
+            acc.count += g.count;
+            g.sums.forEach((v, j) => { acc.sums[j] += v; });
+        });
+        Object.keys(out).forEach(k => { out[k] = avgs(out[k], fields); });
+        return out;
+    };
+    const riskCount = lvl => by.risk[cube.dims.risk.indexOf(lvl)]?.count || 0;
+    const hist = name => hists.find(h => h.name === name);
+    const binAvgs = h => h.labels.map((label, b) => ({
+        label, avg_score: cubeMean(h.scores[b], h.counts[b]), count: h.counts[b]
+    }));
+
+    const clusters = ANALYTICS.clusters.map((c, i) => ({
+        ...c,
+        ...avgs(by.persona[i], ['score', 'hours', 'attend', 'tutor', 'sleep', 'prev']),
+        risk_high: personaHigh[i],
+    }));
+    const kpis = {
+        ...ANALYTICS.kpis,
+        total: total.count,
+        avg_score: cubeMean(total.sums[S('score')], total.count),
+        avg_attend: cubeMean(total.sums[S('attend')], total.count),
+        avg_hours: cubeMean(total.sums[S('hours')], total.count),
+        high_risk: riskCount('High'),
+        medium_risk: riskCount('Medium'),
+        low_risk: riskCount('Low'),
+        top_cluster_pct: total.count ? Math.round(clusters[0].count / total.count * 1000) / 10 : 0,
+    };
+    return {
+        ...ANALYTICS,
+        kpis,
+        clusters,
+        score_dist: { labels: hist('score_dist').labels, counts: hist('score_dist').counts },
+        attend_score: binAvgs(hist('attend_score')),
+        hour_score: binAvgs(hist('hour_score')),
+        by_school: byLevel('school', ['score', 'hours', 'attend']),
+        by_gender: byLevel('gender', ['score', 'hours']),
+        by_motiv: byLevel('motiv', ['score', 'attend'], ['Low', 'Medium', 'High']),
+    };
+}
+
+// ── Roster ───────────────────────────────────────────────────────────────────
+// Compact builds ship the roster as typed-array columns in roster.js, with
+// per-level bitmaps and sort permutations built by preprocess.py, loaded
+// after first paint. Under `preprocess.py serve` pages come from /api/roster
+// instead; legacy builds inline all_students/risk_table in data.js.
+const TYPED_ARRAYS = {
+    u8: Uint8Array, i8: Int8Array, u16: Uint16Array, i16: Int16Array,
+    u32: Uint32Array, i32: Int32Array, f64: Float64Array
+};
+const POPCOUNT = Uint8Array.from({ length: 256 }, (_, b) => b.toString(2).split('1').length - 1);
+
+let roster = null;
+// The API serves the district roster; shard pages query their own roster.js
+let rosterApi = location.protocol.startsWith('http') && ANALYTICS.roster && !ANALYTICS.shard ? 'api/roster' : null;
+
+function decodeBytes(b64) {
+    const bin = atob(b64);
+    const bytes = new Uint8Array(bin.length);
+    for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+    return bytes;
+}
+
+function decodeColumn(c) {
+    return new TYPED_ARRAYS[c.type](decodeBytes(c.data).buffer);
+}
+
+function unpackRoster(R) {
+    const fields = {};
+    Object.entries(R.fields).forEach(([name, c]) => { fields[name] = { col: decodeColumn(c), levels: c.levels }; });
+    const bitmaps = {};
+    Object.entries(R.index.bitmaps).forEach(([name, maps]) => { bitmaps[name] = maps.map(decodeBytes); });
+    const sorts = {};
+    Object.entries(R.index.sorts).forEach(([name, s]) => {
+        sorts[name] = s.levels ? s : { perm: decodeColumn(s.perm), runs: decodeColumn(s.runs) };
+    });
+    roster = { count: R.count, fields, bitmaps, sorts, masks: new Map() };
+}
+
+function loadRoster(onReady) {
+    if (roster || ANALYTICS.risk_table || !ANALYTICS.roster || loadRoster.pending) return;
+    loadRoster.pending = true;
+    const script = document.createElement('script');
+    script.src = ANALYTICS.roster.src;
+    script.onload = () => { unpackRoster(ANALYTICS_ROSTER); onReady(); };
+    document.body.appendChild(script);
+}
+
+function rosterRow(R, pos) {
+    const r = { id: pos + 1 };
+    Object.entries(R.fields).forEach(([name, f]) => { r[name] = f.levels ? f.levels[f.col[pos]] : f.col[pos]; });
+    return r;
+}
+
+/** AND of the level bitmaps for the active filters (null = everyone), cached per combination */
+function rosterMask(R, filters) {
+    const key = JSON.stringify(Object.entries(filters).filter(([, v]) => v !== 'All').sort());
+    if (!R.masks.has(key)) {
+        let mask = null;
+        JSON.parse(key).forEach(([f, v]) => {
+            const names = (R.fields[f].levels || R.bitmaps[f].map((_, i) => i)).map(String);
+            const code = names.indexOf(String(v));
+            const bm = code >= 0 ? R.bitmaps[f][code] : new Uint8Array(Math.ceil(R.count / 8));
+            mask = mask ? mask.map((b, j) => b & bm[j]) : bm;
+        });
+        let total = R.count;
+        if (mask) { total = 0; for (const b of mask) total += POPCOUNT[b]; }
+        R.masks.set(key, { mask, total });
+    }
+    return R.masks.get(key);
+}
+
+/** Roster positions in sort order; ties stay in position (exam-rank) order either way */
+function* rosterOrder(R, sort, desc) {
+    const s = R.sorts[sort];
+    if (s.levels) {
+        const groups = desc ? [...s.levels].reverse() : s.levels;
+        for (const group of groups) {
+            const maps = group.map(c => R.bitmaps[sort][c]);
+            for (let j = 0; j < maps[0].length; j++) {
+                let byte = 0;
+                for (const m of maps) byte |= m[j];
+                for (let bit = 0; byte; bit++, byte >>= 1) if (byte & 1) yield (j << 3) + bit;
+            }
+        }
+        return;
+    }
+    const { perm, runs } = s;
+    for (let k = 0; k < runs.length; k++) {
+        const r = desc ? runs.length - 1 - k : k;
+        const end = r + 1 < runs.length ? runs[r + 1] : R.count;
+        for (let i = runs[r]; i < end; i++) yield perm[i];
+    }
+}
+
+/** One filtered, sorted page — same contract as GET /api/roster */
+function queryRoster(R, q) {
+    const { mask, total } = rosterMask(R, q.filters);
+    let skip = (q.page - 1) * q.size;
+    const rows = [];
+    if (skip < total) {
+        for (const pos of rosterOrder(R, q.sort, q.desc)) {
+            if (mask && !((mask[pos >> 3] >> (pos & 7)) & 1)) continue;
+            if (skip) { skip--; continue; }
+            rows.push(rosterRow(R, pos));
+            if (rows.length === q.size) break;
+        }
+    }
+    return { total, page: q.page, size: q.size, rows };
+}
+
+/** A page of the default view from the top rows in data.js, if they cover it (null otherwise) */
+function topPage(q) {
+    const top = ANALYTICS.roster && ANALYTICS.roster.top;
+    if (!top || q.sort !== top.sort || q.desc !== top.desc) return null;
+    const active = Object.entries(q.filters).filter(([, v]) => v !== 'All').sort();
+    if (JSON.stringify(active) !== JSON.stringify(Object.entries(top.filters).sort())) return null;
+    const start = (q.page - 1) * q.size;
+    if (start + q.size > top.rows.length && top.rows.length < top.total) return null;
+    return { total: top.total, page: q.page, size: q.size, rows: top.rows.slice(start, start + q.size) };
+}
+
+/** Resolve a page from the API, the local index, the data.js top rows, or (legacy data.js) the inlined rows */
+function rosterPage(q) {
+    if (rosterApi) {
+        const params = new URLSearchParams({
+            ...q.filters, sort: q.sort, order: q.desc ? 'desc' : 'asc', page: q.page, size: q.size
+        });
+        return fetch(`${rosterApi}?${params}`)
+            .then(res => { if (!res.ok) throw new Error(res.status); return res.json(); })
+            .catch(() => {
+                // Plain static server: fall back to the local index
+                rosterApi = null;
+                loadRoster(renderRiskTable);
+                return null;
+            });
+    }
+    if (roster) return Promise.resolve(queryRoster(roster, q));
+    if (ANALYTICS.risk_table) return Promise.resolve(legacyRosterPage(q));
+    const top = topPage(q);
+    if (top) return Promise.resolve(top);
+    return Promise.resolve(null);
+}
+
 // Toggle: show all students or only high-risk
 let showAllStudents = false;
 
-/** Filter risk table — uses all_students when toggle is on */
+/** Filter risk table — uses all_students when toggle is on (legacy data.js only) */
 function filteredRisk() {
     const source = showAllStudents
         ? (ANALYTICS.all_students || ANALYTICS.risk_table)
         : ANALYTICS.risk_table;
-    return source.filter(r => {
+    return (source || []).filter(r => {
         if (state.school !== 'All' && r.school !== state.school) return false;
         if (state.gender !== 'All' && r.gender !== state.gender) return false;
         if (state.motiv !== 'All' && r.motiv !== state.motiv) return false;
@@ -122,7 +387,7 @@ function filteredRisk() {
     });
 }
 
-/** Approximate student count from filter (proportional) */
+/** Approximate student count from filter (proportional) — legacy data.js without a cube */
 function estimateCount() {
     const tot = ANALYTICS.kpis.total;
     let frac = 1;
@@ -145,14 +410,14 @@ function estimateCount() {
 // RENDER: KPI Cards
 // ═══════════════════════════════════════════════════════════════════════════════
 function renderKPIs() {
-    const kpi = ANALYTICS.kpis;
-    document.getElementById('kv-total').textContent = Number(estimateCount()).toLocaleString();
+    const kpi = VIEW.kpis;
+    document.getElementById('kv-total').textContent = Number(VIEW.kpis.total).toLocaleString();
     document.getElementById('kv-score').textContent = kpi.avg_score;
     document.getElementById('kv-attend').textContent = kpi.avg_attend + '%';
     document.getElementById('kv-risk').textContent = kpi.high_risk.toLocaleString();
     document.getElementById('kv-hours').textContent = kpi.avg_hours + 'h';
     document.getElementById('kv-cluster').textContent = kpi.top_cluster;
-    document.getElementById('student-count').textContent = Number(estimateCount()).toLocaleString() + ' students';
+    document.getElementById('student-count').textContent = Number(VIEW.kpis.total).toLocaleString() + ' students';
 }
 
 // ═══════════════════════════════════════════════════════════════════════════════
@@ -235,18 +500,18 @@ document.getElementById('close-strategy').addEventListener('click', () => {
 // RENDER: Risk Table
 // ═══════════════════════════════════════════════════════════════════════════════
 function renderRiskSummary() {
-    document.getElementById('risk-high-count').textContent = ANALYTICS.kpis.high_risk.toLocaleString();
-    document.getElementById('risk-med-count').textContent = ANALYTICS.kpis.medium_risk.toLocaleString();
-    document.getElementById('risk-low-count').textContent = ANALYTICS.kpis.low_risk.toLocaleString();
+    document.getElementById('risk-high-count').textContent = VIEW.kpis.high_risk.toLocaleString();
+    document.getElementById('risk-med-count').textContent = VIEW.kpis.medium_risk.toLocaleString();
+    document.getElementById('risk-low-count').textContent = VIEW.kpis.low_risk.toLocaleString();
 
     // Render / update the toggle button group
     const container = document.getElementById('risk-view-toggle');
     if (!container) return;
-    const total = (ANALYTICS.all_students || ANALYTICS.risk_table).length;
+    const total = VIEW.kpis.total;
     container.innerHTML = `
       <button id="btn-view-highrisk" class="view-toggle-btn ${!showAllStudents ? 'active' : ''}"
               title="Show only high-risk students">
-        ⚠️ High-Risk Only &nbsp;<span class="toggle-count">${ANALYTICS.kpis.high_risk.toLocaleString()}</span>
+        ⚠️ High-Risk Only &nbsp;<span class="toggle-count">${VIEW.kpis.high_risk.toLocaleString()}</span>
       </button>
       <button id="btn-view-all" class="view-toggle-btn ${showAllStudents ? 'active' : ''}"
               title="Show all students">
@@ -266,15 +531,18 @@ let riskSortAsc = false;
 let currentRiskPage = 1;
 const rowsPerRiskPage = 50;
 
-function renderRiskTable() {
-    let rows = filteredRisk();
+let riskRequest = 0;
+
+/** Legacy data.js: filter and sort the inlined rows in the browser */
+function legacyRosterPage(q) {
+    const rows = filteredRisk();
+    const asc = !q.desc;
 
-    // Perform sorting
     rows.sort((a, b) => {
-        let valA = a[riskSortCol];
-        let valB = b[riskSortCol];
+        let valA = a[q.sort];
+        let valB = b[q.sort];
 
-        if (riskSortCol === 'persona') {
+        if (q.sort === 'persona') {
             // Sort by resolved persona — rank from best to worst
             const rank = {
                 'Driven Achiever': 0,
@@ -283,51 +551,77 @@ function renderRiskTable() {
                 'Passive Coaster': 3,
                 'Struggling Learner': 4
             };
-            valA = rank[ANALYTICS.clusters[resolvePersona(a, a.persona)]?.name] ?? 5;
-            valB = rank[ANALYTICS.clusters[resolvePersona(b, b.persona)]?.name] ?? 5;
-        } else if (riskSortCol === 'risk') {
-            const m = { 'Low Risk': 0, 'Medium Risk': 1, 'High Risk': 2 };
+            valA = rank[ANALYTICS.clusters[a.persona]?.name] ?? 5;
+            valB = rank[ANALYTICS.clusters[b.persona]?.name] ?? 5;
+        } else if (q.sort === 'risk') {
+            const m = { 'Low': 0, 'Medium': 1, 'High': 2 };
             valA = m[a.risk] || 0;
             valB = m[b.risk] || 0;
-        } else if (riskSortCol === 'internet') {
+        } else if (q.sort === 'internet') {
             valA = a.internet === 'Yes' ? 1 : 0;
             valB = b.internet === 'Yes' ? 1 : 0;
-        } else if (riskSortCol === 'motiv') {
+        } else if (q.sort === 'motiv') {
             const m = { 'Low': 0, 'Medium': 1, 'High': 2 };
             valA = m[a.motiv] || 0;
             valB = m[b.motiv] || 0;
         }
 
         if (typeof valA === 'string' && typeof valB === 'string') {
-            return riskSortAsc ? valA.localeCompare(valB) : valB.localeCompare(valA);
+            return asc ? valA.localeCompare(valB) : valB.localeCompare(valA);
         }
 
-        if (valA < valB) return riskSortAsc ? -1 : 1;
-        if (valA > valB) return riskSortAsc ? 1 : -1;
+        if (valA < valB) return asc ? -1 : 1;
+        if (valA > valB) return asc ? 1 : -1;
         return 0;
     });
 
-    const totalRows = rows.length;
-    const totalPages = Math.ceil(totalRows / rowsPerRiskPage);
-    if (currentRiskPage > totalPages) currentRiskPage = totalPages;
-    if (currentRiskPage < 1) currentRiskPage = 1;
+    const start = (q.page - 1) * q.size;
+    return { total: rows.length, page: q.page, size: q.size, rows: rows.slice(start, start + q.size) };
+}
+
+function renderRiskTable() {
+    const q = {
+        filters: {
+            school: state.school, gender: state.gender, motiv: state.motiv,
+            risk: showAllStudents ? 'All' : 'High'
+        },
+        sort: riskSortCol,
+        desc: !riskSortAsc,
+        page: Math.max(currentRiskPage, 1),
+        size: rowsPerRiskPage
+    };
+    // Only the latest request gets drawn
+    const ticket = ++riskRequest;
+    rosterPage(q).then(res => { if (ticket === riskRequest) drawRiskPage(res, q); });
+}
+
+function drawRiskPage(res, q) {
+    const totalRows = res ? res.total : 0;
+    const totalPages = Math.ceil(totalRows / q.size);
+    if (res && q.page > totalPages && totalPages > 0) {
+        currentRiskPage = totalPages;
+        renderRiskTable();
+        return;
+    }
+    currentRiskPage = q.page;
 
-    const startIdx = (currentRiskPage - 1) * rowsPerRiskPage;
-    const endIdx = startIdx + rowsPerRiskPage;
-    const pageRows = rows.slice(startIdx, endIdx);
+    const startIdx = (q.page - 1) * q.size;
+    const endIdx = startIdx + q.size;
+    const pageRows = res ? res.rows : [];
 
     // Update Pagination UI
-    document.getElementById('pagination-info').textContent = totalRows > 0
-        ? `Showing ${startIdx + 1}-${Math.min(endIdx, totalRows)} of ${totalRows}`
-        : 'Showing 0-0 of 0';
+    document.getElementById('pagination-info').textContent = !res
+        ? 'Loading roster…'
+        : totalRows > 0
+            ? `Showing ${startIdx + 1}-${Math.min(endIdx, totalRows)} of ${totalRows}`
+            : 'Showing 0-0 of 0';
 
     document.getElementById('btn-prev-page').disabled = currentRiskPage === 1;
     document.getElementById('btn-next-page').disabled = currentRiskPage === totalPages || totalPages === 0;
 
     const tbody = document.getElementById('risk-tbody');
     tbody.innerHTML = pageRows.map((r, i) => {
-        const resolvedId = resolvePersona(r, r.persona);
-        const p = ANALYTICS.clusters[resolvedId];
+        const p = ANALYTICS.clusters[r.persona];
         const displayIndex = startIdx + i + 1;
         return `<tr>
       <td style="color:var(--text-muted)">${displayIndex}</td>
@@ -374,7 +668,7 @@ function makeBar(id, labels, datasets, opts = {}) {
             maintainAspectRatio: false,
             plugins: {
                 legend: { display: opts.legend ?? false },
-                tooltip: { mode: 'index', intersect: false },
+                tooltip: { mode: 'index', intersect: false, ...(opts.tooltip || {}) },
             },
             scales: {
                 x: { grid: gridOpts, ticks: { color: '#94A3B8' }, ...(opts.xScale || {}) },
@@ -395,6 +689,8 @@ function chartCorrelation() {
                 v < -0.1 ? 'rgba(239,68,68,0.75)' :
                     'rgba(148,163,184,0.5)'
     );
+    // Bootstrap 95% CI, present when preprocess.py ran with --bootstrap
+    const ci = ANALYTICS.correlation_ci || {};
     makeBar('chart-correlation', labels,
         [{
             label: 'Correlation', data: values, backgroundColor: colors,
@@ -402,6 +698,11 @@ function chartCorrelation() {
         }],
         {
             horizontal: true,
+            tooltip: {
+                callbacks: {
+                    afterLabel: ctx => ci[ctx.label] ? `95% CI: ${ci[ctx.label][0]} to ${ci[ctx.label][1]}` : ''
+                }
+            },
             yScale: { ticks: { font: { size: 11 } } },
             xScale: {
                 min: -0.4, max: 0.5,
@@ -411,8 +712,38 @@ function chartCorrelation() {
     );
 }
 
+/** Feature × feature heatmap from ANALYTICS.correlation_matrix */
+let corrMethod = 'pearson';
+
+function renderCorrHeatmap() {
+    const m = ANALYTICS.correlation_matrix;
+    const table = document.getElementById('corr-heatmap');
+    const toggle = document.getElementById('corr-method-toggle');
+    if (!m || !table) return;
+
+    toggle.innerHTML = ['pearson', 'spearman'].map(k => `
+      <button class="view-toggle-btn ${corrMethod === k ? 'active' : ''}" data-method="${k}">
+        ${k === 'pearson' ? 'Pearson' : 'Spearman (rank)'}
+      </button>`).join('');
+    toggle.querySelectorAll('button').forEach(btn => btn.addEventListener('click', () => {
+        corrMethod = btn.dataset.method;
+        renderCorrHeatmap();
+    }));
+
+    const cell = v => {
+        const a = Math.min(Math.abs(v), 1) * 0.85;
+        const bg = v >= 0 ? `rgba(16,185,129,${a})` : `rgba(239,68,68,${a})`;
+        return `<td style="background:${bg}" title="${v}">${v.toFixed(2)}</td>`;
+    };
+    table.innerHTML = `
+      <thead><tr><th></th>${m.features.map(f => `<th>${f}</th>`).join('')}</tr></thead>
+      <tbody>${m[corrMethod].map((row, i) =>
+        `<tr><th>${m.features[i]}</th>${row.map(cell).join('')}</tr>`).join('')}
+      </tbody>`;
+}
+
 function chartScoreDist() {
-    const d = ANALYTICS.score_dist;
+    const d = VIEW.score_dist;
     makeBar('chart-score-dist', d.labels, [{
         label: 'Students',
         data: d.counts,
@@ -425,7 +756,7 @@ function chartScoreDist() {
 }
 
 function chartAttendScore() {
-    const d = ANALYTICS.attend_score;
+    const d = VIEW.attend_score;
     makeBar('chart-attend-score',
         d.map(x => x.label),
         [{
@@ -445,7 +776,7 @@ function chartAttendScore() {
 }
 
 function chartHourScore() {
-    const d = ANALYTICS.hour_score;
+    const d = VIEW.hour_score;
     makeBar('chart-hour-score',
         d.map(x => x.label),
         [{
@@ -460,11 +791,123 @@ function chartHourScore() {
     );
 }
 
+// Builds with ANALYTICS.scatter_grid draw binned counts per persona from its
+// level-of-detail tiers (coarsest first), overlaid with the sampled High-risk
+// students; clicking zooms in and picks the finest tier that fits the budget.
+const SCATTER_MARKS = 1500;
+const SCATTER_GRID = ANALYTICS.scatter_grid ? {
+    ...ANALYTICS.scatter_grid,
+    tiers: ANALYTICS.scatter_grid.tiers.map(t => ({
+        size: t.size,
+        cells: Object.fromEntries(Object.entries(t.cells).map(([f, c]) => [f, decodeColumn(c)])),
+    })),
+} : null;
+let scatterView = null; // { x: [min, max], y: [min, max] } while zoomed
+
+function scatterFullView() {
+    const { x, y } = SCATTER_GRID.axes;
+    return { x: [x.lo, x.hi], y: [y.lo, y.hi] };
+}
+
+/** Persona bubbles for one tier: [{ persona, x, y, count }] inside the view */
+function scatterCells(tier, view) {
+    const { cells, size } = tier;
+    const { x: ax, y: ay } = SCATTER_GRID.axes;
+    const codes = ['school', 'gender', 'motiv']
+        .filter(f => state[f] !== 'All')
+        .map(f => [cells[f], SCATTER_GRID.dims[f].indexOf(state[f])]);
+    const marks = new Map();
+    for (let i = 0; i < cells.count.length; i++) {
+        if (codes.some(([col, code]) => col[i] !== code)) continue;
+        const x = ax.lo + cells.x[i] * size, y = ay.lo + cells.y[i] * size;
+        if (x + size <= view.x[0] || x > view.x[1] || y + size <= view.y[0] || y > view.y[1]) continue;
+        const key = `${cells.persona[i]}:${cells.x[i]}:${cells.y[i]}`;
+        const m = marks.get(key);
+        if (m) m.count += cells.count[i];
+        else marks.set(key, { persona: cells.persona[i], x: x + (size - 1) / 2, y: y + (size - 1) / 2, count: cells.count[i] });
+    }
+    return [...marks.values()];
+}
+
 function chartScatter() {
+    if (!SCATTER_GRID) return chartScatterPoints();
     destroyChart('chart-scatter');
     const ctx = document.getElementById('chart-scatter').getContext('2d');
+    const view = scatterView || scatterFullView();
+    const tiers = SCATTER_GRID.tiers;
+    let t = tiers.length - 1, marks = scatterCells(tiers[t], view);
+    while (t > 0 && marks.length > SCATTER_MARKS) marks = scatterCells(tiers[--t], view);
+    const size = tiers[t].size;
+    const max = Math.max(1, ...marks.map(m => m.count));
     const byPersona = {};
-    ANALYTICS.scatter.forEach(r => {
+    marks.forEach(m => {
+        (byPersona[m.persona] = byPersona[m.persona] || []).push({ x: m.x, y: m.y, r: 2 + 8 * Math.sqrt(m.count / max), count: m.count });
+    });
+    const datasets = Object.entries(byPersona).map(([pid, pts]) => ({
+        label: ANALYTICS.clusters[+pid]?.name || `Persona ${pid}`,
+        data: pts,
+        backgroundColor: scatterColors[+pid] || 'rgba(255,255,255,0.4)',
+    }));
+    datasets.push({
+        type: 'scatter',
+        label: 'High Risk (sample)',
+        data: filteredScatter().filter(r => r.risk === 'High').map(r => ({ x: r.x, y: r.y })),
+        backgroundColor: COLORS.red, borderColor: COLORS.red,
+        pointStyle: 'crossRot', pointRadius: 3, pointHoverRadius: 5,
+    });
+    const span = v => size > 1 ? `${v - (size - 1) / 2}–${v + (size - 1) / 2}` : `${v}`;
+    charts['chart-scatter'] = new Chart(ctx, {
+        type: 'bubble',
+        data: { datasets },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                legend: { display: true, position: 'bottom', labels: { boxWidth: 10, padding: 8, font: { size: 10 } } },
+                tooltip: {
+                    callbacks: {
+                        label: ctx => ctx.raw.count === undefined
+                            ? `High risk | Attendance: ${ctx.parsed.x}% | Score: ${ctx.parsed.y}`
+                            : `Attendance: ${span(ctx.raw.x)}% | Score: ${span(ctx.raw.y)} | ${ctx.raw.count.toLocaleString()} students`
+                    }
+                }
+            },
+            scales: {
+                x: {
+                    grid: gridOpts, title: { display: true, text: 'Attendance (%)', color: '#64748b' },
+                    min: view.x[0], max: view.x[1], ticks: { color: '#94A3B8' }
+                },
+                y: {
+                    grid: gridOpts, title: { display: true, text: 'Exam Score', color: '#64748b' },
+                    min: view.y[0], max: view.y[1], ticks: { color: '#94A3B8' }
+                },
+            },
+            onClick: (e, _, chart) => {
+                const x = chart.scales.x.getValueForPixel(e.x), y = chart.scales.y.getValueForPixel(e.y);
+                scatterView = t === tiers.length - 1 && scatterView ? null : scatterZoom(view, x, y);
+                chartScatter();
+            },
+            animation: { duration: 500 },
+        }
+    });
+}
+
+/** Halve the view around (x, y), kept inside the full axes */
+function scatterZoom(view, x, y) {
+    const full = scatterFullView();
+    const half = (axis, v) => {
+        const [lo, hi] = full[axis], w = (view[axis][1] - view[axis][0]) / 2;
+        const a = Math.min(Math.max(v - w / 2, lo), hi - w);
+        return [a, a + w];
+    };
+    return { x: half('x', x), y: half('y', y) };
+}
+
+function chartScatterPoints() {
+    destroyChart('chart-scatter');
+    const ctx = document.getElementById('chart-scatter').getContext('2d');
+    const byPersona = {};
+    filteredScatter().forEach(r => {
         if (!byPersona[r.persona]) byPersona[r.persona] = [];
         byPersona[r.persona].push({ x: r.x, y: r.y });
     });
@@ -505,7 +948,7 @@ function chartScatter() {
 function chartRiskDonut() {
     destroyChart('chart-risk-donut');
     const ctx = document.getElementById('chart-risk-donut').getContext('2d');
-    const kpi = ANALYTICS.kpis;
+    const kpi = VIEW.kpis;
     charts['chart-risk-donut'] = new Chart(ctx, {
         type: 'doughnut',
         data: {
@@ -528,9 +971,9 @@ function chartRiskDonut() {
 }
 
 function chartRiskPersona() {
-    const labels = ANALYTICS.clusters.map(c => c.name);
-    const values = ANALYTICS.clusters.map(c => c.risk_high);
-    const colors = ANALYTICS.clusters.map(c => c.color + 'AA');
+    const labels = VIEW.clusters.map(c => c.name);
+    const values = VIEW.clusters.map(c => c.risk_high);
+    const colors = VIEW.clusters.map(c => c.color + 'AA');
     makeBar('chart-risk-persona', labels,
         [{
             label: 'High-Risk Students', data: values, backgroundColor: colors,
@@ -541,7 +984,7 @@ function chartRiskPersona() {
 }
 
 function chartSchool() {
-    const d = ANALYTICS.by_school;
+    const d = VIEW.by_school;
     const labels = Object.keys(d);
     makeBar('chart-school', labels, [
         {
@@ -558,7 +1001,7 @@ function chartSchool() {
 }
 
 function chartGender() {
-    const d = ANALYTICS.by_gender;
+    const d = VIEW.by_gender;
     const labels = Object.keys(d);
     makeBar('chart-gender', labels, [
         {
@@ -575,7 +1018,7 @@ function chartGender() {
 }
 
 function chartMotiv() {
-    const d = ANALYTICS.by_motiv;
+    const d = VIEW.by_motiv;
     const order = ['Low', 'Medium', 'High'];
     const labels = order.filter(k => d[k]);
     makeBar('chart-motiv', labels, [
@@ -639,13 +1082,13 @@ function chartRadar() {
     // Normalize cluster values to 0-100 scale for radar
     const features = ['avg_score', 'avg_attend', 'avg_hours', 'avg_tutor', 'avg_sleep', 'avg_prev'];
     const fLabels = ['Exam Score', 'Attendance', 'Study Hours', 'Tutoring', 'Sleep Hours', 'Prev Scores'];
-    const maxVals = features.map(f => Math.max(...ANALYTICS.clusters.map(c => c[f])));
-    const minVals = features.map(f => Math.min(...ANALYTICS.clusters.map(c => c[f])));
+    const maxVals = features.map(f => Math.max(...VIEW.clusters.map(c => c[f])));
+    const minVals = features.map(f => Math.min(...VIEW.clusters.map(c => c[f])));
     const normalize = (v, i) => {
         const range = maxVals[i] - minVals[i] || 1;
         return Math.round(((v - minVals[i]) / range) * 100);
     };
-    const datasets = ANALYTICS.clusters.map(c => ({
+    const datasets = VIEW.clusters.map(c => ({
         label: c.icon + ' ' + c.name,
         data: features.map((f, i) => normalize(c[f], i)),
         borderColor: c.color,
@@ -677,9 +1120,9 @@ function chartRadar() {
 }
 
 function chartPersonaScore() {
-    const labels = ANALYTICS.clusters.map(c => c.icon + ' ' + c.name);
-    const values = ANALYTICS.clusters.map(c => c.avg_score);
-    const colors = ANALYTICS.clusters.map(c => c.color + 'BB');
+    const labels = VIEW.clusters.map(c => c.icon + ' ' + c.name);
+    const values = VIEW.clusters.map(c => c.avg_score);
+    const colors = VIEW.clusters.map(c => c.color + 'BB');
     makeBar('chart-persona-score', labels, [
         {
             label: 'Avg Exam Score', data: values, backgroundColor: colors,
@@ -688,14 +1131,77 @@ function chartPersonaScore() {
     ], { yScale: { min: 60, max: 80 }, xScale: { ticks: { font: { size: 10 } } } });
 }
 
+// Box plots from the quantile sketches in ANALYTICS.quantiles: whiskers span
+// P5–P95, the box P25–P75. Persona and risk boxes cover all students; each
+// active filter adds its own slice.
+const SPREAD_LABELS = { score: 'Exam Score', attend: 'Attendance', hours: 'Hours Studied', prev: 'Previous Scores' };
+let spreadMetric = 'score';
+
+function chartSpread() {
+    const Q = ANALYTICS.quantiles;
+    if (!Q) {
+        document.getElementById('spread-section').style.display = 'none';
+        return;
+    }
+    const toggle = document.getElementById('spread-toggle');
+    toggle.innerHTML = Object.keys(Q.columns).map(k => `
+      <button class="view-toggle-btn ${spreadMetric === k ? 'active' : ''}" data-metric="${k}">
+        ${SPREAD_LABELS[k] || k}
+      </button>`).join('');
+    toggle.querySelectorAll('button').forEach(btn => btn.addEventListener('click', () => {
+        spreadMetric = btn.dataset.metric;
+        chartSpread();
+    }));
+
+    const groups = [['All students', Q.all]];
+    ['school', 'gender', 'motiv'].forEach(d => {
+        if (state[d] !== 'All' && Q[d][state[d]]) groups.push([state[d], Q[d][state[d]]]);
+    });
+    Object.entries(Q.persona).forEach(([pid, g]) => {
+        groups.push([ANALYTICS.clusters[+pid]?.name || `Persona ${pid}`, g]);
+    });
+    Object.entries(Q.risk).forEach(([lvl, g]) => groups.push([`${lvl} risk`, g]));
+    const qs = groups.map(([, g]) => g[spreadMetric]);
+    const at = p => Q.probs.indexOf(p);
+    makeBar('chart-spread', groups.map(([label]) => label), [
+        {
+            label: 'P5–P95', data: qs.map(q => [q[at(0.05)], q[at(0.95)]]),
+            backgroundColor: 'rgba(148,163,184,0.55)', barPercentage: 0.08, grouped: false,
+        },
+        {
+            label: 'P25–P75', data: qs.map(q => [q[at(0.25)], q[at(0.75)]]),
+            backgroundColor: 'rgba(124,58,237,0.65)', barPercentage: 0.5, grouped: false, borderRadius: 4,
+        },
+        {
+            type: 'line', label: 'Median', data: qs.map(q => q[at(0.5)]), showLine: false,
+            pointStyle: 'line', pointRadius: 14, pointHoverRadius: 14, borderColor: '#F8FAFC', borderWidth: 2,
+        },
+    ], {
+        legend: true,
+        tooltip: {
+            callbacks: {
+                label: ctx => Array.isArray(ctx.raw)
+                    ? `${ctx.dataset.label}: ${ctx.raw[0]} – ${ctx.raw[1]}`
+                    : `Median: ${ctx.raw}`,
+                footer: items => {
+                    const i = items[0].dataIndex, q = qs[i];
+                    return `Min ${q[0]} · Max ${q[q.length - 1]} · ${groups[i][1].count.toLocaleString()} students`;
+                },
+            }
+        },
+    });
+}
+
 // ═══════════════════════════════════════════════════════════════════════════════
 // FULL RENDER
 // ═══════════════════════════════════════════════════════════════════════════════
 function renderAll() {
+    VIEW = cubeView();
     renderKPIs();
     renderRiskSummary();
     renderRiskTable();
     chartCorrelation();
+    renderCorrHeatmap();
     chartScoreDist();
     chartAttendScore();
     chartHourScore();
@@ -710,6 +1216,7 @@ function renderAll() {
     chartResources();
     chartRadar();
     chartPersonaScore();
+    chartSpread();
 }
 
 // ═══════════════════════════════════════════════════════════════════════════════
@@ -728,6 +1235,19 @@ document.getElementById('filter-motiv').addEventListener('change', e => {
     renderAll();
 });
 
+// Partitioned builds: one school's data.js at a time, picked by ?shard= (see index.html)
+if (ANALYTICS.shards) {
+    const select = document.getElementById('filter-shard');
+    ANALYTICS.shards.forEach(sh => {
+        select.add(new Option(`${sh.name} (${sh.count.toLocaleString()})`, sh.slug));
+    });
+    select.value = ANALYTICS.shard || '';
+    document.getElementById('shard-group').hidden = false;
+    select.addEventListener('change', e => {
+        location.search = e.target.value ? `?shard=${encodeURIComponent(e.target.value)}` : '';
+    });
+}
+
 // ═══════════════════════════════════════════════════════════════════════════════
 // ADD STUDENT PREDICITON LOGIC
 // ═══════════════════════════════════════════════════════════════════════════════
@@ -768,69 +1288,12 @@ document.getElementById('add-student-form').addEventListener('submit', (e) => {
         Exam_Score: parseFloat(document.getElementById('inp-score').value)
     };
 
-    // 2. Predict Persona (K-Means distance to centers)
-    const features = ['Hours_Studied', 'Attendance', 'Sleep_Hours', 'Previous_Scores', 'Tutoring_Sessions', 'Physical_Activity'];
-    const norm_stats = ANALYTICS.norm_stats;
-    const centers = ANALYTICS.centers;
-
-    // Normalize input
-    const norm_input = features.map(f => {
-        const val = student[f];
-        const min = norm_stats[f][0];
-        const range = norm_stats[f][1];
-        return (val - min) / range;
-    });
-
-    // Find closest center
-    let closestPersonaId = -1;
-    let minDistance = Infinity;
+    // 2. Predict Persona and Risk (shared rule table)
+    const predictedPersona = ANALYTICS.personas[RULES.persona(student)];
+    const risk_score = RULES.riskScore(student);
+    const risk_label = RISK_TEXT[RULES.levels[RULES.riskLevel(risk_score)]];
 
-    for (const [p_idx, center] of Object.entries(centers)) {
-        let distSq = 0;
-        for (let i = 0; i < center.length; i++) {
-            distSq += Math.pow(norm_input[i] - center[i], 2);
-        }
-        const dist = Math.sqrt(distSq);
-        if (dist < minDistance) {
-            minDistance = dist;
-            closestPersonaId = p_idx;
-        }
-    }
-
-    // Validate K-means persona against actual traits
-    const studentTraits = {
-        score: student.Exam_Score,
-        attend: student.Attendance,
-        motiv: student.Motivation_Level,
-        hours: student.Hours_Studied,
-        prev: student.Previous_Scores,
-        risk_score: 0 // will calculate below
-    };
-    closestPersonaId = resolvePersona(studentTraits, +closestPersonaId);
-    const predictedPersona = ANALYTICS.personas[closestPersonaId];
-
-    // 3. Predict Risk Score (Rule-based)
-    let risk_score = 0;
-    if (student.Attendance < 70.0) risk_score += 2;
-    else if (student.Attendance < 80.0) risk_score += 1;
-
-    if (student.Motivation_Level === 'Low') risk_score += 2;
-    else if (student.Motivation_Level === 'Medium') risk_score += 1;
-
-    if (student.Exam_Score < 62.0) risk_score += 2;
-    else if (student.Exam_Score < 67.0) risk_score += 1;
-
-    if (student.Internet_Access === 'No') risk_score += 1;
-    if (student.Learning_Disabilities === 'Yes') risk_score += 1;
-    if (student.Hours_Studied < 10.0) risk_score += 1;
-    if (student.Peer_Influence === 'Negative') risk_score += 1;
-
-    let risk_label = 'Low';
-    let risk_color = '#6ee7b7';
-    if (risk_score >= 5) { risk_label = 'High Risk'; risk_color = '#fca5a5'; }
-    else if (risk_score >= 3) { risk_label = 'Medium Risk'; risk_color = '#fcd34d'; }
-
-    // 4. Show result as a popup card
+    // 3. Show result as a popup card
     const popup = document.getElementById('pred-popup');
 
     document.getElementById('pred-pop-icon').textContent = predictedPersona.icon;
@@ -891,8 +1354,7 @@ document.getElementById('add-student-form').addEventListener('submit', (e) => {
     renderTips(predictedPersona.strategies || []);
 
     // Try to enhance with AI-personalized advice (async, non-blocking)
-    const hasApiKey = window.GEMINI_API_KEY && window.GEMINI_API_KEY !== 'YOUR_API_KEY_HERE';
-    if (hasApiKey) {
+    if (geminiAvailable()) {
         // Show loading state
         stratSection.innerHTML = `
             <div class="pred-pop-label" style="margin-bottom:0.7rem">📋 Teaching Strategies <span class="ai-badge">✨ AI</span></div>
@@ -1007,7 +1469,16 @@ document.querySelectorAll('.modal-tab').forEach(btn => {
 });
 
 // CSV Processing
-let batchPredictions = [];
+// Served by `preprocess.py serve`, uploads are posted to api/score and scored in
+// Python; from file:// (or a static server without the API) they are parsed and
+// scored here, a chunk of rows at a time so the tab stays responsive.
+const UPLOAD_NUMERIC = ['Attendance', 'Exam_Score', 'Hours_Studied', 'Previous_Scores'];
+const UPLOAD_COLUMNS = [...UPLOAD_NUMERIC, 'Motivation_Level', 'Internet_Access', 'Learning_Disabilities', 'Peer_Influence'];
+const BATCH_CHUNK = 5000;
+const BATCH_PREVIEW = 500;
+
+let scoreApi = location.protocol.startsWith('http') ? 'api/score' : null;
+let batchResult = null; // { count, persona, risk_score, risk, rows_per_sec } (columns)
 
 document.getElementById('inp-csv').addEventListener('change', (e) => {
     const file = e.target.files[0];
@@ -1016,143 +1487,97 @@ document.getElementById('inp-csv').addEventListener('change', (e) => {
     document.getElementById('csv-filename').textContent = file.name;
     document.getElementById('csv-filename').style.display = 'block';
 
-    const reader = new FileReader();
-    reader.onload = function (event) {
-        processCSV(event.target.result);
-    };
-    reader.readAsText(file);
+    const scoreHere = () => file.text().then(scoreCSV);
+    const pending = scoreApi
+        ? scoreRemote(file).catch(() => { scoreApi = null; return scoreHere(); })
+        : scoreHere();
+    pending.then(res => {
+        if (!res) return;
+        batchResult = res;
+        renderBatchResults();
+    });
 });
 
-function processCSV(csvText) {
-    const lines = csvText.split('\n').filter(line => line.trim() !== '');
-    if (lines.length < 2) return alert("CSV file seems empty or invalid.");
-
-    const headers = lines[0].split(',').map(h => h.trim());
-    const expectedHeaders = [
-        'Hours_Studied', 'Attendance', 'Sleep_Hours', 'Previous_Scores',
-        'Tutoring_Sessions', 'Physical_Activity', 'Motivation_Level',
-        'Internet_Access', 'Learning_Disabilities', 'Peer_Influence', 'Exam_Score'
-    ];
-
-    const indices = {};
-    for (const header of expectedHeaders) {
-        const idx = headers.indexOf(header);
-        if (idx === -1) return alert(`CSV is missing required column: ${header}`);
-        indices[header] = idx;
-    }
-
-    batchPredictions = [];
-
-    for (let i = 1; i < lines.length; i++) {
-        // Quick regex to handle CSV splitting preserving quotes if needed, 
-        // but simple split is ok for our generated Dataset as there are no commas in fields.
-        const cols = lines[i].split(',').map(c => c.trim().replace(/^"|"$/g, ''));
-        if (cols.length < expectedHeaders.length) continue;
-
-        const student = {
-            Hours_Studied: parseFloat(cols[indices['Hours_Studied']]),
-            Attendance: parseFloat(cols[indices['Attendance']]),
-            Sleep_Hours: parseFloat(cols[indices['Sleep_Hours']]),
-            Previous_Scores: parseFloat(cols[indices['Previous_Scores']]),
-            Tutoring_Sessions: parseFloat(cols[indices['Tutoring_Sessions']]),
-            Physical_Activity: parseFloat(cols[indices['Physical_Activity']]),
-            Motivation_Level: cols[indices['Motivation_Level']],
-            Internet_Access: cols[indices['Internet_Access']],
-            Learning_Disabilities: cols[indices['Learning_Disabilities']],
-            Peer_Influence: cols[indices['Peer_Influence']],
-            Exam_Score: parseFloat(cols[indices['Exam_Score']])
-        };
+function scoreRemote(file) {
+    return fetch(scoreApi, { method: 'POST', headers: { 'Content-Type': 'text/csv' }, body: file })
+        .then(res => {
+            if (res.status === 400) return res.json().then(b => { alert(b.error); return null; });
+            if (!res.ok) throw new Error(res.statusText);
+            return res.json();
+        })
+        .then(res => res && { ...res, risk: res.risk.map(c => res.risk_levels[c]) });
+}
 
-        batchPredictions.push(predictStudent(student));
+/** RFC 4180 rows: quoted fields may hold commas, doubled quotes and line breaks */
+function* parseCSV(text) {
+    const field = /,|\r?\n|"((?:[^"]|"")*)"|[^,"\r\n]+/y;
+    let row = [], cell = '', i = 0;
+    while (i < text.length) {
+        field.lastIndex = i;
+        const m = field.exec(text);
+        if (!m) { cell += text[i++]; continue; } // stray quote inside an unquoted field
+        i = field.lastIndex;
+        if (m[0] === ',') { row.push(cell); cell = ''; }
+        else if (m[0].endsWith('\n')) { row.push(cell); yield row; row = []; cell = ''; }
+        else cell += m[1] !== undefined ? m[1].replace(/""/g, '"') : m[0];
     }
-    renderBatchResults();
+    if (cell || row.length) { row.push(cell); yield row; }
 }
 
-function predictStudent(student) {
-    const features = ['Hours_Studied', 'Attendance', 'Sleep_Hours', 'Previous_Scores', 'Tutoring_Sessions', 'Physical_Activity'];
-    const norm_stats = ANALYTICS.norm_stats;
-    const centers = ANALYTICS.centers;
-
-    const norm_input = features.map(f => {
-        const val = student[f] || 0;
-        const min = norm_stats[f][0];
-        const range = norm_stats[f][1];
-        return (val - min) / range;
-    });
-
-    let closestPersonaId = -1;
-    let minDistance = Infinity;
-
-    for (const [p_idx, center] of Object.entries(centers)) {
-        let distSq = 0;
-        for (let i = 0; i < center.length; i++) {
-            distSq += Math.pow(norm_input[i] - center[i], 2);
+async function scoreCSV(csvText) {
+    const start = performance.now();
+    const rows = parseCSV(csvText);
+    const headers = (rows.next().value || []).map(h => h.replace(/^\uFEFF/, '').trim());
+    const pos = {};
+    for (const header of UPLOAD_COLUMNS) {
+        pos[header] = headers.indexOf(header);
+        if (pos[header] === -1) { alert(`CSV is missing required column: ${header}`); return null; }
+    }
+    const width = Math.max(...Object.values(pos)) + 1;
+
+    const res = { persona: [], risk_score: [], risk: [] };
+    let inChunk = 0;
+    for (const cols of rows) {
+        if (cols.length < width) continue;
+        const student = {};
+        for (const h of UPLOAD_COLUMNS) {
+            student[h] = UPLOAD_NUMERIC.includes(h) ? parseFloat(cols[pos[h]]) : cols[pos[h]].trim();
         }
-        const dist = Math.sqrt(distSq);
-        if (dist < minDistance) {
-            minDistance = dist;
-            closestPersonaId = p_idx;
+        const risk = RULES.riskScore(student);
+        res.persona.push(RULES.persona(student));
+        res.risk_score.push(risk);
+        res.risk.push(RULES.levels[RULES.riskLevel(risk)]);
+        if (++inChunk === BATCH_CHUNK) {
+            inChunk = 0;
+            await new Promise(r => setTimeout(r));
         }
     }
+    res.count = res.persona.length;
+    const seconds = (performance.now() - start) / 1000;
+    res.rows_per_sec = seconds > 0 ? Math.round(res.count / seconds) : res.count;
+    return res;
+}
 
-    // Calculate risk score first so resolvePersona can use it
-    let pre_risk = 0;
-    if (student.Attendance < 70.0) pre_risk += 2;
-    else if (student.Attendance < 80.0) pre_risk += 1;
-    if (student.Motivation_Level === 'Low') pre_risk += 2;
-    else if (student.Motivation_Level === 'Medium') pre_risk += 1;
-    if (student.Exam_Score < 62.0) pre_risk += 2;
-    else if (student.Exam_Score < 67.0) pre_risk += 1;
-    if (student.Internet_Access === 'No') pre_risk += 1;
-    if (student.Learning_Disabilities === 'Yes') pre_risk += 1;
-    if (student.Hours_Studied < 10.0) pre_risk += 1;
-    if (student.Peer_Influence === 'Negative') pre_risk += 1;
-
-    // Validate K-means persona against actual traits
-    const studentTraits = {
-        score: student.Exam_Score,
-        attend: student.Attendance,
-        motiv: student.Motivation_Level,
-        hours: student.Hours_Studied,
-        prev: student.Previous_Scores,
-        risk_score: pre_risk
-    };
-    closestPersonaId = resolvePersona(studentTraits, +closestPersonaId);
-    const predictedPersona = ANALYTICS.personas[closestPersonaId];
-
-    let risk_score = 0;
-    if (student.Attendance < 70.0) risk_score += 2;
-    else if (student.Attendance < 80.0) risk_score += 1;
-
-    if (student.Motivation_Level === 'Low') risk_score += 2;
-    else if (student.Motivation_Level === 'Medium') risk_score += 1;
-
-    if (student.Exam_Score < 62.0) risk_score += 2;
-    else if (student.Exam_Score < 67.0) risk_score += 1;
-
-    if (student.Internet_Access === 'No') risk_score += 1;
-    if (student.Learning_Disabilities === 'Yes') risk_score += 1;
-    if (student.Hours_Studied < 10.0) risk_score += 1;
-    if (student.Peer_Influence === 'Negative') risk_score += 1;
-
-    let risk_label = 'Low';
-    let risk_pill_class = 'Low';
-    if (risk_score >= 5) { risk_label = 'High Risk'; risk_pill_class = 'High'; }
-    else if (risk_score >= 3) { risk_label = 'Medium Risk'; risk_pill_class = 'Medium'; }
-
+function batchRow(i) {
+    const level = batchResult.risk[i];
     return {
-        persona: predictedPersona,
-        risk_score: risk_score,
-        risk_label: risk_label,
-        risk_pill_class: risk_pill_class
+        persona: ANALYTICS.personas[batchResult.persona[i]],
+        risk_score: batchResult.risk_score[i],
+        risk_label: RISK_TEXT[level],
+        risk_pill_class: level
     };
 }
 
 function renderBatchResults() {
-    document.getElementById('batch-count').textContent = batchPredictions.length;
+    const n = batchResult.count;
+    document.getElementById('batch-count').textContent = n;
+    document.getElementById('batch-rate').textContent =
+        ` · ${batchResult.rows_per_sec.toLocaleString()} rows/sec` + (n > BATCH_PREVIEW ? ` · first ${BATCH_PREVIEW} shown` : '');
     const tbody = document.getElementById('batch-tbody');
 
-    tbody.innerHTML = batchPredictions.map((res, i) => `
+    const rows = [];
+    for (let i = 0; i < Math.min(n, BATCH_PREVIEW); i++) rows.push(batchRow(i));
+    tbody.innerHTML = rows.map((res, i) => `
         <tr>
             <td style="color:var(--text-muted)">${i + 1}</td>
             <td>
@@ -1174,28 +1599,28 @@ function renderBatchResults() {
 
 // Export Results
 document.getElementById('btn-export-batch').addEventListener('click', () => {
-    if (batchPredictions.length === 0) return;
+    if (!batchResult || batchResult.count === 0) return;
 
-    let csvContent = 'data:text/csv;charset=utf-8,';
-    csvContent += 'Row_Number,Predicted_Persona,Risk_Score,Risk_Level\n';
-
-    batchPredictions.forEach((res, i) => {
-        csvContent += `${i + 1},"${res.persona.name}",${res.risk_score},${res.risk_label}\n`;
-    });
+    const lines = ['Row_Number,Predicted_Persona,Risk_Score,Risk_Level\n'];
+    for (let i = 0; i < batchResult.count; i++) {
+        const res = batchRow(i);
+        lines.push(`${i + 1},"${res.persona.name}",${res.risk_score},${res.risk_label}\n`);
+    }
 
-    const encodedUri = encodeURI(csvContent);
+    const url = URL.createObjectURL(new Blob(lines, { type: 'text/csv;charset=utf-8' }));
     const link = document.createElement('a');
-    link.setAttribute('href', encodedUri);
+    link.setAttribute('href', url);
     link.setAttribute('download', 'EduInsight_Batch_Predictions.csv');
     document.body.appendChild(link);
     link.click();
     document.body.removeChild(link);
+    URL.revokeObjectURL(url);
 });
 
 // ═══════════════════════════════════════════════════════════════════════════════
-// BOOT
+// BOOT — called by index.html once this script has loaded (after data.js)
 // ═══════════════════════════════════════════════════════════════════════════════
-document.addEventListener('DOMContentLoaded', () => {
+function boot() {
     // Header Sorting Listeners
     document.querySelectorAll('#risk-table th.sortable').forEach(th => {
         th.addEventListener('click', () => {
@@ -1236,7 +1661,8 @@ document.addEventListener('DOMContentLoaded', () => {
     });
     renderPersonas();
     renderAll();
-});
+    if (!rosterApi) loadRoster(renderRiskTable);
+}
 
 // ═══════════════════════════════════════════════════════════════════════════════
 // FEATURE 3 — AI CHAT ASSISTANT
@@ -1302,9 +1728,8 @@ document.addEventListener('DOMContentLoaded', () => {
         const text = input.value.trim();
         if (!text || isTyping) return;
 
-        // Check API key
-        const hasKey = window.GEMINI_API_KEY && window.GEMINI_API_KEY !== 'YOUR_API_KEY_HERE';
-        if (!hasKey) {
+        // Check API key (or an offline backend)
+        if (!geminiAvailable()) {
             appendBubble('ai', '⚠️ Please add your Gemini API key to <code>config.js</code> to use the AI Assistant.');
             return;
         }
@@ -0,0 +1,267 @@
+"""
+Student Learning Analytics - Benchmarks
+Synthetic Student_data.csv generator and a per-stage benchmark of
+preprocess.py:
+  python bench.py generate 1m students_1m.csv
+  python bench.py run --sizes 10k,100k --save-baseline
+  python bench.py run --sizes 10k,100k --baseline bench_baseline.json
+Each size runs in a fresh process (so peak memory is per size) and the
+results are written as JSON.
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+import preprocess as pp
+
+BENCH_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_data')
+RESULTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_results.json')
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_baseline.json')
+
+# ── 1. Synthetic data ──────────────────────────────────────────────────────────
+# Marginals of the bundled 6,607-row dataset (level counts, blanks included;
+# numeric shapes and ranges) and a linear Exam_Score model fitted to its
+# correlations and group means, so clean(), the risk rules and the personas
+# see the same mix of values as on the real file.
+CATEGORY_COUNTS: Dict[str, Dict[str, int]] = {
+    'Parental_Involvement': {'Low': 1337, 'Medium': 3362, 'High': 1908},
+    'Access_to_Resources': {'Low': 1313, 'Medium': 3319, 'High': 1975},
+    'Extracurricular_Activities': {'No': 2669, 'Yes': 3938},
+    'Motivation_Level': {'Low': 1937, 'Medium': 3351, 'High': 1319},
+    'Internet_Access': {'No': 499, 'Yes': 6108},
+    'Family_Income': {'Low': 2672, 'Medium': 2666, 'High': 1269},
+    'Teacher_Quality': {'Low': 657, 'Medium': 3925, 'High': 1947, '': 78},
+    'School_Type': {'Public': 4598, 'Private': 2009},
+    'Peer_Influence': {'Negative': 1377, 'Neutral': 2592, 'Positive': 2638},
+    'Learning_Disabilities': {'No': 5912, 'Yes': 695},
+    'Parental_Education_Level': {'High School': 3223, 'College': 1989, 'Postgraduate': 1305, '': 90},
+    'Distance_from_Home': {'Near': 3884, 'Moderate': 1998, 'Far': 658, '': 67},
+    'Gender': {'Male': 3814, 'Female': 2793},
+}
+SLEEP_COUNTS = {4: 307, 5: 695, 6: 1338, 7: 1741, 8: 1399, 9: 775, 10: 352}
+ACTIVITY_COUNTS = {0: 46, 1: 421, 2: 1627, 3: 2545, 4: 1575, 5: 361, 6: 32}
+
+# Exam_Score = intercept + slopes · numerics + per-level effects (+ rounding);
+# a small share of students beat the model by a wide margin, as in the source
+SCORE_INTERCEPT = 39.3
+SCORE_SLOPES = {'Hours_Studied': 0.29, 'Attendance': 0.198, 'Previous_Scores': 0.048,
+                'Tutoring_Sessions': 0.49, 'Physical_Activity': 0.14}
+SCORE_EFFECTS: Dict[str, Dict[str, float]] = {
+    'Parental_Involvement': {'Low': -1.0, 'High': 1.0},
+    'Access_to_Resources': {'Low': -1.0, 'High': 1.0},
+    'Extracurricular_Activities': {'Yes': 0.56},
+    'Motivation_Level': {'Low': -0.5, 'High': 0.5},
+    'Internet_Access': {'Yes': 0.9},
+    'Family_Income': {'Low': -0.5, 'High': 0.5},
+    'Teacher_Quality': {'Low': -0.5, 'High': 0.5},
+    'Peer_Influence': {'Negative': -0.5, 'Positive': 0.5},
+    'Learning_Disabilities': {'Yes': -0.85},
+    'Parental_Education_Level': {'College': 0.5, 'Postgraduate': 1.0},
+    'Distance_from_Home': {'Moderate': -0.5, 'Far': -1.0},
+}
+SCORE_OUTLIER_RATE = 0.008
+
+HEADER = [
+    'Hours_Studied', 'Attendance', 'Parental_Involvement', 'Access_to_Resources',
+    'Extracurricular_Activities', 'Sleep_Hours', 'Previous_Scores', 'Motivation_Level',
+    'Internet_Access', 'Tutoring_Sessions', 'Family_Income', 'Teacher_Quality', 'School_Type',
+    'Peer_Influence', 'Physical_Activity', 'Learning_Disabilities', 'Parental_Education_Level',
+    'Distance_from_Home', 'Gender', 'Exam_Score',
+]
+
+def _poisson(rng: random.Random, lam: float) -> int:
+    # Knuth's method; fine for the small means used here
+    k, p, limit = 0, rng.random(), math.exp(-lam)
+    while p > limit:
+        k += 1
+        p *= rng.random()
+    return k
+
+def synthesize(n: int, seed: int = 7) -> Iterator[List[Any]]:
+    """Yield ``n`` synthetic rows in HEADER order."""
+    rng = random.Random(seed)
+    levels = {c: (list(counts), list(counts.values())) for c, counts in CATEGORY_COUNTS.items()}
+    sleep, activity = (list(SLEEP_COUNTS), list(SLEEP_COUNTS.values())), \
+        (list(ACTIVITY_COUNTS), list(ACTIVITY_COUNTS.values()))
+    for _ in range(n):
+        row: Dict[str, Any] = {
+            'Hours_Studied': min(44, max(1, round(rng.gauss(20.0, 6.0)))),
+            'Attendance': rng.randint(60, 100),
+            'Sleep_Hours': rng.choices(*sleep)[0],
+            'Previous_Scores': rng.randint(50, 100),
+            'Tutoring_Sessions': min(8, _poisson(rng, 1.5)),
+            'Physical_Activity': rng.choices(*activity)[0],
+        }
+        for c, (names, weights) in levels.items():
+            row[c] = rng.choices(names, weights)[0]
+        score = SCORE_INTERCEPT + sum(row[c] * w for c, w in SCORE_SLOPES.items())
+        score += sum(effects.get(row[c], 0.0) for c, effects in SCORE_EFFECTS.items())
+        score = round(score + rng.gauss(0.0, 0.5))
+        if rng.random() < SCORE_OUTLIER_RATE:
+            score += rng.randint(8, 33)
+        row['Exam_Score'] = min(101, max(55, score))
+        yield [row[c] for c in HEADER]
+
+def generate(n: int, path: str, seed: int = 7) -> None:
+    tmp = path + '.tmp'
+    with open(tmp, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        writer.writerows(synthesize(n, seed))
+    os.replace(tmp, path)
+
+def dataset(n: int, data_dir: str = BENCH_DIR) -> str:
+    # Synthetic CSVs are kept between runs; 10M rows take minutes to write
+    path = os.path.join(data_dir, f'students_{n}.csv')
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        print(f"Generating {n} rows → {path}")
+        generate(n, path)
+    return path
+
+# ── 2. Measurement ─────────────────────────────────────────────────────────────
+SIZES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000, '10m': 10_000_000}
+
+def parse_size(text: str) -> int:
+    text = text.strip().lower()
+    if text in SIZES:
+        return SIZES[text]
+    scale = {'k': 1_000, 'm': 1_000_000}.get(text[-1:], 1)
+    return int(float(text.rstrip('km')) * scale)
+
+def measure(path: str, workers: int = 1) -> Dict[str, Any]:
+    """Run the default (in-memory, compact output) pipeline on ``path``, uncached."""
+    stages = pp.Instruments()
+    with tempfile.TemporaryDirectory() as out:
+        pp.OUT_PATH = os.path.join(out, 'data.js')
+        pp.ROSTER_PATH = os.path.join(out, 'roster.js')
+        output, roster = pp.run_in_memory(path, 0, stages, workers)
+        pp.checkpoint(stages, 'tables', len(roster))
+        written = pp.write_compact(output, roster)
+        pp.checkpoint(stages, 'serialize', len(roster))
+        sizes = {os.path.basename(p): os.path.getsize(p) for p in written}
+    report = stages.report()
+    return {
+        'rows': output['kpis']['total'],
+        'wall_s': report['wall_s'],
+        'cpu_s': report['cpu_s'],
+        'peak_rss_mb': report['peak_rss_mb'],
+        'output_bytes': sizes,
+        'stages': report['stages'],
+    }
+
+def run_size(n: int, workers: int) -> Dict[str, Any]:
+    # A fresh interpreter per size: ru_maxrss only ever grows within a process
+    path = dataset(n)
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), 'measure', path, '--workers', str(workers)],
+                          stdout=subprocess.PIPE, check=True, text=True)
+    return json.loads(proc.stdout.splitlines()[-1])
+
+# ── 3. Regression check ────────────────────────────────────────────────────────
+def regressions(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float,
+                min_seconds: float) -> List[str]:
+    """
+    Stages (and whole runs) at least ``threshold`` slower than in
+    ``baseline``, for the sizes both have. Differences under ``min_seconds``
+    are noise and never count.
+    """
+    found = []
+    for size, run in results['runs'].items():
+        base = baseline.get('runs', {}).get(size)
+        if base is None:
+            continue
+        pairs = [('total', run['wall_s'], base['wall_s'])]
+        pairs += [(name, st['wall_s'], base['stages'][name]['wall_s'])
+                  for name, st in run['stages'].items() if name in base['stages']]
+        for name, now, then in pairs:
+            if now - then >= min_seconds and now > then * (1 + threshold):
+                found.append(f"{size} rows, {name}: {then:.3f}s → {now:.3f}s (+{(now / then - 1) * 100:.0f}%)"
+                             if then else f"{size} rows, {name}: {then:.3f}s → {now:.3f}s")
+    return found
+
+def report(results: Dict[str, Any]) -> None:
+    for size, run in results['runs'].items():
+        out = ', '.join(f"{k} {v / 1024:.0f}KB" for k, v in run['output_bytes'].items())
+        print(f"{int(size):>10} rows  {run['wall_s']:8.2f}s  peak {run['peak_rss_mb']:.0f}MB  {out}")
+        print('            ' + ', '.join(f"{k} {v['wall_s']:.2f}s" for k, v in run['stages'].items()))
+
+# ── 4. Main ────────────────────────────────────────────────────────────────────
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Synthetic data and benchmarks for preprocess.py')
+    commands = parser.add_subparsers(dest='command', required=True, metavar='{generate,run}')
+    gen = commands.add_parser('generate', help='write a synthetic Student_data.csv')
+    gen.add_argument('rows', type=parse_size, help='row count, e.g. 50000, 100k or 1m')
+    gen.add_argument('output')
+    gen.add_argument('--seed', type=int, default=7)
+    run = commands.add_parser('run', help='benchmark each pipeline stage at several sizes')
+    run.add_argument('--sizes', default=','.join(SIZES),
+                     help=f"comma-separated row counts (default: {','.join(SIZES)})")
+    run.add_argument('--workers', type=int, default=1,
+                     help='pipeline processes; per-stage times are only exact with 1 (default: 1)')
+    run.add_argument('--out', default=RESULTS_PATH, help='where to write the results JSON')
+    run.add_argument('--baseline', default=None, metavar='JSON',
+                     help='compare against this results file and exit 1 on regressions')
+    run.add_argument('--threshold', type=float, default=0.25,
+                     help='allowed slowdown per stage as a fraction (default: 0.25)')
+    run.add_argument('--min-seconds', type=float, default=0.05,
+                     help='ignore slowdowns smaller than this many seconds (default: 0.05)')
+    run.add_argument('--save-baseline', action='store_true',
+                     help=f'also store the results as {os.path.basename(BASELINE_PATH)}')
+    meas = commands.add_parser('measure')  # internal: one size, in a child process
+    meas.add_argument('path')
+    meas.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    if args.command == 'generate':
+        generate(args.rows, args.output, args.seed)
+        print(f"Wrote {args.rows} rows to {args.output}")
+        return
+    if args.command == 'measure':
+        sys.stdout = sys.stderr  # keep the pipeline's progress output off the result line
+        result = measure(args.path, args.workers)
+        sys.stdout = sys.__stdout__
+        print(json.dumps(result))
+        return
+
+    baseline: Optional[Dict[str, Any]] = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    results: Dict[str, Any] = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'workers': args.workers,
+        'runs': {},
+    }
+    for n in map(parse_size, args.sizes.split(',')):
+        print(f"Benchmarking {n} rows...")
+        results['runs'][str(n)] = run_size(n, args.workers)
+    report(results)
+    paths = [args.out] + ([BASELINE_PATH] if args.save_baseline else [])
+    for path in paths:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {path}")
+
+    if baseline is not None:
+        found = regressions(results, baseline, args.threshold, args.min_seconds)
+        for line in found:
+            print(f"REGRESSION {line}")
+        if found:
+            sys.exit(1)
+        print(f"No stage regressed more than {args.threshold:.0%} against {args.baseline}")
+
+if __name__ == '__main__':
+    main()
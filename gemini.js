@@ -4,22 +4,219 @@ const GEMINI_MODEL = 'gemini-2.5-flash';
 
 const GEMINI_ENDPOINT = `https://generativelanguage.googleapis.com/v1beta/models/${GEMINI_MODEL}:generateContent`;
 
+// Response cache: LRU of GEMINI_CACHE_SIZE entries, each valid for
+// GEMINI_CACHE_TTL_MS, persisted in localStorage so reloads keep it
+const GEMINI_CACHE_SIZE = 200;
+const GEMINI_CACHE_TTL_MS = 24 * 60 * 60 * 1000;
+const GEMINI_CACHE_STORE = 'eduinsight.gemini.cache.v1';
+
+// History budget: the last GEMINI_HISTORY_TURNS messages are sent verbatim
+// (within GEMINI_HISTORY_CHARS); older ones are folded into a short summary
+const GEMINI_HISTORY_TURNS = 6;
+const GEMINI_HISTORY_CHARS = 6000;
+const GEMINI_SUMMARY_CHARS = 1200;
+
+/** 53-bit string hash (cyrb53); synchronous, so it also works from file:// */
+function hashText(str, seed = 0) {
+    let h1 = 0xdeadbeef ^ seed, h2 = 0x41c6ce57 ^ seed;
+    for (let i = 0; i < str.length; i++) {
+        const ch = str.charCodeAt(i);
+        h1 = Math.imul(h1 ^ ch, 2654435761);
+        h2 = Math.imul(h2 ^ ch, 1597334677);
+    }
+    h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+    h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+    return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(36);
+}
+
+/** Version of the dashboard data the answers are about (changes with data.js or the shard) */
+const dataVersion = (() => {
+    let version = null;
+    return () => version ?? (version = hashText(JSON.stringify([
+        ANALYTICS.shard || '', ANALYTICS.kpis,
+        ANALYTICS.clusters.map(c => [c.name, c.count, c.avg_score, c.avg_attend, c.risk_high]),
+    ])));
+})();
+
+// ── Response cache ────────────────────────────────────────────────────────────
+const geminiCache = {
+    entries: null, // Map key → { text, at }, least recently used first
+
+    load() {
+        if (this.entries) return this.entries;
+        this.entries = new Map();
+        try {
+            const saved = JSON.parse(localStorage.getItem(GEMINI_CACHE_STORE) || '[]');
+            saved.forEach(([key, entry]) => this.entries.set(key, entry));
+        } catch (e) { /* storage unavailable or corrupt: start empty */ }
+        return this.entries;
+    },
+
+    save() {
+        try {
+            localStorage.setItem(GEMINI_CACHE_STORE, JSON.stringify([...this.entries]));
+        } catch (e) {
+            // Quota: keep the newer half and try once more
+            [...this.entries.keys()].slice(0, this.entries.size >> 1).forEach(k => this.entries.delete(k));
+            try { localStorage.setItem(GEMINI_CACHE_STORE, JSON.stringify([...this.entries])); } catch (e2) { }
+        }
+    },
+
+    get(key) {
+        const entries = this.load();
+        const entry = entries.get(key);
+        if (!entry) return undefined;
+        entries.delete(key);
+        if (Date.now() - entry.at > GEMINI_CACHE_TTL_MS) {
+            this.save();
+            return undefined;
+        }
+        entries.set(key, entry); // most recently used
+        return entry.text;
+    },
+
+    set(key, text) {
+        const entries = this.load();
+        entries.delete(key);
+        entries.set(key, { text, at: Date.now() });
+        const now = Date.now();
+        for (const [k, entry] of entries) {
+            if (entries.size <= GEMINI_CACHE_SIZE && now - entry.at <= GEMINI_CACHE_TTL_MS) break;
+            entries.delete(k);
+        }
+        this.save();
+    },
+
+    clear() {
+        this.entries = new Map();
+        try { localStorage.removeItem(GEMINI_CACHE_STORE); } catch (e) { }
+    },
+};
+
+// Hit/miss counts and latency (ms) of cached vs backend answers; see geminiStats()
+const geminiMetrics = { hits: 0, misses: 0, shared: 0, errors: 0, hitMs: 0, backendMs: 0, maxBackendMs: 0 };
+
+function geminiStats() {
+    const m = geminiMetrics;
+    const calls = m.hits + m.misses;
+    return {
+        ...m,
+        hitRate: calls ? Math.round(m.hits / calls * 1000) / 1000 : 0,
+        avgHitMs: m.hits ? Math.round(m.hitMs / m.hits * 10) / 10 : 0,
+        avgBackendMs: m.misses ? Math.round(m.backendMs / m.misses) : 0,
+        entries: geminiCache.load().size,
+    };
+}
+
+// ── History budget ────────────────────────────────────────────────────────────
+/**
+ * Split chat history into the recent turns sent verbatim and a plain-text
+ * summary of the older ones (first sentence of each, newest kept first
+ * when the summary is over budget).
+ * @param {Array} history — [{role, parts:[{text}]}]
+ * @returns {{recent: Array, summary: string}}
+ */
+function compactHistory(history) {
+    let start = Math.max(0, history.length - GEMINI_HISTORY_TURNS);
+    if (start % 2) start++; // start on a user turn
+    let chars = 0;
+    for (let i = history.length - 1; i >= start; i--) {
+        chars += history[i].parts.map(p => p.text).join('').length;
+        if (chars > GEMINI_HISTORY_CHARS) { start = i + 1 + ((i + 1) % 2); break; }
+    }
+    const lines = [];
+    let budget = GEMINI_SUMMARY_CHARS;
+    for (let i = start - 1; i >= 0 && budget > 0; i--) {
+        const text = history[i].parts.map(p => p.text).join(' ').replace(/\s+/g, ' ').trim();
+        const gist = (text.match(/^.*?[.!?](\s|$)/)?.[0] || text).trim().slice(0, 200);
+        const line = `${history[i].role === 'user' ? 'Teacher' : 'Assistant'}: ${gist}`;
+        lines.unshift(line);
+        budget -= line.length;
+    }
+    return { recent: history.slice(start), summary: lines.join('\n') };
+}
+
+// ── Backends ──────────────────────────────────────────────────────────────────
+// A backend takes a generateContent request body and resolves to the reply
+// text. Pick one with window.GEMINI_BACKEND ('gemini' or 'local', e.g. in
+// config.js) or register another in GEMINI_BACKENDS.
+const GEMINI_BACKENDS = {
+    async gemini(body) {
+        const key = window.GEMINI_API_KEY;
+        if (!key || key === 'YOUR_API_KEY_HERE') {
+            throw new Error('No API key — open config.js and add your Gemini key.');
+        }
+        const res = await fetch(`${GEMINI_ENDPOINT}?key=${key}`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(body)
+        });
+
+        if (!res.ok) {
+            const err = await res.json().catch(() => ({}));
+            throw new Error(err?.error?.message || `Gemini API error ${res.status}`);
+        }
+
+        const data = await res.json();
+        return data?.candidates?.[0]?.content?.parts?.[0]?.text ?? '(No response)';
+    },
+
+    // Offline stand-in: answers from the persona strategies in data.js, so the
+    // assistant and the cache can be exercised without a key or network
+    async local(body) {
+        const prompt = body.contents[body.contents.length - 1].parts[0].text;
+        const persona = ANALYTICS.personas.find(p => prompt.includes(p.name)) || ANALYTICS.personas[0];
+        await new Promise(r => setTimeout(r, window.GEMINI_LOCAL_DELAY_MS ?? 300));
+        return `(offline) Suggestions for ${persona.name} students:\n` +
+            persona.strategies.slice(0, 4).map((s, i) => `${i + 1}. ${s}`).join('\n');
+    },
+};
+
+function geminiBackend() {
+    return GEMINI_BACKENDS[window.GEMINI_BACKEND || 'gemini'] || GEMINI_BACKENDS.gemini;
+}
+
+/** True when callGemini can answer: an API key is set, or another backend is selected */
+function geminiAvailable() {
+    if (geminiBackend() !== GEMINI_BACKENDS.gemini) return true;
+    return Boolean(window.GEMINI_API_KEY && window.GEMINI_API_KEY !== 'YOUR_API_KEY_HERE');
+}
+
+const geminiPending = new Map(); // cache key → in-flight Promise, shared by identical calls
+
 /**
- * Call the Gemini API.
+ * Call the Gemini API (or the selected backend), through the response cache.
+ * Answers are keyed on the normalized prompt, system context, recent history
+ * and dashboard data version.
  * @param {string}   userPrompt   — the user message text
  * @param {string}   systemCtx    — optional system instruction block
- * @param {Array}    history      — [{role, parts:[{text}]}] for multi-turn
+ * @param {Array}    history      — [{role, parts:[{text}]}] for multi-turn; trimmed by compactHistory
  * @returns {Promise<string>} response text
  */
 async function callGemini(userPrompt, systemCtx = '', history = []) {
-    const key = window.GEMINI_API_KEY;
-    if (!key || key === 'YOUR_API_KEY_HERE') {
-        throw new Error('No API key — open config.js and add your Gemini key.');
+    const { recent, summary } = compactHistory(history);
+    const system = summary ? `${systemCtx}\n\nEarlier in this conversation:\n${summary}` : systemCtx;
+    const normalize = t => t.replace(/\s+/g, ' ').trim().toLowerCase();
+    const key = hashText(JSON.stringify([
+        GEMINI_MODEL, window.GEMINI_BACKEND || 'gemini', dataVersion(), normalize(system),
+        recent.map(m => [m.role, normalize(m.parts.map(p => p.text).join(' '))]), normalize(userPrompt),
+    ]));
+
+    const started = performance.now();
+    const cached = geminiCache.get(key);
+    if (cached !== undefined) {
+        geminiMetrics.hits++;
+        geminiMetrics.hitMs += performance.now() - started;
+        return cached;
+    }
+    if (geminiPending.has(key)) {
+        geminiMetrics.shared++;
+        return geminiPending.get(key);
     }
 
     const body = {
         contents: [
-            ...history,
+            ...recent,
             { role: 'user', parts: [{ text: userPrompt }] }
         ],
         generationConfig: {
@@ -31,43 +228,43 @@ async function callGemini(userPrompt, systemCtx = '', history = []) {
     };
 
     // Use systemInstruction when provided (cleaner than embedding it in user message)
-    if (systemCtx) {
-        body.systemInstruction = { parts: [{ text: systemCtx }] };
-    }
-
-    const res = await fetch(`${GEMINI_ENDPOINT}?key=${key}`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify(body)
-    });
-
-    if (!res.ok) {
-        const err = await res.json().catch(() => ({}));
-        throw new Error(err?.error?.message || `Gemini API error ${res.status}`);
+    if (system) {
+        body.systemInstruction = { parts: [{ text: system }] };
     }
 
-    const data = await res.json();
-    return data?.candidates?.[0]?.content?.parts?.[0]?.text ?? '(No response)';
+    geminiMetrics.misses++;
+    const request = geminiBackend()(body).then(text => {
+        const ms = performance.now() - started;
+        geminiMetrics.backendMs += ms;
+        geminiMetrics.maxBackendMs = Math.max(geminiMetrics.maxBackendMs, Math.round(ms));
+        if (text !== '(No response)') geminiCache.set(key, text);
+        return text;
+    }, err => {
+        geminiMetrics.errors++;
+        throw err;
+    }).finally(() => geminiPending.delete(key));
+    geminiPending.set(key, request);
+    return request;
 }
 
 /**
- * Compact dashboard context for the chat assistant.
+ * Compact dashboard context for the chat assistant (built once per page load).
  */
-function buildDashboardContext() {
-    const k = ANALYTICS.kpis;
-    const cs = ANALYTICS.clusters;
+const buildDashboardContext = (() => {
+    let built = null;
+    return () => {
+        if (built !== null) return built;
+        const k = ANALYTICS.kpis;
+        const cs = ANALYTICS.clusters;
 
-    const personaSummary = cs.map(c =>
-        `${c.name}: ${c.count} students, avg score ${c.avg_score}, attendance ${c.avg_attend}%, high-risk ${c.risk_high}`
-    ).join(' | ');
+        const personaSummary = cs.map(c =>
+            `${c.name}: ${c.count} students, avg score ${c.avg_score}, attendance ${c.avg_attend}%, high-risk ${c.risk_high}`
+        ).join(' | ');
 
-    return `You are EduInsight AI, a teaching assistant for school educators.
+        built = `You are EduInsight AI, a teaching assistant for school educators.
 Dataset: ${k.total} students | avg score ${k.avg_score} | avg attendance ${k.avg_attend}% | high-risk ${k.high_risk} | medium-risk ${k.medium_risk} | low-risk ${k.low_risk} | avg study hours ${k.avg_hours}h/wk
 Personas: ${personaSummary}
 Be concise, practical, and supportive. Answer only from the data above when relevant.`;
-}
-
-
-
-
-
+        return built;
+    };
+})();
@@ -8,55 +8,404 @@ Reads Student_data.csv, performs:
 Outputs: data.js (embedded in the dashboard)
 """
 
+import argparse
+import base64
+import bisect
+import cProfile
 import csv
+import fnmatch
+import functools
+import gzip
+import hashlib
+import heapq
+import itertools
 import json
 import math
+import mmap
+import operator
 import random
 import os
-from typing import Any, Dict, List, Tuple
+import posixpath
+import sys
+import tempfile
+import time
+from array import array
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # optional, only for --precompress br
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
 CSV_PATH = os.path.join(os.path.dirname(__file__), 'Student_data.csv')
 OUT_PATH = os.path.join(os.path.dirname(__file__), 'data.js')
+ROSTER_PATH = os.path.join(os.path.dirname(__file__), 'roster.js')
+STATE_PATH = os.path.join(os.path.dirname(__file__), 'data.state.json')
+STATE_ROSTER_DIR = os.path.join(os.path.dirname(__file__), 'data.state.roster')
+CACHE_PATH = os.path.join(os.path.dirname(__file__), 'Student_data.cache')
+SHARDS_DIR = os.path.join(os.path.dirname(__file__), 'shards')
 
 # ── 1. Load CSV ────────────────────────────────────────────────────────────────
-def load_csv(path: str) -> List[Dict[str, str]]:
-    rows = []
-    with open(path, newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            rows.append(row)
-    return rows
-
-def clean(rows: List[Dict[str, str]]) -> List[Dict[str, Any]]:
-    cleaned = []
-    for r in rows:
-        try:
-            row: Dict[str, Any] = {
-                'Hours_Studied': float(r['Hours_Studied']),
-                'Attendance': float(r['Attendance']),
-                'Parental_Involvement': r['Parental_Involvement'].strip(),
-                'Access_to_Resources': r['Access_to_Resources'].strip(),
-                'Extracurricular_Activities': r['Extracurricular_Activities'].strip(),
-                'Sleep_Hours': float(r['Sleep_Hours']),
-                'Previous_Scores': float(r['Previous_Scores']),
-                'Motivation_Level': r['Motivation_Level'].strip(),
-                'Internet_Access': r['Internet_Access'].strip(),
-                'Tutoring_Sessions': float(r['Tutoring_Sessions']),
-                'Family_Income': r['Family_Income'].strip(),
-                'Teacher_Quality': r['Teacher_Quality'].strip() if r['Teacher_Quality'].strip() else 'Medium',
-                'School_Type': r['School_Type'].strip(),
-                'Peer_Influence': r['Peer_Influence'].strip(),
-                'Physical_Activity': float(r['Physical_Activity']),
-                'Learning_Disabilities': r['Learning_Disabilities'].strip(),
-                'Parental_Education_Level': r['Parental_Education_Level'].strip() if r['Parental_Education_Level'].strip() else 'High School',
-                'Distance_from_Home': r['Distance_from_Home'].strip() if r['Distance_from_Home'].strip() else 'Near',
-                'Gender': r['Gender'].strip(),
-                'Exam_Score': float(r['Exam_Score'])
-            }
-            cleaned.append(row)
-        except (ValueError, KeyError):
-            continue
-    return cleaned
+# Cleaned data is held column-wise: one typed array per numeric column and one
+# dictionary-encoded code array per categorical column (codes index into
+# Table.levels[col], assigned in first-seen order).
+NUMERIC_COLUMNS = [
+    'Hours_Studied', 'Attendance', 'Sleep_Hours', 'Previous_Scores',
+    'Tutoring_Sessions', 'Physical_Activity', 'Exam_Score'
+]
+
+# Categorical column -> fallback used when the cell is blank (None = keep blank)
+CATEGORICAL_COLUMNS: Dict[str, Optional[str]] = {
+    'Parental_Involvement': None,
+    'Access_to_Resources': None,
+    'Extracurricular_Activities': None,
+    'Motivation_Level': None,
+    'Internet_Access': None,
+    'Family_Income': None,
+    'Teacher_Quality': 'Medium',
+    'School_Type': None,
+    'Peer_Influence': None,
+    'Learning_Disabilities': None,
+    'Parental_Education_Level': 'High School',
+    'Distance_from_Home': 'Near',
+    'Gender': None,
+}
+
+def column_type(name: str) -> str:
+    # array typecode for a column, including the derived ones
+    if name in NUMERIC_COLUMNS:
+        return 'd'
+    if name in CATEGORICAL_COLUMNS:
+        return 'H'
+    return 'B' if name == 'risk_label' else 'b'
+
+def typecode(col: Any) -> str:
+    # Columns are arrays, or memoryviews when mapped from the cache, a roster log
+    # or shared memory
+    return col.typecode if isinstance(col, array) else col.format
+
+def encode_array(col: array) -> List[str]:
+    return [typecode(col), base64.b64encode(col.tobytes()).decode('ascii')]
+
+def decode_array(state: List[str]) -> array:
+    col = array(state[0])
+    col.frombytes(base64.b64decode(state[1]))
+    return col
+
+class Table:
+    """Column-oriented student table.
+
+    ``columns`` maps a column name to a typed ``array``; categorical columns
+    hold integer codes and have their decoded values in ``levels``.
+    """
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, array] = {}
+        self.levels: Dict[str, List[str]] = {}
+        self.norm: List[array] = []
+
+    def __len__(self) -> int:
+        return len(self.columns['Exam_Score']) if 'Exam_Score' in self.columns else 0
+
+    def __getitem__(self, name: str) -> array:
+        return self.columns[name]
+
+    def __setitem__(self, name: str, col: array) -> None:
+        self.columns[name] = col
+
+    def add_categorical(self, name: str, codes: array, levels: List[str]) -> None:
+        self.columns[name] = codes
+        self.levels[name] = levels
+
+    def decode(self, name: str) -> List[str]:
+        levels = self.levels[name]
+        return [levels[c] for c in self.columns[name]]
+
+    def value(self, name: str, i: int) -> Any:
+        v = self.columns[name][i]
+        return self.levels[name][v] if name in self.levels else v
+
+    def select(self, names: List[str]) -> 'Table':
+        # New table holding copies of ``names``; level lists stay shared.
+        out = Table()
+        for name in names:
+            out[name] = array(typecode(self.columns[name]), self.columns[name])
+            if name in self.levels:
+                out.levels[name] = self.levels[name]
+        return out
+
+    @classmethod
+    def from_rows(cls, rows: List[Tuple[Any, ...]], names: List[str],
+                  levels: Dict[str, List[str]]) -> 'Table':
+        # Build a table from row tuples of ``names``; categorical codes refer to ``levels``.
+        out = cls()
+        for j, name in enumerate(names):
+            out[name] = array(column_type(name), [r[j] for r in rows])
+            if name in levels:
+                out.levels[name] = levels[name]
+        return out
+
+    def to_state(self) -> Dict[str, Any]:
+        return {name: encode_array(col) for name, col in self.columns.items()}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any], levels: Dict[str, List[str]]) -> 'Table':
+        out = cls()
+        for name, col in state.items():
+            out[name] = decode_array(col)
+            if name in levels:
+                out.levels[name] = levels[name]
+        return out
+
+    def slice(self, start: int, stop: int) -> 'Table':
+        # Rows [start, stop) (copies for arrays, views for shared-memory columns).
+        part = Table()
+        for name, col in self.columns.items():
+            part[name] = col[start:stop]
+        part.levels = self.levels
+        return part
+
+    def blocks(self, size: int) -> Iterator['Table']:
+        # Consecutive row slices of at most ``size`` rows.
+        for start in range(0, len(self), size):
+            yield self.slice(start, start + size)
+
+    def extend(self, other: 'Table') -> None:
+        # Append the rows of ``other``; categorical codes must share level lists.
+        for name, col in self.columns.items():
+            col.extend(other[name])
+
+    def recoded(self, luts: Dict[str, List[int]], levels: Dict[str, List[str]]) -> 'Table':
+        # Copy with categorical codes mapped through ``luts`` onto ``levels``
+        out = Table()
+        for name, col in self.columns.items():
+            lut = luts.get(name)
+            out[name] = array(typecode(col), col if lut is None else map(lut.__getitem__, col))
+            if name in self.levels:
+                out.levels[name] = levels.get(name, self.levels[name])
+        return out
+
+def load_csv(path: str, start: int = 0, end: Optional[int] = None) -> Iterator[List[str]]:
+    # Yields the header followed by raw rows; nothing is buffered here. With a
+    # byte range, only rows between ``start`` and ``end`` are read (the header
+    # is then only yielded if ``start`` is 0).
+    if not start and end is None:
+        with open(path, newline='', encoding='utf-8') as f:
+            yield from csv.reader(f)
+        return
+    with open(path, 'rb') as f:
+        f.seek(start)
+        yield from csv.reader(_decoded_lines(f, None if end is None else end - start))
+
+def _decoded_lines(f: Any, limit: Optional[int]) -> Iterator[str]:
+    for line in f:
+        if limit is not None:
+            if limit <= 0:
+                return
+            limit -= len(line)
+        yield line.decode('utf-8')
+
+def file_digest(path: str, end: int) -> str:
+    # Hash of the first ``end`` bytes; raw bytes only, nothing is parsed.
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        remaining = end
+        while remaining > 0:
+            block = f.read(min(1 << 20, remaining))
+            if not block:
+                break
+            h.update(block)
+            remaining -= len(block)
+    return h.hexdigest()
+
+def clean(rows: Iterator[List[str]]) -> Table:
+    return next(clean_chunks(rows))
+
+def clean_chunks(rows: Iterator[List[str]], chunk_size: Optional[int] = None,
+                 levels: Optional[Dict[str, List[str]]] = None) -> Iterator[Table]:
+    """
+    Clean and type-convert raw CSV rows (header first) into Tables of at most
+    ``chunk_size`` rows (a single Table when None). All chunks share the same
+    level lists, so categorical codes mean the same thing in every chunk;
+    pass ``levels`` to continue the encoding of an earlier run.
+    """
+    header = next(rows, None)
+    if levels is None:
+        levels = {c: [] for c in CATEGORICAL_COLUMNS}
+
+    def empty() -> Table:
+        table = Table()
+        for c in NUMERIC_COLUMNS:
+            table[c] = array('d')
+        for c in CATEGORICAL_COLUMNS:
+            table.add_categorical(c, array('H'), levels[c])
+        return table
+
+    try:
+        num_pos = [header.index(c) for c in NUMERIC_COLUMNS] if header else None
+        cat_pos = [header.index(c) for c in CATEGORICAL_COLUMNS] if header else None
+    except ValueError:
+        num_pos = cat_pos = None
+    if num_pos is None or cat_pos is None:
+        yield empty()
+        return
+
+    defaults = list(CATEGORICAL_COLUMNS.values())
+    level_lists = [levels[c] for c in CATEGORICAL_COLUMNS]
+    index: List[Dict[str, int]] = [{v: i for i, v in enumerate(lv)} for lv in level_lists]
+    width = max(num_pos + cat_pos) + 1
+    first = True
+
+    while True:
+        table = empty()
+        nums = [table[c] for c in NUMERIC_COLUMNS]
+        cats = [table[c] for c in CATEGORICAL_COLUMNS]
+        seen = 0
+        for r in itertools.islice(rows, chunk_size):
+            seen += 1
+            if len(r) < width:
+                continue
+            try:
+                vals = [float(r[p]) for p in num_pos]
+            except ValueError:
+                continue
+            for col, v in zip(nums, vals):
+                col.append(v)
+            for j, p in enumerate(cat_pos):
+                v = r[p].strip()
+                if not v and defaults[j] is not None:
+                    v = defaults[j]
+                code = index[j].get(v)
+                if code is None:
+                    code = index[j][v] = len(level_lists[j])
+                    level_lists[j].append(v)
+                cats[j].append(code)
+        if not seen and not first:
+            return
+        first = False
+        yield table
+        if chunk_size is None:
+            return
+
+def level_lut(levels: List[str], values: List[str]) -> List[int]:
+    # Code of each of ``values`` in ``levels``, appending the ones it lacks
+    index = {v: i for i, v in enumerate(levels)}
+    lut = []
+    for v in values:
+        if v not in index:
+            index[v] = len(levels)
+            levels.append(v)
+        lut.append(index[v])
+    return lut
+
+def recoder(columns: List[str], luts: Dict[str, List[int]]) -> Callable[[Tuple[Any, ...]], Tuple[Any, ...]]:
+    # Maps a tuple of ``columns`` values through each column's code lut (if any)
+    maps = [luts.get(c) for c in columns]
+    return lambda key: tuple(v if m is None else m[v] for v, m in zip(key, maps))
+
+# Binary cache of a cleaned CSV: CACHE_MAGIC, an 8-byte header length, a JSON
+# header (source key, levels, column layout), then each column's raw array
+# bytes at an 8-byte aligned offset. Reads map the file and hand out
+# memoryviews into it, so nothing is parsed or copied.
+CACHE_MAGIC = b'EDUCOLS1'
+CACHE_ALIGN = 8
+
+def cache_schema() -> Dict[str, Any]:
+    # Anything that changes what clean() produces must invalidate the cache
+    return {'numeric': NUMERIC_COLUMNS, 'categorical': CATEGORICAL_COLUMNS, 'byteorder': sys.byteorder}
+
+def source_key(path: str) -> Dict[str, int]:
+    st = os.stat(path)
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+def write_cache(table: Table, cache_path: str, source: Dict[str, Any]) -> None:
+    layout: Dict[str, Tuple[str, int, int]] = {}
+    offset = 0
+    for name, col in table.columns.items():
+        layout[name] = (typecode(col), offset, len(col))
+        nbytes = len(col) * col.itemsize
+        offset += nbytes + -nbytes % CACHE_ALIGN
+    header = json.dumps({'schema': cache_schema(), 'source': source, 'levels': table.levels,
+                         'columns': layout}, separators=(',', ':')).encode('utf-8')
+    header += b' ' * (-(len(CACHE_MAGIC) + 8 + len(header)) % CACHE_ALIGN)
+    tmp = cache_path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(CACHE_MAGIC + len(header).to_bytes(8, 'little') + header)
+        for col in table.columns.values():
+            data = memoryview(col).cast('B')
+            f.write(data)
+            f.write(bytes(-len(data) % CACHE_ALIGN))
+    os.replace(tmp, cache_path)
+
+def read_cache(cache_path: str) -> Optional[Tuple[Dict[str, Any], Table]]:
+    # (header, table of read-only memoryviews into the mapped file), or None
+    # when the file is missing, foreign or written by a different schema.
+    try:
+        with open(cache_path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    start = len(CACHE_MAGIC) + 8
+    if mapped[:len(CACHE_MAGIC)] != CACHE_MAGIC:
+        return None
+    size = int.from_bytes(mapped[len(CACHE_MAGIC):start], 'little')
+    try:
+        header = json.loads(mapped[start:start + size])
+    except ValueError:
+        return None
+    if header.get('schema') != json.loads(json.dumps(cache_schema())):
+        return None
+    base = start + size
+    view = memoryview(mapped)
+    table = Table()
+    for name, (code, offset, count) in header['columns'].items():
+        nbytes = count * array(code).itemsize
+        if base + offset + nbytes > len(mapped):
+            return None
+        table[name] = view[base + offset:base + offset + nbytes].cast(code)
+        if name in header['levels']:
+            table.levels[name] = header['levels'][name]
+    return header, table
+
+def load_cached(path: str, cache_path: str) -> Optional[Table]:
+    """
+    The cleaned table for ``path`` from the cache, if it was built from this
+    exact file. Size and mtime matching is enough; otherwise the content
+    digest decides (a touched or copied file still hits, and its cache entry
+    is re-keyed).
+    """
+    cached = read_cache(cache_path)
+    if cached is None:
+        return None
+    header, table = cached
+    key, source = source_key(path), header['source']
+    if key == {k: source[k] for k in key}:
+        return table
+    if key['size'] != source['size'] or file_digest(path, key['size']) != source['digest']:
+        return None
+    try:
+        write_cache(table, cache_path, {**key, 'digest': source['digest']})
+    except OSError:
+        pass  # e.g. Windows refuses to replace a mapped file; the digest still matches next time
+    return table
+
+def store_cache(table: Table, path: str, cache_path: str, key: Dict[str, int]) -> None:
+    # ``key`` is the source's stat from before it was parsed; a file that
+    # changed while being parsed is not cached.
+    if source_key(path) != key:
+        return
+    try:
+        write_cache(table, cache_path, {**key, 'digest': file_digest(path, key['size'])})
+    except OSError as e:
+        print(f"  (cache not written: {e})")
 
 # ── 2. K-Means Clustering (k=5) ───────────────────────────────────────────────
 CLUSTER_FEATURES = [
@@ -64,40 +413,181 @@ CLUSTER_FEATURES = [
     'Previous_Scores', 'Tutoring_Sessions', 'Physical_Activity'
 ]
 
-def normalize(data: List[Dict[str, Any]], features: List[str]) -> Tuple[List[Dict[str, Any]], Dict[str, Tuple[float, float]]]:
-    stats: Dict[str, Tuple[float, float]] = {}
+def normalize(data: Table, features: List[str],
+              stats: Optional[Dict[str, Tuple[float, float]]] = None) -> Tuple[Table, Dict[str, Tuple[float, float]]]:
+    # Min-max scale ``features`` into data.norm; pass ``stats`` to reuse
+    # (min, range) pairs computed elsewhere, e.g. over a whole stream.
+    if stats is None:
+        stats = {}
+        for f in features:
+            mn, mx = min(data[f]), max(data[f])
+            stats[f] = (mn, mx - mn if mx != mn else 1.0)
+    data.norm = []
     for f in features:
-        vals = [float(r[f]) for r in data]
-        mn, mx = min(vals), max(vals)
-        stats[f] = (mn, mx - mn if mx != mn else 1.0)
-    
-    for r in data:
-        r['_norm'] = [(float(r[f]) - stats[f][0]) / stats[f][1] for f in features]
+        mn, rng = stats[f]
+        data.norm.append(array('d', [(v - mn) / rng for v in data[f]]))
     return data, stats
 
-def dist(a: List[float], b: List[float]) -> float:
-    return math.sqrt(sum((x - y) ** 2 for x, y in zip(a, b)))
+# Restarts for main(); mini-batch mode kicks in above KMEANS_MINIBATCH_ROWS rows
+KMEANS_RESTARTS = 4
+KMEANS_TOL = 1e-4
+KMEANS_MINIBATCH_ROWS = 200_000
+KMEANS_BATCH_SIZE = 4096
+ASSIGN_CHUNK = 65_536
+
+def _assign(cols: List[Any], centers: List[List[float]]) -> Tuple[List[int], List[float]]:
+    # Nearest center per point and its distance, computed a block of rows at a
+    # time so only ASSIGN_CHUNK point tuples are alive at once. Ties go to the
+    # lower center id.
+    labels: List[int] = []
+    best: List[float] = []
+    for s in range(0, len(cols[0]), ASSIGN_CHUNK):
+        pts = list(zip(*[col[s:s + ASSIGN_CHUNK] for col in cols]))
+        ds = [[math.dist(p, c) for p in pts] for c in centers]
+        mins = list(map(min, *ds)) if len(ds) > 1 else ds[0]
+        labels.extend([r.index(m) for r, m in zip(zip(*ds), mins)])
+        best.extend(mins)
+    return labels, best
+
+def _kmeanspp(cols: List[Any], k: int, rng: random.Random) -> List[List[float]]:
+    # Each new seed costs one distance pass over the rows: only the distances
+    # to the newest seed are computed
+    n = len(cols[0])
+    first = rng.randrange(n)
+    centers = [[col[first] for col in cols]]
+    _, closest = _assign(cols, centers)
+    while len(centers) < k:
+        # Sample the next seed with probability proportional to D(x)^2
+        cum = list(itertools.accumulate(d * d for d in closest))
+        if cum[-1] <= 0.0:
+            idx = rng.randrange(n)
+        else:
+            idx = min(bisect.bisect_right(cum, rng.random() * cum[-1]), n - 1)
+        centers.append([col[idx] for col in cols])
+        _, dist = _assign(cols, centers[-1:])
+        closest = list(map(min, closest, dist))
+    return centers
+
+def _update_centers(cols: List[Any], labels: List[int], centers: List[List[float]]) -> List[List[float]]:
+    k = len(centers)
+    counts = [0] * k
+    for l in labels:
+        counts[l] += 1
+    sums = []
+    for col in cols:
+        s = [0.0] * k
+        for l, x in zip(labels, col):
+            s[l] += x
+        sums.append(s)
+    # Empty clusters keep their previous center
+    return [[sums[j][c] / counts[c] for j in range(len(cols))] if counts[c] else centers[c]
+            for c in range(k)]
+
+def _minibatch_step(cols: List[Any], centers: List[List[float]], seen: List[int],
+                    batch: List[int]) -> List[float]:
+    # Returns each batch point's distance to its center before the update
+    sub = [[col[i] for i in batch] for col in cols]
+    labels, best = _assign(sub, centers)
+    for pos, c in enumerate(labels):
+        seen[c] += 1
+        eta = 1.0 / seen[c]
+        center = centers[c]
+        for j, col in enumerate(sub):
+            center[j] += eta * (col[pos] - center[j])
+    return best
+
+def _mean_variance(cols: List[Any]) -> float:
+    n = len(cols[0])
+    return sum(math.fsum(x * x for x in col) / n - (math.fsum(col) / n) ** 2 for col in cols) / len(cols)
+
+def _kmeans_run(cols: List[Any], k: int, iters: int, tol: float, seed: int, init: Any,
+                batch_size: Optional[int], trace: bool = False) -> Tuple[float, List[int], List[List[float]],
+                                                                         Optional[List[Dict[str, float]]]]:
+    # With ``trace``, also returns the inertia (over the batch in mini-batch
+    # mode) and the largest squared center shift of every iteration.
+    rng = random.Random(seed)
+    steps: Optional[List[Dict[str, float]]] = [] if trace else None
+    n = len(cols[0])
+    if not isinstance(init, str):
+        centers = [list(c) for c in init]
+    elif init == 'k-means++':
+        centers = _kmeanspp(cols, k, rng)
+    else:
+        centers = [[col[i] for col in cols] for i in rng.sample(range(n), k)]
+
+    if batch_size and batch_size < n:
+        # Batch inertia is too noisy to test, so stop on the center shift
+        # relative to the spread of the data
+        limit = tol * _mean_variance(cols)
+        seen = [0] * k
+        for _ in range(iters):
+            before = [c[:] for c in centers]
+            dist = _minibatch_step(cols, centers, seen, rng.sample(range(n), batch_size))
+            shift = max(sum((x - y) ** 2 for x, y in zip(a, b)) for a, b in zip(centers, before))
+            if steps is not None:
+                steps.append({'inertia': sum(d * d for d in dist), 'shift': shift})
+            if shift <= limit:
+                break
+        labels, best = _assign(cols, centers)
+        return sum(d * d for d in best), labels, centers, steps
 
-def kmeans(data: List[Dict[str, Any]], k: int = 5, iters: int = 30) -> Tuple[List[int], List[List[float]]]:
-    random.seed(42)
-    centers = [data[i]['_norm'][:] for i in random.sample(range(len(data)), k)]
-    labels = [0] * len(data)
-    
+    labels: List[int] = []
+    last = math.inf
     for _ in range(iters):
-        for i, r in enumerate(data):
-            dists = [dist(r['_norm'], c) for c in centers]
-            labels[i] = dists.index(min(dists))
-            
-        new_centers = []
-        for c in range(k):
-            members = [data[i]['_norm'] for i in range(len(data)) if labels[i] == c]
-            if members:
-                new_centers.append([sum(x[j] for x in members) / len(members) for j in range(len(CLUSTER_FEATURES))])
-            else:
-                new_centers.append(centers[c])
-        centers = new_centers
-        
-    return labels, centers
+        new_labels, dist = _assign(cols, centers)
+        inertia = sum(d * d for d in dist)
+        new_centers = _update_centers(cols, new_labels, centers)
+        shift = max(sum((x - y) ** 2 for x, y in zip(a, b)) for a, b in zip(new_centers, centers))
+        if steps is not None:
+            steps.append({'inertia': inertia, 'shift': shift})
+        converged = new_labels == labels or last - inertia <= tol * inertia
+        labels, centers, last = new_labels, new_centers, inertia
+        if converged:
+            break
+    labels, best = _assign(cols, centers)
+    return sum(d * d for d in best), labels, centers, steps
+
+def restart_seeds(seed: int, n_init: int) -> List[int]:
+    # Independent sub-seeds for the restarts, drawn from a private Random(seed)
+    rng = random.Random(seed)
+    return [rng.getrandbits(32) for _ in range(n_init)]
+
+def best_restart(seeds: List[int], runs: List[Tuple[float, Any, List[List[float]], Any]],
+                 trace: Optional[List[Dict[str, Any]]] = None) -> Tuple[Any, List[List[float]]]:
+    # Lowest inertia wins, the earliest restart on ties, so the result does not
+    # depend on how the restarts were scheduled
+    best = min(range(len(runs)), key=lambda r: runs[r][0])
+    if trace is not None:
+        trace.extend({'seed': s, 'inertia': inertia, 'best': r == best, 'iterations': steps}
+                     for r, (s, (inertia, _, _, steps)) in enumerate(zip(seeds, runs)))
+    return runs[best][1], runs[best][2]
+
+def kmeans(data: Table, k: int = 5, iters: int = 30, tol: float = KMEANS_TOL, n_init: int = 1,
+           init: Any = 'k-means++', batch_size: Optional[int] = None, workers: int = 1,
+           seed: int = 42, trace: Optional[List[Dict[str, Any]]] = None) -> Tuple[List[int], List[List[float]]]:
+    """
+    Lloyd's K-Means over the normalized columns (``data.norm``).
+
+    ``init`` is 'k-means++', 'random', or a list of k starting centers (warm
+    start, run once). Stops early once labels stop changing or an iteration
+    lowers the inertia by less than ``tol`` (relative). With ``batch_size``
+    set, runs mini-batch K-Means, stopping once no center moves more than
+    ``tol`` times the mean feature variance, and labels every row in a final
+    pass. The ``n_init`` restarts use restart_seeds(seed) and run in a
+    process pool when ``workers > 1``; the lowest-inertia run wins, so the
+    result is the same for any worker count. Pass a list as ``trace`` to have
+    every restart's inertia and per-iteration inertia and center shift
+    appended to it.
+    """
+    cols = data.norm
+    seeds = restart_seeds(seed, n_init) if isinstance(init, str) else [seed]
+    args = [(cols, k, iters, tol, s, init, batch_size, trace is not None) for s in seeds]
+    if workers > 1 and len(seeds) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(seeds))) as pool:
+            runs = list(pool.map(_kmeans_run, *zip(*args)))
+    else:
+        runs = [_kmeans_run(*a) for a in args]
+    return best_restart(seeds, runs, trace)
 
 PERSONA_PROFILES = [
     {
@@ -167,199 +657,1568 @@ PERSONA_PROFILES = [
     }
 ]
 
-def assign_persona_by_score(data: List[Dict[str, Any]]) -> List[int]:
-    """
-    Assign persona labels using the same score-first rules as resolvePersona() in app.js.
-    
-    Persona IDs:
-      0 = Driven Achiever    — high current exam score + solid attendance
-      1 = Consistent Worker  — solid attendance, moderate-good scores
-      2 = Passive Coaster    — mid-range metrics, coasting
-      3 = Struggling Learner — low score / low attendance / at-risk
-      4 = Potential Bloomer  — high previous score but underperforming now
-    
-    Cluster averages (for reference):
-      DA:  avg_score ~70, avg_attend ~90%
-      CW:  avg_score ~68, avg_attend ~89%
-      PC:  avg_score ~68, avg_attend ~88%
-      SL:  avg_score ~65, avg_attend ~69%
-      PB:  avg_score ~66, avg_attend ~70%
-    """
-    labels = []
-    for r in data:
-        score  = float(r['Exam_Score'])
-        attend = float(r['Attendance'])
-        prev   = float(r['Previous_Scores'])
-
-        # Score < 63 → never a Driven Achiever or Consistent Worker
-        if score < 63:
-            if prev >= 78:
-                labels.append(4)  # Potential Bloomer (had strong past, slipped)
-            else:
-                labels.append(3)  # Struggling Learner
-
-        # Score 63–69 → at most Consistent Worker
-        elif score < 70:
-            if attend >= 85:
-                labels.append(1)  # Consistent Worker (high attend saves them)
-            elif prev >= 80 and score < prev - 8:
-                labels.append(4)  # Potential Bloomer (was once much better)
-            elif attend >= 75:
-                labels.append(2)  # Passive Coaster
-            elif attend < 72:
-                labels.append(3)  # Struggling Learner (low attend + low score)
+# ── 3. Risk & Persona Rules ────────────────────────────────────────────────────
+# Both rule sets are plain data: they are compiled here into whole-column
+# operations, and shipped in data.js ('rules') where app.js generates its
+# evaluators from them, so a rule edit is made once, here.
+RISK_LEVELS = ['High', 'Medium', 'Low']
+
+# Composite risk: each rule adds the points of the first ``value < bound`` band
+# (bounds ascending) or of the row's level; the total is labelled
+# RISK_LEVELS[i] for the first minimum in 'labels' it reaches.
+RISK_RULES: Dict[str, Any] = {
+    'points': [
+        {'column': 'Attendance', 'below': [[70.0, 2], [80.0, 1]]},
+        {'column': 'Motivation_Level', 'levels': {'Low': 2, 'Medium': 1}},
+        {'column': 'Exam_Score', 'below': [[62.0, 2], [67.0, 1]]},
+        {'column': 'Internet_Access', 'levels': {'No': 1}},
+        {'column': 'Learning_Disabilities', 'levels': {'Yes': 1}},
+        {'column': 'Hours_Studied', 'below': [[10.0, 1]]},
+        {'column': 'Peer_Influence', 'levels': {'Negative': 1}},
+    ],
+    'labels': [5, 3, 0],
+}
+
+# Persona decision list, score-first; the first rule whose conditions all hold
+# wins. A condition is [column, '<' | '>=', bound], where the bound is a number
+# or [column, offset] (compare against another column plus an offset).
+#   0 = Driven Achiever    — high current exam score + solid attendance
+#   1 = Consistent Worker  — solid attendance, moderate-good scores
+#   2 = Passive Coaster    — mid-range metrics, coasting
+#   3 = Struggling Learner — low score / low attendance / at-risk
+#   4 = Potential Bloomer  — high previous score but underperforming now
+# Cluster averages (for reference):
+#   DA:  avg_score ~70, avg_attend ~90%    SL:  avg_score ~65, avg_attend ~69%
+#   CW:  avg_score ~68, avg_attend ~89%    PB:  avg_score ~66, avg_attend ~70%
+#   PC:  avg_score ~68, avg_attend ~88%
+PERSONA_RULES: List[Dict[str, Any]] = [
+    # Score < 63 → never a Driven Achiever or Consistent Worker
+    {'when': [['Exam_Score', '<', 63], ['Previous_Scores', '>=', 78]], 'persona': 4},  # had strong past, slipped
+    {'when': [['Exam_Score', '<', 63]], 'persona': 3},
+    # Score 63–69 → at most Consistent Worker
+    {'when': [['Exam_Score', '<', 70], ['Attendance', '>=', 85]], 'persona': 1},  # high attend saves them
+    {'when': [['Exam_Score', '<', 70], ['Previous_Scores', '>=', 80],
+              ['Exam_Score', '<', ['Previous_Scores', -8]]], 'persona': 4},  # was once much better
+    {'when': [['Exam_Score', '<', 70], ['Attendance', '>=', 75]], 'persona': 2},
+    {'when': [['Exam_Score', '<', 70], ['Attendance', '<', 72]], 'persona': 3},  # low attend + low score
+    {'when': [['Exam_Score', '<', 70]], 'persona': 2},
+    # Score 70–74 → DA only with solid attendance
+    {'when': [['Exam_Score', '<', 75], ['Attendance', '>=', 82]], 'persona': 0},
+    {'when': [['Exam_Score', '<', 75], ['Attendance', '>=', 72]], 'persona': 1},
+    {'when': [['Exam_Score', '<', 75], ['Previous_Scores', '>=', 78]], 'persona': 4},  # dropping from past highs
+    {'when': [['Exam_Score', '<', 75]], 'persona': 3},
+    # Score ≥ 75 → Driven Achiever unconditionally
+    {'when': [], 'persona': 0},
+]
+
+# Both compiled tables evaluate a column at a time with "lanes": per-row small
+# integers are packed into one byte (or two) each and the packed buffer read as
+# a single Python int, so adding two columns row-wise is one big-int add
+# (no lane ever carries into the next), and a final bytes.translate or lookup
+# maps the packed results through the precomputed table.
+def _lanes(values: Iterable[int], typecode: str = 'B') -> int:
+    packed = bytes(values) if typecode == 'B' else array(typecode, values).tobytes()
+    return int.from_bytes(packed, sys.byteorder)
+
+def _unlanes(packed: int, n: int, typecode: str = 'B') -> array:
+    out = array(typecode)
+    out.frombytes(packed.to_bytes(n * out.itemsize, sys.byteorder))
+    return out
+
+def _translation(values: List[int]) -> bytes:
+    return bytes(values) + bytes(256 - len(values))
+
+class PointRules:
+    """
+    Compiled RISK_RULES. A band rule bisects its column into bins and
+    translates bins to points (NaN lands past the last bound: no points); a
+    level rule maps category codes to points. Totals are summed in byte lanes.
+    """
+
+    def __init__(self, spec: Dict[str, Any]) -> None:
+        self.bands: List[Tuple[str, List[float], bytes]] = []
+        self.levels: List[Tuple[str, Dict[str, int]]] = []
+        top = 0
+        for rule in spec['points']:
+            points = [p for _, p in rule['below']] if 'below' in rule else list(rule['levels'].values())
+            # Lanes carry into each other: a negative point would borrow from the next row
+            if not all(isinstance(p, int) and p >= 0 for p in points):
+                raise ValueError(f"{rule['column']}: points must be non-negative integers")
+            if 'below' in rule:
+                bounds = [float(b) for b, _ in rule['below']]
+                if bounds != sorted(bounds):
+                    raise ValueError(f"{rule['column']}: band bounds must be ascending")
+                self.bands.append((rule['column'], bounds, _translation(points + [0])))
             else:
-                labels.append(2)  # Passive Coaster (default mid-range)
-
-        # Score 70–74 → DA only with solid attendance
-        elif score < 75:
-            if attend >= 82:
-                labels.append(0)  # Driven Achiever
-            elif attend >= 72:
-                labels.append(1)  # Consistent Worker
-            elif prev >= 78:
-                labels.append(4)  # Potential Bloomer (dropping from past highs)
+                self.levels.append((rule['column'], rule['levels']))
+            top += max(points, default=0)
+        if top > 127:
+            raise ValueError(f'risk points can total {top} per row; a lane holds at most 127')
+        mins = spec['labels']
+        if mins != sorted(mins, reverse=True) or not mins or mins[-1] > 0:
+            raise ValueError('risk label minimums must be descending and end at 0 or below')
+        self.labels = _translation([next(i for i, m in enumerate(mins) if s >= m) for s in range(top + 1)])
+
+    def evaluate(self, data: Table) -> Tuple[array, array]:
+        total = 0
+        for column, bounds, points in self.bands:
+            bins = bytes(map(functools.partial(bisect.bisect_right, bounds), data[column]))
+            total += int.from_bytes(bins.translate(points), sys.byteorder)
+        for column, points in self.levels:
+            lut = [points.get(level, 0) for level in data.levels[column]]
+            total += _lanes(map(lut.__getitem__, data[column]))
+        scores = total.to_bytes(len(data), sys.byteorder)
+        return array('b', scores), array('B', scores.translate(self.labels))
+
+class DecisionTable:
+    """
+    Compiled first-match rule list. Every column is cut at the bounds its
+    conditions use (NaN gets a bin of its own) and each relational condition
+    adds a 0/1 axis; the outcome of every bin combination is precomputed, so
+    a row is reduced to one cell index, summed in lanes, and looked up once.
+    """
+
+    def __init__(self, rules: List[Dict[str, Any]], outcome: str) -> None:
+        cuts: Dict[str, set] = {}
+        self.relations: List[Tuple[str, str, str, float]] = []
+        for rule in rules:
+            for column, op, bound in rule['when']:
+                if op not in ('<', '>='):
+                    raise ValueError(f"unsupported operator {op!r} (use '<' or '>=')")
+                if isinstance(bound, list):
+                    rel = (column, op, bound[0], float(bound[1]))
+                    if rel not in self.relations:
+                        self.relations.append(rel)
+                else:
+                    cuts.setdefault(column, set()).add(float(bound))
+        self.cuts = {c: sorted(v) for c, v in cuts.items()}
+
+        # Axis sizes: value bins, then the NaN bin, per column; 2 per relation
+        sizes = [len(v) + 2 for v in self.cuts.values()] + [2] * len(self.relations)
+        self.strides = [math.prod(sizes[i + 1:]) for i in range(len(sizes))]
+        cells = math.prod(sizes)
+        if cells > 1 << 16:
+            raise ValueError(f'{cells} rule table cells; use fewer distinct bounds')
+        self.lane = 'B' if cells <= 1 << 8 else 'H'
+        axis = {c: i for i, c in enumerate(self.cuts)}
+
+        def holds(cell: Tuple[int, ...], column: str, op: str, bound: Any) -> bool:
+            if isinstance(bound, list):
+                i = len(self.cuts) + self.relations.index((column, op, bound[0], float(bound[1])))
+                return cell[i] == 1
+            b, bounds = cell[axis[column]], self.cuts[column]
+            if b > len(bounds):
+                return False  # NaN
+            # bin b holds bounds[b-1] <= v < bounds[b]
+            j = bounds.index(float(bound))
+            return j >= b if op == '<' else j < b
+
+        table = []
+        for cell in itertools.product(*map(range, sizes)):
+            for rule in rules:
+                if all(holds(cell, *cond) for cond in rule['when']):
+                    table.append(rule[outcome])
+                    break
             else:
-                labels.append(3)  # Struggling Learner
+                raise ValueError('rule list needs a final catch-all rule')
+        self.table = array('b', table)
+        self.translation = _translation(table) if self.lane == 'B' else b''
 
-        # Score ≥ 75 → Driven Achiever unconditionally
-        else:
-            labels.append(0)
-
-    return labels
-
-
-# ── 3. Risk Scoring ────────────────────────────────────────────────────────────
-def compute_risk(row: Dict[str, Any]) -> Tuple[int, str]:
-    score = 0
-    if row['Attendance'] < 70.0:
-        score += 2
-    elif row['Attendance'] < 80.0:
-        score += 1
-        
-    if row['Motivation_Level'] == 'Low':
-        score += 2
-    elif row['Motivation_Level'] == 'Medium':
-        score += 1
-        
-    if row['Exam_Score'] < 62.0:
-        score += 2
-    elif row['Exam_Score'] < 67.0:
-        score += 1
-        
-    if row['Internet_Access'] == 'No':
-        score += 1
-    if row['Learning_Disabilities'] == 'Yes':
-        score += 1
-    if row['Hours_Studied'] < 10.0:
-        score += 1
-    if row['Peer_Influence'] == 'Negative':
-        score += 1
-        
-    risk_label = 'High' if score >= 5 else ('Medium' if score >= 3 else 'Low')
-    return score, risk_label
+    def evaluate(self, data: Table) -> array:
+        n = len(data)
+        index = 0
+        for (column, bounds), stride in zip(self.cuts.items(), self.strides):
+            col = data[column]
+            bins = map(functools.partial(bisect.bisect_right, bounds), col)
+            if any(map(math.isnan, col)):
+                nan = len(bounds) + 1
+                bins = (nan if v != v else b for v, b in zip(col, bins))
+            index += _lanes(bins, self.lane) * stride
+        for (column, op, other, offset), stride in zip(self.relations, self.strides[len(self.cuts):]):
+            compare = operator.lt if op == '<' else operator.ge
+            index += _lanes(map(compare, data[column], map(offset.__add__, data[other])), self.lane) * stride
+        if self.lane == 'B':
+            return array('b', index.to_bytes(n, sys.byteorder).translate(self.translation))
+        return array('b', map(self.table.__getitem__, _unlanes(index, n, self.lane)))
+
+RISK_TABLE = PointRules(RISK_RULES)
+PERSONA_TABLE = DecisionTable(PERSONA_RULES, 'persona')
+
+def compute_risk(data: Table) -> Tuple[array, array]:
+    """Whole-column risk scoring; returns (risk_score, risk_label codes into RISK_LEVELS)."""
+    return RISK_TABLE.evaluate(data)
+
+def assign_persona_by_score(data: Table) -> array:
+    """Persona labels from PERSONA_RULES (the same table resolvePersona() in app.js runs)."""
+    return PERSONA_TABLE.evaluate(data)
+
+def rules_spec() -> Dict[str, Any]:
+    # Shipped to the dashboard; 'fields' maps columns to the roster's short names
+    return {'risk': RISK_RULES, 'risk_levels': RISK_LEVELS, 'persona': PERSONA_RULES,
+            'fields': {col: field for field, col in ROSTER_FIELDS.items()}}
 
 # ── 4. Pearson Correlation ─────────────────────────────────────────────────────
-def pearson(xs: List[float], ys: List[float]) -> float:
-    n = len(xs)
-    if n == 0:
-        return 0.0
-    mx, my = sum(xs) / n, sum(ys) / n
-    num = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
-    den = math.sqrt(sum((x - mx) ** 2 for x in xs) * sum((y - my) ** 2 for y in ys))
-    return num / den if den != 0 else 0.0
-
-def encode_cat(vals: List[str], order: List[str]) -> List[float]:
-    return [float(order.index(v)) if v in order else 0.0 for v in vals]
-
-def compute_correlations(data: List[Dict[str, Any]]) -> Dict[str, float]:
-    scores = [float(r['Exam_Score']) for r in data]
-    features: Dict[str, List[float]] = {
-        'Hours Studied': [float(r['Hours_Studied']) for r in data],
-        'Attendance': [float(r['Attendance']) for r in data],
-        'Sleep Hours': [float(r['Sleep_Hours']) for r in data],
-        'Previous Scores': [float(r['Previous_Scores']) for r in data],
-        'Tutoring Sessions': [float(r['Tutoring_Sessions']) for r in data],
-        'Physical Activity': [float(r['Physical_Activity']) for r in data],
-        'Motivation': encode_cat([str(r['Motivation_Level']) for r in data], ['Low', 'Medium', 'High']),
-        'Parental Involvement': encode_cat([str(r['Parental_Involvement']) for r in data], ['Low', 'Medium', 'High']),
-        'Access to Resources': encode_cat([str(r['Access_to_Resources']) for r in data], ['Low', 'Medium', 'High']),
-        'Peer Influence': encode_cat([str(r['Peer_Influence']) for r in data], ['Negative', 'Neutral', 'Positive']),
-        'Internet Access': encode_cat([str(r['Internet_Access']) for r in data], ['No', 'Yes']),
-        'Teacher Quality': encode_cat([str(r['Teacher_Quality']) for r in data], ['Low', 'Medium', 'High']),
-        'Family Income': encode_cat([str(r['Family_Income']) for r in data], ['Low', 'Medium', 'High']),
-        'Extracurricular': encode_cat([str(r['Extracurricular_Activities']) for r in data], ['No', 'Yes']),
-        'School Type': encode_cat([str(r['School_Type']) for r in data], ['Public', 'Private']),
-    }
-    corr = {name: round(pearson(vals, scores), 4) for name, vals in features.items()}
+def encode_cat(data: Table, name: str, order: List[str]) -> List[float]:
+    lut = [float(order.index(v)) if v in order else 0.0 for v in data.levels[name]]
+    return [lut[c] for c in data[name]]
+
+# Display name -> numeric column, or (categorical column, ordinal level order)
+CORRELATION_FEATURES: Dict[str, Any] = {
+    'Hours Studied': 'Hours_Studied',
+    'Attendance': 'Attendance',
+    'Sleep Hours': 'Sleep_Hours',
+    'Previous Scores': 'Previous_Scores',
+    'Tutoring Sessions': 'Tutoring_Sessions',
+    'Physical Activity': 'Physical_Activity',
+    'Motivation': ('Motivation_Level', ['Low', 'Medium', 'High']),
+    'Parental Involvement': ('Parental_Involvement', ['Low', 'Medium', 'High']),
+    'Access to Resources': ('Access_to_Resources', ['Low', 'Medium', 'High']),
+    'Peer Influence': ('Peer_Influence', ['Negative', 'Neutral', 'Positive']),
+    'Internet Access': ('Internet_Access', ['No', 'Yes']),
+    'Teacher Quality': ('Teacher_Quality', ['Low', 'Medium', 'High']),
+    'Family Income': ('Family_Income', ['Low', 'Medium', 'High']),
+    'Extracurricular': ('Extracurricular_Activities', ['No', 'Yes']),
+    'School Type': ('School_Type', ['Public', 'Private']),
+}
+
+CORRELATION_TARGET = 'Exam Score'
+CORRELATION_NAMES = list(CORRELATION_FEATURES) + [CORRELATION_TARGET]
+
+# Rows per block when building correlation vectors, bounding temporaries
+CORRELATION_BLOCK = 65_536
+
+def feature_vectors(data: Table) -> List[Any]:
+    # One vector per CORRELATION_NAMES entry, Exam_Score last
+    vecs = [data[f] if isinstance(f, str) else encode_cat(data, *f) for f in CORRELATION_FEATURES.values()]
+    return vecs + [data['Exam_Score']]
+
+class CoMoments:
+    """
+    Mergeable one-pass Pearson state for a set of columns: row count, means
+    and the full co-moment matrix. Blocks are centred on their own means and
+    merged with the pairwise update of Chan et al., so any chunking of the
+    stream gives the same matrix up to rounding.
+    """
+
+    def __init__(self, p: int) -> None:
+        self.n = 0
+        self.mean = [0.0] * p
+        self.cm = [[0.0] * p for _ in range(p)]
+
+    def update(self, vectors: List[Any]) -> None:
+        nb = len(vectors[0]) if vectors else 0
+        if not nb:
+            return
+        block = CoMoments(len(vectors))
+        block.n = nb
+        block.mean = [sum(v) / nb for v in vectors]
+        devs = [[x - m for x in v] for v, m in zip(vectors, block.mean)]
+        for i, di in enumerate(devs):
+            for j in range(i, len(devs)):
+                block.cm[i][j] = block.cm[j][i] = sum(map(operator.mul, di, devs[j]))
+        self.merge(block)
+
+    def merge(self, other: 'CoMoments') -> None:
+        na, nb = self.n, other.n
+        n = na + nb
+        if not nb:
+            return
+        delta = [b - a for a, b in zip(self.mean, other.mean)]
+        p = len(delta)
+        for i in range(p):
+            for j in range(i, p):
+                c = self.cm[i][j] + other.cm[i][j] + delta[i] * delta[j] * na * nb / n
+                self.cm[i][j] = self.cm[j][i] = c
+        self.mean = [m + d * nb / n for m, d in zip(self.mean, delta)]
+        self.n = n
+
+    def corr(self, i: int, j: int) -> float:
+        den = math.sqrt(self.cm[i][i] * self.cm[j][j])
+        return self.cm[i][j] / den if den != 0 else 0.0
+
+    def matrix(self) -> List[List[float]]:
+        p = len(self.mean)
+        return [[self.corr(i, j) for j in range(p)] for i in range(p)]
+
+    def to_state(self) -> Dict[str, Any]:
+        return {'n': self.n, 'mean': self.mean, 'cm': self.cm}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'CoMoments':
+        out = cls(len(state['mean']))
+        out.n, out.mean, out.cm = state['n'], state['mean'], state['cm']
+        return out
+
+def rank_correlations(corr: Dict[str, float]) -> Dict[str, float]:
+    corr = {name: round(r, 4) for name, r in corr.items()}
     return dict(sorted(corr.items(), key=lambda x: abs(x[1]), reverse=True))
 
+def score_correlations(moments: CoMoments) -> Dict[str, float]:
+    # Each feature against Exam_Score, strongest first (the Feature Impact chart)
+    t = len(CORRELATION_NAMES) - 1
+    return rank_correlations({name: moments.corr(i, t) for i, name in enumerate(CORRELATION_FEATURES)})
+
+def spearman_matrix(data: Table) -> List[List[float]]:
+    """
+    Spearman rank correlation: Pearson over average ranks (ties share a rank).
+    NaN values are left unranked and propagate like they do in Pearson's r.
+    """
+    moments = CoMoments(len(CORRELATION_NAMES))
+    vectors = feature_vectors(data)
+    luts = []
+    for v in vectors:
+        lut: Dict[float, float] = {}
+        below = 0
+        for value, count in sorted(Counter(x for x in v if x == x).items()):
+            lut[value] = below + (count + 1) / 2
+            below += count
+        luts.append(lut)
+    for s in range(0, len(data), CORRELATION_BLOCK):
+        moments.update([[lut.get(x, math.nan) for x in v[s:s + CORRELATION_BLOCK]]
+                        for v, lut in zip(vectors, luts)])
+    return moments.matrix()
+
+def _bootstrap_replicates(vectors: List[array], seeds: List[int]) -> List[List[float]]:
+    # Feature-vs-score Pearson r for each resample; runs in worker processes.
+    n = len(vectors[0])
+    out = []
+    for seed in seeds:
+        take = operator.itemgetter(*random.Random(seed).choices(range(n), k=n))
+        ys = take(vectors[-1])
+        sy, syy = sum(ys), sum(map(operator.mul, ys, ys))
+        rs = []
+        for v in vectors[:-1]:
+            xs = take(v)
+            sx, sxx, sxy = sum(xs), sum(map(operator.mul, xs, xs)), sum(map(operator.mul, xs, ys))
+            den = math.sqrt(max(n * sxx - sx * sx, 0.0) * max(n * syy - sy * sy, 0.0))
+            rs.append((n * sxy - sx * sy) / den if den != 0 else 0.0)
+        out.append(rs)
+    return out
+
+def bootstrap_seeds(replicates: int, workers: int, seed: int = 42) -> List[List[int]]:
+    # Replicate b always uses seed + b; split into one batch per worker
+    seeds = [seed + b for b in range(replicates)]
+    step = -(-replicates // max(workers, 1))
+    return [seeds[i:i + step] for i in range(0, replicates, step)]
+
+def bootstrap_interval(runs: List[List[float]], level: float = 0.95) -> Dict[str, List[float]]:
+    replicates = len(runs)
+    tail = (1.0 - level) / 2
+    lo, hi = int(math.floor(tail * (replicates - 1))), int(math.ceil((1.0 - tail) * (replicates - 1)))
+    ci = {}
+    for i, name in enumerate(CORRELATION_FEATURES):
+        vals = sorted(r[i] for r in runs)
+        ci[name] = [round(vals[lo], 4), round(vals[hi], 4)]
+    return ci
+
+def bootstrap_ci(data: Table, replicates: int, workers: int = 1, seed: int = 42,
+                 level: float = 0.95) -> Dict[str, List[float]]:
+    """
+    Percentile bootstrap confidence intervals for each feature's correlation
+    with Exam_Score. Replicate b resamples with seed ``seed + b`` and the
+    replicates are split across a process pool, so results do not depend on
+    the worker count.
+    """
+    if replicates <= 0 or len(data) < 2:
+        return {}
+    vectors = [array('d', v) for v in feature_vectors(data)]
+    batches = bootstrap_seeds(replicates, workers, seed)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = pool.map(_bootstrap_replicates, itertools.repeat(vectors), batches)
+            runs = [r for part in parts for r in part]
+    else:
+        runs = _bootstrap_replicates(vectors, batches[0])
+    return bootstrap_interval(runs, level)
+
+def correlation_matrix(pearson_m: List[List[float]], spearman_m: List[List[float]]) -> Dict[str, Any]:
+    return {
+        'features': CORRELATION_NAMES,
+        'pearson': [[round(r, 4) for r in row] for row in pearson_m],
+        'spearman': [[round(r, 4) for r in row] for row in spearman_m],
+    }
+
 # ── 5. Aggregates ──────────────────────────────────────────────────────────────
-def avg(lst: List[float]) -> float:
-    return round(sum(lst) / len(lst), 2) if lst else 0.0
-
-def score_distribution(data: List[Dict[str, Any]]) -> Dict[str, Any]:
-    buckets = list(range(55, 102, 3))
-    counts = [0] * len(buckets)
-    for r in data:
-        s = float(r['Exam_Score'])
-        for i, b in enumerate(buckets):
-            if s <= float(b) or i == len(buckets) - 1:
-                counts[i] += 1
+# Each summary block is a spec: an optional group key, how rows map to groups,
+# and the metrics to report. Metric values are (column, 'mean'|'sum'|'min'|'max')
+# for numeric columns, (column, 'quantiles') for its QUANTILE_PROBS quantiles
+# from a QuantileSketch, or (column, level) to count rows with that level.
+#   key only        → categorical groups in first-seen order
+#   allowed         → levels outside the list are pooled as 'Other'
+#   slots           → integer key 0..slots-1, all slots reported
+#   buckets         → half-open [min, max) ranges, all buckets reported
+#   edges           → first edge >= value, overflow (and NaN) goes to the last edge
+ATTEND_BUCKETS = [
+    {'label': '<60%', 'min': 0.0, 'max': 60.0},
+    {'label': '60-70%', 'min': 60.0, 'max': 70.0},
+    {'label': '70-80%', 'min': 70.0, 'max': 80.0},
+    {'label': '80-90%', 'min': 80.0, 'max': 90.0},
+    {'label': '90%+', 'min': 90.0, 'max': 101.0},
+]
+
+HOUR_BUCKETS = [
+    {'label': '0-10h', 'min': 0.0, 'max': 10.0},
+    {'label': '10-20h', 'min': 10.0, 'max': 20.0},
+    {'label': '20-30h', 'min': 20.0, 'max': 30.0},
+    {'label': '30-40h', 'min': 30.0, 'max': 40.0},
+    {'label': '40h+', 'min': 40.0, 'max': 999.0},
+]
+
+SCORE = ('Exam_Score', 'mean')
+HOURS = ('Hours_Studied', 'mean')
+ATTEND = ('Attendance', 'mean')
+LMH = ['Low', 'Medium', 'High']
+SPREAD = {'score': ('Exam_Score', 'quantiles'), 'attend': ('Attendance', 'quantiles'),
+          'hours': ('Hours_Studied', 'quantiles'), 'prev': ('Previous_Scores', 'quantiles')}
+
+AGGREGATES: Dict[str, Dict[str, Any]] = {
+    'kpis': {'metrics': {'avg_score': SCORE, 'avg_attend': ATTEND, 'avg_hours': HOURS,
+                         'high_risk': ('risk_label', 'High'), 'medium_risk': ('risk_label', 'Medium'),
+                         'low_risk': ('risk_label', 'Low')}},
+    'clusters': {'key': 'persona', 'slots': 5,
+                 'metrics': {'avg_score': SCORE, 'avg_hours': HOURS, 'avg_attend': ATTEND,
+                             'avg_tutor': ('Tutoring_Sessions', 'mean'), 'avg_sleep': ('Sleep_Hours', 'mean'),
+                             'avg_prev': ('Previous_Scores', 'mean'), 'risk_high': ('risk_label', 'High')}},
+    'score_dist': {'key': 'Exam_Score', 'edges': list(range(55, 102, 3)), 'metrics': {}},
+    'by_school': {'key': 'School_Type', 'metrics': {'avg_score': SCORE, 'avg_hours': HOURS, 'avg_attend': ATTEND}},
+    'by_gender': {'key': 'Gender', 'metrics': {'avg_score': SCORE, 'avg_hours': HOURS}},
+    'by_motiv': {'key': 'Motivation_Level', 'allowed': LMH, 'metrics': {'avg_score': SCORE, 'avg_attend': ATTEND}},
+    'by_parent': {'key': 'Parental_Involvement', 'allowed': LMH, 'metrics': {'avg_score': SCORE}},
+    'by_income': {'key': 'Family_Income', 'allowed': LMH, 'metrics': {'avg_score': SCORE}},
+    'by_resources': {'key': 'Access_to_Resources', 'allowed': LMH, 'metrics': {'avg_score': SCORE}},
+    'attend_score': {'key': 'Attendance', 'buckets': ATTEND_BUCKETS, 'metrics': {'avg_score': SCORE}},
+    'hour_score': {'key': 'Hours_Studied', 'buckets': HOUR_BUCKETS, 'metrics': {'avg_score': SCORE}},
+    # Box plot / percentile band data, exported as ANALYTICS.quantiles
+    'q_all': {'metrics': SPREAD},
+    'q_persona': {'key': 'persona', 'slots': 5, 'metrics': SPREAD},
+    'q_risk': {'key': 'risk_label', 'metrics': SPREAD},
+    'q_school': {'key': 'School_Type', 'metrics': SPREAD},
+    'q_gender': {'key': 'Gender', 'metrics': SPREAD},
+    'q_motiv': {'key': 'Motivation_Level', 'allowed': LMH, 'metrics': SPREAD},
+}
+NUMERIC_AGGS = ('mean', 'sum', 'min', 'max')
+QUANTILE_PROBS = [0.0, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 1.0]
+
+def mean(total: float, count: int) -> float:
+    return round(total / count, 2) if count else 0.0
+
+def binner(spec: Dict[str, Any]) -> Callable[[float], Optional[int]]:
+    # Bin index of a value for a 'buckets' or 'edges' spec (None: outside every bucket)
+    if 'buckets' in spec:
+        lows = [b['min'] for b in spec['buckets']]
+        highs = [b['max'] for b in spec['buckets']]
+        def in_bucket(v: float) -> Optional[int]:
+            i = bisect.bisect_right(lows, v) - 1
+            return i if i >= 0 and v < highs[i] else None
+        return in_bucket
+    edges = spec['edges']
+    last = len(edges) - 1
+    # NaN fails every comparison, so bisect would put it first; it overflows instead
+    return lambda v: min(bisect.bisect_left(edges, v), last) if v == v else last
+
+def bin_labels(spec: Dict[str, Any]) -> List[str]:
+    return [b['label'] for b in spec['buckets']] if 'buckets' in spec else [str(e) for e in spec['edges']]
+
+# KLL accuracy: rank error is about 1.7 / SKETCH_K of the rows. Sketches are
+# fed a block of rows at a time, grouped by slot.
+SKETCH_K = 200
+SKETCH_MIN_WIDTH = 8
+SKETCH_BLOCK = 65_536
+
+class QuantileSketch:
+    """
+    KLL quantile sketch (Karnin, Lang & Liberty). Values sit in a stack of
+    levels, where a value on level h stands for 2**h rows; a full level is
+    sorted and every other value promoted, so memory stays O(SKETCH_K)
+    however many rows are added (values are taken in batches, compacted
+    together). Sketches of any split of the rows merge.
+    Which half survives alternates per level instead of a coin flip, so
+    results are deterministic; the exact minimum and maximum are kept.
+    """
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.size = 0
+        self.levels: List[List[float]] = [[]]
+        self.flips = [0]
+        self.lo, self.hi = math.inf, -math.inf
+        self.max_size = self._capacity(0)
+
+    def _capacity(self, h: int) -> int:
+        depth = len(self.levels) - h - 1
+        return max(SKETCH_MIN_WIDTH, int(SKETCH_K * (2 / 3) ** depth + 0.5))
+
+    def extend(self, values: Iterable[float]) -> None:
+        level = self.levels[0]
+        before = len(level)
+        level.extend(values)
+        self.n += len(level) - before
+        self.size += len(level) - before
+        while self.size >= self.max_size:
+            self._compress()
+
+    def _compress(self) -> None:
+        for h, level in enumerate(self.levels):
+            if len(level) < self._capacity(h):
+                continue
+            if h + 1 == len(self.levels):
+                self.levels.append([])
+                self.flips.append(0)
+                self.max_size = sum(map(self._capacity, range(len(self.levels))))
+            level.sort()
+            self.lo, self.hi = min(self.lo, level[0]), max(self.hi, level[-1])
+            odd = len(level) % 2
+            self.levels[h + 1].extend(level[self.flips[h]:len(level) - odd:2])
+            self.levels[h] = level[len(level) - odd:]
+            self.flips[h] ^= 1
+            self.size -= (len(level) - odd) // 2
+            if self.size < self.max_size:
+                return
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+            self.flips.append(0)
+        for mine, theirs in zip(self.levels, other.levels):
+            mine.extend(theirs)
+        self.n += other.n
+        self.size += other.size
+        self.lo, self.hi = min(self.lo, other.lo), max(self.hi, other.hi)
+        self.max_size = sum(map(self._capacity, range(len(self.levels))))
+        while self.size >= self.max_size:
+            self._compress()
+
+    def quantiles(self, probs: List[float]) -> List[float]:
+        if not self.n:
+            return [0.0] * len(probs)
+        items = sorted((v, 1 << h) for h, level in enumerate(self.levels) for v in level)
+        lo = min(self.lo, items[0][0])
+        hi = max(self.hi, items[-1][0])
+        total = sum(w for _, w in items)
+        out, i, seen = [], 0, 0
+        for q in probs:
+            # Smallest value whose weighted rank reaches q of the rows
+            while i < len(items) - 1 and seen + items[i][1] < q * total:
+                seen += items[i][1]
+                i += 1
+            v = lo if q <= 0 else hi if q >= 1 else items[i][0]
+            out.append(round(v, 2))
+        return out
+
+    def to_state(self) -> Dict[str, Any]:
+        return {'n': self.n, 'levels': self.levels, 'flips': self.flips,
+                'lo': self.lo if self.n else None, 'hi': self.hi if self.n else None}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'QuantileSketch':
+        out = cls()
+        out.n, out.levels, out.flips = state['n'], state['levels'], state['flips']
+        out.size = sum(map(len, out.levels))
+        if state['lo'] is not None:
+            out.lo, out.hi = state['lo'], state['hi']
+        out.max_size = sum(map(out._capacity, range(len(out.levels))))
+        return out
+
+class Aggregator:
+    """
+    Computes every spec in ``specs`` in a single pass over the rows using
+    running count/sum/min/max accumulators (plus level counts for categorical
+    metrics and a QuantileSketch per quantile column). ``update`` can be called
+    once per chunk; ``result`` shapes the accumulated state into
+    ``{spec: {group: {'count': n, metric: value}}}``.
+    """
+
+    def __init__(self, specs: Dict[str, Dict[str, Any]]) -> None:
+        self.specs = specs
+        self.slots: Dict[str, Dict[str, int]] = {}
+        self.acc: Dict[str, List[List[Any]]] = {}
+        self.fixed: Dict[str, bool] = {}
+        for name, spec in specs.items():
+            self.slots[name] = {}
+            self.acc[name] = []
+            if 'key' not in spec:
+                fixed = ['all']
+            elif 'slots' in spec:
+                fixed = [str(i) for i in range(spec['slots'])]
+            elif 'buckets' in spec or 'edges' in spec:
+                fixed = bin_labels(spec)
+            else:
+                fixed = []
+            # Fixed groups are always reported; categorical ones only once seen
+            self.fixed[name] = bool(fixed)
+            for label in fixed:
+                self._slot(name, label)
+
+    def _num_cols(self, name: str) -> List[str]:
+        return list(dict.fromkeys(c for c, agg in self.specs[name]['metrics'].values()
+                                  if agg in NUMERIC_AGGS))
+
+    def _sketch_cols(self, name: str) -> List[str]:
+        return list(dict.fromkeys(c for c, agg in self.specs[name]['metrics'].values()
+                                  if agg == 'quantiles'))
+
+    def _cat_cols(self, name: str) -> List[str]:
+        return list(dict.fromkeys(c for c, agg in self.specs[name]['metrics'].values()
+                                  if agg not in NUMERIC_AGGS and agg != 'quantiles'))
+
+    def _slot(self, name: str, label: str) -> int:
+        slots = self.slots[name]
+        if label not in slots:
+            slots[label] = len(slots)
+            k = len(self._num_cols(name))
+            self.acc[name].append([0, [0] * k, [math.inf] * k, [-math.inf] * k,
+                                   [{} for _ in self._cat_cols(name)],
+                                   [QuantileSketch() for _ in self._sketch_cols(name)]])
+        return slots[label]
+
+    def _slotter(self, name: str, spec: Dict[str, Any], data: Table) -> Callable[[Any], Optional[int]]:
+        if 'slots' in spec:
+            return lambda v: v
+        if 'buckets' in spec or 'edges' in spec:
+            return binner(spec)
+        # Categorical: levels are in first-seen order, so creating slots in code
+        # order keeps groups in first-seen order too
+        allowed = spec.get('allowed')
+        lut = [self._slot(name, lvl if not allowed or lvl in allowed else 'Other')
+               for lvl in data.levels[spec['key']]]
+        return lut.__getitem__
+
+    def update(self, data: Table) -> None:
+        names: List[str] = []
+        for spec in self.specs.values():
+            names.extend(c for c in [spec.get('key')] + [c for c, _ in spec['metrics'].values()] if c)
+        names = list(dict.fromkeys(names))
+        pos = {c: i for i, c in enumerate(names)}
+
+        compiled = []
+        for name, spec in self.specs.items():
+            if self._sketch_only(name):
+                continue
+            key = spec.get('key')
+            compiled.append((
+                pos[key] if key else None,
+                self._slotter(name, spec, data) if key else None,
+                self.acc[name],
+                [pos[c] for c in self._num_cols(name)],
+                [(pos[c], data.levels[c]) for c in self._cat_cols(name)],
+            ))
+
+        for row in zip(*[data[c] for c in names]):
+            for kp, slot_of, acc, num, cat in compiled:
+                if kp is None:
+                    a = acc[0]
+                else:
+                    g = slot_of(row[kp])
+                    if g is None:
+                        continue
+                    a = acc[g]
+                a[0] += 1
+                sums, mins, maxs, levels = a[1], a[2], a[3], a[4]
+                for j, p in enumerate(num):
+                    v = row[p]
+                    sums[j] += v
+                    if v < mins[j]:
+                        mins[j] = v
+                    if v > maxs[j]:
+                        maxs[j] = v
+                for j, (p, lv) in enumerate(cat):
+                    counts = levels[j]
+                    label = lv[row[p]]
+                    counts[label] = counts.get(label, 0) + 1
+        self._update_sketches(data)
+
+    def _sketch_only(self, name: str) -> bool:
+        # Specs with only quantile metrics are counted by _update_sketches
+        metrics = self.specs[name]['metrics']
+        return bool(metrics) and all(agg == 'quantiles' for _, agg in metrics.values())
+
+    def _update_sketches(self, data: Table) -> None:
+        for name, spec in self.specs.items():
+            cols = self._sketch_cols(name)
+            if not cols:
+                continue
+            key = spec.get('key')
+            slot_of = self._slotter(name, spec, data) if key else None
+            counted = self._sketch_only(name)
+            for start in range(0, len(data), SKETCH_BLOCK):
+                values = [data[c][start:start + SKETCH_BLOCK] for c in cols]
+                if slot_of is None:
+                    groups = {0: range(len(values[0]))}
+                else:
+                    groups = {}
+                    for i, g in enumerate(map(slot_of, data[key][start:start + SKETCH_BLOCK])):
+                        if g is not None:
+                            groups.setdefault(g, []).append(i)
+                for g, rows in groups.items():
+                    acc = self.acc[name][g]
+                    if counted:
+                        acc[0] += len(rows)
+                    for sketch, col in zip(acc[5], values):
+                        sketch.extend(map(col.__getitem__, rows))
+
+    def merge(self, other: 'Aggregator') -> None:
+        # Groups are keyed by label, so states built over different level lists merge directly
+        for name in self.specs:
+            for label, slot in other.slots[name].items():
+                a = self.acc[name][self._slot(name, label)]
+                count, sums, mins, maxs, levels, sketches = other.acc[name][slot]
+                a[0] += count
+                a[1] = [x + y for x, y in zip(a[1], sums)]
+                a[2] = [min(x, y) for x, y in zip(a[2], mins)]
+                a[3] = [max(x, y) for x, y in zip(a[3], maxs)]
+                for mine, theirs in zip(a[4], levels):
+                    for label_, n in theirs.items():
+                        mine[label_] = mine.get(label_, 0) + n
+                for mine_, theirs_ in zip(a[5], sketches):
+                    mine_.merge(theirs_)
+
+    def to_state(self) -> Dict[str, Any]:
+        # Groups and their sufficient statistics; specs live in code
+        return {'slots': self.slots,
+                'acc': {name: [a[:5] + [[s.to_state() for s in a[5]]] for a in accs]
+                        for name, accs in self.acc.items()}}
+
+    @classmethod
+    def from_state(cls, specs: Dict[str, Dict[str, Any]], state: Dict[str, Any]) -> 'Aggregator':
+        out = cls(specs)
+        out.slots = state['slots']
+        out.acc = {name: [a[:5] + [[QuantileSketch.from_state(s) for s in a[5]]] for a in accs]
+                   for name, accs in state['acc'].items()}
+        return out
+
+    def result(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        out: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for name, spec in self.specs.items():
+            num = self._num_cols(name)
+            cat = self._cat_cols(name)
+            sketched = self._sketch_cols(name)
+            groups: Dict[str, Dict[str, Any]] = {}
+            for label, slot in self.slots[name].items():
+                count, sums, mins, maxs, levels, sketches = self.acc[name][slot]
+                if not count and not self.fixed[name]:
+                    continue
+                stats: Dict[str, Any] = {'count': count}
+                for metric, (col, agg) in spec['metrics'].items():
+                    if agg == 'quantiles':
+                        stats[metric] = sketches[sketched.index(col)].quantiles(QUANTILE_PROBS)
+                        continue
+                    if col in cat:
+                        stats[metric] = levels[cat.index(col)].get(agg, 0)
+                        continue
+                    j = num.index(col)
+                    if agg == 'mean':
+                        stats[metric] = mean(sums[j], count)
+                    elif agg == 'sum':
+                        stats[metric] = sums[j]
+                    else:
+                        stats[metric] = (mins if agg == 'min' else maxs)[j] if count else 0.0
+                groups[label] = stats
+            out[name] = groups
+        return out
+
+def aggregate(data: Table, specs: Dict[str, Dict[str, Any]] = AGGREGATES) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    agg = Aggregator(specs)
+    agg.update(data)
+    return agg.result()
+
+# Data cube: dimensions (dashboard name → column), summed columns, and the
+# AGGREGATES histograms kept per cell (bin counts, plus Exam_Score sums for
+# the ones that report an average score)
+CUBE_DIMS = {'school': 'School_Type', 'gender': 'Gender', 'motiv': 'Motivation_Level',
+             'persona': 'persona', 'risk': 'risk_label'}
+CUBE_SUMS = {'score': 'Exam_Score', 'attend': 'Attendance', 'hours': 'Hours_Studied',
+             'tutor': 'Tutoring_Sessions', 'sleep': 'Sleep_Hours', 'prev': 'Previous_Scores'}
+CUBE_HISTOGRAMS = ['score_dist', 'attend_score', 'hour_score']
+
+def cube_dims(levels: Dict[str, List[str]]) -> Dict[str, List[Any]]:
+    # Level list per CUBE_DIMS field, indexed by the codes stored in cells
+    return {field: (list(range(len(PERSONA_PROFILES))) if col == 'persona'
+                    else RISK_LEVELS if col == 'risk_label' else levels[col])
+            for field, col in CUBE_DIMS.items()}
+
+class Cube:
+    """
+    Cross-tab of CUBE_DIMS. Each non-empty cell holds a flat accumulator:
+    row count, one sum per CUBE_SUMS column, then for each CUBE_HISTOGRAMS
+    spec its bin counts, followed by the Exam_Score sum per bin when the
+    spec has metrics. Any filter
+    on the dimensions is answered exactly by adding up the matching cells,
+    without touching the roster.
+    """
+
+    def __init__(self) -> None:
+        self.cells: Dict[Tuple[int, ...], List[Any]] = {}
+        self.bins = [len(bin_labels(AGGREGATES[h])) for h in CUBE_HISTOGRAMS]
+        self.scored = [bool(AGGREGATES[h]['metrics']) for h in CUBE_HISTOGRAMS]
+        self.width = 1 + len(CUBE_SUMS) + sum(nb * (1 + sc) for nb, sc in zip(self.bins, self.scored))
+
+    def update(self, data: Table) -> None:
+        sums = [data[c] for c in CUBE_SUMS.values()]
+        score = data['Exam_Score']
+        hists = []
+        offset = 1 + len(CUBE_SUMS)
+        for name, nb, scored in zip(CUBE_HISTOGRAMS, self.bins, self.scored):
+            spec = AGGREGATES[name]
+            hists.append((data[spec['key']], binner(spec), offset, offset + nb if scored else None))
+            offset += nb * (1 + scored)
+        cells, width = self.cells, self.width
+        for i, key in enumerate(zip(*[data[c] for c in CUBE_DIMS.values()])):
+            acc = cells.get(key)
+            if acc is None:
+                acc = cells[key] = [0] * width
+            acc[0] += 1
+            for j, col in enumerate(sums, 1):
+                acc[j] += col[i]
+            for col, bin_of, counts, totals in hists:
+                b = bin_of(col[i])
+                if b is not None:
+                    acc[counts + b] += 1
+                    if totals is not None:
+                        acc[totals + b] += score[i]
+
+    def merge(self, other: 'Cube') -> None:
+        # Both cubes must code the dimensions alike (blocks of the same Table
+        # do; see recoded otherwise)
+        for key, theirs in other.cells.items():
+            acc = self.cells.get(key)
+            self.cells[key] = list(theirs) if acc is None else [a + b for a, b in zip(acc, theirs)]
+
+    def result(self, levels: Dict[str, List[str]]) -> Dict[str, Any]:
+        return {
+            'dims': cube_dims(levels),
+            'sums': list(CUBE_SUMS),
+            'histograms': {h: {'labels': bin_labels(AGGREGATES[h]), 'score': sc}
+                           for h, sc in zip(CUBE_HISTOGRAMS, self.scored)},
+            # Integral sums as ints to keep the file small
+            'cells': [list(key) + [int(v) if isinstance(v, float) and v.is_integer() else v for v in acc]
+                      for key, acc in sorted(self.cells.items())],
+        }
+
+    def recoded(self, luts: Dict[str, List[int]]) -> 'Cube':
+        out = Cube()
+        key_of = recoder(list(CUBE_DIMS.values()), luts)
+        out.cells = {key_of(key): acc for key, acc in self.cells.items()}
+        return out
+
+    def to_state(self) -> Dict[str, Any]:
+        return {'cells': [[list(key), acc] for key, acc in self.cells.items()]}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'Cube':
+        out = cls()
+        out.cells = {tuple(key): acc for key, acc in state['cells']}
+        return out
+
+# Attendance × Exam_Score scatter: counts per unit cell of each axis range
+# (values beyond it land in the edge cells) and CUBE_DIMS combination, plus a
+# stratified sample of points. Coarser level-of-detail tiers merge size×size
+# unit cells; tiers finer than SCATTER_TIER_CELLS cells are left out. The
+# sample shipped is at most SCATTER_POINTS points and one per
+# SCATTER_ROWS_PER_POINT rows, since the tiers already cover small cohorts.
+SCATTER_AXES = {'x': ('Attendance', 55, 100), 'y': ('Exam_Score', 55, 101)}
+SCATTER_TIERS = [8, 4, 2, 1]
+SCATTER_TIER_CELLS = 4096
+SCATTER_POINTS = 600
+SCATTER_ROWS_PER_POINT = 10
+SCATTER_STRATUM_ROWS = SCATTER_POINTS  # sample candidates kept per combination
+
+def _priority(i: int) -> int:
+    # splitmix64 of the row number: a fixed random-looking sampling priority,
+    # so samples taken over any split of the rows merge into the same sample
+    z = (i + 1) * 0x9E3779B97F4A7C15 & 0xFFFFFFFFFFFFFFFF
+    z = (z ^ z >> 30) * 0xBF58476D1CE4E5B9 & 0xFFFFFFFFFFFFFFFF
+    z = (z ^ z >> 27) * 0x94D049BB133111EB & 0xFFFFFFFFFFFFFFFF
+    return z ^ z >> 31
+
+def _unit_cell(v: float, lo: float, top: int) -> int:
+    c = v - lo
+    return top if c >= top else int(c) if c > 0 else 0  # NaN → 0
+
+class ScatterGrid:
+    """
+    Scatter summary that merges like Cube: unit-cell counts over SCATTER_AXES
+    per CUBE_DIMS combination, and per combination the SCATTER_STRATUM_ROWS
+    rows with the smallest _priority (a bottom-k sample). Every persona, risk
+    and filter combination keeps example points, however rare.
+    """
+
+    def __init__(self) -> None:
+        self.cells: Counter = Counter()
+        # combination -> max-heap of (-priority, row number, SCATTER_COLUMNS values)
+        self.sample: Dict[Tuple[int, ...], List[Tuple[int, int, Tuple[Any, ...]]]] = {}
+
+    def update(self, data: Table, start: int = 0) -> None:
+        # ``start`` is the row number of data's first row in the whole input
+        (xc, x0, x1), (yc, y0, y1) = SCATTER_AXES['x'], SCATTER_AXES['y']
+        xs, ys = data[xc], data[yc]
+        columns = [data[c] for c in SCATTER_COLUMNS]
+        cells, sample, cap = self.cells, self.sample, SCATTER_STRATUM_ROWS
+        for j, key in enumerate(zip(*[data[c] for c in CUBE_DIMS.values()])):
+            cells[key + (_unit_cell(xs[j], x0, x1 - x0), _unit_cell(ys[j], y0, y1 - y0))] += 1
+            pri = _priority(start + j)
+            heap = sample.get(key)
+            if heap is None:
+                heap = sample[key] = []
+            if len(heap) < cap:
+                heapq.heappush(heap, (-pri, start + j, tuple(col[j] for col in columns)))
+            elif pri < -heap[0][0]:
+                heapq.heapreplace(heap, (-pri, start + j, tuple(col[j] for col in columns)))
+
+    def merge(self, other: 'ScatterGrid') -> None:
+        self.cells.update(other.cells)
+        for key, theirs in other.sample.items():
+            heap = heapq.nlargest(SCATTER_STRATUM_ROWS, self.sample.get(key, []) + theirs)
+            heapq.heapify(heap)
+            self.sample[key] = heap
+
+    def recoded(self, luts: Dict[str, List[int]]) -> 'ScatterGrid':
+        out = ScatterGrid()
+        key_of = recoder(list(CUBE_DIMS.values()) + ['x', 'y'], luts)
+        row_of = recoder(SCATTER_COLUMNS, luts)
+        out.cells = Counter({key_of(key): count for key, count in self.cells.items()})
+        out.sample = {key_of(key): [(p, i, row_of(row)) for p, i, row in heap] for key, heap in self.sample.items()}
+        return out
+
+    def tiers(self) -> List[Dict[str, Any]]:
+        out = []
+        for size in SCATTER_TIERS:
+            tier: Counter = Counter()
+            for key, count in self.cells.items():
+                tier[key[:-2] + (key[-2] // size, key[-1] // size)] += count
+            if out and len(tier) > SCATTER_TIER_CELLS:
                 break
-    return {'labels': [str(b) for b in buckets], 'counts': counts}
-
-def group_by(data: List[Dict[str, Any]], key: str, allowed: List[str] = None) -> Dict[str, List[Dict[str, Any]]]:
-    groups: Dict[str, List[Dict[str, Any]]] = {}
-    for r in data:
-        v = str(r[key])
-        if allowed and v not in allowed:
-            v = 'Other'
-        groups.setdefault(v, []).append(r)
-    return groups
-
-# ── 6. Main ────────────────────────────────────────────────────────────────────
-def main() -> None:
-    print("Loading CSV...")
-    raw = load_csv(CSV_PATH)
-    data = clean(raw)
-    print(f"  {len(data)} students loaded")
-
-    print("Normalizing + clustering...")
-    data, norm_stats = normalize(data, CLUSTER_FEATURES)
-    labels, centers = kmeans(data, k=5, iters=40)
+            cols = list(zip(*[key + (count,) for key, count in sorted(tier.items())])) or [()] * (len(CUBE_DIMS) + 3)
+            out.append({'size': size, 'cells': {f: pack_array(list(col)) for f, col
+                                                in zip(list(CUBE_DIMS) + ['x', 'y', 'count'], cols)}})
+        return out
 
-    # Assign personas using score-based rules (same as resolvePersona() in app.js)
-    persona_labels = assign_persona_by_score(data)
+    def points(self, levels: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        # The point budget split across combinations by size; every combination
+        # with high-risk students gets at least one (the dashboard overlays them)
+        sizes: Counter = Counter()
+        for key, count in self.cells.items():
+            sizes[key[:-2]] += count
+        n = sum(sizes.values())
+        budget = min(SCATTER_POINTS, n // SCATTER_ROWS_PER_POINT)
+        risk = list(CUBE_DIMS.values()).index('risk_label')
+        out = []
+        for key in sorted(self.sample):
+            quota = round(budget * sizes[key] / n)
+            if RISK_LEVELS[key[risk]] == 'High':
+                quota = max(quota, 1)
+            out.extend(scatter_point(levels, *row) for _, _, row in heapq.nlargest(quota, self.sample[key]))
+        return out
+
+    def result(self, levels: Dict[str, List[str]]) -> Dict[str, Any]:
+        return {
+            'axes': {a: {'column': c, 'lo': lo, 'hi': hi} for a, (c, lo, hi) in SCATTER_AXES.items()},
+            'dims': cube_dims(levels),
+            'tiers': self.tiers(),
+        }
+
+    def to_state(self) -> Dict[str, Any]:
+        return {'cells': [list(key) + [count] for key, count in self.cells.items()],
+                'sample': [[list(key), [[-p, i, list(row)] for p, i, row in heap]]
+                           for key, heap in self.sample.items()]}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'ScatterGrid':
+        out = cls()
+        out.cells = Counter({tuple(c[:-1]): c[-1] for c in state['cells']})
+        out.sample = {tuple(key): [(-p, i, tuple(row)) for p, i, row in heap] for key, heap in state['sample']}
+        for heap in out.sample.values():
+            heapq.heapify(heap)
+        return out
+
+# Roster table fields (dashboard name → column), in display order
+ROSTER_FIELDS = {
+    'gender': 'Gender', 'school': 'School_Type', 'score': 'Exam_Score', 'attend': 'Attendance',
+    'hours': 'Hours_Studied', 'motiv': 'Motivation_Level', 'risk': 'risk_label',
+    'risk_score': 'risk_score', 'persona': 'persona', 'internet': 'Internet_Access',
+    'tutor': 'Tutoring_Sessions', 'prev': 'Previous_Scores', 'disability': 'Learning_Disabilities',
+    'peer': 'Peer_Influence',
+}
+ROSTER_COLUMNS = list(ROSTER_FIELDS.values())
 
+SCATTER_COLUMNS = ['Attendance', 'Exam_Score', 'Hours_Studied', 'persona', 'risk_label',
+                   'School_Type', 'Gender', 'Motivation_Level']
+
+def roster_row(data: Table, i: int, rank: int) -> Dict[str, Any]:
+    row: Dict[str, Any] = {'id': rank + 1}
+    for field, col in ROSTER_FIELDS.items():
+        row[field] = data.value(col, i)
+    return row
+
+def scatter_point(levels: Dict[str, List[str]], attend: float, score: float, hours: float,
+                  persona: int, risk: int, school: int, gender: int, motiv: int) -> Dict[str, Any]:
+    # School, gender and motivation let the dashboard filter the sample
+    return {'x': round(attend, 1), 'y': round(score, 1), 'hours': hours,
+            'persona': persona, 'risk': RISK_LEVELS[risk], 'school': levels['School_Type'][school],
+            'gender': levels['Gender'][gender], 'motiv': levels['Motivation_Level'][motiv]}
+
+def map_centers(labels: List[int], persona_labels: List[int],
+                centers: List[List[float]]) -> Dict[int, List[float]]:
     # Keep K-means centers for the live prediction form — map raw cluster → best persona
     # We still need a rough mapping for the scatter chart coloring
-    from collections import Counter
-    cluster_to_persona = {}
+    cluster_to_persona: Dict[int, List[int]] = {}
     for raw_lbl, p_lbl in zip(labels, persona_labels):
         cluster_to_persona.setdefault(raw_lbl, []).append(p_lbl)
     # Pick the most common persona per cluster
-    cluster_to_persona = {c: Counter(ps).most_common(1)[0][0] for c, ps in cluster_to_persona.items()}
-    mapped_centers = {cluster_to_persona.get(i, i): centers[i] for i in range(5)}
+    best = {c: Counter(ps).most_common(1)[0][0] for c, ps in cluster_to_persona.items()}
+    return {best.get(i, i): centers[i] for i in range(len(centers))}
+
+def score_rows(data: Table) -> None:
+    # Row-wise stages: persona rules and risk scoring, added as columns.
+    # Assign personas using score-based rules (same as resolvePersona() in app.js)
+    data['persona'] = assign_persona_by_score(data)
+    risk_scores, risk_codes = compute_risk(data)
+    data['risk_score'] = risk_scores
+    data.add_categorical('risk_label', risk_codes, RISK_LEVELS)
+
+# ── 6. Streaming ───────────────────────────────────────────────────────────────
+# Rows kept for fitting K-Means (and rank statistics) when streaming;
+# everything else is accumulated
+KMEANS_SAMPLE_ROWS = 100_000
+INCREMENTAL_CHUNK_ROWS = 50_000
+SAMPLE_COLUMNS = NUMERIC_COLUMNS + [f[0] for f in CORRELATION_FEATURES.values() if not isinstance(f, str)] + ['persona']
+
+class Reservoir:
+    """Uniform fixed-size sample of rows from a stream (Algorithm R)."""
+
+    def __init__(self, size: int, seed: int) -> None:
+        self.size = size
+        self.rng = random.Random(seed)
+        self.seen = 0
+        self.rows: List[Tuple[Any, ...]] = []
+
+    def offer(self, data: Table, names: List[str]) -> None:
+        for row in zip(*[data[c] for c in names]):
+            if self.seen < self.size:
+                self.rows.append(row)
+            else:
+                j = self.rng.randrange(self.seen + 1)
+                if j < self.size:
+                    self.rows[j] = row
+            self.seen += 1
+
+    def merge(self, other: 'Reservoir') -> None:
+        # A uniform sample of both streams: draw which of the seen rows a
+        # uniform sample would take, then that many rows from each side
+        n = self.seen + other.seen
+        k = min(self.size, n)
+        ours = sum(1 for j in self.rng.sample(range(n), k) if j < self.seen)
+        self.rows = self.rng.sample(self.rows, ours) + self.rng.sample(other.rows, k - ours)
+        self.seen = n
+
+    def recoded(self, names: List[str], luts: Dict[str, List[int]]) -> 'Reservoir':
+        out = Reservoir(self.size, seed=0)
+        out.rng.setstate(self.rng.getstate())
+        out.seen = self.seen
+        out.rows = list(map(recoder(names, luts), self.rows))
+        return out
+
+    def to_state(self, names: List[str]) -> Dict[str, Any]:
+        return {'size': self.size, 'seen': self.seen, 'rng': self.rng.getstate(),
+                'rows': Table.from_rows(self.rows, names, {}).to_state()}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'Reservoir':
+        out = cls(state['size'], seed=0)
+        version, internal, gauss = state['rng']
+        out.rng.setstate((version, tuple(internal), gauss))
+        out.seen = state['seen']
+        out.rows = list(zip(*[decode_array(c) for c in state['rows'].values()]))
+        return out
+
+ROSTER_LOG_BLOCK = 65_536  # rows copied at a time when one log is merged into another
+
+class RosterLog:
+    """
+    Roster rows of a streaming run, kept on disk: one append-only file of raw
+    array values per roster column in ``directory``. Chunks are appended as
+    they stream past, so memory does not grow with the CSV; ``table`` maps
+    the files back (read-only memoryviews, as for the column cache) to write
+    the outputs. Opening a log keeps its first ``rows`` rows (none for a new
+    log) and cuts anything after them, e.g. rows appended by a run that
+    stopped before saving its snapshot; ValueError if a file is shorter.
+    """
+
+    def __init__(self, directory: str, rows: int = 0) -> None:
+        self.directory = directory
+        self.rows = rows
+        os.makedirs(directory, exist_ok=True)
+        for name in ROSTER_COLUMNS:
+            with open(self._path(name), 'ab') as f:
+                size = rows * array(column_type(name)).itemsize
+                if os.path.getsize(self._path(name)) < size:
+                    raise ValueError(f"roster log {self._path(name)} is shorter than {rows} rows")
+                f.truncate(size)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name + '.col')
+
+    def append(self, table: Table) -> None:
+        for name in ROSTER_COLUMNS:
+            with open(self._path(name), 'ab') as f:
+                f.write(table[name])
+        self.rows += len(table)
+
+    def table(self, levels: Dict[str, List[str]]) -> Table:
+        out = Table()
+        for name in ROSTER_COLUMNS:
+            code = column_type(name)
+            if self.rows:
+                with open(self._path(name), 'rb') as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                out[name] = memoryview(mapped)[:self.rows * array(code).itemsize].cast(code)
+            else:
+                out[name] = array(code)
+            if name in levels:
+                out.levels[name] = levels[name]
+        return out
+
+def peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+class Instruments(dict):
+    """
+    A ``stages`` dict that also records, per stage, wall and CPU time, rows
+    processed, net allocated memory blocks and how much peak RSS grew. A
+    stage runs from the previous checkpoint unless begin() marks its start
+    (stages overlapping on a pool), and run_dag adds the CPU time its tasks
+    used in worker processes. K-Means restarts append their per-iteration
+    trace to ``kmeans``. Plain dicts record peak RSS only.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self.kmeans: List[Dict[str, Any]] = []
+        self.started: Dict[str, Tuple[float, float, int, float]] = {}
+        self.worker_cpu: Counter = Counter()
+        self.pool_cpu = 0.0
+        self.first = self.last = self._sample()
+
+    @staticmethod
+    def _sample() -> Tuple[float, float, int, float]:
+        return time.perf_counter(), time.process_time(), sys.getallocatedblocks(), peak_rss_mb()
+
+    def begin(self, name: str) -> None:
+        self.started[name] = self._sample()
+
+    def record(self, name: str, rows: Optional[int] = None) -> None:
+        now = self._sample()
+        wall0, cpu0, blocks0, rss0 = self.started.pop(name, self.last)
+        wall = now[0] - wall0
+        pool_cpu = self.worker_cpu.pop(name, 0.0)
+        self.pool_cpu += pool_cpu
+        self.stats[name] = {
+            'wall_s': round(wall, 4),
+            'cpu_s': round(now[1] - cpu0 + pool_cpu, 4),
+            'rows': rows,
+            'rows_per_s': round(rows / wall) if rows and wall > 0 else None,
+            'alloc_blocks': now[2] - blocks0,
+            'peak_rss_mb': round(now[3], 1),
+            'rss_delta_mb': round(now[3] - rss0, 1),
+        }
+        self.last = now
+        self[name] = now[3]
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            'wall_s': round(self.last[0] - self.first[0], 4),
+            'cpu_s': round(self.last[1] - self.first[1] + self.pool_cpu, 4),
+            'peak_rss_mb': round(self.last[3], 1),
+            'stages': self.stats,
+            'kmeans': self.kmeans,
+        }
+
+def checkpoint(stages: Dict[str, float], name: str, rows: Optional[int] = None) -> None:
+    if isinstance(stages, Instruments):
+        stages.record(name, rows)
+    else:
+        stages[name] = peak_rss_mb()
+
+def _timed_task(fn: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+    # Pool-side wrapper used when instrumenting: the result and its CPU time
+    start = time.process_time()
+    return fn(*args), time.process_time() - start
+
+def run_in_memory(path: str, bootstrap: int, stages: Dict[str, float], workers: int = 1,
+                  cache_path: Optional[str] = None) -> Tuple[Dict[str, Any], Table]:
+    """
+    Load the whole CSV and run the PIPELINE stage DAG over it, on a pool of
+    ``workers`` processes sharing the columns (inline when ``workers`` is 1).
+    Results do not depend on the worker count. With ``cache_path``, the
+    cleaned columns are mapped from that cache when it matches the CSV, and
+    written to it after parsing otherwise.
+    """
+    if workers > 1 and os.name == 'posix':
+        # Start the resource tracker before any worker forks, so workers share it
+        # instead of starting their own, which would unlink our shared memory when
+        # they exit (Windows has no tracker; its shared memory is freed with the
+        # last handle)
+        resource_tracker.ensure_running()
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    shared: Optional[SharedTable] = None
+    try:
+        print("Loading CSV...")
+        data = load_cached(path, cache_path) if cache_path else None
+        if data is not None:
+            print(f"  mapped cleaned columns from {cache_path}")
+        else:
+            key = source_key(path)
+            if pool is not None and key['size'] > PARALLEL_CLEAN_BYTES:
+                data = parallel_clean(path, pool, workers)
+            else:
+                data = clean(load_csv(path))
+            if cache_path:
+                store_cache(data, path, cache_path, key)
+        n = len(data)
+        print(f"  {n} students loaded")
+        checkpoint(stages, 'load', n)
+
+        data, norm_stats = normalize(data, CLUSTER_FEATURES)
+        checkpoint(stages, 'normalize', n)
+        if pool is not None:
+            shared = SharedTable(data)
+        print(f"Running {len(PIPELINE)} stages on {workers} worker(s)...")
+        ctx = run_dag(PIPELINE, {'data': data, 'shared': shared, 'handle': shared.handle if shared else data,
+                                 'workers': workers, 'replicates': bootstrap, 'stages': stages}, pool, stages)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if shared is not None:
+            shared.close()
+
+    moments = ctx['moments']
+    matrix = correlation_matrix(moments.matrix(), ctx['spearman'])
+
+    grid = ctx['scatter']
+    output = build_output(norm_stats, ctx['centers'], score_correlations(moments), matrix, ctx['bootstrap'],
+                          ctx['aggregates'], ctx['cube'].result(data.levels), grid.points(data.levels),
+                          grid.result(data.levels), n)
+    return output, data.select(ROSTER_COLUMNS)
+
+class StreamState:
+    """
+    Everything the streaming pass accumulates: shared categorical levels,
+    normalization bounds, Pearson moments, aggregate sufficient statistics,
+    the K-Means reservoir and the scatter grid, plus the roster columns in a
+    RosterLog under ``roster_dir``. ``consume`` can be called again with more
+    rows. Everything but the roster rows round-trips through a JSON snapshot,
+    which records how many rows of the log it covers, so a later run can
+    resume where this one stopped.
+    """
+
+    VERSION = 5
 
-    for i, r in enumerate(data):
-        r['persona'] = persona_labels[i]
+    def __init__(self, roster_dir: str, roster_rows: int = 0) -> None:
+        self.levels: Dict[str, List[str]] = {c: [] for c in CATEGORICAL_COLUMNS}
+        self.bounds = {f: [math.inf, -math.inf] for f in CLUSTER_FEATURES}
+        self.moments = CoMoments(len(CORRELATION_NAMES))
+        self.agg = Aggregator(AGGREGATES)
+        self.cube = Cube()
+        self.sample = Reservoir(KMEANS_SAMPLE_ROWS, seed=42)
+        self.scatter = ScatterGrid()
+        self.roster = RosterLog(roster_dir, roster_rows)
+        # Source watermark: header, bytes consumed and their digest
+        self.header: Optional[List[str]] = None
+        self.offset = 0
+        self.digest = ''
+        # Previous fit, used to warm-start K-Means
+        self.norm_stats: Optional[Dict[str, Tuple[float, float]]] = None
+        self.centers: Optional[List[List[float]]] = None
 
-    print("Computing risk scores...")
-    risk_counts = {'High': 0, 'Medium': 0, 'Low': 0}
-    for r in data:
-        risk_score, risk_label = compute_risk(r)
-        r['risk_score'] = risk_score
-        r['risk_label'] = risk_label
-        risk_counts[risk_label] += 1
+    def consume(self, rows: Iterator[List[str]], chunk_size: int, row_base: int = 0) -> None:
+        # ``row_base`` offsets the row numbers that fix scatter sampling
+        # priorities, for states that are merged later (see run_partitioned)
+        for chunk in clean_chunks(rows, chunk_size, self.levels):
+            if not len(chunk):
+                continue
+            score_rows(chunk)
+            for f, b in self.bounds.items():
+                b[0] = min(b[0], min(chunk[f]))
+                b[1] = max(b[1], max(chunk[f]))
+            self.moments.update(feature_vectors(chunk))
+            self.agg.update(chunk)
+            self.cube.update(chunk)
+            self.scatter.update(chunk, row_base + self.sample.seen)
+            self.sample.offer(chunk, SAMPLE_COLUMNS)
+            self.roster.append(chunk)
 
-    print("Computing correlations...")
-    correlations = compute_correlations(data)
+    def merge(self, other: 'StreamState') -> None:
+        # Fold in a state streamed from other rows (another shard). Every
+        # accumulator merges; other's categorical codes are remapped onto
+        # this state's levels and the previous fit is dropped.
+        luts = {c: level_lut(self.levels[c], other.levels[c]) for c in CATEGORICAL_COLUMNS}
+        for f, b in self.bounds.items():
+            lo, hi = other.bounds[f]
+            b[0], b[1] = min(b[0], lo), max(b[1], hi)
+        self.moments.merge(other.moments)
+        self.agg.merge(other.agg)
+        self.cube.merge(other.cube.recoded(luts))
+        self.scatter.merge(other.scatter.recoded(luts))
+        self.sample.merge(other.sample.recoded(SAMPLE_COLUMNS, luts))
+        for block in other.roster_table().blocks(ROSTER_LOG_BLOCK):
+            self.roster.append(block.recoded(luts, self.levels))
+        self.norm_stats = self.centers = None
+
+    def roster_table(self) -> Table:
+        return self.roster.table({**self.levels, 'risk_label': RISK_LEVELS})
+
+    def finish(self, bootstrap: int, stages: Dict[str, float],
+               workers: int = 1) -> Tuple[Dict[str, Any], Table]:
+        if not self.roster.rows:
+            raise ValueError("no usable rows")
+
+        print("Clustering reservoir sample...")
+        norm_stats = {f: (mn, mx - mn if mx != mn else 1.0) for f, (mn, mx) in self.bounds.items()}
+        fit = Table.from_rows(self.sample.rows, SAMPLE_COLUMNS, self.levels)
+        normalize(fit, CLUSTER_FEATURES, norm_stats)
+        n = len(fit)
+        batch_size = KMEANS_BATCH_SIZE if n > KMEANS_MINIBATCH_ROWS else None
+        trace = stages.kmeans if isinstance(stages, Instruments) else None
+        if self.centers and self.norm_stats:
+            print("  warm start from previous centers")
+            init = rescale_centers(self.centers, self.norm_stats, norm_stats)
+            labels, centers = kmeans(fit, k=5, iters=40, init=init, batch_size=batch_size, trace=trace)
+        else:
+            labels, centers = kmeans(fit, k=5, iters=40, n_init=KMEANS_RESTARTS,
+                                     batch_size=batch_size, workers=workers, trace=trace)
+        self.norm_stats, self.centers = norm_stats, centers
+        mapped_centers = map_centers(labels, fit['persona'], centers)
+        checkpoint(stages, 'cluster', n)
+
+        print("Rank correlations on reservoir sample...")
+        matrix = correlation_matrix(self.moments.matrix(), spearman_matrix(fit))
+        ci = bootstrap_ci(fit, bootstrap, workers=workers)
+        checkpoint(stages, 'correlations', n)
+
+        output = build_output(norm_stats, mapped_centers, score_correlations(self.moments), matrix, ci,
+                              self.agg.result(), self.cube.result(self.levels),
+                              self.scatter.points(self.levels), self.scatter.result(self.levels),
+                              self.roster.rows)
+        return output, self.roster_table()
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            'version': self.VERSION,
+            'source': {'header': self.header, 'offset': self.offset, 'digest': self.digest},
+            'levels': self.levels,
+            'bounds': self.bounds,
+            'moments': self.moments.to_state(),
+            'aggregates': self.agg.to_state(),
+            'cube': self.cube.to_state(),
+            'sample': self.sample.to_state(SAMPLE_COLUMNS),
+            'scatter': self.scatter.to_state(),
+            'roster_rows': self.roster.rows,
+            'norm_stats': self.norm_stats,
+            'centers': self.centers,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any], roster_dir: str) -> 'StreamState':
+        out = cls(roster_dir, state['roster_rows'])
+        source = state['source']
+        out.header, out.offset, out.digest = source['header'], source['offset'], source['digest']
+        out.levels = state['levels']
+        out.bounds = state['bounds']
+        out.moments = CoMoments.from_state(state['moments'])
+        out.agg = Aggregator.from_state(AGGREGATES, state['aggregates'])
+        out.cube = Cube.from_state(state['cube'])
+        out.sample = Reservoir.from_state(state['sample'])
+        out.scatter = ScatterGrid.from_state(state['scatter'])
+        out.norm_stats = state['norm_stats'] and {f: tuple(v) for f, v in state['norm_stats'].items()}
+        out.centers = state['centers']
+        return out
+
+    @classmethod
+    def load(cls, path: str, roster_dir: str) -> Optional['StreamState']:
+        try:
+            with open(path, encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') != cls.VERSION:
+                return None
+            return cls.from_state(state, roster_dir)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, path: str) -> None:
+        # Write-then-rename so an interrupted run never leaves a torn snapshot
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.to_state(), f, separators=(',', ':'))
+        os.replace(tmp, path)
+
+def rescale_centers(centers: List[List[float]], old: Dict[str, Tuple[float, float]],
+                    new: Dict[str, Tuple[float, float]]) -> List[List[float]]:
+    # Move normalized centers from one set of min-max bounds to another.
+    out = []
+    for c in centers:
+        out.append([(v * old[f][1] + old[f][0] - new[f][0]) / new[f][1]
+                    for v, f in zip(c, CLUSTER_FEATURES)])
+    return out
+
+def run_streaming(path: str, chunk_size: int, bootstrap: int, stages: Dict[str, float],
+                  workers: int = 1, work_dir: Optional[str] = None) -> Tuple[Dict[str, Any], Table]:
+    """
+    Single pass over the CSV in ``chunk_size``-row chunks. Normalization
+    bounds, Pearson moments and aggregates are accumulated per chunk; K-Means,
+    Spearman and the bootstrap run on a reservoir sample, and the roster
+    columns are spilled to a RosterLog in ``work_dir``.
+    """
+    print(f"Streaming CSV in chunks of {chunk_size} rows...")
+    state = StreamState(os.path.join(work_dir or tempfile.mkdtemp(), 'roster'))
+    state.consume(load_csv(path), chunk_size)
+    print(f"  {state.sample.seen} students streamed")
+    checkpoint(stages, 'stream', state.sample.seen)
+    return state.finish(bootstrap, stages, workers)
+
+def _resumable(state: StreamState, path: str, size: int) -> bool:
+    # The already-consumed prefix must be byte-for-byte unchanged and end on
+    # a row boundary; anything else (edits, deletions, a rewritten file) means
+    # a full rebuild, since rows cannot be retracted from the accumulators.
+    if state.header is None or state.offset > size:
+        return False
+    if state.offset:
+        with open(path, 'rb') as f:
+            f.seek(state.offset - 1)
+            if f.read(1) != b'\n':
+                return False
+    return file_digest(path, state.offset) == state.digest
+
+def run_incremental(path: str, state_path: str, roster_dir: str, chunk_size: int, bootstrap: int,
+                    stages: Dict[str, float], workers: int = 1) -> Tuple[Dict[str, Any], Table, StreamState]:
+    """
+    Streaming run that resumes from the snapshot at ``state_path`` and the
+    roster log in ``roster_dir``: only rows appended since the last run are
+    read, and K-Means restarts from the previous centers. Falls back to a
+    full pass when the snapshot or log is missing or the already-processed
+    part of the CSV has changed.
+    """
+    size = os.path.getsize(path)
+    state = StreamState.load(state_path, roster_dir)
+    before = 0
+    if state is not None and _resumable(state, path, size):
+        print(f"Resuming from byte {state.offset} of {size} ({state.sample.seen} students cached)...")
+        before = state.sample.seen
+        state.consume(itertools.chain([state.header], load_csv(path, state.offset, size)), chunk_size)
+        print(f"  {state.sample.seen - before} new students streamed")
+    else:
+        if state is not None:
+            print("Source changed since the last snapshot, rebuilding...")
+        print(f"Streaming CSV in chunks of {chunk_size} rows...")
+        state = StreamState(roster_dir)
+        rows = load_csv(path, 0, size)
+        state.header = next(rows, None)
+        state.consume(itertools.chain([state.header] if state.header else [], rows), chunk_size)
+        print(f"  {state.sample.seen} students streamed")
+    state.offset = size
+    state.digest = file_digest(path, size)
+    checkpoint(stages, 'stream', state.sample.seen - before)
+    return (*state.finish(bootstrap, stages, workers), state)
+
+# Partitioned runs: one StreamState per shard (a CSV of a directory, or a
+# value of a partition column), streamed in pool workers. The district rollup
+# merges the shard states rather than reading any row again. A partition
+# column is read in fixed-size byte ranges, so the shards do not depend on
+# the worker count.
+PARTITION_RANGE_BYTES = 16 << 20
+PARTITION_BLANK = 'unassigned'  # shard for rows with an empty partition column
+
+def _shard_task(path: str, chunk_size: int, row_base: int, work_dir: str) -> StreamState:
+    state = StreamState(tempfile.mkdtemp(dir=work_dir))
+    state.consume(load_csv(path), chunk_size, row_base)
+    return state
+
+def _partition_task(path: str, header: List[str], column: str, start: int, end: int,
+                    chunk_size: int, work_dir: str) -> Dict[str, StreamState]:
+    pos = header.index(column)
+    groups: Dict[str, List[List[str]]] = {}
+    for row in load_csv(path, start, end):
+        if len(row) > pos:
+            groups.setdefault(row[pos].strip() or PARTITION_BLANK, []).append(row)
+    states = {}
+    row_base = start
+    for name, rows in groups.items():
+        # Groups take consecutive row numbers from the range's byte offset; a
+        # range holds fewer rows than bytes, so numbers are unique across ranges
+        states[name] = StreamState(tempfile.mkdtemp(dir=work_dir))
+        states[name].consume(itertools.chain([header], rows), chunk_size, row_base)
+        row_base += len(rows)
+    return states
+
+def _finish_task(state: StreamState, bootstrap: int) -> Dict[str, Any]:
+    # Only the summary comes back; the parent maps the roster from the shard's log
+    return state.finish(bootstrap, {})[0]
+
+def run_partitioned(source: str, column: Optional[str], chunk_size: int, bootstrap: int,
+                    stages: Dict[str, float], workers: int = 1, work_dir: Optional[str] = None
+                    ) -> Tuple[List[Tuple[str, Dict[str, Any], Table]], Dict[str, Any], Table]:
+    """
+    Process ``source`` as shards: every CSV in the directory ``source``, or
+    the rows of the CSV ``source`` grouped by ``column``. Shards are streamed
+    and fitted on a pool of ``workers`` processes, with their roster logs in
+    ``work_dir``. Returns (name, output, roster) per shard, in name order, and
+    the district rollup's output and roster, fitted on the merged shard states.
+    """
+    work_dir = work_dir or tempfile.mkdtemp()
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    run = pool.map if pool is not None else map
+    try:
+        states: Dict[str, StreamState] = {}
+        if column is None:
+            files = sorted(f for f in os.listdir(source) if f.lower().endswith('.csv'))
+            print(f"Streaming {len(files)} shard files from {source}...")
+            paths = [os.path.join(source, f) for f in files]
+            bases = [i << 40 for i in range(len(files))]
+            for f, state in zip(files, run(_shard_task, paths, itertools.repeat(chunk_size), bases,
+                                           itertools.repeat(work_dir))):
+                states[os.path.splitext(f)[0]] = state
+        else:
+            parts = max(1, -(-os.path.getsize(source) // PARTITION_RANGE_BYTES))
+            header, ranges = csv_ranges(source, parts)
+            if column not in header:
+                raise ValueError(f"no {column} column")
+            print(f"Streaming CSV partitioned by {column}...")
+            for part in run(_partition_task, itertools.repeat(source), itertools.repeat(header),
+                            itertools.repeat(column), [a for a, _ in ranges], [b for _, b in ranges],
+                            itertools.repeat(chunk_size), itertools.repeat(work_dir)):
+                for name, state in part.items():
+                    if name in states:
+                        states[name].merge(state)
+                    else:
+                        states[name] = state
+        states = {name: state for name, state in sorted(states.items()) if state.roster.rows}
+        rollup = StreamState(os.path.join(work_dir, 'rollup'))
+        for state in states.values():
+            rollup.merge(state)
+        print(f"  {len(states)} shards, {rollup.sample.seen} students")
+        checkpoint(stages, 'partition', rollup.sample.seen)
+
+        results = list(run(_finish_task, [*states.values(), rollup], itertools.repeat(bootstrap)))
+        checkpoint(stages, 'fit', rollup.sample.seen)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    output = results.pop()
+    shards = [(name, result, state.roster_table()) for (name, state), result in zip(states.items(), results)]
+    return shards, output, rollup.roster_table()
+
+def build_output(norm_stats: Dict[str, Tuple[float, float]], mapped_centers: Dict[int, List[float]],
+                 correlations: Dict[str, float], matrix: Dict[str, Any], ci: Dict[str, List[float]],
+                 agg: Dict[str, Dict[str, Dict[str, Any]]], cube: Dict[str, Any],
+                 scatter_data: List[Dict[str, Any]], scatter_grid: Dict[str, Any], n: int) -> Dict[str, Any]:
+    # Summary only; the roster itself is written by write_legacy/write_compact
 
     # Cluster summaries — based on score-assigned persona labels
     cluster_summaries = []
-    for p_idx in range(5):
-        members = [r for r in data if r['persona'] == p_idx]
+    for p_idx, stats in enumerate(agg['clusters'].values()):
         profile = PERSONA_PROFILES[p_idx]
         cluster_summaries.append({
             'id': p_idx,
@@ -368,126 +2227,25 @@ def main() -> None:
             'color': profile['color'],
             'description': profile['description'],
             'strategies': profile['strategies'],
-            'count': len(members),
-            'avg_score': avg([float(m['Exam_Score']) for m in members]),
-            'avg_hours': avg([float(m['Hours_Studied']) for m in members]),
-            'avg_attend': avg([float(m['Attendance']) for m in members]),
-            'avg_tutor': avg([float(m['Tutoring_Sessions']) for m in members]),
-            'avg_sleep': avg([float(m['Sleep_Hours']) for m in members]),
-            'avg_prev': avg([float(m['Previous_Scores']) for m in members]),
-            'risk_high': sum(1 for m in members if m['risk_label'] == 'High'),
+            **stats,
         })
 
-    # Score distribution
-    score_dist = score_distribution(data)
-
-    # Group summaries
-    by_school = {k: {'count': len(v), 'avg_score': avg([float(r['Exam_Score']) for r in v]),
-                     'avg_hours': avg([float(r['Hours_Studied']) for r in v]),
-                     'avg_attend': avg([float(r['Attendance']) for r in v])}
-                 for k, v in group_by(data, 'School_Type').items()}
-
-    by_gender = {k: {'count': len(v), 'avg_score': avg([float(r['Exam_Score']) for r in v]),
-                     'avg_hours': avg([float(r['Hours_Studied']) for r in v])}
-                 for k, v in group_by(data, 'Gender').items()}
-
-    by_motiv = {k: {'count': len(v), 'avg_score': avg([float(r['Exam_Score']) for r in v]),
-                    'avg_attend': avg([float(r['Attendance']) for r in v])}
-                for k, v in group_by(data, 'Motivation_Level', ['Low', 'Medium', 'High']).items()}
-
-    by_parent = {k: {'count': len(v), 'avg_score': avg([float(r['Exam_Score']) for r in v])}
-                 for k, v in group_by(data, 'Parental_Involvement', ['Low', 'Medium', 'High']).items()}
-
-    by_income = {k: {'count': len(v), 'avg_score': avg([float(r['Exam_Score']) for r in v])}
-                 for k, v in group_by(data, 'Family_Income', ['Low', 'Medium', 'High']).items()}
-
-    by_resources = {k: {'count': len(v), 'avg_score': avg([float(r['Exam_Score']) for r in v])}
-                    for k, v in group_by(data, 'Access_to_Resources', ['Low', 'Medium', 'High']).items()}
-
-    # Attendance buckets vs score
-    attend_buckets = [
-        {'label': '<60%', 'min': 0.0, 'max': 60.0},
-        {'label': '60-70%', 'min': 60.0, 'max': 70.0},
-        {'label': '70-80%', 'min': 70.0, 'max': 80.0},
-        {'label': '80-90%', 'min': 80.0, 'max': 90.0},
-        {'label': '90%+', 'min': 90.0, 'max': 101.0},
-    ]
-    attend_score = []
-    for b in attend_buckets:
-        grp = [float(r['Exam_Score']) for r in data if b['min'] <= float(r['Attendance']) < b['max']]
-        attend_score.append({'label': b['label'], 'avg_score': avg(grp), 'count': len(grp)})
-
-    # Hours vs score
-    hour_buckets = [
-        {'label': '0-10h', 'min': 0.0, 'max': 10.0},
-        {'label': '10-20h', 'min': 10.0, 'max': 20.0},
-        {'label': '20-30h', 'min': 20.0, 'max': 30.0},
-        {'label': '30-40h', 'min': 30.0, 'max': 40.0},
-        {'label': '40h+', 'min': 40.0, 'max': 999.0},
-    ]
-    hour_score = []
-    for b in hour_buckets:
-        grp = [float(r['Exam_Score']) for r in data if b['min'] <= float(r['Hours_Studied']) < b['max']]
-        hour_score.append({'label': b['label'], 'avg_score': avg(grp), 'count': len(grp)})
-
-    # Scatter data (sample 600 for performance)
-    random.seed(0)
-    sample = random.sample(data, min(600, len(data)))
-    scatter_data = [{'x': round(float(r['Attendance']), 1), 'y': round(float(r['Exam_Score']), 1),
-                     'hours': r['Hours_Studied'], 'persona': r['persona'],
-                     'risk': r['risk_label']} for r in sample]
-
-    # Top risk students table
-    high_risk = sorted([r for r in data if r['risk_label'] == 'High'],
-                       key=lambda r: float(r['risk_score']), reverse=True)
-    risk_table = [{
-        'id': i + 1,
-        'gender': r['Gender'],
-        'school': r['School_Type'],
-        'score': r['Exam_Score'],
-        'attend': r['Attendance'],
-        'hours': r['Hours_Studied'],
-        'motiv': r['Motivation_Level'],
-        'risk': r['risk_label'],
-        'risk_score': r['risk_score'],
-        'persona': r['persona'],
-        'internet': r['Internet_Access'],
-        'tutor': r['Tutoring_Sessions'],
-        'prev': r['Previous_Scores'],
-        'disability': r['Learning_Disabilities'],
-        'peer': r['Peer_Influence'],
-    } for i, r in enumerate(high_risk)]
-
-    # All students table (for full-roster view in dashboard)
-    all_students_sorted = sorted(data, key=lambda r: float(r['Exam_Score']), reverse=True)
-    all_students = [{
-        'id': i + 1,
-        'gender': r['Gender'],
-        'school': r['School_Type'],
-        'score': r['Exam_Score'],
-        'attend': r['Attendance'],
-        'hours': r['Hours_Studied'],
-        'motiv': r['Motivation_Level'],
-        'risk': r['risk_label'],
-        'risk_score': r['risk_score'],
-        'persona': r['persona'],
-        'internet': r['Internet_Access'],
-        'tutor': r['Tutoring_Sessions'],
-        'prev': r['Previous_Scores'],
-        'disability': r['Learning_Disabilities'],
-        'peer': r['Peer_Influence'],
-    } for i, r in enumerate(all_students_sorted)]
+    attend_score = [{'label': k, 'avg_score': g['avg_score'], 'count': g['count']}
+                    for k, g in agg['attend_score'].items()]
+    hour_score = [{'label': k, 'avg_score': g['avg_score'], 'count': g['count']}
+                  for k, g in agg['hour_score'].items()]
 
+    totals = agg['kpis']['all']
     kpis = {
-        'total': len(data),
-        'avg_score': avg([float(r['Exam_Score']) for r in data]),
-        'avg_attend': avg([float(r['Attendance']) for r in data]),
-        'avg_hours': avg([float(r['Hours_Studied']) for r in data]),
-        'high_risk': risk_counts['High'],
-        'medium_risk': risk_counts['Medium'],
-        'low_risk': risk_counts['Low'],
+        'total': n,
+        'avg_score': totals['avg_score'],
+        'avg_attend': totals['avg_attend'],
+        'avg_hours': totals['avg_hours'],
+        'high_risk': totals['high_risk'],
+        'medium_risk': totals['medium_risk'],
+        'low_risk': totals['low_risk'],
         'top_cluster': cluster_summaries[0]['name'] if cluster_summaries else '',
-        'top_cluster_pct': round((cluster_summaries[0]['count'] / len(data) * 100.0) if cluster_summaries else 0.0, 1),
+        'top_cluster_pct': round((cluster_summaries[0]['count'] / n * 100.0) if cluster_summaries else 0.0, 1),
     }
 
     # Final output object
@@ -497,27 +2255,959 @@ def main() -> None:
         'centers': mapped_centers,
         'clusters': cluster_summaries,
         'correlations': correlations,
-        'score_dist': score_dist,
-        'by_school': by_school,
-        'by_gender': by_gender,
-        'by_motiv': by_motiv,
-        'by_parent': by_parent,
-        'by_income': by_income,
-        'by_resources': by_resources,
+        'correlation_matrix': matrix,
+        'score_dist': {'labels': list(agg['score_dist']),
+                       'counts': [g['count'] for g in agg['score_dist'].values()]},
+        'by_school': agg['by_school'],
+        'by_gender': agg['by_gender'],
+        'by_motiv': agg['by_motiv'],
+        'by_parent': agg['by_parent'],
+        'by_income': agg['by_income'],
+        'by_resources': agg['by_resources'],
         'attend_score': attend_score,
         'hour_score': hour_score,
+        'cube': cube,
+        'quantiles': {'probs': QUANTILE_PROBS, 'columns': {m: c for m, (c, _) in SPREAD.items()},
+                      'all': agg['q_all']['all'], 'persona': agg['q_persona'], 'risk': agg['q_risk'],
+                      'school': agg['q_school'], 'gender': agg['q_gender'], 'motiv': agg['q_motiv']},
         'scatter': scatter_data,
-        'risk_table': risk_table,
-        'all_students': all_students,
+        'scatter_grid': scatter_grid,
         'personas': PERSONA_PROFILES,
+        'rules': rules_spec(),
     }
+    if ci:
+        output['correlation_ci'] = ci
+    return output
+
+# ── 7. Parallel pipeline ───────────────────────────────────────────────────────
+# The in-memory run as a stage DAG. After load + normalize, every stage below
+# needs only the cleaned columns (or the rules columns), so the stages fan out
+# into tasks on one process pool; workers read the columns from shared memory.
+PARALLEL_CLEAN_BYTES = 4 << 20  # smaller files parse faster in one process
+RULE_CHUNK_ROWS = 250_000
+# Rows per aggregates/cube task. Fixed rather than derived from --workers, so
+# float sums and quantile sketches come out the same for any worker count
+AGGREGATE_BLOCK = 65_536
+
+class SharedTable:
+    """
+    A Table's columns copied once into shared memory, one block per column
+    (normalized columns included). ``handle`` is the small picklable
+    descriptor that tasks receive; ``attach`` turns it back into a Table of
+    zero-copy memoryviews in the worker. The owner unlinks the blocks.
+    """
+
+    def __init__(self, table: Table) -> None:
+        self.blocks: List[Any] = []
+        self.handle: Dict[str, Any] = {'columns': {}, 'levels': dict(table.levels), 'norm': []}
+        for name, col in table.columns.items():
+            self.add(name, col)
+        self.handle['norm'] = [self._publish(col) for col in table.norm]
+
+    def _publish(self, col: array) -> Tuple[str, str, int]:
+        nbytes = len(col) * col.itemsize
+        shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+        shm.buf[:nbytes] = memoryview(col).cast('B')
+        self.blocks.append(shm)
+        return shm.name, typecode(col), len(col)
+
+    def add(self, name: str, col: array, levels: Optional[List[str]] = None) -> None:
+        self.handle['columns'][name] = self._publish(col)
+        if levels is not None:
+            self.handle['levels'][name] = levels
+
+    def close(self) -> None:
+        for shm in self.blocks:
+            shm.close()
+            shm.unlink()
+        self.blocks = []
+
+# Worker side: blocks stay mapped for the life of the worker process
+_ATTACHED: Dict[str, Any] = {}
+
+def _block_view(block: Tuple[str, str, int]) -> memoryview:
+    name, typecode, n = block
+    shm = _ATTACHED.get(name)
+    if shm is None:
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            # The pool was forked with the owner's resource tracker already running
+            # (see run_in_memory), so registering the segment again is a no-op
+            shm = shared_memory.SharedMemory(name=name)
+        _ATTACHED[name] = shm
+    return shm.buf[:n * array(typecode).itemsize].cast(typecode)
+
+def attach(handle: Any) -> Table:
+    # A task's input: the Table itself when running inline, else a SharedTable handle
+    if isinstance(handle, Table):
+        return handle
+    table = Table()
+    for name, block in handle['columns'].items():
+        table[name] = _block_view(block)
+    table.levels = handle['levels']
+    table.norm = [_block_view(b) for b in handle['norm']]
+    return table
+
+def _clean_task(path: str, header: List[str], start: int, end: int) -> Table:
+    return clean(itertools.chain([header], load_csv(path, start, end)))
+
+def _rules_task(handle: Any, start: int, stop: int) -> Tuple[array, array, array]:
+    table = attach(handle)
+    part = table if (start, stop) == (0, len(table)) else table.slice(start, stop)
+    score_rows(part)
+    return part['persona'], part['risk_score'], part['risk_label']
+
+def _kmeans_task(handle: Any, k: int, iters: int, seed: int, batch_size: Optional[int],
+                 trace: bool) -> Tuple[float, array, List[List[float]], Optional[List[Dict[str, float]]]]:
+    inertia, labels, centers, steps = _kmeans_run(attach(handle).norm, k, iters, KMEANS_TOL, seed,
+                                                  'k-means++', batch_size, trace)
+    return inertia, array('B', labels), centers, steps
+
+def _moments_task(handle: Any, start: int, stop: int) -> CoMoments:
+    moments = CoMoments(len(CORRELATION_NAMES))
+    moments.update(feature_vectors(attach(handle).slice(start, stop)))
+    return moments
+
+def _spearman_task(handle: Any) -> List[List[float]]:
+    return spearman_matrix(attach(handle))
+
+def _bootstrap_task(handle: Any, seeds: List[int]) -> List[List[float]]:
+    return _bootstrap_replicates([array('d', v) for v in feature_vectors(attach(handle))], seeds)
+
+def _aggregate_task(handle: Any, start: int, stop: int) -> Aggregator:
+    agg = Aggregator(AGGREGATES)
+    agg.update(attach(handle).slice(start, stop))
+    return agg
+
+def _cube_task(handle: Any, start: int, stop: int) -> 'Cube':
+    cube = Cube()
+    cube.update(attach(handle).slice(start, stop))
+    return cube
+
+def _scatter_task(handle: Any, start: int, stop: int) -> ScatterGrid:
+    grid = ScatterGrid()
+    grid.update(attach(handle).slice(start, stop), start)
+    return grid
+
+def merge_tables(tables: List[Table]) -> Table:
+    """
+    Concatenate independently cleaned Tables in order. Level lists are merged
+    in table order and codes remapped, which gives the same first-seen levels
+    as cleaning the rows in one pass.
+    """
+    out = next(clean_chunks(iter([NUMERIC_COLUMNS + list(CATEGORICAL_COLUMNS)])))
+    for table in tables:
+        for name in CATEGORICAL_COLUMNS:
+            lut = level_lut(out.levels[name], table.levels[name])
+            out[name].extend(array('H', map(lut.__getitem__, table[name])))
+        for name in NUMERIC_COLUMNS:
+            out[name].extend(table[name])
+    return out
+
+def csv_ranges(path: str, parts: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    # The header and up to ``parts`` byte ranges of the body on line boundaries
+    # (rows must not contain embedded newlines)
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        header_line = f.readline()
+        body = f.tell()
+        cuts = [body]
+        for i in range(1, parts):
+            f.seek(max(body + (size - body) * i // parts, cuts[-1]))
+            if f.tell() > body:
+                f.readline()
+            cuts.append(max(f.tell(), cuts[-1]))
+        cuts.append(size)
+    header = next(csv.reader([header_line.decode('utf-8')]), [])
+    return header, [(a, b) for a, b in zip(cuts, cuts[1:]) if b > a]
+
+def parallel_clean(path: str, pool: ProcessPoolExecutor, parts: int) -> Table:
+    # Clean ``parts`` byte ranges of the file concurrently
+    header, ranges = csv_ranges(path, parts)
+    tables = pool.map(_clean_task, itertools.repeat(path), itertools.repeat(header), *zip(*ranges))
+    return merge_tables(list(tables))
+
+class Stage(NamedTuple):
+    # ``plan`` lists the stage's (function, args) tasks given the results so
+    # far; ``merge`` combines the task results into the stage result.
+    deps: List[str]
+    plan: Callable[[Dict[str, Any]], List[Tuple[Callable[..., Any], Tuple[Any, ...]]]]
+    merge: Callable[[Dict[str, Any], List[Any]], Any]
+
+def _plan_rules(ctx: Dict[str, Any]) -> List[Tuple[Callable[..., Any], Tuple[Any, ...]]]:
+    n = len(ctx['data'])
+    step = max(min(-(-n // ctx['workers']), RULE_CHUNK_ROWS), 1)
+    return [(_rules_task, (ctx['handle'], a, min(a + step, n))) for a in range(0, n, step)]
+
+def _merge_rules(ctx: Dict[str, Any], parts: List[Tuple[array, array, array]]) -> None:
+    data, shared = ctx['data'], ctx['shared']
+    columns = [array('b'), array('b'), array('B')]
+    for part in parts:
+        for col, chunk in zip(columns, part):
+            col.extend(chunk)
+    data['persona'], data['risk_score'] = columns[0], columns[1]
+    data.add_categorical('risk_label', columns[2], RISK_LEVELS)
+    if shared is not None:
+        shared.add('persona', columns[0])
+        shared.add('risk_score', columns[1])
+        shared.add('risk_label', columns[2], RISK_LEVELS)
+
+def _plan_kmeans(ctx: Dict[str, Any]) -> List[Tuple[Callable[..., Any], Tuple[Any, ...]]]:
+    n = len(ctx['data'])
+    batch_size = KMEANS_BATCH_SIZE if n > KMEANS_MINIBATCH_ROWS else None
+    trace = isinstance(ctx['stages'], Instruments)
+    # One task per restart; every restart seeds and refines its own centers
+    return [(_kmeans_task, (ctx['handle'], 5, 40, s, batch_size, trace))
+            for s in restart_seeds(42, KMEANS_RESTARTS)]
+
+def _merge_kmeans(ctx: Dict[str, Any], runs: List[Tuple[float, array, List[List[float]], Any]]) -> Tuple[array, List[List[float]]]:
+    trace = ctx['stages'].kmeans if isinstance(ctx['stages'], Instruments) else None
+    return best_restart(restart_seeds(42, KMEANS_RESTARTS), runs, trace)
+
+def _plan_scatter(ctx: Dict[str, Any]) -> List[Tuple[Callable[..., Any], Tuple[Any, ...]]]:
+    n = len(ctx['data'])
+    step = max(-(-n // ctx['workers']), 1)
+    return [(_scatter_task, (ctx['handle'], a, min(a + step, n))) for a in range(0, n, step)]
+
+def _merge_scatter(ctx: Dict[str, Any], grids: List[ScatterGrid]) -> ScatterGrid:
+    out = ScatterGrid()
+    for grid in grids:
+        out.merge(grid)
+    return out
+
+def _plan_blocks(task: Callable[..., Any]) -> Callable[[Dict[str, Any]], List[Tuple[Callable[..., Any], Tuple[Any, ...]]]]:
+    def plan(ctx: Dict[str, Any]) -> List[Tuple[Callable[..., Any], Tuple[Any, ...]]]:
+        n = len(ctx['data'])
+        return [(task, (ctx['handle'], a, min(a + AGGREGATE_BLOCK, n))) for a in range(0, n, AGGREGATE_BLOCK)]
+    return plan
+
+def _merge_aggregates(ctx: Dict[str, Any], parts: List[Aggregator]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    # Blocks merge in row order, so categorical groups keep first-seen order
+    agg = Aggregator(AGGREGATES)
+    for part in parts:
+        agg.merge(part)
+    return agg.result()
+
+def _merge_cube(ctx: Dict[str, Any], parts: List['Cube']) -> 'Cube':
+    cube = Cube()
+    for part in parts:
+        cube.merge(part)
+    return cube
+
+def _merge_moments(ctx: Dict[str, Any], blocks: List[CoMoments]) -> CoMoments:
+    moments = CoMoments(len(CORRELATION_NAMES))
+    for block in blocks:
+        moments.merge(block)
+    return moments
+
+PIPELINE: Dict[str, Stage] = {
+    'rules': Stage([], _plan_rules, _merge_rules),
+    'kmeans': Stage([], _plan_kmeans, _merge_kmeans),
+    'moments': Stage([], lambda ctx: [(_moments_task, (ctx['handle'], a, a + CORRELATION_BLOCK))
+                                      for a in range(0, len(ctx['data']), CORRELATION_BLOCK)],
+                     _merge_moments),
+    'spearman': Stage([], lambda ctx: [(_spearman_task, (ctx['handle'],))], lambda ctx, r: r[0]),
+    'bootstrap': Stage([], lambda ctx: [(_bootstrap_task, (ctx['handle'], seeds))
+                                        for seeds in bootstrap_seeds(ctx['replicates'], ctx['workers'])]
+                       if ctx['replicates'] > 0 and len(ctx['data']) > 1 else [],
+                       lambda ctx, parts: bootstrap_interval([r for p in parts for r in p]) if parts else {}),
+    'aggregates': Stage(['rules'], _plan_blocks(_aggregate_task), _merge_aggregates),
+    'cube': Stage(['rules'], _plan_blocks(_cube_task), _merge_cube),
+    'scatter': Stage(['rules'], _plan_scatter, _merge_scatter),
+    'centers': Stage(['rules', 'kmeans'], lambda ctx: [],
+                     lambda ctx, _: map_centers(ctx['kmeans'][0], ctx['data']['persona'], ctx['kmeans'][1])),
+}
+
+def run_dag(dag: Dict[str, Stage], ctx: Dict[str, Any], pool: Optional[ProcessPoolExecutor],
+            stages: Dict[str, float]) -> Dict[str, Any]:
+    """
+    Run ``dag`` in dependency order, storing each stage's result in ``ctx``
+    under its name. The tasks of every ready stage are submitted to ``pool``
+    together, and a stage is merged here as soon as its last task finishes.
+    Without a pool the tasks run inline.
+    """
+    timed = isinstance(stages, Instruments)
+    remaining = dict(dag)
+    running: Dict[str, List[Future]] = {}
+    while remaining or running:
+        ready = [name for name, st in remaining.items() if all(d in ctx for d in st.deps)]
+        for name in ready:
+            stage = remaining.pop(name)
+            if timed:
+                stages.begin(name)
+            tasks = stage.plan(ctx)
+            if pool is None or not tasks:
+                ctx[name] = stage.merge(ctx, [fn(*args) for fn, args in tasks])
+                checkpoint(stages, name, len(ctx['data']))
+            elif timed:
+                running[name] = [pool.submit(_timed_task, fn, *args) for fn, args in tasks]
+            else:
+                running[name] = [pool.submit(fn, *args) for fn, args in tasks]
+        if ready:
+            continue
+        if not running:
+            raise ValueError(f"unsatisfiable stage dependencies: {sorted(remaining)}")
+        wait([f for fs in running.values() for f in fs], return_when=FIRST_COMPLETED)
+        for name in [n for n, fs in running.items() if all(f.done() for f in fs)]:
+            results = [f.result() for f in running.pop(name)]
+            if timed:
+                stages.worker_cpu[name] += sum(cpu for _, cpu in results)
+                results = [r for r, _ in results]
+            ctx[name] = dag[name].merge(ctx, results)
+            checkpoint(stages, name, len(ctx['data']))
+    return ctx
+
+# ── 8. Output ──────────────────────────────────────────────────────────────────
+JS_HEADER = "// Auto-generated by preprocess.py — do not edit manually\n"
+
+# Integer typed arrays, narrowest first: (array typecode, JS type, min, max)
+INT_TYPES = [
+    ('B', 'u8', 0, 0xFF), ('b', 'i8', -0x80, 0x7F), ('H', 'u16', 0, 0xFFFF),
+    ('h', 'i16', -0x8000, 0x7FFF), ('I', 'u32', 0, 0xFFFFFFFF), ('i', 'i32', -0x80000000, 0x7FFFFFFF),
+]
+
+def top_k(key: Callable[[int], Any], candidates: Iterable[int], k: Optional[int] = None,
+          desc: bool = True) -> List[int]:
+    """
+    The ``k`` candidates with the largest (``desc``) or smallest keys, in
+    key order with ties in candidate order, as a stable sort would give.
+    Uses a k-element heap, O(n log k); ``k=None`` sorts them all.
+    """
+    if k is None:
+        return sorted(candidates, key=key, reverse=desc)
+    return (heapq.nlargest if desc else heapq.nsmallest)(k, candidates, key=key)
+
+def roster_orders(roster: Table) -> Tuple[List[int], List[int]]:
+    # All students by exam score, and high-risk students by risk score (both descending)
+    n = len(roster)
+    by_score = sorted(range(n), key=roster['Exam_Score'].__getitem__, reverse=True)
+    risk_codes = roster['risk_label']
+    high_risk = top_k(roster['risk_score'].__getitem__, (i for i in range(n) if risk_codes[i] == 0))
+    return by_score, high_risk
+
+def pack_array(values: Any) -> Dict[str, str]:
+    """
+    Encode a numeric column as the narrowest typed array that holds it
+    exactly: integer-valued columns become (u)int8/16/32, anything else
+    float64. Data is little-endian base64, ready for ``new Uint8Array(...)``.
+    """
+    col = values if isinstance(values, array) else array('d', values)
+    kind = 'f64'
+    if not col or col.typecode != 'd' or all(map(float.is_integer, col)):
+        lo, hi = (min(col), max(col)) if col else (0, 0)
+        for code, name, a, b in INT_TYPES:
+            if a <= lo and hi <= b and array(code).itemsize == int(name[1:]) // 8:
+                col, kind = array(code, map(int, col)), name
+                break
+    if kind == 'f64' and col.typecode != 'd':
+        col = array('d', col)
+    if sys.byteorder == 'big':
+        col = array(col.typecode, col)
+        col.byteswap()
+    return {'type': kind, 'data': base64.b64encode(col.tobytes()).decode('ascii')}
+
+def unpack_array(packed: Dict[str, str]) -> array:
+    code = next((c for c, name, _, _ in INT_TYPES if name == packed['type']), 'd')
+    col = array(code, base64.b64decode(packed['data']))
+    if sys.byteorder == 'big':
+        col.byteswap()
+    return col
+
+# Rows of the default (high-risk) table view written into data.js, enough for
+# the first dashboard page before roster.js arrives
+RISK_TOP_K = 50
+
+# Filtered sort orders RosterIndex keeps materialized (least recently used dropped)
+ROSTER_VIEWS = 16
+
+# Roster fields the dashboard filters on; each gets one bitmap per level
+ROSTER_BITMAPS = ['school', 'gender', 'motiv', 'risk', 'persona', 'internet']
+
+# Ascending sort key per sortable roster field (same orderings as the dashboard table)
+PERSONA_RANK = {'Driven Achiever': 0, 'Consistent Worker': 1, 'Potential Bloomer': 2,
+                'Passive Coaster': 3, 'Struggling Learner': 4}
+LEVEL_RANK = {'Low': 0, 'Medium': 1, 'High': 2}
+ROSTER_SORTS: Dict[str, Optional[Callable[[Any], Any]]] = {
+    'persona': lambda p: PERSONA_RANK.get(PERSONA_PROFILES[p]['name'], 5),
+    'school': str,
+    'gender': str,
+    'motiv': lambda v: LEVEL_RANK.get(v, 0),
+    'internet': lambda v: v == 'Yes',
+    'risk': lambda v: -RISK_LEVELS.index(v),
+    # Numeric fields sort by value
+    'score': None, 'attend': None, 'hours': None, 'risk_score': None,
+}
+
+class RosterIndex:
+    """
+    Query layer over the roster, held column-wise in exam-score order (a
+    row's position is its all-students rank). Filters are per-level bitmaps
+    ANDed together per request; sort orders are permutations grouped into
+    runs of equal keys, so either direction keeps ties in position order
+    (like a stable sort). The first query for a filter and sort walks the
+    sort order once, O(roster), and keeps the matching positions; later
+    pages of that view are slices, O(page size). Only the ROSTER_VIEWS most
+    recently used views are kept.
+    """
+
+    def __init__(self, fields: Dict[str, array], levels: Dict[str, List[Any]],
+                 bitmaps: Dict[str, List[bytes]], sorts: Dict[str, Dict[str, Any]]) -> None:
+        self.fields = fields
+        self.levels = levels
+        self.bitmaps = bitmaps
+        self.sorts = sorts
+        self.count = len(fields['score'])
+        self._views: Dict[Tuple[Any, ...], array] = {}
+
+    @classmethod
+    def build(cls, roster: Table, order: List[int]) -> 'RosterIndex':
+        fields = {f: array(typecode(roster[c]), map(roster[c].__getitem__, order))
+                  for f, c in ROSTER_FIELDS.items()}
+        levels: Dict[str, List[Any]] = {f: roster.levels[c] for f, c in ROSTER_FIELDS.items()
+                                        if c in roster.levels}
+        levels['persona'] = list(range(len(PERSONA_PROFILES)))
+        n = len(order)
+        bitmaps = {}
+        for f in ROSTER_BITMAPS:
+            maps = [bytearray((n + 7) // 8) for _ in levels[f]]
+            for pos, code in enumerate(fields[f]):
+                maps[code][pos >> 3] |= 1 << (pos & 7)
+            bitmaps[f] = [bytes(m) for m in maps]
+        sorts: Dict[str, Dict[str, Any]] = {}
+        for f, key in ROSTER_SORTS.items():
+            if f in bitmaps:
+                # Categorical: visit the level bitmaps in key order, levels with
+                # equal keys together
+                codes = sorted(range(len(levels[f])), key=lambda c: key(levels[f][c]))
+                sorts[f] = {'levels': [list(g) for _, g in itertools.groupby(codes, key=lambda c: key(levels[f][c]))]}
+                continue
+            col = fields[f]
+            perm = sorted(range(n), key=col.__getitem__)
+            runs = [i for i in range(n) if i == 0 or col[perm[i]] != col[perm[i - 1]]]
+            sorts[f] = {'perm': array('I', perm), 'runs': array('I', runs)}
+        return cls(fields, levels, bitmaps, sorts)
+
+    def to_compact(self) -> Dict[str, Any]:
+        fields = {}
+        for f, col in self.fields.items():
+            fields[f] = pack_array(col)
+            if f in self.levels and f != 'persona':
+                fields[f]['levels'] = self.levels[f]
+        sorts = {f: s if 'levels' in s else {'perm': pack_array(s['perm']), 'runs': pack_array(s['runs'])}
+                 for f, s in self.sorts.items()}
+        bitmaps = {f: [base64.b64encode(m).decode('ascii') for m in maps]
+                   for f, maps in self.bitmaps.items()}
+        return {'count': self.count, 'fields': fields, 'index': {'bitmaps': bitmaps, 'sorts': sorts}}
+
+    @classmethod
+    def from_compact(cls, compact: Dict[str, Any]) -> 'RosterIndex':
+        fields = {f: unpack_array(c) for f, c in compact['fields'].items()}
+        levels: Dict[str, List[Any]] = {f: c['levels'] for f, c in compact['fields'].items() if 'levels' in c}
+        levels['persona'] = list(range(len(PERSONA_PROFILES)))
+        index = compact['index']
+        bitmaps = {f: [base64.b64decode(m) for m in maps] for f, maps in index['bitmaps'].items()}
+        sorts = {f: s if 'levels' in s else {'perm': unpack_array(s['perm']), 'runs': unpack_array(s['runs'])}
+                 for f, s in index['sorts'].items()}
+        return cls(fields, levels, bitmaps, sorts)
+
+    def row(self, pos: int) -> Dict[str, Any]:
+        out: Dict[str, Any] = {'id': pos + 1}
+        for f, col in self.fields.items():
+            out[f] = self.levels[f][col[pos]] if f in self.levels and f != 'persona' else col[pos]
+        return out
+
+    def mask(self, filters: Dict[str, str]) -> Tuple[Optional[bytes], int]:
+        # (bitmap of matching positions or None for "all", match count)
+        bits: Optional[int] = None
+        for f, v in self._filter_key(filters):
+            if f not in self.bitmaps:
+                raise ValueError(f"cannot filter on {f!r}")
+            names = [str(lv) for lv in self.levels[f]]
+            m = int.from_bytes(self.bitmaps[f][names.index(v)], 'little') if v in names else 0
+            bits = m if bits is None else bits & m
+        if bits is None:
+            return None, self.count
+        return bits.to_bytes((self.count + 7) // 8, 'little'), bin(bits).count('1')
+
+    @staticmethod
+    def _filter_key(filters: Dict[str, str]) -> Tuple[Tuple[str, str], ...]:
+        return tuple(sorted((f, str(v)) for f, v in filters.items() if v not in (None, '', 'All')))
+
+    def view(self, filters: Dict[str, str], sort: str, desc: bool) -> array:
+        # Matching positions in sort order, materialized once per view
+        key = (self._filter_key(filters), sort, desc)
+        positions = self._views.pop(key, None)
+        if positions is None:
+            mask, _ = self.mask(filters)
+            order = self.order(sort, desc)
+            if mask is not None:
+                order = (pos for pos in order if mask[pos >> 3] >> (pos & 7) & 1)
+            positions = array('I', order)
+            if len(self._views) >= ROSTER_VIEWS:
+                del self._views[next(iter(self._views))]
+        self._views[key] = positions
+        return positions
+
+    def order(self, sort: str, desc: bool) -> Iterator[int]:
+        if sort not in self.sorts:
+            raise ValueError(f"cannot sort on {sort!r}")
+        s = self.sorts[sort]
+        if 'levels' in s:
+            maps = self.bitmaps[sort]
+            for group in (reversed(s['levels']) if desc else s['levels']):
+                bits = maps[group[0]]
+                if len(group) > 1:
+                    merged = 0
+                    for code in group:
+                        merged |= int.from_bytes(maps[code], 'little')
+                    bits = merged.to_bytes(len(bits), 'little')
+                for j, byte in enumerate(bits):
+                    while byte:
+                        low = byte & -byte
+                        yield (j << 3) + low.bit_length() - 1
+                        byte ^= low
+            return
+        perm, runs = s['perm'], s['runs']
+        bounds = list(zip(runs, list(runs[1:]) + [self.count]))
+        for a, b in (reversed(bounds) if desc else bounds):
+            for i in range(a, b):
+                yield perm[i]
+
+    def top(self, filters: Optional[Dict[str, str]] = None, sort: str = 'risk_score',
+            desc: bool = True, k: int = RISK_TOP_K) -> List[int]:
+        # The first k positions of order() among the matching rows, from a
+        # bounded heap instead of the permutation (no sort order needed)
+        if sort not in self.sorts:
+            raise ValueError(f"cannot sort on {sort!r}")
+        mask, _ = self.mask(filters or {})
+        candidates: Iterable[int] = range(self.count)
+        if mask is not None:
+            candidates = (pos for pos in candidates if mask[pos >> 3] >> (pos & 7) & 1)
+        col, s = self.fields[sort], self.sorts[sort]
+        if 'levels' in s:
+            group = {code: g for g, codes in enumerate(s['levels']) for code in codes}
+            return top_k(lambda pos: group[col[pos]], candidates, k, desc)
+        return top_k(col.__getitem__, candidates, k, desc)
+
+    def query(self, filters: Optional[Dict[str, str]] = None, sort: str = 'risk_score',
+              desc: bool = True, page: int = 1, size: int = 50) -> Dict[str, Any]:
+        if page < 1 or size < 1:
+            raise ValueError('page and size must be at least 1')
+        positions = self.view(filters or {}, sort, desc)
+        skip = (page - 1) * size
+        return {'total': len(positions), 'page': page, 'size': size,
+                'rows': [self.row(pos) for pos in positions[skip:skip + size]]}
+
+def compact_roster(roster: Table) -> RosterIndex:
+    """
+    Columnar roster: one typed array per field, in exam-score order (the
+    all-students view), categoricals as codes plus their level list, and
+    the RosterIndex bitmaps and sort orders. Every table view, the
+    high-risk one included, is a filter plus a sort order over it.
+    """
+    n = len(roster)
+    return RosterIndex.build(roster, sorted(range(n), key=roster['Exam_Score'].__getitem__, reverse=True))
+
+def read_js(path: str) -> Any:
+    # Inverse of write_js: the JSON literal assigned in an auto-generated file
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    return json.loads(text[text.index('=') + 1:].strip().rstrip(';'))
+
+def write_js(path: str, name: str, value: Any, indent: Optional[int] = None) -> None:
+    separators = None if indent else (',', ':')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"{JS_HEADER}const {name} = {json.dumps(value, indent=indent, separators=separators)};\n")
+
+def write_legacy(output: Dict[str, Any], roster: Table, out_path: Optional[str] = None) -> List[str]:
+    # Everything in one data.js, roster rows inlined as objects (twice for high-risk students)
+    out_path = out_path or OUT_PATH
+    by_score, high_risk = roster_orders(roster)
+    full: Dict[str, Any] = {}
+    for key, value in output.items():
+        if key == 'personas':
+            full['risk_table'] = [roster_row(roster, i, rank) for rank, i in enumerate(high_risk)]
+            full['all_students'] = [roster_row(roster, i, rank) for rank, i in enumerate(by_score)]
+        full[key] = value
+    write_js(out_path, 'ANALYTICS', full, indent=2)
+    return [out_path]
+
+def write_compact(output: Dict[str, Any], roster: Table, k: int = RISK_TOP_K,
+                  out_path: Optional[str] = None, roster_path: Optional[str] = None) -> List[str]:
+    # Small eager data.js plus roster.js, which the dashboard loads after first
+    # paint; data.js carries the first k rows of the default table view so the
+    # first page(s) need no roster.js
+    out_path, roster_path = out_path or OUT_PATH, roster_path or ROSTER_PATH
+    index = compact_roster(roster)
+    view = {'filters': {'risk': RISK_LEVELS[0]}, 'sort': 'risk_score', 'desc': True}
+    top = {**view, 'total': index.mask(view['filters'])[1],
+           'rows': [index.row(pos) for pos in index.top(**view, k=k)]}
+    # roster.js is loaded relative to the dashboard page, which sits next to OUT_PATH
+    src = os.path.relpath(roster_path, os.path.dirname(OUT_PATH)).replace(os.sep, '/')
+    write_js(out_path, 'ANALYTICS', {**output, 'roster': {'src': src, 'count': len(roster), 'top': top}})
+    write_js(roster_path, 'ANALYTICS_ROSTER', index.to_compact())
+    return [out_path, roster_path]
+
+def shard_slug(name: str) -> str:
+    # File-name-safe shard id; the dashboard loads shards/<slug>.data.js for ?shard=<slug>
+    return ''.join(ch if ch.isalnum() or ch in '-_' else '_' for ch in name) or '_'
+
+def write_shards(shards: List[Tuple[str, Dict[str, Any], Table]], fmt: str,
+                 k: int = RISK_TOP_K) -> Tuple[List[Dict[str, Any]], List[str]]:
+    # One data.js (+ roster.js) per shard under SHARDS_DIR, each listing every
+    # shard so the dashboard can switch between them; returns that listing
+    listing, slugs = [], Counter()
+    for name, _, roster in shards:
+        slug = shard_slug(name)
+        slugs[slug] += 1
+        if slugs[slug] > 1:
+            slug = f"{slug}-{slugs[slug]}"
+        listing.append({'name': name, 'slug': slug, 'count': len(roster)})
+    os.makedirs(SHARDS_DIR, exist_ok=True)
+    written = []
+    for entry, (_, output, roster) in zip(listing, shards):
+        output = {**output, 'shard': entry['slug'], 'shards': listing}
+        base = os.path.join(SHARDS_DIR, entry['slug'])
+        if fmt == 'compact':
+            written += write_compact(output, roster, k, base + '.data.js', base + '.roster.js')
+        else:
+            written += write_legacy(output, roster, base + '.data.js')
+    return listing, written
+
+def precompress(paths: List[str], methods: List[str]) -> List[str]:
+    # Sibling .gz/.br files for static servers that serve precompressed assets
+    written = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        for method in methods:
+            if method == 'gzip':
+                out, data = path + '.gz', gzip.compress(raw, compresslevel=9, mtime=0)
+            else:
+                out, data = path + '.br', brotli.compress(raw, quality=11)
+            with open(out, 'wb') as f:
+                f.write(data)
+            written.append(out)
+    return written
+
+# ── 9. Batch scoring ───────────────────────────────────────────────────────────
+# Persona and risk for uploaded student rows, with the same rules the pipeline
+# applies (assign_persona_by_score, compute_risk). Uploads only need the
+# columns those rules read; rows are scored a column batch at a time.
+SCORE_NUMERIC = ['Attendance', 'Exam_Score', 'Hours_Studied', 'Previous_Scores']
+SCORE_CATEGORICAL = ['Motivation_Level', 'Internet_Access', 'Learning_Disabilities', 'Peer_Influence']
+SCORE_BATCH_ROWS = 4096  # larger batches only add allocation churn
+
+# Same columns and labels as the dashboard's batch export
+SCORE_HEADER = ['Row_Number', 'Predicted_Persona', 'Risk_Score', 'Risk_Level']
+SCORE_RISK_TEXT = ['High Risk', 'Medium Risk', 'Low']
+
+def _number(v: str) -> float:
+    # Blank or malformed cells score as NaN, which matches no rule threshold
+    try:
+        return float(v)
+    except ValueError:
+        return math.nan
+
+def upload_batches(rows: Iterator[List[str]], batch_size: int = SCORE_BATCH_ROWS) -> Iterator[Table]:
+    """
+    Parse uploaded CSV rows (header first) into Tables of at most
+    ``batch_size`` rows holding the SCORE_* columns. Unlike clean_chunks, rows
+    with unparseable numbers are kept (as NaN); only short or blank lines are
+    skipped. Raises ValueError naming the first missing column.
+    """
+    header = [h.lstrip('\ufeff').strip() for h in next(rows, [])]
+    for c in SCORE_NUMERIC + SCORE_CATEGORICAL:
+        if c not in header:
+            raise ValueError(f"CSV is missing required column: {c}")
+    num_pos = [header.index(c) for c in SCORE_NUMERIC]
+    cat_pos = [header.index(c) for c in SCORE_CATEGORICAL]
+    width = max(num_pos + cat_pos) + 1
+    levels: List[List[str]] = [[] for _ in SCORE_CATEGORICAL]
+    index: List[Dict[str, int]] = [{} for _ in SCORE_CATEGORICAL]
+
+    rows = (r for r in rows if len(r) >= width)
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return
+        table = Table()
+        for c, p in zip(SCORE_NUMERIC, num_pos):
+            table[c] = array('d', [_number(r[p]) for r in batch])
+        for j, (c, p) in enumerate(zip(SCORE_CATEGORICAL, cat_pos)):
+            codes = array('H')
+            for r in batch:
+                v = r[p].strip()
+                code = index[j].get(v)
+                if code is None:
+                    code = index[j][v] = len(levels[j])
+                    levels[j].append(v)
+                codes.append(code)
+            table.add_categorical(c, codes, levels[j])
+        yield table
+
+def score_upload(rows: Iterator[List[str]], batch_size: int = SCORE_BATCH_ROWS) -> Iterator[Table]:
+    # Scored batches: upload_batches plus persona, risk_score and risk_label columns.
+    for batch in upload_batches(rows, batch_size):
+        score_rows(batch)
+        yield batch
+
+def score_file(src: str, dst: str, batch_size: int = SCORE_BATCH_ROWS) -> Tuple[int, float]:
+    """Score the CSV at ``src`` into ``dst``; returns (rows scored, seconds)."""
+    names = [p['name'] for p in PERSONA_PROFILES]
+    start = time.perf_counter()
+    n = 0
+    with open(src, newline='', encoding='utf-8-sig') as f, \
+            open(dst, 'w', newline='', encoding='utf-8') as out:
+        writer = csv.writer(out)
+        writer.writerow(SCORE_HEADER)
+        for batch in score_upload(csv.reader(f), batch_size):
+            writer.writerows(zip(range(n + 1, n + len(batch) + 1),
+                                 map(names.__getitem__, batch['persona']),
+                                 batch['risk_score'],
+                                 map(SCORE_RISK_TEXT.__getitem__, batch['risk_label'])))
+            n += len(batch)
+    return n, time.perf_counter() - start
+
+def rows_per_sec(n: int, seconds: float) -> int:
+    return round(n / seconds) if seconds > 0 else n
+
+# ── 10. Serve ──────────────────────────────────────────────────────────────────
+# Local stand-in for a backend: serves the dashboard files plus
+# GET  /api/roster?school=..&gender=..&motiv=..&risk=..&persona=..&internet=..
+#                 &sort=risk_score&order=desc&page=1&size=50
+# POST /api/score   (body: an upload CSV) → persona/risk columns + throughput
+# Only the dashboard's own files are served; the CSV, cache, snapshot and
+# everything else in the directory answer 404.
+ROSTER_PAGE_MAX = 500
+SERVE_FILES = ['index.html', 'index.css', 'app.js', 'gemini.js', 'config.js', 'data*.js', 'roster*.js',
+               'shards/*.data.js', 'shards/*.roster.js']
+
+def servable(path: str) -> bool:
+    # Whether a URL path names a file matched by SERVE_FILES ('/' is index.html)
+    from urllib.parse import unquote
+    parts = posixpath.normpath('/' + unquote(path)).lstrip('/').split('/')
+    if parts == ['']:
+        return True
+    return any(len(parts) == len(pattern) and all(map(fnmatch.fnmatchcase, parts, pattern))
+               for pattern in (p.split('/') for p in SERVE_FILES))
+
+def _body_lines(f: Any, length: int) -> Iterator[str]:
+    # Request body as text lines, never reading past Content-Length
+    while length > 0:
+        line = f.readline(length)
+        if not line:
+            return
+        length -= len(line)
+        yield line.decode('utf-8')
+
+def api_handler(index: RosterIndex) -> Any:
+    from http.server import SimpleHTTPRequestHandler
+    from urllib.parse import parse_qs, urlsplit
+
+    class Handler(SimpleHTTPRequestHandler):
+        def send_head(self) -> Any:
+            # GET and HEAD of static files
+            if not servable(urlsplit(self.path).path):
+                self.send_error(404)
+                return None
+            return super().send_head()
+
+        def do_GET(self) -> None:
+            url = urlsplit(self.path)
+            if url.path.rstrip('/') != '/api/roster':
+                super().do_GET()
+                return
+            params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            try:
+                body = index.query(
+                    filters={f: params[f] for f in ROSTER_BITMAPS if f in params},
+                    sort=params.get('sort', 'risk_score'),
+                    desc=params.get('order', 'desc') != 'asc',
+                    page=int(params.get('page', 1)),
+                    size=min(int(params.get('size', 50)), ROSTER_PAGE_MAX),
+                )
+                status = 200
+            except ValueError as e:
+                body, status = {'error': str(e)}, 400
+            self.send_json(body, status)
+
+        def do_POST(self) -> None:
+            if urlsplit(self.path).path.rstrip('/') != '/api/score':
+                self.send_error(404)
+                return
+            start = time.perf_counter()
+            length = int(self.headers.get('Content-Length') or 0)
+            persona, risk_score, risk = array('b'), array('b'), array('B')
+            try:
+                for batch in score_upload(csv.reader(_body_lines(self.rfile, length))):
+                    persona.extend(batch['persona'])
+                    risk_score.extend(batch['risk_score'])
+                    risk.extend(batch['risk_label'])
+            except (ValueError, UnicodeDecodeError) as e:
+                self.send_json({'error': str(e)}, 400)
+                return
+            seconds = time.perf_counter() - start
+            self.send_json({'count': len(persona), 'seconds': round(seconds, 3),
+                            'rows_per_sec': rows_per_sec(len(persona), seconds),
+                            'risk_levels': RISK_LEVELS, 'persona': persona.tolist(),
+                            'risk_score': risk_score.tolist(), 'risk': risk.tolist()})
+
+        def send_json(self, body: Any, status: int = 200) -> None:
+            data = json.dumps(body, separators=(',', ':')).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
+
+def serve(host: str, port: int) -> None:
+    from functools import partial
+    from http.server import ThreadingHTTPServer
+
+    if not os.path.exists(ROSTER_PATH):
+        sys.exit(f"{ROSTER_PATH} not found; run preprocess.py (compact format) first")
+    index = RosterIndex.from_compact(read_js(ROSTER_PATH))
+    handler = partial(api_handler(index), directory=os.path.dirname(os.path.abspath(ROSTER_PATH)))
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"Serving dashboard, /api/roster ({index.count} students) and /api/score on http://{host}:{port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+# ── 11. Main ───────────────────────────────────────────────────────────────────
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Generate data.js from Student_data.csv')
+    parser.add_argument('--chunk-size', type=int, default=None, metavar='N',
+                        help='stream the CSV N rows at a time with bounded memory '
+                             '(default: load the whole file)')
+    parser.add_argument('--incremental', action='store_true',
+                        help=f'stream the CSV and keep a snapshot in {os.path.basename(STATE_PATH)} so later '
+                             'runs only process appended rows (chunk size from --chunk-size, '
+                             f'default {INCREMENTAL_CHUNK_ROWS})')
+    partition = parser.add_mutually_exclusive_group()
+    partition.add_argument('--partition-dir', default=None, metavar='DIR',
+                           help='process every CSV in DIR as one shard (e.g. one school): writes '
+                                f'{os.path.basename(SHARDS_DIR)}/<name>.data.js per shard and the district '
+                                'rollup, merged from the shard statistics, as data.js')
+    partition.add_argument('--partition-by', default=None, metavar='COLUMN',
+                           help=f'split {os.path.basename(CSV_PATH)} into shards by the value of COLUMN, '
+                                'written like --partition-dir')
+    parser.add_argument('--bootstrap', type=int, default=0, metavar='B',
+                        help='add 95%% bootstrap confidence intervals for the score correlations '
+                             'from B resamples, computed across all cores (default: off)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, metavar='N',
+                        help='processes for the stage pipeline, K-Means restarts and the bootstrap '
+                             '(default: all cores; 1 runs everything in this process)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'always parse the CSV: neither read nor write the cleaned-column cache '
+                             f'({os.path.basename(CACHE_PATH)}, used by the default in-memory mode)')
+    parser.add_argument('--format', choices=['compact', 'legacy'], default='compact',
+                        help='compact: small data.js summary + columnar roster.js loaded lazily; '
+                             'legacy: a single data.js with the roster inlined (default: compact)')
+    parser.add_argument('--precompress', choices=['gzip', 'br'], action='append', default=[],
+                        help='also write .gz/.br copies of the output files (repeatable; '
+                             'br needs the brotli package)')
+    parser.add_argument('--top-k', type=int, default=RISK_TOP_K, metavar='K',
+                        help='high-risk rows written into the compact data.js so the risk table '
+                             f'draws before roster.js loads (default: {RISK_TOP_K})')
+    parser.add_argument('--report', default=None, metavar='JSON',
+                        help='write per-stage wall/CPU time, rows/sec, allocations and RSS growth, '
+                             'plus the K-Means convergence trace, to this file')
+    parser.add_argument('--profile', default=None, metavar='PROF',
+                        help='run under cProfile and save the stats here (for pstats, snakeviz or '
+                             'flameprof; pool workers are not profiled, use --workers 1 to see everything)')
+    commands = parser.add_subparsers(dest='command', metavar='{serve,score}')
+    serve_cmd = commands.add_parser('serve', help='serve the dashboard with /api/roster and /api/score endpoints')
+    serve_cmd.add_argument('--host', default='127.0.0.1')
+    serve_cmd.add_argument('--port', type=int, default=8000)
+    score_cmd = commands.add_parser('score', help='predict persona and risk level for every row of a CSV')
+    score_cmd.add_argument('input', help='student CSV (needs the columns the risk and persona rules read)')
+    score_cmd.add_argument('output', help='where to write Row_Number, Predicted_Persona, Risk_Score, Risk_Level')
+    score_cmd.add_argument('--batch-size', type=int, default=SCORE_BATCH_ROWS, metavar='N',
+                           help=f'rows scored per batch (default: {SCORE_BATCH_ROWS})')
+    args = parser.parse_args(argv)
+    if args.command == 'serve':
+        serve(args.host, args.port)
+        return
+    if args.command == 'score':
+        try:
+            n, seconds = score_file(args.input, args.output, args.batch_size)
+        except ValueError as e:
+            sys.exit(f"{args.input}: {e}")
+        print(f"Scored {n} students in {seconds:.2f}s ({rows_per_sec(n, seconds)} rows/sec) → {args.output}")
+        return
+    if 'br' in args.precompress and brotli is None:
+        parser.error('--precompress br requires the brotli package (pip install brotli)')
+    partitioned = args.partition_dir or args.partition_by
+    if partitioned and args.incremental:
+        parser.error('--incremental cannot be combined with --partition-dir/--partition-by')
+
+    stages: Dict[str, float] = Instruments() if args.report else {}
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler is not None:
+        profiler.enable()
+    state: Optional[StreamState] = None
+    shards: List[Tuple[str, Dict[str, Any], Table]] = []
+    # Streaming roster logs; mapped until the outputs are written
+    work = tempfile.TemporaryDirectory(prefix='preprocess-', ignore_cleanup_errors=True)
+    source = args.partition_dir or CSV_PATH
+    if partitioned:
+        try:
+            shards, output, roster = run_partitioned(source, args.partition_by,
+                                                     args.chunk_size or INCREMENTAL_CHUNK_ROWS,
+                                                     args.bootstrap, stages, args.workers, work.name)
+        except (OSError, ValueError) as e:
+            sys.exit(f"{source}: {e}")
+    elif args.incremental:
+        output, roster, state = run_incremental(CSV_PATH, STATE_PATH, STATE_ROSTER_DIR,
+                                                args.chunk_size or INCREMENTAL_CHUNK_ROWS,
+                                                args.bootstrap, stages, args.workers)
+    elif args.chunk_size:
+        output, roster = run_streaming(CSV_PATH, args.chunk_size, args.bootstrap, stages, args.workers,
+                                       work.name)
+    else:
+        output, roster = run_in_memory(CSV_PATH, args.bootstrap, stages, args.workers,
+                                       None if args.no_cache else CACHE_PATH)
+    checkpoint(stages, 'tables', len(roster))
+
+    written = []
+    if shards:
+        listing, written = write_shards(shards, args.format, args.top_k)
+        output = {**output, 'shards': listing}
+    if args.format == 'compact':
+        written += write_compact(output, roster, args.top_k)
+    else:
+        written += write_legacy(output, roster)
+    written += precompress(written, args.precompress)
+    checkpoint(stages, 'serialize', len(roster))
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+        print(f"  Profile written to {args.profile}")
+    if isinstance(stages, Instruments):
+        mode = ('partitioned' if partitioned else 'incremental' if args.incremental
+                else 'streaming' if args.chunk_size else 'in-memory')
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'source': source, 'mode': mode,
+                       'workers': args.workers, 'rows': len(roster), **stages.report()}, f, indent=2)
+        print(f"  Report written to {args.report}")
 
-    js_content = f"// Auto-generated by preprocess.py — do not edit manually\nconst ANALYTICS = {json.dumps(output, indent=2)};\n"
-    with open(OUT_PATH, 'w', encoding='utf-8') as f:
-        f.write(js_content)
-        
-    file_kb = len(js_content) // 1024
-    print(f"  Written to {OUT_PATH} ({file_kb}KB)")
+    for path in written:
+        print(f"  Written to {path} ({os.path.getsize(path) // 1024}KB)")
+    if state is not None:
+        # Only after data.js is in place, so the snapshot never runs ahead of it
+        state.save(STATE_PATH)
+        print(f"  Snapshot saved to {STATE_PATH}")
+    work.cleanup()
+    if resource is not None:
+        print("Peak RSS by stage: " + ', '.join(f"{k} {v:.1f}MB" for k, v in stages.items()))
     print("Done! ✅")
 
 if __name__ == '__main__':
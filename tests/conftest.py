@@ -0,0 +1,106 @@
+"""
+Shared fixtures for the preprocess.py tests. fixtures/students.csv is 400
+synthetic rows, a few with dirty values; fixtures/baseline_data.js is the
+original script's data.js for it.
+"""
+
+import functools
+import os
+import sys
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import preprocess as pp  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+STUDENTS_CSV = os.path.join(FIXTURES, 'students.csv')
+BASELINE_JS = os.path.join(FIXTURES, 'baseline_data.js')
+
+# Fitted on the reservoir sample (warm-started on incremental runs) or read
+# from the KLL sketches, so only close to the in-memory result
+APPROXIMATE_KEYS = {'centers', 'quantiles'}
+
+
+@pytest.fixture(scope='session')
+def in_memory():
+    return pp.run_in_memory(STUDENTS_CSV, 0, {}, 1)
+
+
+@pytest.fixture
+def outputs(tmp_path, monkeypatch):
+    # Point every file main() reads or writes next to the fixture CSV at tmp_path
+    for name, path in [('CSV_PATH', 'Student_data.csv'), ('OUT_PATH', 'data.js'), ('ROSTER_PATH', 'roster.js'),
+                       ('CACHE_PATH', 'Student_data.cache'), ('STATE_PATH', 'data.state.json'),
+                       ('STATE_ROSTER_DIR', 'data.state.roster'), ('SHARDS_DIR', 'shards')]:
+        monkeypatch.setattr(pp, name, str(tmp_path / path))
+    with open(STUDENTS_CSV, encoding='utf-8') as src, open(pp.CSV_PATH, 'w', encoding='utf-8') as dst:
+        dst.write(src.read())
+    return tmp_path
+
+
+@pytest.fixture(scope='session')
+def api(in_memory, tmp_path_factory):
+    # The serve command's handler on a free port, over a directory holding a
+    # data.js and a CSV
+    tmp_path = tmp_path_factory.mktemp('site')
+    (tmp_path / 'data.js').write_text('const ANALYTICS = {};\n', encoding='utf-8')
+    (tmp_path / 'Student_data.csv').write_text('not for the browser\n', encoding='utf-8')
+    handler = functools.partial(pp.api_handler(pp.compact_roster(in_memory[1])), directory=str(tmp_path))
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+def fetch(url, body=None):
+    # (status, body bytes); POSTs ``body`` when given
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=body)) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def students():
+    return pp.clean(pp.load_csv(STUDENTS_CSV))
+
+
+def columns(roster):
+    # Roster columns as plain values (categorical codes decoded)
+    return {c: [roster.levels[c][v] for v in roster[c]] if c in roster.levels else list(roster[c])
+            for c in pp.ROSTER_COLUMNS}
+
+
+def assert_quantiles_close(approx, exact):
+    # Same groups and counts; sketch endpoints are the exact minimum and maximum
+    if isinstance(exact, dict):
+        assert approx.keys() == exact.keys()
+        for key in exact:
+            assert_quantiles_close(approx[key], exact[key])
+    elif isinstance(exact, list) and len(exact) == len(pp.QUANTILE_PROBS):
+        assert len(approx) == len(exact)
+        assert (approx[0], approx[-1]) == (exact[0], exact[-1])
+        assert approx == sorted(approx)
+    else:
+        assert approx == exact
+
+
+def assert_matches_in_memory(result, in_memory):
+    (output, roster), (expected, expected_roster) = result, in_memory
+    assert output.keys() == expected.keys()
+    for key in expected.keys() - APPROXIMATE_KEYS:
+        assert output[key] == expected[key], key
+    assert_quantiles_close(output['quantiles'], expected['quantiles'])
+    # Clusters are mapped to their majority persona, so which personas get a
+    # center depends on the fit
+    width, = {len(c) for c in expected['centers'].values()}
+    assert {len(c) for c in output['centers'].values()} == {width}
+    assert output['centers'].keys() <= set(range(len(pp.PERSONA_PROFILES)))
+    assert columns(roster) == columns(expected_roster)
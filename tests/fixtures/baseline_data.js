@@ -0,0 +1,2 @@
+// data.js written by the original preprocess.py (before the columnar rewrite) for students.csv
+const ANALYTICS = {"kpis":{"total":398,"avg_score":67.16,"avg_attend":80.04,"avg_hours":19.65,"high_risk":68,"medium_risk":143,"low_risk":187,"top_cluster":"Driven Achiever","top_cluster_pct":22.1},"norm_stats":{"Hours_Studied":[2.0,34.0],"Attendance":[60.0,40.0],"Sleep_Hours":[4.0,6.0],"Previous_Scores":[50.0,50.0],"Tutoring_Sessions":[0.0,7.0],"Physical_Activity":[0.0,6.0]},"centers":{"4":[0.5098039215686274,0.26722222222222214,0.7277777777777774,0.63,0.21269841269841266,0.4833333333333335],"1":[0.5065359477124186,0.7677777777777777,0.5037037037037038,0.23888888888888893,0.19047619047619044,0.4833333333333333],"0":[0.5185185185185184,0.8179012345679014,0.6378600823045271,0.7686419753086423,0.20282186948853617,0.4979423868312757],"3":[0.5620915032679737,0.2017361111111111,0.4259259259259258,0.2599999999999999,0.17658730158730163,0.474537037037037]},"clusters":[{"id":0,"name":"Driven Achiever","icon":"🚀","color":"#7C3AED","description":"High study hours, excellent attendance, strong motivation. These students consistently perform at the top.","strategies":["Offer advanced challenge projects and enrichment tasks to maintain engagement.","Assign peer mentoring roles to reinforce their own learning through teaching.","Provide access to competitions (Olympiads, subject fairs) and external programs.","Give autonomy in project-based learning — they thrive with creative freedom.","Regularly celebrate milestones to sustain intrinsic motivation long-term."],"count":88,"avg_score":72.27,"avg_hours":22.76,"avg_attend":92.69,"avg_tutor":1.5,"avg_sleep":7.32,"avg_prev":80.23,"risk_high":0},{"id":1,"name":"Consistent Worker","icon":"📚","color":"#0EA5E9","description":"Steady attendance and moderate study hours. Reliable performers who respond well to structured learning.","strategies":["Use structured study plans and weekly goal-setting exercises.","Introduce spaced repetition tools (flashcards, quizzes) for retention.","Leverage collaborative study groups — they excel when paired with peers.","Offer regular, specific feedback to help them identify precise gaps.","Introduce slightly harder problems progressively to build confidence."],"count":87,"avg_score":67.63,"avg_hours":16.63,"avg_attend":90.47,"avg_tutor":1.36,"avg_sleep":7.13,"avg_prev":73.05,"risk_high":1},{"id":2,"name":"Passive Coaster","icon":"🌊","color":"#F59E0B","description":"Average attendance and minimal study effort. These students coast without clear academic direction.","strategies":["Connect curriculum topics to real-world interests and career relevance.","Use gamified learning (points, leaderboards) to spark engagement.","Check in one-on-one to understand hidden barriers or personal challenges.","Break tasks into short, achievable micro-goals to build momentum.","Introduce choice in assignments to restore a sense of ownership."],"count":53,"avg_score":65.96,"avg_hours":20.55,"avg_attend":77.38,"avg_tutor":1.34,"avg_sleep":7.49,"avg_prev":65.55,"risk_high":8},{"id":3,"name":"Struggling Learner","icon":"🆘","color":"#EF4444","description":"Low attendance, lower previous scores, and limited resources. High risk of falling behind without support.","strategies":["Assign a dedicated mentor or tutor for weekly one-on-one sessions.","Coordinate with parents/guardians to reinforce learning at home.","Use multi-modal teaching (videos, hands-on activities) to suit diverse styles.","Ensure access to school resources: library, devices, tutoring programs.","Create safe, judgment-free classroom environments to reduce anxiety."],"count":69,"avg_score":63.36,"avg_hours":20.67,"avg_attend":66.12,"avg_tutor":1.25,"avg_sleep":7.04,"avg_prev":65.39,"risk_high":35},{"id":4,"name":"Potential Bloomer","icon":"🌱","color":"#10B981","description":"High previous scores but lower current engagement or attendance. Untapped potential waiting to be unlocked.","strategies":["Investigate recent disengagement — personal, social, or academic triggers.","Reignite curiosity with exploratory, discovery-based learning activities.","Connect them with inspiring role models or alumni in their interest area.","Flexible deadlines and project alternatives reduce pressure triggers.","Offer leadership roles (class rep, project lead) to rebuild confidence."],"count":101,"avg_score":65.51,"avg_hours":18.36,"avg_attend":70.95,"avg_tutor":1.55,"avg_sleep":7.08,"avg_prev":90.22,"risk_high":24}],"correlations":{"Attendance":0.5586,"Hours Studied":0.3494,"Motivation":0.1848,"Previous Scores":0.1847,"Parental Involvement":0.1826,"Access to Resources":0.171,"Family Income":0.1607,"Tutoring Sessions":0.1069,"Internet Access":0.0867,"Physical Activity":0.0814,"Peer Influence":0.0687,"Extracurricular":0.0622,"Sleep Hours":0.0289,"School Type":-0.002,"Teacher Quality":0.0003},"score_dist":{"labels":["55","58","61","64","67","70","73","76","79","82","85","88","91","94","97","100"],"counts":[0,4,13,86,115,115,52,9,0,1,0,1,0,1,1,0]},"by_school":{"Public":{"count":281,"avg_score":67.16,"avg_hours":19.91,"avg_attend":79.73},"Private":{"count":117,"avg_score":67.15,"avg_hours":19.0,"avg_attend":80.79}},"by_gender":{"Female":{"count":167,"avg_score":66.77,"avg_hours":19.62},"Male":{"count":231,"avg_score":67.44,"avg_hours":19.66}},"by_motiv":{"Medium":{"count":187,"avg_score":67.32,"avg_attend":80.16},"Low":{"count":124,"avg_score":66.19,"avg_attend":79.69},"High":{"count":86,"avg_score":68.26,"avg_attend":80.41},"Other":{"count":1,"avg_score":64.0,"avg_attend":72.0}},"by_parent":{"Medium":{"count":220,"avg_score":67.37},"Low":{"count":76,"avg_score":65.54},"High":{"count":102,"avg_score":67.9}},"by_income":{"Medium":{"count":160,"avg_score":67.51},"Low":{"count":160,"avg_score":66.37},"High":{"count":78,"avg_score":68.05}},"by_resources":{"Medium":{"count":215,"avg_score":67.34},"Low":{"count":71,"avg_score":65.56},"High":{"count":112,"avg_score":67.82}},"attend_score":[{"label":"<60%","avg_score":0.0,"count":0},{"label":"60-70%","avg_score":64.55,"count":105},{"label":"70-80%","avg_score":65.84,"count":92},{"label":"80-90%","avg_score":68.03,"count":92},{"label":"90%+","avg_score":70.05,"count":109}],"hour_score":[{"label":"0-10h","avg_score":62.88,"count":17},{"label":"10-20h","avg_score":66.39,"count":180},{"label":"20-30h","avg_score":68.13,"count":181},{"label":"30-40h","avg_score":68.9,"count":20},{"label":"40h+","avg_score":0.0,"count":0}],"scatter":[{"x":63.0,"y":63.0,"hours":14.0,"persona":3,"risk":"Medium"},{"x":100.0,"y":70.0,"hours":22.0,"persona":0,"risk":"Low"},{"x":88.0,"y":70.0,"hours":23.0,"persona":0,"risk":"Medium"},{"x":92.0,"y":68.0,"hours":17.0,"persona":1,"risk":"Low"},{"x":86.0,"y":71.0,"hours":25.0,"persona":0,"risk":"Low"},{"x":68.0,"y":64.0,"hours":20.0,"persona":3,"risk":"Medium"},{"x":99.0,"y":68.0,"hours":13.0,"persona":1,"risk":"Medium"},{"x":88.0,"y":73.0,"hours":24.0,"persona":0,"risk":"Low"},{"x":89.0,"y":72.0,"hours":19.0,"persona":0,"risk":"Low"},{"x":99.0,"y":66.0,"hours":12.0,"persona":1,"risk":"Medium"},{"x":88.0,"y":71.0,"hours":22.0,"persona":0,"risk":"Low"},{"x":61.0,"y":67.0,"hours":22.0,"persona":4,"risk":"Low"},{"x":66.0,"y":65.0,"hours":22.0,"persona":4,"risk":"Medium"},{"x":74.0,"y":65.0,"hours":18.0,"persona":4,"risk":"Medium"},{"x":73.0,"y":64.0,"hours":15.0,"persona":2,"risk":"Medium"},{"x":69.0,"y":67.0,"hours":26.0,"persona":3,"risk":"Low"},{"x":97.0,"y":70.0,"hours":17.0,"persona":0,"risk":"Medium"},{"x":72.0,"y":65.0,"hours":22.0,"persona":4,"risk":"Low"},{"x":89.0,"y":70.0,"hours":20.0,"persona":0,"risk":"Low"},{"x":80.0,"y":68.0,"hours":19.0,"persona":4,"risk":"Low"},{"x":71.0,"y":63.0,"hours":10.0,"persona":4,"risk":"Medium"},{"x":94.0,"y":68.0,"hours":16.0,"persona":1,"risk":"Low"},{"x":99.0,"y":72.0,"hours":18.0,"persona":0,"risk":"Low"},{"x":73.0,"y":63.0,"hours":14.0,"persona":2,"risk":"Medium"},{"x":76.0,"y":67.0,"hours":23.0,"persona":2,"risk":"Medium"},{"x":100.0,"y":70.0,"hours":18.0,"persona":0,"risk":"Low"},{"x":97.0,"y":67.0,"hours":5.0,"persona":1,"risk":"Low"},{"x":95.0,"y":72.0,"hours":24.0,"persona":0,"risk":"Low"},{"x":82.0,"y":67.0,"hours":20.0,"persona":2,"risk":"Low"},{"x":96.0,"y":72.0,"hours":23.0,"persona":0,"risk":"Low"},{"x":91.0,"y":68.0,"hours":12.0,"persona":1,"risk":"Low"},{"x":84.0,"y":66.0,"hours":10.0,"persona":4,"risk":"Medium"},{"x":90.0,"y":64.0,"hours":6.0,"persona":1,"risk":"High"},{"x":68.0,"y":58.0,"hours":10.0,"persona":3,"risk":"High"},{"x":63.0,"y":66.0,"hours":16.0,"persona":4,"risk":"Medium"},{"x":76.0,"y":67.0,"hours":17.0,"persona":4,"risk":"Low"},{"x":76.0,"y":67.0,"hours":20.0,"persona":4,"risk":"Low"},{"x":62.0,"y":64.0,"hours":15.0,"persona":4,"risk":"High"},{"x":71.0,"y":66.0,"hours":21.0,"persona":3,"risk":"Medium"},{"x":85.0,"y":69.0,"hours":20.0,"persona":1,"risk":"Low"},{"x":100.0,"y":76.0,"hours":35.0,"persona":0,"risk":"Low"},{"x":88.0,"y":70.0,"hours":20.0,"persona":0,"risk":"Low"},{"x":62.0,"y":64.0,"hours":23.0,"persona":3,"risk":"Medium"},{"x":96.0,"y":66.0,"hours":9.0,"persona":1,"risk":"Low"},{"x":61.0,"y":67.0,"hours":25.0,"persona":4,"risk":"Low"},{"x":86.0,"y":71.0,"hours":30.0,"persona":0,"risk":"Low"},{"x":68.0,"y":65.0,"hours":27.0,"persona":4,"risk":"Medium"},{"x":79.0,"y":64.0,"hours":10.0,"persona":2,"risk":"High"},{"x":65.0,"y":65.0,"hours":21.0,"persona":4,"risk":"High"},{"x":89.0,"y":69.0,"hours":15.0,"persona":1,"risk":"Low"},{"x":89.0,"y":67.0,"hours":13.0,"persona":1,"risk":"Low"},{"x":71.0,"y":61.0,"hours":13.0,"persona":4,"risk":"Medium"},{"x":69.0,"y":64.0,"hours":8.0,"persona":4,"risk":"High"},{"x":88.0,"y":71.0,"hours":17.0,"persona":0,"risk":"Low"},{"x":99.0,"y":74.0,"hours":23.0,"persona":0,"risk":"Low"},{"x":93.0,"y":80.0,"hours":19.0,"persona":0,"risk":"Low"},{"x":87.0,"y":67.0,"hours":18.0,"persona":1,"risk":"Medium"},{"x":94.0,"y":66.0,"hours":16.0,"persona":1,"risk":"Medium"},{"x":75.0,"y":64.0,"hours":22.0,"persona":4,"risk":"High"},{"x":77.0,"y":63.0,"hours":8.0,"persona":4,"risk":"High"},{"x":74.0,"y":66.0,"hours":21.0,"persona":4,"risk":"Medium"},{"x":74.0,"y":68.0,"hours":26.0,"persona":4,"risk":"Medium"},{"x":89.0,"y":68.0,"hours":24.0,"persona":1,"risk":"Low"},{"x":83.0,"y":65.0,"hours":12.0,"persona":4,"risk":"Medium"},{"x":88.0,"y":71.0,"hours":23.0,"persona":0,"risk":"Low"},{"x":95.0,"y":69.0,"hours":18.0,"persona":1,"risk":"Medium"},{"x":86.0,"y":68.0,"hours":17.0,"persona":1,"risk":"Low"},{"x":67.0,"y":66.0,"hours":16.0,"persona":4,"risk":"High"},{"x":84.0,"y":65.0,"hours":15.0,"persona":2,"risk":"Low"},{"x":99.0,"y":66.0,"hours":17.0,"persona":1,"risk":"Medium"},{"x":61.0,"y":63.0,"hours":19.0,"persona":4,"risk":"High"},{"x":87.0,"y":68.0,"hours":19.0,"persona":1,"risk":"Low"},{"x":88.0,"y":68.0,"hours":11.0,"persona":1,"risk":"Low"},{"x":73.0,"y":68.0,"hours":31.0,"persona":4,"risk":"Low"},{"x":63.0,"y":64.0,"hours":22.0,"persona":3,"risk":"Medium"},{"x":95.0,"y":69.0,"hours":17.0,"persona":1,"risk":"Low"},{"x":64.0,"y":65.0,"hours":17.0,"persona":4,"risk":"High"},{"x":65.0,"y":69.0,"hours":26.0,"persona":4,"risk":"Medium"},{"x":89.0,"y":70.0,"hours":25.0,"persona":0,"risk":"Low"},{"x":69.0,"y":68.0,"hours":21.0,"persona":4,"risk":"High"},{"x":75.0,"y":64.0,"hours":25.0,"persona":2,"risk":"High"},{"x":93.0,"y":73.0,"hours":18.0,"persona":0,"risk":"Low"},{"x":94.0,"y":69.0,"hours":25.0,"persona":1,"risk":"Low"},{"x":70.0,"y":62.0,"hours":14.0,"persona":3,"risk":"Medium"},{"x":92.0,"y":70.0,"hours":22.0,"persona":0,"risk":"Medium"},{"x":81.0,"y":68.0,"hours":15.0,"persona":4,"risk":"Low"},{"x":60.0,"y":62.0,"hours":25.0,"persona":3,"risk":"Medium"},{"x":98.0,"y":94.0,"hours":16.0,"persona":0,"risk":"Low"},{"x":69.0,"y":62.0,"hours":22.0,"persona":3,"risk":"High"},{"x":73.0,"y":64.0,"hours":11.0,"persona":2,"risk":"Medium"},{"x":94.0,"y":70.0,"hours":22.0,"persona":0,"risk":"Low"},{"x":93.0,"y":71.0,"hours":29.0,"persona":0,"risk":"Low"},{"x":82.0,"y":64.0,"hours":17.0,"persona":2,"risk":"Medium"},{"x":90.0,"y":63.0,"hours":10.0,"persona":1,"risk":"Medium"},{"x":80.0,"y":69.0,"hours":29.0,"persona":2,"risk":"Low"},{"x":61.0,"y":63.0,"hours":13.0,"persona":4,"risk":"Medium"},{"x":81.0,"y":70.0,"hours":19.0,"persona":1,"risk":"Low"},{"x":91.0,"y":70.0,"hours":21.0,"persona":0,"risk":"Low"},{"x":68.0,"y":67.0,"hours":17.0,"persona":4,"risk":"Low"},{"x":82.0,"y":68.0,"hours":21.0,"persona":2,"risk":"Low"},{"x":72.0,"y":62.0,"hours":16.0,"persona":4,"risk":"Medium"},{"x":97.0,"y":70.0,"hours":23.0,"persona":0,"risk":"Low"},{"x":84.0,"y":66.0,"hours":17.0,"persona":4,"risk":"Medium"},{"x":67.0,"y":63.0,"hours":25.0,"persona":3,"risk":"High"},{"x":78.0,"y":66.0,"hours":10.0,"persona":2,"risk":"Medium"},{"x":73.0,"y":64.0,"hours":16.0,"persona":4,"risk":"Medium"},{"x":76.0,"y":86.0,"hours":12.0,"persona":0,"risk":"Low"},{"x":61.0,"y":59.0,"hours":17.0,"persona":3,"risk":"High"},{"x":67.0,"y":63.0,"hours":21.0,"persona":4,"risk":"High"},{"x":98.0,"y":73.0,"hours":24.0,"persona":0,"risk":"Low"},{"x":60.0,"y":64.0,"hours":23.0,"persona":3,"risk":"Medium"},{"x":91.0,"y":68.0,"hours":19.0,"persona":1,"risk":"Low"},{"x":96.0,"y":66.0,"hours":10.0,"persona":1,"risk":"Medium"},{"x":88.0,"y":70.0,"hours":23.0,"persona":0,"risk":"Low"},{"x":65.0,"y":69.0,"hours":29.0,"persona":4,"risk":"Low"},{"x":61.0,"y":63.0,"hours":23.0,"persona":4,"risk":"High"},{"x":83.0,"y":71.0,"hours":27.0,"persona":0,"risk":"Low"},{"x":89.0,"y":68.0,"hours":17.0,"persona":1,"risk":"Low"},{"x":75.0,"y":59.0,"hours":2.0,"persona":3,"risk":"High"},{"x":92.0,"y":68.0,"hours":21.0,"persona":1,"risk":"Low"},{"x":68.0,"y":69.0,"hours":27.0,"persona":4,"risk":"Low"},{"x":74.0,"y":62.0,"hours":14.0,"persona":3,"risk":"Medium"},{"x":63.0,"y":61.0,"hours":17.0,"persona":3,"risk":"High"},{"x":88.0,"y":71.0,"hours":24.0,"persona":0,"risk":"Low"},{"x":65.0,"y":65.0,"hours":23.0,"persona":3,"risk":"High"},{"x":64.0,"y":65.0,"hours":30.0,"persona":3,"risk":"High"},{"x":76.0,"y":65.0,"hours":23.0,"persona":4,"risk":"High"},{"x":86.0,"y":70.0,"hours":30.0,"persona":0,"risk":"Low"},{"x":87.0,"y":67.0,"hours":2.0,"persona":1,"risk":"Low"},{"x":91.0,"y":68.0,"hours":17.0,"persona":1,"risk":"Medium"},{"x":72.0,"y":65.0,"hours":25.0,"persona":2,"risk":"Medium"},{"x":90.0,"y":69.0,"hours":20.0,"persona":1,"risk":"Medium"},{"x":65.0,"y":62.0,"hours":21.0,"persona":3,"risk":"Medium"},{"x":72.0,"y":65.0,"hours":18.0,"persona":2,"risk":"Medium"},{"x":87.0,"y":64.0,"hours":10.0,"persona":1,"risk":"Low"},{"x":80.0,"y":68.0,"hours":14.0,"persona":4,"risk":"Low"},{"x":85.0,"y":64.0,"hours":15.0,"persona":1,"risk":"Low"},{"x":78.0,"y":66.0,"hours":17.0,"persona":4,"risk":"Medium"},{"x":81.0,"y":61.0,"hours":16.0,"persona":3,"risk":"Medium"},{"x":91.0,"y":66.0,"hours":15.0,"persona":1,"risk":"Low"},{"x":80.0,"y":65.0,"hours":20.0,"persona":2,"risk":"Medium"},{"x":66.0,"y":63.0,"hours":14.0,"persona":4,"risk":"High"},{"x":85.0,"y":64.0,"hours":15.0,"persona":1,"risk":"Low"},{"x":97.0,"y":73.0,"hours":24.0,"persona":0,"risk":"Low"},{"x":90.0,"y":69.0,"hours":23.0,"persona":1,"risk":"Low"},{"x":74.0,"y":65.0,"hours":21.0,"persona":2,"risk":"Medium"},{"x":68.0,"y":68.0,"hours":26.0,"persona":4,"risk":"Medium"},{"x":71.0,"y":65.0,"hours":14.0,"persona":4,"risk":"Medium"},{"x":99.0,"y":71.0,"hours":23.0,"persona":0,"risk":"Low"},{"x":79.0,"y":69.0,"hours":27.0,"persona":2,"risk":"Low"},{"x":63.0,"y":62.0,"hours":22.0,"persona":3,"risk":"High"},{"x":96.0,"y":69.0,"hours":18.0,"persona":1,"risk":"Low"},{"x":97.0,"y":70.0,"hours":20.0,"persona":0,"risk":"Low"},{"x":67.0,"y":66.0,"hours":21.0,"persona":4,"risk":"Medium"},{"x":97.0,"y":65.0,"hours":18.0,"persona":1,"risk":"Medium"},{"x":79.0,"y":70.0,"hours":23.0,"persona":1,"risk":"Low"},{"x":72.0,"y":62.0,"hours":12.0,"persona":3,"risk":"Medium"},{"x":75.0,"y":72.0,"hours":34.0,"persona":1,"risk":"Medium"},{"x":92.0,"y":66.0,"hours":13.0,"persona":1,"risk":"Low"},{"x":73.0,"y":71.0,"hours":22.0,"persona":1,"risk":"Low"},{"x":77.0,"y":66.0,"hours":13.0,"persona":4,"risk":"Medium"},{"x":68.0,"y":66.0,"hours":17.0,"persona":4,"risk":"High"},{"x":73.0,"y":66.0,"hours":19.0,"persona":2,"risk":"Medium"},{"x":80.0,"y":64.0,"hours":20.0,"persona":2,"risk":"High"},{"x":85.0,"y":66.0,"hours":10.0,"persona":1,"risk":"Low"},{"x":87.0,"y":66.0,"hours":19.0,"persona":1,"risk":"Low"},{"x":93.0,"y":68.0,"hours":20.0,"persona":1,"risk":"Low"},{"x":77.0,"y":67.0,"hours":18.0,"persona":4,"risk":"Medium"},{"x":72.0,"y":64.0,"hours":24.0,"persona":2,"risk":"Medium"},{"x":76.0,"y":65.0,"hours":30.0,"persona":2,"risk":"High"},{"x":100.0,"y":71.0,"hours":17.0,"persona":0,"risk":"Low"},{"x":67.0,"y":67.0,"hours":28.0,"persona":3,"risk":"Medium"},{"x":81.0,"y":68.0,"hours":25.0,"persona":4,"risk":"Low"},{"x":79.0,"y":66.0,"hours":19.0,"persona":2,"risk":"Low"},{"x":84.0,"y":68.0,"hours":23.0,"persona":2,"risk":"Low"},{"x":99.0,"y":73.0,"hours":20.0,"persona":0,"risk":"Low"},{"x":78.0,"y":64.0,"hours":19.0,"persona":4,"risk":"Medium"},{"x":64.0,"y":64.0,"hours":27.0,"persona":3,"risk":"High"},{"x":66.0,"y":59.0,"hours":8.0,"persona":3,"risk":"High"},{"x":89.0,"y":67.0,"hours":11.0,"persona":1,"risk":"Low"},{"x":99.0,"y":68.0,"hours":12.0,"persona":1,"risk":"Low"},{"x":92.0,"y":64.0,"hours":18.0,"persona":1,"risk":"Medium"},{"x":84.0,"y":69.0,"hours":22.0,"persona":4,"risk":"Low"},{"x":81.0,"y":68.0,"hours":26.0,"persona":2,"risk":"Medium"},{"x":91.0,"y":69.0,"hours":18.0,"persona":1,"risk":"Low"},{"x":94.0,"y":66.0,"hours":15.0,"persona":1,"risk":"Medium"},{"x":67.0,"y":62.0,"hours":12.0,"persona":4,"risk":"Medium"},{"x":72.0,"y":69.0,"hours":28.0,"persona":2,"risk":"Medium"},{"x":78.0,"y":69.0,"hours":28.0,"persona":2,"risk":"Medium"},{"x":98.0,"y":72.0,"hours":25.0,"persona":0,"risk":"Low"},{"x":71.0,"y":66.0,"hours":13.0,"persona":4,"risk":"Low"},{"x":95.0,"y":69.0,"hours":12.0,"persona":1,"risk":"Low"},{"x":65.0,"y":70.0,"hours":23.0,"persona":4,"risk":"Low"},{"x":91.0,"y":72.0,"hours":25.0,"persona":0,"risk":"Low"},{"x":81.0,"y":64.0,"hours":15.0,"persona":4,"risk":"Medium"},{"x":63.0,"y":62.0,"hours":12.0,"persona":4,"risk":"High"},{"x":64.0,"y":66.0,"hours":24.0,"persona":3,"risk":"Medium"},{"x":82.0,"y":66.0,"hours":23.0,"persona":4,"risk":"Medium"},{"x":63.0,"y":65.0,"hours":31.0,"persona":3,"risk":"Medium"},{"x":94.0,"y":67.0,"hours":12.0,"persona":1,"risk":"Low"},{"x":66.0,"y":68.0,"hours":33.0,"persona":3,"risk":"Low"},{"x":83.0,"y":68.0,"hours":14.0,"persona":2,"risk":"Low"},{"x":69.0,"y":64.0,"hours":15.0,"persona":4,"risk":"High"},{"x":90.0,"y":69.0,"hours":17.0,"persona":1,"risk":"Low"},{"x":95.0,"y":72.0,"hours":23.0,"persona":0,"risk":"Low"},{"x":89.0,"y":70.0,"hours":24.0,"persona":0,"risk":"Low"},{"x":66.0,"y":63.0,"hours":23.0,"persona":3,"risk":"High"},{"x":67.0,"y":65.0,"hours":17.0,"persona":4,"risk":"High"},{"x":87.0,"y":70.0,"hours":22.0,"persona":0,"risk":"Low"},{"x":98.0,"y":72.0,"hours":29.0,"persona":0,"risk":"Medium"},{"x":79.0,"y":66.0,"hours":14.0,"persona":4,"risk":"Medium"},{"x":98.0,"y":72.0,"hours":25.0,"persona":0,"risk":"Low"},{"x":64.0,"y":62.0,"hours":15.0,"persona":3,"risk":"High"},{"x":64.0,"y":66.0,"hours":21.0,"persona":3,"risk":"Medium"},{"x":97.0,"y":76.0,"hours":28.0,"persona":0,"risk":"Low"},{"x":71.0,"y":65.0,"hours":21.0,"persona":3,"risk":"Medium"},{"x":61.0,"y":63.0,"hours":17.0,"persona":4,"risk":"Medium"},{"x":100.0,"y":71.0,"hours":23.0,"persona":0,"risk":"Low"},{"x":76.0,"y":67.0,"hours":13.0,"persona":2,"risk":"Medium"},{"x":64.0,"y":63.0,"hours":16.0,"persona":4,"risk":"Medium"},{"x":82.0,"y":63.0,"hours":14.0,"persona":4,"risk":"Low"},{"x":65.0,"y":62.0,"hours":8.0,"persona":4,"risk":"High"},{"x":74.0,"y":66.0,"hours":20.0,"persona":2,"risk":"Low"},{"x":69.0,"y":67.0,"hours":18.0,"persona":4,"risk":"Medium"},{"x":66.0,"y":66.0,"hours":34.0,"persona":3,"risk":"High"},{"x":64.0,"y":62.0,"hours":14.0,"persona":3,"risk":"High"},{"x":96.0,"y":70.0,"hours":18.0,"persona":0,"risk":"Low"},{"x":71.0,"y":64.0,"hours":29.0,"persona":3,"risk":"Medium"},{"x":63.0,"y":63.0,"hours":28.0,"persona":3,"risk":"High"},{"x":69.0,"y":65.0,"hours":18.0,"persona":3,"risk":"High"},{"x":84.0,"y":66.0,"hours":12.0,"persona":2,"risk":"Medium"},{"x":91.0,"y":67.0,"hours":14.0,"persona":1,"risk":"Low"},{"x":77.0,"y":69.0,"hours":25.0,"persona":2,"risk":"Low"},{"x":96.0,"y":69.0,"hours":15.0,"persona":1,"risk":"Low"},{"x":89.0,"y":70.0,"hours":21.0,"persona":0,"risk":"Low"},{"x":66.0,"y":64.0,"hours":17.0,"persona":3,"risk":"Medium"},{"x":77.0,"y":65.0,"hours":16.0,"persona":2,"risk":"Medium"},{"x":94.0,"y":74.0,"hours":26.0,"persona":0,"risk":"Low"},{"x":91.0,"y":72.0,"hours":25.0,"persona":0,"risk":"Low"},{"x":72.0,"y":65.0,"hours":27.0,"persona":2,"risk":"High"},{"x":100.0,"y":72.0,"hours":15.0,"persona":0,"risk":"Low"},{"x":78.0,"y":66.0,"hours":13.0,"persona":2,"risk":"Low"},{"x":100.0,"y":70.0,"hours":15.0,"persona":0,"risk":"Low"},{"x":93.0,"y":73.0,"hours":21.0,"persona":0,"risk":"Low"},{"x":68.0,"y":62.0,"hours":12.0,"persona":3,"risk":"High"},{"x":89.0,"y":70.0,"hours":20.0,"persona":0,"risk":"Low"},{"x":71.0,"y":60.0,"hours":19.0,"persona":3,"risk":"High"},{"x":76.0,"y":66.0,"hours":16.0,"persona":4,"risk":"Medium"},{"x":80.0,"y":70.0,"hours":31.0,"persona":1,"risk":"Low"},{"x":75.0,"y":66.0,"hours":20.0,"persona":4,"risk":"Medium"},{"x":90.0,"y":67.0,"hours":15.0,"persona":1,"risk":"Low"},{"x":68.0,"y":65.0,"hours":21.0,"persona":3,"risk":"High"},{"x":98.0,"y":69.0,"hours":14.0,"persona":1,"risk":"Low"},{"x":96.0,"y":70.0,"hours":22.0,"persona":0,"risk":"Low"},{"x":89.0,"y":65.0,"hours":18.0,"persona":1,"risk":"Medium"},{"x":77.0,"y":64.0,"hours":18.0,"persona":2,"risk":"High"},{"x":65.0,"y":68.0,"hours":25.0,"persona":3,"risk":"Medium"},{"x":88.0,"y":70.0,"hours":18.0,"persona":0,"risk":"Medium"},{"x":61.0,"y":71.0,"hours":29.0,"persona":4,"risk":"Low"},{"x":91.0,"y":68.0,"hours":19.0,"persona":1,"risk":"Low"},{"x":95.0,"y":71.0,"hours":28.0,"persona":0,"risk":"Low"},{"x":81.0,"y":71.0,"hours":25.0,"persona":1,"risk":"Low"},{"x":93.0,"y":68.0,"hours":16.0,"persona":1,"risk":"Low"},{"x":66.0,"y":96.0,"hours":17.0,"persona":0,"risk":"Medium"},{"x":87.0,"y":64.0,"hours":11.0,"persona":1,"risk":"Medium"},{"x":70.0,"y":65.0,"hours":12.0,"persona":4,"risk":"Medium"},{"x":69.0,"y":66.0,"hours":17.0,"persona":4,"risk":"Medium"},{"x":97.0,"y":68.0,"hours":2.0,"persona":1,"risk":"Medium"},{"x":64.0,"y":65.0,"hours":23.0,"persona":4,"risk":"Medium"},{"x":72.0,"y":64.0,"hours":19.0,"persona":2,"risk":"High"},{"x":88.0,"y":70.0,"hours":25.0,"persona":0,"risk":"Low"},{"x":64.0,"y":65.0,"hours":24.0,"persona":4,"risk":"Medium"},{"x":99.0,"y":74.0,"hours":25.0,"persona":0,"risk":"Low"},{"x":61.0,"y":61.0,"hours":17.0,"persona":4,"risk":"Medium"},{"x":64.0,"y":63.0,"hours":24.0,"persona":3,"risk":"High"},{"x":99.0,"y":72.0,"hours":20.0,"persona":0,"risk":"Low"},{"x":91.0,"y":69.0,"hours":16.0,"persona":1,"risk":"Low"},{"x":66.0,"y":64.0,"hours":25.0,"persona":4,"risk":"Medium"},{"x":67.0,"y":68.0,"hours":24.0,"persona":3,"risk":"Medium"},{"x":83.0,"y":64.0,"hours":3.0,"persona":4,"risk":"Medium"},{"x":94.0,"y":70.0,"hours":24.0,"persona":0,"risk":"Medium"},{"x":69.0,"y":64.0,"hours":17.0,"persona":4,"risk":"Medium"},{"x":69.0,"y":58.0,"hours":7.0,"persona":3,"risk":"High"},{"x":62.0,"y":61.0,"hours":21.0,"persona":3,"risk":"High"},{"x":62.0,"y":66.0,"hours":21.0,"persona":3,"risk":"Medium"},{"x":74.0,"y":69.0,"hours":26.0,"persona":4,"risk":"Low"},{"x":100.0,"y":69.0,"hours":15.0,"persona":1,"risk":"Low"},{"x":89.0,"y":68.0,"hours":16.0,"persona":1,"risk":"Medium"},{"x":61.0,"y":56.0,"hours":10.0,"persona":3,"risk":"High"},{"x":96.0,"y":70.0,"hours":19.0,"persona":0,"risk":"Medium"},{"x":65.0,"y":63.0,"hours":24.0,"persona":4,"risk":"High"},{"x":96.0,"y":73.0,"hours":27.0,"persona":0,"risk":"Low"},{"x":63.0,"y":68.0,"hours":27.0,"persona":3,"risk":"Medium"},{"x":79.0,"y":73.0,"hours":32.0,"persona":1,"risk":"Low"},{"x":74.0,"y":62.0,"hours":9.0,"persona":4,"risk":"Medium"},{"x":73.0,"y":68.0,"hours":25.0,"persona":2,"risk":"Low"},{"x":87.0,"y":71.0,"hours":25.0,"persona":0,"risk":"Low"},{"x":74.0,"y":65.0,"hours":19.0,"persona":2,"risk":"Medium"},{"x":78.0,"y":69.0,"hours":29.0,"persona":2,"risk":"Medium"},{"x":78.0,"y":68.0,"hours":17.0,"persona":4,"risk":"Medium"},{"x":65.0,"y":66.0,"hours":32.0,"persona":3,"risk":"Medium"},{"x":73.0,"y":65.0,"hours":21.0,"persona":2,"risk":"Medium"},{"x":93.0,"y":72.0,"hours":25.0,"persona":0,"risk":"Low"},{"x":85.0,"y":70.0,"hours":19.0,"persona":0,"risk":"Low"},{"x":60.0,"y":66.0,"hours":20.0,"persona":4,"risk":"Medium"},{"x":99.0,"y":72.0,"hours":15.0,"persona":0,"risk":"Low"},{"x":87.0,"y":73.0,"hours":29.0,"persona":0,"risk":"Low"},{"x":71.0,"y":65.0,"hours":22.0,"persona":3,"risk":"Medium"},{"x":76.0,"y":69.0,"hours":22.0,"persona":4,"risk":"Low"},{"x":64.0,"y":63.0,"hours":19.0,"persona":3,"risk":"High"},{"x":65.0,"y":68.0,"hours":30.0,"persona":3,"risk":"Medium"},{"x":97.0,"y":74.0,"hours":23.0,"persona":0,"risk":"Low"},{"x":66.0,"y":61.0,"hours":17.0,"persona":3,"risk":"High"},{"x":80.0,"y":69.0,"hours":26.0,"persona":4,"risk":"Medium"},{"x":100.0,"y":68.0,"hours":20.0,"persona":1,"risk":"Low"},{"x":70.0,"y":64.0,"hours":8.0,"persona":4,"risk":"High"},{"x":70.0,"y":63.0,"hours":22.0,"persona":3,"risk":"Medium"},{"x":73.0,"y":65.0,"hours":21.0,"persona":2,"risk":"Medium"},{"x":76.0,"y":61.0,"hours":9.0,"persona":3,"risk":"High"},{"x":97.0,"y":74.0,"hours":28.0,"persona":0,"risk":"Low"},{"x":83.0,"y":68.0,"hours":23.0,"persona":2,"risk":"Low"},{"x":93.0,"y":69.0,"hours":17.0,"persona":1,"risk":"Low"},{"x":78.0,"y":65.0,"hours":20.0,"persona":2,"risk":"Medium"},{"x":87.0,"y":69.0,"hours":28.0,"persona":1,"risk":"Low"},{"x":68.0,"y":67.0,"hours":19.0,"persona":4,"risk":"Medium"},{"x":96.0,"y":67.0,"hours":12.0,"persona":1,"risk":"Low"},{"x":82.0,"y":70.0,"hours":29.0,"persona":0,"risk":"Low"},{"x":88.0,"y":71.0,"hours":16.0,"persona":0,"risk":"Low"},{"x":79.0,"y":69.0,"hours":25.0,"persona":2,"risk":"Low"},{"x":76.0,"y":65.0,"hours":26.0,"persona":2,"risk":"High"},{"x":69.0,"y":65.0,"hours":26.0,"persona":3,"risk":"Medium"},{"x":78.0,"y":69.0,"hours":26.0,"persona":4,"risk":"Medium"},{"x":88.0,"y":68.0,"hours":24.0,"persona":1,"risk":"Low"},{"x":64.0,"y":63.0,"hours":18.0,"persona":4,"risk":"Medium"},{"x":93.0,"y":71.0,"hours":30.0,"persona":0,"risk":"Low"},{"x":91.0,"y":75.0,"hours":36.0,"persona":0,"risk":"Low"},{"x":80.0,"y":66.0,"hours":19.0,"persona":2,"risk":"Low"},{"x":75.0,"y":72.0,"hours":26.0,"persona":1,"risk":"Low"},{"x":61.0,"y":64.0,"hours":24.0,"persona":3,"risk":"High"},{"x":81.0,"y":64.0,"hours":21.0,"persona":2,"risk":"Medium"},{"x":77.0,"y":67.0,"hours":12.0,"persona":4,"risk":"Medium"},{"x":88.0,"y":70.0,"hours":27.0,"persona":0,"risk":"Low"},{"x":80.0,"y":70.0,"hours":26.0,"persona":1,"risk":"Low"},{"x":97.0,"y":73.0,"hours":16.0,"persona":0,"risk":"Low"},{"x":75.0,"y":63.0,"hours":15.0,"persona":2,"risk":"Medium"},{"x":83.0,"y":67.0,"hours":13.0,"persona":4,"risk":"Low"},{"x":92.0,"y":72.0,"hours":13.0,"persona":0,"risk":"Low"},{"x":71.0,"y":67.0,"hours":19.0,"persona":4,"risk":"Low"},{"x":99.0,"y":69.0,"hours":20.0,"persona":1,"risk":"Medium"},{"x":96.0,"y":67.0,"hours":15.0,"persona":1,"risk":"Medium"},{"x":94.0,"y":66.0,"hours":15.0,"persona":1,"risk":"Medium"},{"x":85.0,"y":67.0,"hours":11.0,"persona":1,"risk":"Low"},{"x":72.0,"y":67.0,"hours":25.0,"persona":4,"risk":"Low"},{"x":66.0,"y":69.0,"hours":28.0,"persona":4,"risk":"Low"},{"x":60.0,"y":66.0,"hours":35.0,"persona":3,"risk":"Medium"},{"x":88.0,"y":67.0,"hours":13.0,"persona":1,"risk":"Low"},{"x":97.0,"y":67.0,"hours":20.0,"persona":1,"risk":"Low"},{"x":81.0,"y":66.0,"hours":21.0,"persona":2,"risk":"Low"},{"x":89.0,"y":71.0,"hours":28.0,"persona":0,"risk":"Low"},{"x":95.0,"y":72.0,"hours":27.0,"persona":0,"risk":"Low"},{"x":64.0,"y":59.0,"hours":11.0,"persona":3,"risk":"High"},{"x":93.0,"y":69.0,"hours":21.0,"persona":1,"risk":"Low"},{"x":99.0,"y":71.0,"hours":20.0,"persona":0,"risk":"Low"},{"x":89.0,"y":64.0,"hours":15.0,"persona":1,"risk":"Medium"},{"x":65.0,"y":63.0,"hours":22.0,"persona":3,"risk":"High"},{"x":96.0,"y":74.0,"hours":29.0,"persona":0,"risk":"Low"},{"x":73.0,"y":67.0,"hours":26.0,"persona":4,"risk":"Medium"},{"x":83.0,"y":67.0,"hours":25.0,"persona":2,"risk":"Medium"},{"x":61.0,"y":64.0,"hours":31.0,"persona":3,"risk":"High"},{"x":73.0,"y":66.0,"hours":24.0,"persona":2,"risk":"Medium"},{"x":61.0,"y":62.0,"hours":19.0,"persona":4,"risk":"High"},{"x":71.0,"y":63.0,"hours":19.0,"persona":3,"risk":"Medium"},{"x":92.0,"y":70.0,"hours":19.0,"persona":0,"risk":"Low"},{"x":98.0,"y":64.0,"hours":7.0,"persona":1,"risk":"Medium"},{"x":79.0,"y":64.0,"hours":14.0,"persona":2,"risk":"Medium"},{"x":60.0,"y":63.0,"hours":19.0,"persona":4,"risk":"High"},{"x":85.0,"y":68.0,"hours":24.0,"persona":1,"risk":"Medium"},{"x":89.0,"y":68.0,"hours":22.0,"persona":1,"risk":"Low"},{"x":100.0,"y":71.0,"hours":26.0,"persona":0,"risk":"Low"},{"x":64.0,"y":68.0,"hours":19.0,"persona":4,"risk":"Medium"},{"x":75.0,"y":67.0,"hours":28.0,"persona":4,"risk":"Medium"},{"x":62.0,"y":64.0,"hours":15.0,"persona":3,"risk":"Medium"},{"x":93.0,"y":73.0,"hours":24.0,"persona":0,"risk":"Low"},{"x":83.0,"y":68.0,"hours":26.0,"persona":2,"risk":"Low"},{"x":79.0,"y":67.0,"hours":18.0,"persona":4,"risk":"Low"},{"x":65.0,"y":67.0,"hours":30.0,"persona":3,"risk":"High"},{"x":84.0,"y":72.0,"hours":32.0,"persona":0,"risk":"Low"},{"x":90.0,"y":68.0,"hours":16.0,"persona":1,"risk":"Low"},{"x":68.0,"y":63.0,"hours":17.0,"persona":3,"risk":"High"},{"x":68.0,"y":64.0,"hours":13.0,"persona":4,"risk":"High"},{"x":71.0,"y":64.0,"hours":11.0,"persona":4,"risk":"Medium"},{"x":70.0,"y":64.0,"hours":17.0,"persona":3,"risk":"Medium"},{"x":61.0,"y":62.0,"hours":13.0,"persona":3,"risk":"High"},{"x":96.0,"y":71.0,"hours":15.0,"persona":0,"risk":"Low"},{"x":96.0,"y":68.0,"hours":11.0,"persona":1,"risk":"Low"},{"x":64.0,"y":57.0,"hours":6.0,"persona":4,"risk":"High"},{"x":61.0,"y":60.0,"hours":14.0,"persona":3,"risk":"High"},{"x":80.0,"y":67.0,"hours":22.0,"persona":4,"risk":"Low"}],"risk_table":[{"id":1,"gender":"Female","school":"Public","score":57.0,"attend":64.0,"hours":6.0,"motiv":"Medium","risk":"High","risk_score":8,"persona":4,"internet":"No","tutor":3.0,"prev":80.0,"disability":"No","peer":"Negative"},{"id":2,"gender":"Male","school":"Public","score":61.0,"attend":66.0,"hours":17.0,"motiv":"Low","risk":"High","risk_score":7,"persona":3,"internet":"Yes","tutor":0.0,"prev":74.0,"disability":"No","peer":"Negative"},{"id":3,"gender":"Female","school":"Public","score":61.0,"attend":63.0,"hours":17.0,"motiv":"Low","risk":"High","risk_score":7,"persona":3,"internet":"Yes","tutor":1.0,"prev":70.0,"disability":"No","peer":"Negative"},{"id":4,"gender":"Male","school":"Private","score":63.0,"attend":67.0,"hours":25.0,"motiv":"Low","risk":"High","risk_score":7,"persona":3,"internet":"No","tutor":1.0,"prev":74.0,"disability":"Yes","peer":"Neutral"},{"id":5,"gender":"Female","school":"Public","score":58.0,"attend":68.0,"hours":10.0,"motiv":"Low","risk":"High","risk_score":7,"persona":3,"internet":"Yes","tutor":0.0,"prev":63.0,"disability":"No","peer":"Negative"},{"id":6,"gender":"Male","school":"Public","score":58.0,"attend":69.0,"hours":7.0,"motiv":"Medium","risk":"High","risk_score":7,"persona":3,"internet":"No","tutor":1.0,"prev":75.0,"disability":"No","peer":"Positive"},{"id":7,"gender":"Male","school":"Private","score":56.0,"attend":61.0,"hours":10.0,"motiv":"Medium","risk":"High","risk_score":7,"persona":3,"internet":"No","tutor":0.0,"prev":67.0,"disability":"No","peer":"Negative"},{"id":8,"gender":"Female","school":"Private","score":62.0,"attend":63.0,"hours":22.0,"motiv":"Low","risk":"High","risk_score":7,"persona":3,"internet":"No","tutor":2.0,"prev":53.0,"disability":"No","peer":"Negative"},{"id":9,"gender":"Male","school":"Public","score":61.0,"attend":62.0,"hours":21.0,"motiv":"Low","risk":"High","risk_score":6,"persona":3,"internet":"Yes","tutor":2.0,"prev":65.0,"disability":"No","peer":"Positive"},{"id":10,"gender":"Female","school":"Public","score":63.0,"attend":66.0,"hours":23.0,"motiv":"Low","risk":"High","risk_score":6,"persona":3,"internet":"Yes","tutor":1.0,"prev":79.0,"disability":"Yes","peer":"Neutral"},{"id":11,"gender":"Male","school":"Public","score":65.0,"attend":76.0,"hours":23.0,"motiv":"Low","risk":"High","risk_score":6,"persona":4,"internet":"No","tutor":3.0,"prev":100.0,"disability":"Yes","peer":"Neutral"},{"id":12,"gender":"Female","school":"Public","score":66.0,"attend":68.0,"hours":17.0,"motiv":"Low","risk":"High","risk_score":6,"persona":4,"internet":"Yes","tutor":3.0,"prev":96.0,"disability":"Yes","peer":"Positive"},{"id":13,"gender":"Male","school":"Public","score":59.0,"attend":75.0,"hours":2.0,"motiv":"Low","risk":"High","risk_score":6,"persona":3,"internet":"Yes","tutor":3.0,"prev":55.0,"disability":"No","peer":"Neutral"},{"id":14,"gender":"Female","school":"Private","score":64.0,"attend":90.0,"hours":6.0,"motiv":"Low","risk":"High","risk_score":6,"persona":1,"internet":"Yes","tutor":1.0,"prev":75.0,"disability":"Yes","peer":"Negative"},{"id":15,"gender":"Male","school":"Public","score":65.0,"attend":64.0,"hours":30.0,"motiv":"Low","risk":"High","risk_score":6,"persona":3,"internet":"No","tutor":2.0,"prev":51.0,"disability":"No","peer":"Neutral"},{"id":16,"gender":"Male","school":"Public","score":62.0,"attend":65.0,"hours":8.0,"motiv":"Medium","risk":"High","risk_score":6,"persona":4,"internet":"Yes","tutor":4.0,"prev":99.0,"disability":"No","peer":"Negative"},{"id":17,"gender":"Female","school":"Public","score":60.0,"attend":71.0,"hours":19.0,"motiv":"Low","risk":"High","risk_score":6,"persona":3,"internet":"Yes","tutor":0.0,"prev":56.0,"disability":"Yes","peer":"Neutral"},{"id":18,"gender":"Male","school":"Public","score":66.0,"attend":67.0,"hours":16.0,"motiv":"Low","risk":"High","risk_score":6,"persona":4,"internet":"Yes","tutor":6.0,"prev":85.0,"disability":"No","peer":"Negative"},{"id":19,"gender":"Female","school":"Public","score":63.0,"attend":65.0,"hours":22.0,"motiv":"High","risk":"High","risk_score":6,"persona":3,"internet":"No","tutor":2.0,"prev":61.0,"disability":"Yes","peer":"Negative"},{"id":20,"gender":"Male","school":"Private","score":64.0,"attend":64.0,"hours":27.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":67.0,"disability":"No","peer":"Neutral"},{"id":21,"gender":"Male","school":"Public","score":62.0,"attend":64.0,"hours":14.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":62.0,"disability":"No","peer":"Positive"},{"id":22,"gender":"Male","school":"Private","score":64.0,"attend":80.0,"hours":20.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":2,"internet":"No","tutor":2.0,"prev":53.0,"disability":"Yes","peer":"Negative"},{"id":23,"gender":"Female","school":"Public","score":63.0,"attend":63.0,"hours":28.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":2.0,"prev":51.0,"disability":"No","peer":"Negative"},{"id":24,"gender":"Male","school":"Public","score":62.0,"attend":61.0,"hours":13.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":62.0,"disability":"No","peer":"Positive"},{"id":25,"gender":"Male","school":"Public","score":67.0,"attend":65.0,"hours":30.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":3,"internet":"No","tutor":2.0,"prev":71.0,"disability":"Yes","peer":"Neutral"},{"id":26,"gender":"Male","school":"Public","score":62.0,"attend":61.0,"hours":19.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"No","tutor":0.0,"prev":84.0,"disability":"No","peer":"Neutral"},{"id":27,"gender":"Female","school":"Public","score":62.0,"attend":64.0,"hours":15.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":71.0,"disability":"No","peer":"Neutral"},{"id":28,"gender":"Female","school":"Public","score":66.0,"attend":66.0,"hours":34.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":69.0,"disability":"No","peer":"Negative"},{"id":29,"gender":"Female","school":"Public","score":64.0,"attend":62.0,"hours":15.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":2.0,"prev":97.0,"disability":"No","peer":"Positive"},{"id":30,"gender":"Female","school":"Public","score":64.0,"attend":77.0,"hours":18.0,"motiv":"Low","risk":"High","risk_score":5,"persona":2,"internet":"No","tutor":2.0,"prev":65.0,"disability":"No","peer":"Positive"},{"id":31,"gender":"Male","school":"Public","score":63.0,"attend":67.0,"hours":21.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":1.0,"prev":83.0,"disability":"No","peer":"Neutral"},{"id":32,"gender":"Female","school":"Public","score":65.0,"attend":65.0,"hours":23.0,"motiv":"High","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":77.0,"disability":"Yes","peer":"Negative"},{"id":33,"gender":"Male","school":"Public","score":63.0,"attend":77.0,"hours":8.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":0.0,"prev":91.0,"disability":"No","peer":"Neutral"},{"id":34,"gender":"Female","school":"Public","score":59.0,"attend":61.0,"hours":17.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":55.0,"disability":"No","peer":"Neutral"},{"id":35,"gender":"Male","school":"Public","score":62.0,"attend":69.0,"hours":22.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":0.0,"prev":70.0,"disability":"No","peer":"Neutral"},{"id":36,"gender":"Male","school":"Public","score":63.0,"attend":64.0,"hours":24.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":2.0,"prev":60.0,"disability":"No","peer":"Negative"},{"id":37,"gender":"Male","school":"Private","score":61.0,"attend":76.0,"hours":9.0,"motiv":"High","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":73.0,"disability":"Yes","peer":"Positive"},{"id":38,"gender":"Male","school":"Private","score":59.0,"attend":66.0,"hours":8.0,"motiv":"High","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":0.0,"prev":71.0,"disability":"No","peer":"Neutral"},{"id":39,"gender":"Male","school":"Public","score":59.0,"attend":64.0,"hours":11.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":2.0,"prev":75.0,"disability":"No","peer":"Neutral"},{"id":40,"gender":"Female","school":"Public","score":63.0,"attend":61.0,"hours":19.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":0.0,"prev":88.0,"disability":"No","peer":"Neutral"},{"id":41,"gender":"Male","school":"Private","score":65.0,"attend":76.0,"hours":30.0,"motiv":"Low","risk":"High","risk_score":5,"persona":2,"internet":"Yes","tutor":0.0,"prev":72.0,"disability":"No","peer":"Negative"},{"id":42,"gender":"Female","school":"Public","score":63.0,"attend":66.0,"hours":14.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":1.0,"prev":88.0,"disability":"Yes","peer":"Positive"},{"id":43,"gender":"Male","school":"Public","score":63.0,"attend":65.0,"hours":24.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":0.0,"prev":90.0,"disability":"No","peer":"Positive"},{"id":44,"gender":"Male","school":"Public","score":64.0,"attend":79.0,"hours":10.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":2,"internet":"No","tutor":3.0,"prev":68.0,"disability":"No","peer":"Negative"},{"id":45,"gender":"Male","school":"Public","score":65.0,"attend":67.0,"hours":17.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":0.0,"prev":100.0,"disability":"No","peer":"Negative"},{"id":46,"gender":"Female","school":"Public","score":65.0,"attend":68.0,"hours":21.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":0.0,"prev":73.0,"disability":"No","peer":"Positive"},{"id":47,"gender":"Female","school":"Public","score":64.0,"attend":69.0,"hours":15.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":0.0,"prev":83.0,"disability":"No","peer":"Neutral"},{"id":48,"gender":"Female","school":"Public","score":64.0,"attend":72.0,"hours":19.0,"motiv":"Low","risk":"High","risk_score":5,"persona":2,"internet":"No","tutor":1.0,"prev":70.0,"disability":"No","peer":"Positive"},{"id":49,"gender":"Female","school":"Public","score":65.0,"attend":76.0,"hours":26.0,"motiv":"Low","risk":"High","risk_score":5,"persona":2,"internet":"Yes","tutor":1.0,"prev":51.0,"disability":"No","peer":"Negative"},{"id":50,"gender":"Male","school":"Public","score":64.0,"attend":68.0,"hours":13.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":2.0,"prev":85.0,"disability":"No","peer":"Neutral"},{"id":51,"gender":"Female","school":"Public","score":63.0,"attend":60.0,"hours":19.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":1.0,"prev":91.0,"disability":"Yes","peer":"Positive"},{"id":52,"gender":"Male","school":"Public","score":62.0,"attend":63.0,"hours":12.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":1.0,"prev":96.0,"disability":"No","peer":"Negative"},{"id":53,"gender":"Male","school":"Public","score":64.0,"attend":70.0,"hours":8.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"No","tutor":6.0,"prev":82.0,"disability":"No","peer":"Neutral"},{"id":54,"gender":"Female","school":"Private","score":62.0,"attend":68.0,"hours":12.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":0.0,"prev":63.0,"disability":"No","peer":"Neutral"},{"id":55,"gender":"Female","school":"Private","score":64.0,"attend":69.0,"hours":8.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":2.0,"prev":95.0,"disability":"No","peer":"Neutral"},{"id":56,"gender":"Male","school":"Private","score":65.0,"attend":69.0,"hours":18.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":3.0,"prev":56.0,"disability":"No","peer":"Positive"},{"id":57,"gender":"Male","school":"Private","score":64.0,"attend":61.0,"hours":24.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":0.0,"prev":74.0,"disability":"No","peer":"Positive"},{"id":58,"gender":"Male","school":"Public","score":65.0,"attend":64.0,"hours":17.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":3.0,"prev":93.0,"disability":"Yes","peer":"Neutral"},{"id":59,"gender":"Female","school":"Public","score":65.0,"attend":72.0,"hours":27.0,"motiv":"Low","risk":"High","risk_score":5,"persona":2,"internet":"Yes","tutor":0.0,"prev":59.0,"disability":"No","peer":"Negative"},{"id":60,"gender":"Male","school":"Public","score":64.0,"attend":75.0,"hours":22.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"No","tutor":2.0,"prev":86.0,"disability":"Yes","peer":"Neutral"},{"id":61,"gender":"Female","school":"Public","score":64.0,"attend":75.0,"hours":25.0,"motiv":"Low","risk":"High","risk_score":5,"persona":2,"internet":"Yes","tutor":1.0,"prev":74.0,"disability":"Yes","peer":"Neutral"},{"id":62,"gender":"Male","school":"Public","score":68.0,"attend":69.0,"hours":21.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":1.0,"prev":82.0,"disability":"No","peer":"Negative"},{"id":63,"gender":"Male","school":"Public","score":63.0,"attend":68.0,"hours":17.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":0.0,"prev":70.0,"disability":"No","peer":"Positive"},{"id":64,"gender":"Male","school":"Public","score":65.0,"attend":65.0,"hours":21.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":3.0,"prev":93.0,"disability":"Yes","peer":"Neutral"},{"id":65,"gender":"Female","school":"Private","score":63.0,"attend":61.0,"hours":23.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":2.0,"prev":81.0,"disability":"No","peer":"Negative"},{"id":66,"gender":"Male","school":"Public","score":60.0,"attend":61.0,"hours":14.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":76.0,"disability":"No","peer":"Neutral"},{"id":67,"gender":"Male","school":"Public","score":64.0,"attend":61.0,"hours":31.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":59.0,"disability":"No","peer":"Neutral"},{"id":68,"gender":"Male","school":"Private","score":63.0,"attend":64.0,"hours":19.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":0.0,"prev":65.0,"disability":"No","peer":"Positive"}],"all_students":[{"id":1,"gender":"Male","school":"Private","score":96.0,"attend":66.0,"hours":17.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":0,"internet":"Yes","tutor":1.0,"prev":81.0,"disability":"No","peer":"Positive"},{"id":2,"gender":"Male","school":"Public","score":94.0,"attend":98.0,"hours":16.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":2.0,"prev":84.0,"disability":"No","peer":"Negative"},{"id":3,"gender":"Female","school":"Public","score":86.0,"attend":76.0,"hours":12.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":0.0,"prev":66.0,"disability":"No","peer":"Neutral"},{"id":4,"gender":"Male","school":"Public","score":80.0,"attend":93.0,"hours":19.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":1.0,"prev":79.0,"disability":"No","peer":"Positive"},{"id":5,"gender":"Female","school":"Public","score":76.0,"attend":100.0,"hours":35.0,"motiv":"High","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":0.0,"prev":83.0,"disability":"Yes","peer":"Negative"},{"id":6,"gender":"Male","school":"Public","score":76.0,"attend":97.0,"hours":28.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":2.0,"prev":96.0,"disability":"No","peer":"Positive"},{"id":7,"gender":"Female","school":"Public","score":75.0,"attend":91.0,"hours":36.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":2.0,"prev":71.0,"disability":"No","peer":"Neutral"},{"id":8,"gender":"Female","school":"Public","score":74.0,"attend":94.0,"hours":26.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":1.0,"prev":83.0,"disability":"No","peer":"Neutral"},{"id":9,"gender":"Male","school":"Private","score":74.0,"attend":99.0,"hours":25.0,"motiv":"High","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":1.0,"prev":84.0,"disability":"Yes","peer":"Positive"},{"id":10,"gender":"Male","school":"Private","score":74.0,"attend":97.0,"hours":23.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":1.0,"prev":96.0,"disability":"No","peer":"Positive"},{"id":11,"gender":"Male","school":"Public","score":74.0,"attend":99.0,"hours":23.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":2.0,"prev":78.0,"disability":"No","peer":"Neutral"},{"id":12,"gender":"Female","school":"Public","score":74.0,"attend":97.0,"hours":28.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":2.0,"prev":78.0,"disability":"No","peer":"Positive"},{"id":13,"gender":"Female","school":"Public","score":74.0,"attend":96.0,"hours":29.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":2.0,"prev":92.0,"disability":"No","peer":"Positive"},{"id":14,"gender":"Male","school":"Public","score":73.0,"attend":97.0,"hours":24.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":0.0,"prev":63.0,"disability":"No","peer":"Neutral"},{"id":15,"gender":"Female","school":"Private","score":73.0,"attend":93.0,"hours":24.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":2.0,"prev":99.0,"disability":"No","peer":"Neutral"},{"id":16,"gender":"Male","school":"Public","score":73.0,"attend":79.0,"hours":32.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":4.0,"prev":89.0,"disability":"No","peer":"Neutral"},{"id":17,"gender":"Male","school":"Public","score":73.0,"attend":93.0,"hours":18.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":5.0,"prev":82.0,"disability":"No","peer":"Positive"},{"id":18,"gender":"Male","school":"Public","score":73.0,"attend":93.0,"hours":21.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":2.0,"prev":94.0,"disability":"No","peer":"Positive"},{"id":19,"gender":"Male","school":"Public","score":73.0,"attend":88.0,"hours":24.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":3.0,"prev":67.0,"disability":"No","peer":"Neutral"},{"id":20,"gender":"Male","school":"Private","score":73.0,"attend":98.0,"hours":24.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":0.0,"prev":94.0,"disability":"No","peer":"Neutral"},{"id":21,"gender":"Female","school":"Private","score":73.0,"attend":87.0,"hours":29.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":1.0,"prev":97.0,"disability":"No","peer":"Neutral"},{"id":22,"gender":"Male","school":"Private","score":73.0,"attend":96.0,"hours":27.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":0.0,"prev":67.0,"disability":"No","peer":"Neutral"},{"id":23,"gender":"Male","school":"Private","score":73.0,"attend":99.0,"hours":20.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":1.0,"prev":87.0,"disability":"No","peer":"Positive"},{"id":24,"gender":"Female","school":"Public","score":73.0,"attend":97.0,"hours":16.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":1.0,"prev":87.0,"disability":"No","peer":"Positive"},{"id":25,"gender":"Female","school":"Public","score":72.0,"attend":91.0,"hours":25.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":0.0,"prev":94.0,"disability":"No","peer":"Neutral"},{"id":26,"gender":"Male","school":"Private","score":72.0,"attend":92.0,"hours":13.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":1.0,"prev":71.0,"disability":"No","peer":"Positive"},{"id":27,"gender":"Female","school":"Public","score":72.0,"attend":99.0,"hours":15.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":0.0,"prev":98.0,"disability":"No","peer":"Positive"},{"id":28,"gender":"Male","school":"Public","score":72.0,"attend":100.0,"hours":15.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":1.0,"prev":72.0,"disability":"No","peer":"Negative"},{"id":29,"gender":"Male","school":"Public","score":72.0,"attend":98.0,"hours":25.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":0,"internet":"No","tutor":0.0,"prev":82.0,"disability":"No","peer":"Neutral"},{"id":30,"gender":"Male","school":"Private","score":72.0,"attend":89.0,"hours":19.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":6.0,"prev":87.0,"disability":"No","peer":"Positive"},{"id":31,"gender":"Male","school":"Public","score":72.0,"attend":98.0,"hours":25.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":1.0,"prev":57.0,"disability":"No","peer":"Positive"},{"id":32,"gender":"Male","school":"Private","score":72.0,"attend":91.0,"hours":25.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":4.0,"prev":89.0,"disability":"No","peer":"Neutral"},{"id":33,"gender":"Male","school":"Public","score":72.0,"attend":75.0,"hours":34.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":1,"internet":"No","tutor":3.0,"prev":98.0,"disability":"No","peer":"Negative"},{"id":34,"gender":"Female","school":"Public","score":72.0,"attend":96.0,"hours":23.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":2.0,"prev":99.0,"disability":"No","peer":"Neutral"},{"id":35,"gender":"Male","school":"Public","score":72.0,"attend":93.0,"hours":25.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":3.0,"prev":82.0,"disability":"No","peer":"Neutral"},{"id":36,"gender":"Female","school":"Public","score":72.0,"attend":95.0,"hours":23.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":1.0,"prev":77.0,"disability":"No","peer":"Positive"},{"id":37,"gender":"Male","school":"Public","score":72.0,"attend":75.0,"hours":26.0,"motiv":"High","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":3.0,"prev":92.0,"disability":"No","peer":"Positive"},{"id":38,"gender":"Female","school":"Public","score":72.0,"attend":99.0,"hours":18.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":0,"internet":"No","tutor":3.0,"prev":92.0,"disability":"No","peer":"Positive"},{"id":39,"gender":"Female","school":"Private","score":72.0,"attend":98.0,"hours":29.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":0,"internet":"Yes","tutor":2.0,"prev":55.0,"disability":"Yes","peer":"Positive"},{"id":40,"gender":"Male","school":"Private","score":72.0,"attend":95.0,"hours":24.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":2.0,"prev":87.0,"disability":"No","peer":"Neutral"},{"id":41,"gender":"Male","school":"Public","score":72.0,"attend":99.0,"hours":20.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":0.0,"prev":78.0,"disability":"No","peer":"Positive"},{"id":42,"gender":"Female","school":"Public","score":72.0,"attend":95.0,"hours":27.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":1.0,"prev":94.0,"disability":"No","peer":"Positive"},{"id":43,"gender":"Male","school":"Private","score":72.0,"attend":84.0,"hours":32.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":0.0,"prev":90.0,"disability":"No","peer":"Negative"},{"id":44,"gender":"Female","school":"Private","score":71.0,"attend":86.0,"hours":30.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":3.0,"prev":51.0,"disability":"No","peer":"Neutral"},{"id":45,"gender":"Female","school":"Private","score":71.0,"attend":100.0,"hours":26.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":1.0,"prev":53.0,"disability":"Yes","peer":""},{"id":46,"gender":"Male","school":"Public","score":71.0,"attend":88.0,"hours":23.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":2.0,"prev":75.0,"disability":"No","peer":"Neutral"},{"id":47,"gender":"Female","school":"Public","score":71.0,"attend":83.0,"hours":27.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":1.0,"prev":90.0,"disability":"No","peer":"Positive"},{"id":48,"gender":"Male","school":"Public","score":71.0,"attend":96.0,"hours":15.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":2.0,"prev":86.0,"disability":"No","peer":"Positive"},{"id":49,"gender":"Male","school":"Public","score":71.0,"attend":100.0,"hours":17.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":2.0,"prev":92.0,"disability":"No","peer":"Positive"},{"id":50,"gender":"Male","school":"Public","score":71.0,"attend":87.0,"hours":25.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":1.0,"prev":89.0,"disability":"No","peer":"Positive"},{"id":51,"gender":"Male","school":"Public","score":71.0,"attend":93.0,"hours":29.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":1.0,"prev":77.0,"disability":"Yes","peer":"Neutral"},{"id":52,"gender":"Male","school":"Public","score":71.0,"attend":89.0,"hours":28.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":1.0,"prev":97.0,"disability":"No","peer":"Neutral"},{"id":53,"gender":"Female","school":"Private","score":71.0,"attend":86.0,"hours":25.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":1.0,"prev":86.0,"disability":"No","peer":"Neutral"},{"id":54,"gender":"Male","school":"Private","score":71.0,"attend":88.0,"hours":16.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":1.0,"prev":85.0,"disability":"No","peer":"Positive"},{"id":55,"gender":"Male","school":"Public","score":71.0,"attend":88.0,"hours":17.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":2.0,"prev":94.0,"disability":"No","peer":"Neutral"},{"id":56,"gender":"Female","school":"Public","score":71.0,"attend":88.0,"hours":22.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":1.0,"prev":72.0,"disability":"No","peer":"Positive"},{"id":57,"gender":"Male","school":"Public","score":71.0,"attend":88.0,"hours":24.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":1.0,"prev":94.0,"disability":"No","peer":"Neutral"},{"id":58,"gender":"Male","school":"Public","score":71.0,"attend":73.0,"hours":22.0,"motiv":"High","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":2.0,"prev":94.0,"disability":"No","peer":"Positive"},{"id":59,"gender":"Male","school":"Public","score":71.0,"attend":95.0,"hours":28.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":0.0,"prev":67.0,"disability":"No","peer":"Positive"},{"id":60,"gender":"Male","school":"Public","score":71.0,"attend":81.0,"hours":25.0,"motiv":"High","risk":"Low","risk_score":1,"persona":1,"internet":"No","tutor":1.0,"prev":82.0,"disability":"No","peer":"Positive"},{"id":61,"gender":"Male","school":"Public","score":71.0,"attend":93.0,"hours":30.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":0.0,"prev":65.0,"disability":"No","peer":"Positive"},{"id":62,"gender":"Male","school":"Public","score":71.0,"attend":61.0,"hours":29.0,"motiv":"High","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":3.0,"prev":78.0,"disability":"No","peer":"Positive"},{"id":63,"gender":"Female","school":"Public","score":71.0,"attend":100.0,"hours":23.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":2.0,"prev":68.0,"disability":"No","peer":"Neutral"},{"id":64,"gender":"Male","school":"Private","score":71.0,"attend":99.0,"hours":20.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":1.0,"prev":98.0,"disability":"No","peer":"Neutral"},{"id":65,"gender":"Male","school":"Public","score":71.0,"attend":99.0,"hours":23.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":0.0,"prev":73.0,"disability":"No","peer":"Neutral"},{"id":66,"gender":"Male","school":"Private","score":70.0,"attend":88.0,"hours":25.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":1.0,"prev":90.0,"disability":"Yes","peer":"Positive"},{"id":67,"gender":"Male","school":"Public","score":70.0,"attend":82.0,"hours":29.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":1.0,"prev":57.0,"disability":"No","peer":"Negative"},{"id":68,"gender":"Female","school":"Public","score":70.0,"attend":96.0,"hours":19.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":0,"internet":"No","tutor":2.0,"prev":62.0,"disability":"No","peer":"Negative"},{"id":69,"gender":"Female","school":"Public","score":70.0,"attend":81.0,"hours":19.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":2.0,"prev":99.0,"disability":"No","peer":"Neutral"},{"id":70,"gender":"Male","school":"Public","score":70.0,"attend":85.0,"hours":19.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":0,"internet":"No","tutor":3.0,"prev":97.0,"disability":"No","peer":"Positive"},{"id":71,"gender":"Female","school":"Public","score":70.0,"attend":89.0,"hours":24.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":1.0,"prev":83.0,"disability":"No","peer":"Positive"},{"id":72,"gender":"Male","school":"Private","score":70.0,"attend":91.0,"hours":21.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":3.0,"prev":79.0,"disability":"No","peer":"Positive"},{"id":73,"gender":"Female","school":"Public","score":70.0,"attend":100.0,"hours":18.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":3.0,"prev":79.0,"disability":"No","peer":"Neutral"},{"id":74,"gender":"Male","school":"Public","score":70.0,"attend":80.0,"hours":31.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":1.0,"prev":83.0,"disability":"No","peer":"Neutral"},{"id":75,"gender":"Male","school":"Private","score":70.0,"attend":94.0,"hours":22.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":0.0,"prev":89.0,"disability":"No","peer":"Positive"},{"id":76,"gender":"Female","school":"Public","score":70.0,"attend":92.0,"hours":19.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":2.0,"prev":97.0,"disability":"No","peer":"Neutral"},{"id":77,"gender":"Male","school":"Public","score":70.0,"attend":94.0,"hours":24.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":0,"internet":"Yes","tutor":0.0,"prev":65.0,"disability":"No","peer":"Negative"},{"id":78,"gender":"Male","school":"Private","score":70.0,"attend":87.0,"hours":22.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":0,"internet":"No","tutor":4.0,"prev":56.0,"disability":"No","peer":"Positive"},{"id":79,"gender":"Male","school":"Public","score":70.0,"attend":88.0,"hours":23.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":0.0,"prev":100.0,"disability":"No","peer":"Neutral"},{"id":80,"gender":"Female","school":"Public","score":70.0,"attend":80.0,"hours":26.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":0.0,"prev":70.0,"disability":"No","peer":"Positive"},{"id":81,"gender":"Female","school":"Public","score":70.0,"attend":65.0,"hours":23.0,"motiv":"High","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":2.0,"prev":100.0,"disability":"No","peer":"Neutral"},{"id":82,"gender":"Female","school":"Public","score":70.0,"attend":89.0,"hours":20.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":1.0,"prev":85.0,"disability":"No","peer":"Positive"},{"id":83,"gender":"Male","school":"Public","score":70.0,"attend":88.0,"hours":23.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":0,"internet":"Yes","tutor":2.0,"prev":89.0,"disability":"Yes","peer":"Negative"},{"id":84,"gender":"Male","school":"Private","score":70.0,"attend":96.0,"hours":18.0,"motiv":"High","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":1.0,"prev":78.0,"disability":"Yes","peer":"Negative"},{"id":85,"gender":"Female","school":"Public","score":70.0,"attend":89.0,"hours":21.0,"motiv":"High","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":3.0,"prev":73.0,"disability":"No","peer":"Negative"},{"id":86,"gender":"Female","school":"Private","score":70.0,"attend":88.0,"hours":20.0,"motiv":"High","risk":"Low","risk_score":1,"persona":0,"internet":"No","tutor":1.0,"prev":68.0,"disability":"No","peer":"Positive"},{"id":87,"gender":"Male","school":"Public","score":70.0,"attend":88.0,"hours":18.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":0,"internet":"Yes","tutor":1.0,"prev":91.0,"disability":"Yes","peer":"Neutral"},{"id":88,"gender":"Male","school":"Public","score":70.0,"attend":96.0,"hours":22.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":1.0,"prev":97.0,"disability":"No","peer":"Neutral"},{"id":89,"gender":"Female","school":"Public","score":70.0,"attend":92.0,"hours":22.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":0,"internet":"No","tutor":4.0,"prev":76.0,"disability":"No","peer":"Neutral"},{"id":90,"gender":"Male","school":"Private","score":70.0,"attend":89.0,"hours":20.0,"motiv":"High","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":2.0,"prev":66.0,"disability":"No","peer":"Negative"},{"id":91,"gender":"Male","school":"Public","score":70.0,"attend":86.0,"hours":30.0,"motiv":"High","risk":"Low","risk_score":0,"persona":0,"internet":"Yes","tutor":1.0,"prev":56.0,"disability":"No","peer":"Neutral"},{"id":92,"gender":"Female","school":"Public","score":70.0,"attend":97.0,"hours":23.0,"motiv":"High","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":2.0,"prev":53.0,"disability":"No","peer":"Negative"},{"id":93,"gender":"Female","school":"Public","score":70.0,"attend":88.0,"hours":27.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":1.0,"prev":75.0,"disability":"No","peer":"Neutral"},{"id":94,"gender":"Male","school":"Private","score":70.0,"attend":97.0,"hours":20.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":0,"internet":"Yes","tutor":0.0,"prev":80.0,"disability":"No","peer":"Negative"},{"id":95,"gender":"Male","school":"Private","score":70.0,"attend":100.0,"hours":15.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":3.0,"prev":82.0,"disability":"No","peer":"Neutral"},{"id":96,"gender":"Male","school":"Private","score":70.0,"attend":79.0,"hours":23.0,"motiv":"High","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":3.0,"prev":87.0,"disability":"No","peer":"Neutral"},{"id":97,"gender":"Male","school":"Public","score":70.0,"attend":89.0,"hours":25.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":3.0,"prev":64.0,"disability":"No","peer":"Neutral"},{"id":98,"gender":"Male","school":"Private","score":70.0,"attend":97.0,"hours":17.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":0,"internet":"Yes","tutor":3.0,"prev":94.0,"disability":"Yes","peer":"Negative"},{"id":99,"gender":"Male","school":"Public","score":70.0,"attend":100.0,"hours":22.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":0,"internet":"Yes","tutor":1.0,"prev":55.0,"disability":"No","peer":"Neutral"},{"id":100,"gender":"Male","school":"Public","score":69.0,"attend":91.0,"hours":16.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":0.0,"prev":88.0,"disability":"No","peer":"Positive"},{"id":101,"gender":"Female","school":"Public","score":69.0,"attend":95.0,"hours":18.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":1,"internet":"Yes","tutor":1.0,"prev":82.0,"disability":"Yes","peer":"Negative"},{"id":102,"gender":"Female","school":"Public","score":69.0,"attend":65.0,"hours":29.0,"motiv":"High","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":2.0,"prev":80.0,"disability":"No","peer":"Neutral"},{"id":103,"gender":"Female","school":"Public","score":69.0,"attend":78.0,"hours":28.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":1.0,"prev":73.0,"disability":"No","peer":"Neutral"},{"id":104,"gender":"Male","school":"Private","score":69.0,"attend":95.0,"hours":12.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":2.0,"prev":100.0,"disability":"No","peer":"Neutral"},{"id":105,"gender":"Female","school":"Public","score":69.0,"attend":76.0,"hours":22.0,"motiv":"High","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":3.0,"prev":85.0,"disability":"No","peer":"Negative"},{"id":106,"gender":"Male","school":"Public","score":69.0,"attend":96.0,"hours":15.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":3.0,"prev":57.0,"disability":"No","peer":"Neutral"},{"id":107,"gender":"Male","school":"Public","score":69.0,"attend":90.0,"hours":20.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":1,"internet":"Yes","tutor":0.0,"prev":75.0,"disability":"No","peer":"Negative"},{"id":108,"gender":"Male","school":"Public","score":69.0,"attend":74.0,"hours":26.0,"motiv":"High","risk":"Low","risk_score":1,"persona":4,"internet":"Yes","tutor":1.0,"prev":83.0,"disability":"No","peer":"Positive"},{"id":109,"gender":"Male","school":"Public","score":69.0,"attend":91.0,"hours":18.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":1.0,"prev":66.0,"disability":"No","peer":"Neutral"},{"id":110,"gender":"Male","school":"Public","score":69.0,"attend":80.0,"hours":26.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":1.0,"prev":100.0,"disability":"No","peer":"Negative"},{"id":111,"gender":"Female","school":"Public","score":69.0,"attend":78.0,"hours":29.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":1.0,"prev":72.0,"disability":"No","peer":"Negative"},{"id":112,"gender":"Male","school":"Public","score":69.0,"attend":72.0,"hours":28.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":2.0,"prev":77.0,"disability":"No","peer":"Neutral"},{"id":113,"gender":"Male","school":"Public","score":69.0,"attend":99.0,"hours":20.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":1,"internet":"Yes","tutor":1.0,"prev":93.0,"disability":"Yes","peer":"Positive"},{"id":114,"gender":"Male","school":"Public","score":69.0,"attend":77.0,"hours":25.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":2,"internet":"Yes","tutor":2.0,"prev":76.0,"disability":"No","peer":"Neutral"},{"id":115,"gender":"Male","school":"Public","score":69.0,"attend":98.0,"hours":14.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":3.0,"prev":51.0,"disability":"No","peer":"Neutral"},{"id":116,"gender":"Male","school":"Private","score":69.0,"attend":94.0,"hours":25.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":3.0,"prev":55.0,"disability":"No","peer":"Neutral"},{"id":117,"gender":"Male","school":"Public","score":69.0,"attend":100.0,"hours":15.0,"motiv":"High","risk":"Low","risk_score":0,"persona":1,"internet":"Yes","tutor":3.0,"prev":67.0,"disability":"No","peer":"Neutral"},{"id":118,"gender":"Male","school":"Private","score":69.0,"attend":79.0,"hours":25.0,"motiv":"High","risk":"Low","risk_score":1,"persona":2,"internet":"Yes","tutor":1.0,"prev":54.0,"disability":"No","peer":"Neutral"},{"id":119,"gender":"Female","school":"Private","score":69.0,"attend":84.0,"hours":22.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":0.0,"prev":97.0,"disability":"No","peer":"Neutral"},{"id":120,"gender":"Female","school":"Public","score":69.0,"attend":96.0,"hours":18.0,"motiv":"High","risk":"Low","risk_score":0,"persona":1,"internet":"Yes","tutor":1.0,"prev":51.0,"disability":"No","peer":"Neutral"},{"id":121,"gender":"Female","school":"Public","score":69.0,"attend":93.0,"hours":17.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":2.0,"prev":74.0,"disability":"No","peer":"Positive"},{"id":122,"gender":"Female","school":"Public","score":69.0,"attend":89.0,"hours":15.0,"motiv":"High","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":1.0,"prev":90.0,"disability":"Yes","peer":"Neutral"},{"id":123,"gender":"Male","school":"Public","score":69.0,"attend":90.0,"hours":17.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":1.0,"prev":95.0,"disability":"No","peer":"Positive"},{"id":124,"gender":"Female","school":"Public","score":69.0,"attend":68.0,"hours":27.0,"motiv":"High","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":1.0,"prev":93.0,"disability":"No","peer":"Neutral"},{"id":125,"gender":"Female","school":"Public","score":69.0,"attend":95.0,"hours":17.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":2.0,"prev":84.0,"disability":"No","peer":"Neutral"},{"id":126,"gender":"Male","school":"Public","score":69.0,"attend":93.0,"hours":21.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":1.0,"prev":69.0,"disability":"No","peer":"Positive"},{"id":127,"gender":"Female","school":"Public","score":69.0,"attend":79.0,"hours":27.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":2,"internet":"Yes","tutor":2.0,"prev":68.0,"disability":"No","peer":"Positive"},{"id":128,"gender":"Male","school":"Private","score":69.0,"attend":80.0,"hours":29.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":2,"internet":"Yes","tutor":0.0,"prev":76.0,"disability":"No","peer":"Positive"},{"id":129,"gender":"Male","school":"Public","score":69.0,"attend":66.0,"hours":28.0,"motiv":"High","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":3.0,"prev":90.0,"disability":"No","peer":"Neutral"},{"id":130,"gender":"Male","school":"Public","score":69.0,"attend":65.0,"hours":26.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":3.0,"prev":83.0,"disability":"No","peer":"Positive"},{"id":131,"gender":"Female","school":"Public","score":69.0,"attend":87.0,"hours":28.0,"motiv":"High","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":2.0,"prev":55.0,"disability":"Yes","peer":"Negative"},{"id":132,"gender":"Male","school":"Public","score":69.0,"attend":90.0,"hours":23.0,"motiv":"High","risk":"Low","risk_score":0,"persona":1,"internet":"Yes","tutor":1.0,"prev":62.0,"disability":"No","peer":"Neutral"},{"id":133,"gender":"Female","school":"Public","score":69.0,"attend":78.0,"hours":26.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":3.0,"prev":82.0,"disability":"Yes","peer":"Neutral"},{"id":134,"gender":"Male","school":"Private","score":69.0,"attend":85.0,"hours":20.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":2.0,"prev":96.0,"disability":"No","peer":"Negative"},{"id":135,"gender":"Male","school":"Public","score":68.0,"attend":96.0,"hours":11.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":0.0,"prev":59.0,"disability":"No","peer":"Neutral"},{"id":136,"gender":"Male","school":"Public","score":68.0,"attend":80.0,"hours":14.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":2.0,"prev":95.0,"disability":"No","peer":"Neutral"},{"id":137,"gender":"Male","school":"Private","score":68.0,"attend":93.0,"hours":20.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":1.0,"prev":51.0,"disability":"No","peer":"Neutral"},{"id":138,"gender":"Female","school":"Public","score":68.0,"attend":92.0,"hours":17.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":1.0,"prev":63.0,"disability":"No","peer":"Negative"},{"id":139,"gender":"Male","school":"Private","score":68.0,"attend":90.0,"hours":16.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":2.0,"prev":71.0,"disability":"No","peer":"Neutral"},{"id":140,"gender":"Male","school":"Public","score":68.0,"attend":83.0,"hours":26.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":2,"internet":"Yes","tutor":1.0,"prev":79.0,"disability":"No","peer":"Negative"},{"id":141,"gender":"Male","school":"Public","score":68.0,"attend":83.0,"hours":14.0,"motiv":"High","risk":"Low","risk_score":0,"persona":2,"internet":"Yes","tutor":5.0,"prev":70.0,"disability":"No","peer":"Neutral"},{"id":142,"gender":"Male","school":"Public","score":68.0,"attend":68.0,"hours":26.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":1.0,"prev":99.0,"disability":"No","peer":"Positive"},{"id":143,"gender":"Male","school":"Private","score":68.0,"attend":88.0,"hours":24.0,"motiv":"High","risk":"Low","risk_score":0,"persona":1,"internet":"Yes","tutor":1.0,"prev":74.0,"disability":"No","peer":"Positive"},{"id":144,"gender":"Female","school":"Public","score":68.0,"attend":73.0,"hours":31.0,"motiv":"High","risk":"Low","risk_score":1,"persona":4,"internet":"Yes","tutor":0.0,"prev":93.0,"disability":"No","peer":"Neutral"},{"id":145,"gender":"Female","school":"Public","score":68.0,"attend":66.0,"hours":33.0,"motiv":"High","risk":"Low","risk_score":2,"persona":3,"internet":"Yes","tutor":0.0,"prev":69.0,"disability":"No","peer":"Positive"},{"id":146,"gender":"Male","school":"Public","score":68.0,"attend":73.0,"hours":25.0,"motiv":"High","risk":"Low","risk_score":1,"persona":2,"internet":"Yes","tutor":2.0,"prev":59.0,"disability":"No","peer":"Neutral"},{"id":147,"gender":"Female","school":"Public","score":68.0,"attend":74.0,"hours":26.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":1.0,"prev":99.0,"disability":"No","peer":"Neutral"},{"id":148,"gender":"Male","school":"Public","score":68.0,"attend":82.0,"hours":21.0,"motiv":"High","risk":"Low","risk_score":1,"persona":2,"internet":"No","tutor":1.0,"prev":64.0,"disability":"No","peer":"Positive"},{"id":149,"gender":"Female","school":"Public","score":68.0,"attend":65.0,"hours":30.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":3,"internet":"Yes","tutor":2.0,"prev":51.0,"disability":"No","peer":"Positive"},{"id":150,"gender":"Female","school":"Private","score":68.0,"attend":67.0,"hours":24.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"No","tutor":5.0,"prev":54.0,"disability":"No","peer":"Positive"},{"id":151,"gender":"Male","school":"Public","score":68.0,"attend":83.0,"hours":23.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":2,"internet":"Yes","tutor":0.0,"prev":51.0,"disability":"No","peer":"Positive"},{"id":152,"gender":"Female","school":"Private","score":68.0,"attend":97.0,"hours":2.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":1,"internet":"Yes","tutor":0.0,"prev":85.0,"disability":"No","peer":"Positive"},{"id":153,"gender":"Male","school":"Private","score":68.0,"attend":80.0,"hours":19.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":0.0,"prev":97.0,"disability":"No","peer":"Negative"},{"id":154,"gender":"Male","school":"Private","score":68.0,"attend":89.0,"hours":16.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":1,"internet":"No","tutor":0.0,"prev":89.0,"disability":"No","peer":"Neutral"},{"id":155,"gender":"Male","school":"Public","score":68.0,"attend":88.0,"hours":11.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":3.0,"prev":98.0,"disability":"No","peer":"Positive"},{"id":156,"gender":"Male","school":"Public","score":68.0,"attend":86.0,"hours":17.0,"motiv":"High","risk":"Low","risk_score":0,"persona":1,"internet":"Yes","tutor":2.0,"prev":68.0,"disability":"No","peer":"Neutral"},{"id":157,"gender":"Female","school":"Private","score":68.0,"attend":99.0,"hours":12.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":1.0,"prev":80.0,"disability":"No","peer":"Neutral"},{"id":158,"gender":"Male","school":"Public","score":68.0,"attend":85.0,"hours":24.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":1,"internet":"No","tutor":2.0,"prev":59.0,"disability":"No","peer":"Negative"},{"id":159,"gender":"Male","school":"Public","score":68.0,"attend":78.0,"hours":17.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":3.0,"prev":83.0,"disability":"No","peer":"Positive"},{"id":160,"gender":"Male","school":"Private","score":68.0,"attend":91.0,"hours":19.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":0.0,"prev":76.0,"disability":"No","peer":"Positive"},{"id":161,"gender":"Male","school":"Public","score":68.0,"attend":81.0,"hours":26.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":2,"internet":"No","tutor":1.0,"prev":65.0,"disability":"No","peer":"Negative"},{"id":162,"gender":"Male","school":"Public","score":68.0,"attend":99.0,"hours":13.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":1,"internet":"No","tutor":1.0,"prev":96.0,"disability":"Yes","peer":"Neutral"},{"id":163,"gender":"Male","school":"Private","score":68.0,"attend":89.0,"hours":17.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":2.0,"prev":93.0,"disability":"No","peer":"Negative"},{"id":164,"gender":"Male","school":"Public","score":68.0,"attend":64.0,"hours":19.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":3.0,"prev":96.0,"disability":"No","peer":"Neutral"},{"id":165,"gender":"Male","school":"Public","score":68.0,"attend":89.0,"hours":24.0,"motiv":"High","risk":"Low","risk_score":0,"persona":1,"internet":"Yes","tutor":1.0,"prev":52.0,"disability":"No","peer":"Neutral"},{"id":166,"gender":"Female","school":"Private","score":68.0,"attend":93.0,"hours":16.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":2.0,"prev":94.0,"disability":"No","peer":"Neutral"},{"id":167,"gender":"Male","school":"Public","score":68.0,"attend":91.0,"hours":12.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":2.0,"prev":64.0,"disability":"No","peer":"Positive"},{"id":168,"gender":"Female","school":"Private","score":68.0,"attend":91.0,"hours":19.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":0.0,"prev":50.0,"disability":"No","peer":"Negative"},{"id":169,"gender":"Male","school":"Public","score":68.0,"attend":69.0,"hours":21.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":1.0,"prev":82.0,"disability":"No","peer":"Negative"},{"id":170,"gender":"Female","school":"Public","score":68.0,"attend":100.0,"hours":20.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":2.0,"prev":61.0,"disability":"No","peer":"Negative"},{"id":171,"gender":"Male","school":"Private","score":68.0,"attend":92.0,"hours":21.0,"motiv":"High","risk":"Low","risk_score":2,"persona":1,"internet":"No","tutor":0.0,"prev":81.0,"disability":"No","peer":"Negative"},{"id":172,"gender":"Male","school":"Public","score":68.0,"attend":91.0,"hours":17.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":1,"internet":"Yes","tutor":2.0,"prev":89.0,"disability":"Yes","peer":"Neutral"},{"id":173,"gender":"Male","school":"Public","score":68.0,"attend":87.0,"hours":19.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":1.0,"prev":88.0,"disability":"No","peer":"Neutral"},{"id":174,"gender":"Male","school":"Private","score":68.0,"attend":94.0,"hours":16.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":1.0,"prev":61.0,"disability":"No","peer":"Positive"},{"id":175,"gender":"Female","school":"Public","score":68.0,"attend":84.0,"hours":23.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":2,"internet":"Yes","tutor":1.0,"prev":73.0,"disability":"No","peer":"Neutral"},{"id":176,"gender":"Female","school":"Public","score":68.0,"attend":63.0,"hours":27.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":3,"internet":"Yes","tutor":0.0,"prev":73.0,"disability":"No","peer":"Neutral"},{"id":177,"gender":"Female","school":"Private","score":68.0,"attend":89.0,"hours":22.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":1.0,"prev":60.0,"disability":"No","peer":"Neutral"},{"id":178,"gender":"Female","school":"Public","score":68.0,"attend":81.0,"hours":25.0,"motiv":"High","risk":"Low","risk_score":1,"persona":4,"internet":"Yes","tutor":4.0,"prev":84.0,"disability":"Yes","peer":"Neutral"},{"id":179,"gender":"Female","school":"Public","score":68.0,"attend":65.0,"hours":25.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":3,"internet":"Yes","tutor":3.0,"prev":75.0,"disability":"No","peer":"Positive"},{"id":180,"gender":"Male","school":"Public","score":68.0,"attend":81.0,"hours":15.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":4,"internet":"Yes","tutor":3.0,"prev":93.0,"disability":"No","peer":"Positive"},{"id":181,"gender":"Female","school":"Public","score":67.0,"attend":89.0,"hours":13.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":0.0,"prev":87.0,"disability":"No","peer":"Neutral"},{"id":182,"gender":"Male","school":"Public","score":67.0,"attend":87.0,"hours":18.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":1,"internet":"Yes","tutor":2.0,"prev":64.0,"disability":"No","peer":"Negative"},{"id":183,"gender":"Female","school":"Public","score":67.0,"attend":97.0,"hours":5.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":2.0,"prev":82.0,"disability":"No","peer":"Neutral"},{"id":184,"gender":"Male","school":"Public","score":67.0,"attend":76.0,"hours":13.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":3.0,"prev":74.0,"disability":"No","peer":"Neutral"},{"id":185,"gender":"Male","school":"Public","score":67.0,"attend":77.0,"hours":18.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":0.0,"prev":83.0,"disability":"No","peer":"Positive"},{"id":186,"gender":"Female","school":"Public","score":67.0,"attend":68.0,"hours":17.0,"motiv":"High","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":2.0,"prev":95.0,"disability":"No","peer":"Neutral"},{"id":187,"gender":"Male","school":"Public","score":67.0,"attend":65.0,"hours":30.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":3,"internet":"No","tutor":2.0,"prev":71.0,"disability":"Yes","peer":"Neutral"},{"id":188,"gender":"Male","school":"Private","score":67.0,"attend":67.0,"hours":28.0,"motiv":"High","risk":"Medium","risk_score":3,"persona":3,"internet":"Yes","tutor":2.0,"prev":72.0,"disability":"No","peer":"Negative"},{"id":189,"gender":"Male","school":"Public","score":67.0,"attend":91.0,"hours":14.0,"motiv":"High","risk":"Low","risk_score":0,"persona":1,"internet":"Yes","tutor":2.0,"prev":74.0,"disability":"No","peer":"Neutral"},{"id":190,"gender":"Male","school":"Public","score":67.0,"attend":85.0,"hours":11.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":1.0,"prev":54.0,"disability":"No","peer":"Positive"},{"id":191,"gender":"Female","school":"Private","score":67.0,"attend":94.0,"hours":12.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":2.0,"prev":62.0,"disability":"No","peer":"Positive"},{"id":192,"gender":"Male","school":"Private","score":67.0,"attend":69.0,"hours":26.0,"motiv":"High","risk":"Low","risk_score":2,"persona":3,"internet":"Yes","tutor":1.0,"prev":74.0,"disability":"No","peer":"Neutral"},{"id":193,"gender":"Female","school":"Public","score":67.0,"attend":80.0,"hours":22.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":0.0,"prev":94.0,"disability":"No","peer":"Neutral"},{"id":194,"gender":"Female","school":"Public","score":67.0,"attend":76.0,"hours":23.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":5.0,"prev":78.0,"disability":"Yes","peer":"Neutral"},{"id":195,"gender":"Female","school":"Public","score":67.0,"attend":96.0,"hours":12.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":1,"internet":"No","tutor":1.0,"prev":78.0,"disability":"No","peer":"Neutral"},{"id":196,"gender":"Male","school":"Public","score":67.0,"attend":97.0,"hours":20.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":0.0,"prev":80.0,"disability":"No","peer":"Neutral"},{"id":197,"gender":"Male","school":"Private","score":67.0,"attend":82.0,"hours":20.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":2,"internet":"Yes","tutor":0.0,"prev":72.0,"disability":"No","peer":"Neutral"},{"id":198,"gender":"Female","school":"Public","score":67.0,"attend":75.0,"hours":28.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":1.0,"prev":87.0,"disability":"No","peer":"Negative"},{"id":199,"gender":"Male","school":"Public","score":67.0,"attend":79.0,"hours":18.0,"motiv":"High","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":3.0,"prev":91.0,"disability":"No","peer":"Negative"},{"id":200,"gender":"Male","school":"Public","score":67.0,"attend":71.0,"hours":19.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":3.0,"prev":97.0,"disability":"No","peer":"Neutral"},{"id":201,"gender":"Male","school":"Private","score":67.0,"attend":83.0,"hours":13.0,"motiv":"High","risk":"Low","risk_score":0,"persona":4,"internet":"Yes","tutor":3.0,"prev":94.0,"disability":"No","peer":"Positive"},{"id":202,"gender":"Male","school":"Public","score":67.0,"attend":73.0,"hours":26.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":0.0,"prev":80.0,"disability":"Yes","peer":"Positive"},{"id":203,"gender":"Female","school":"Public","score":67.0,"attend":88.0,"hours":13.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":1.0,"prev":50.0,"disability":"No","peer":"Positive"},{"id":204,"gender":"Female","school":"Public","score":67.0,"attend":72.0,"hours":25.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":1.0,"prev":86.0,"disability":"No","peer":"Positive"},{"id":205,"gender":"Male","school":"Public","score":67.0,"attend":87.0,"hours":2.0,"motiv":"High","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":4.0,"prev":92.0,"disability":"No","peer":"Positive"},{"id":206,"gender":"Female","school":"Private","score":67.0,"attend":89.0,"hours":11.0,"motiv":"Medium","risk":"Low","risk_score":1,"persona":1,"internet":"Yes","tutor":0.0,"prev":93.0,"disability":"No","peer":"Neutral"},{"id":207,"gender":"Female","school":"Public","score":67.0,"attend":68.0,"hours":19.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":0.0,"prev":91.0,"disability":"No","peer":"Positive"},{"id":208,"gender":"Male","school":"Private","score":67.0,"attend":77.0,"hours":12.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":2.0,"prev":96.0,"disability":"No","peer":"Negative"},{"id":209,"gender":"Female","school":"Private","score":67.0,"attend":61.0,"hours":25.0,"motiv":"High","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":0.0,"prev":100.0,"disability":"No","peer":"Neutral"},{"id":210,"gender":"Male","school":"Private","score":67.0,"attend":61.0,"hours":22.0,"motiv":"High","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":5.0,"prev":94.0,"disability":"No","peer":"Positive"},{"id":211,"gender":"Male","school":"Public","score":67.0,"attend":76.0,"hours":17.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":3.0,"prev":90.0,"disability":"No","peer":"Neutral"},{"id":212,"gender":"Male","school":"Public","score":67.0,"attend":96.0,"hours":15.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":1,"internet":"No","tutor":1.0,"prev":59.0,"disability":"Yes","peer":"Positive"},{"id":213,"gender":"Female","school":"Private","score":67.0,"attend":76.0,"hours":20.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":0.0,"prev":82.0,"disability":"No","peer":"Positive"},{"id":214,"gender":"Male","school":"Public","score":67.0,"attend":90.0,"hours":15.0,"motiv":"Low","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":1.0,"prev":52.0,"disability":"No","peer":"Positive"},{"id":215,"gender":"Female","school":"Public","score":67.0,"attend":83.0,"hours":25.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":0.0,"prev":58.0,"disability":"No","peer":"Negative"},{"id":216,"gender":"Female","school":"Public","score":67.0,"attend":69.0,"hours":18.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":5.0,"prev":95.0,"disability":"No","peer":"Positive"},{"id":217,"gender":"Female","school":"Public","score":66.0,"attend":96.0,"hours":9.0,"motiv":"High","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":2.0,"prev":55.0,"disability":"No","peer":"Positive"},{"id":218,"gender":"Male","school":"Public","score":66.0,"attend":64.0,"hours":24.0,"motiv":"High","risk":"Medium","risk_score":3,"persona":3,"internet":"Yes","tutor":1.0,"prev":77.0,"disability":"No","peer":"Positive"},{"id":219,"gender":"Female","school":"Public","score":66.0,"attend":84.0,"hours":10.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":4,"internet":"No","tutor":0.0,"prev":81.0,"disability":"No","peer":"Positive"},{"id":220,"gender":"Female","school":"Public","score":66.0,"attend":67.0,"hours":21.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":3.0,"prev":86.0,"disability":"No","peer":"Neutral"},{"id":221,"gender":"Female","school":"Public","score":66.0,"attend":99.0,"hours":17.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":1,"internet":"Yes","tutor":0.0,"prev":66.0,"disability":"Yes","peer":"Neutral"},{"id":222,"gender":"Female","school":"Public","score":66.0,"attend":66.0,"hours":34.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":69.0,"disability":"No","peer":"Negative"},{"id":223,"gender":"Male","school":"Private","score":66.0,"attend":94.0,"hours":16.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":1,"internet":"Yes","tutor":2.0,"prev":59.0,"disability":"No","peer":"Negative"},{"id":224,"gender":"Female","school":"Public","score":66.0,"attend":60.0,"hours":35.0,"motiv":"High","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":1.0,"prev":52.0,"disability":"Yes","peer":"Positive"},{"id":225,"gender":"Female","school":"Public","score":66.0,"attend":68.0,"hours":17.0,"motiv":"Low","risk":"High","risk_score":6,"persona":4,"internet":"Yes","tutor":3.0,"prev":96.0,"disability":"Yes","peer":"Positive"},{"id":226,"gender":"Female","school":"Public","score":66.0,"attend":75.0,"hours":20.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":1.0,"prev":89.0,"disability":"No","peer":"Neutral"},{"id":227,"gender":"Male","school":"Private","score":66.0,"attend":74.0,"hours":20.0,"motiv":"High","risk":"Low","risk_score":2,"persona":2,"internet":"Yes","tutor":1.0,"prev":69.0,"disability":"No","peer":"Positive"},{"id":228,"gender":"Male","school":"Private","score":66.0,"attend":74.0,"hours":21.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":0.0,"prev":92.0,"disability":"No","peer":"Neutral"},{"id":229,"gender":"Male","school":"Private","score":66.0,"attend":69.0,"hours":17.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":1.0,"prev":95.0,"disability":"No","peer":"Positive"},{"id":230,"gender":"Male","school":"Public","score":66.0,"attend":77.0,"hours":13.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":1.0,"prev":93.0,"disability":"No","peer":"Neutral"},{"id":231,"gender":"Female","school":"Public","score":66.0,"attend":63.0,"hours":16.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":7.0,"prev":85.0,"disability":"No","peer":"Positive"},{"id":232,"gender":"Female","school":"Private","score":66.0,"attend":71.0,"hours":13.0,"motiv":"High","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":1.0,"prev":96.0,"disability":"No","peer":"Positive"},{"id":233,"gender":"Male","school":"Public","score":66.0,"attend":92.0,"hours":13.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":1.0,"prev":85.0,"disability":"No","peer":"Positive"},{"id":234,"gender":"Male","school":"Private","score":66.0,"attend":73.0,"hours":24.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":0.0,"prev":76.0,"disability":"No","peer":"Neutral"},{"id":235,"gender":"Male","school":"Public","score":66.0,"attend":94.0,"hours":15.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":1,"internet":"Yes","tutor":2.0,"prev":98.0,"disability":"Yes","peer":"Positive"},{"id":236,"gender":"Male","school":"Public","score":66.0,"attend":94.0,"hours":15.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":1,"internet":"Yes","tutor":1.0,"prev":54.0,"disability":"No","peer":"Neutral"},{"id":237,"gender":"Female","school":"Public","score":66.0,"attend":79.0,"hours":14.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":0.0,"prev":99.0,"disability":"No","peer":"Positive"},{"id":238,"gender":"Female","school":"Public","score":66.0,"attend":85.0,"hours":10.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":2.0,"prev":53.0,"disability":"No","peer":"Positive"},{"id":239,"gender":"Female","school":"Public","score":66.0,"attend":81.0,"hours":21.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":2,"internet":"Yes","tutor":0.0,"prev":70.0,"disability":"No","peer":"Neutral"},{"id":240,"gender":"Female","school":"Public","score":66.0,"attend":99.0,"hours":12.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":1,"internet":"Yes","tutor":0.0,"prev":58.0,"disability":"No","peer":"Neutral"},{"id":241,"gender":"Male","school":"Public","score":66.0,"attend":78.0,"hours":13.0,"motiv":"High","risk":"Low","risk_score":2,"persona":2,"internet":"Yes","tutor":2.0,"prev":71.0,"disability":"No","peer":"Neutral"},{"id":242,"gender":"Male","school":"Private","score":66.0,"attend":79.0,"hours":19.0,"motiv":"High","risk":"Low","risk_score":2,"persona":2,"internet":"Yes","tutor":2.0,"prev":67.0,"disability":"No","peer":"Neutral"},{"id":243,"gender":"Male","school":"Public","score":66.0,"attend":67.0,"hours":16.0,"motiv":"Low","risk":"High","risk_score":6,"persona":4,"internet":"Yes","tutor":6.0,"prev":85.0,"disability":"No","peer":"Negative"},{"id":244,"gender":"Female","school":"Private","score":66.0,"attend":78.0,"hours":10.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":4.0,"prev":57.0,"disability":"No","peer":"Positive"},{"id":245,"gender":"Female","school":"Private","score":66.0,"attend":71.0,"hours":21.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":2.0,"prev":67.0,"disability":"No","peer":"Neutral"},{"id":246,"gender":"Male","school":"Private","score":66.0,"attend":82.0,"hours":23.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":0.0,"prev":95.0,"disability":"Yes","peer":"Neutral"},{"id":247,"gender":"Male","school":"Public","score":66.0,"attend":87.0,"hours":19.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":2.0,"prev":88.0,"disability":"No","peer":"Positive"},{"id":248,"gender":"Male","school":"Public","score":66.0,"attend":60.0,"hours":20.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":1.0,"prev":91.0,"disability":"No","peer":"Positive"},{"id":249,"gender":"Female","school":"Private","score":66.0,"attend":78.0,"hours":17.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":3.0,"prev":93.0,"disability":"No","peer":"Negative"},{"id":250,"gender":"Female","school":"Public","score":66.0,"attend":84.0,"hours":12.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":3.0,"prev":69.0,"disability":"No","peer":"Neutral"},{"id":251,"gender":"Female","school":"Public","score":66.0,"attend":91.0,"hours":15.0,"motiv":"High","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":2.0,"prev":78.0,"disability":"Yes","peer":"Neutral"},{"id":252,"gender":"Male","school":"Private","score":66.0,"attend":65.0,"hours":32.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":0.0,"prev":54.0,"disability":"No","peer":"Neutral"},{"id":253,"gender":"Female","school":"Public","score":66.0,"attend":84.0,"hours":17.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":4,"internet":"No","tutor":0.0,"prev":100.0,"disability":"No","peer":"Neutral"},{"id":254,"gender":"Female","school":"Private","score":66.0,"attend":64.0,"hours":21.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":2.0,"prev":79.0,"disability":"No","peer":"Positive"},{"id":255,"gender":"Male","school":"Private","score":66.0,"attend":96.0,"hours":10.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":1,"internet":"No","tutor":0.0,"prev":51.0,"disability":"No","peer":"Neutral"},{"id":256,"gender":"Female","school":"Public","score":66.0,"attend":76.0,"hours":16.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":2.0,"prev":85.0,"disability":"No","peer":"Positive"},{"id":257,"gender":"Male","school":"Private","score":66.0,"attend":80.0,"hours":19.0,"motiv":"High","risk":"Low","risk_score":1,"persona":2,"internet":"Yes","tutor":1.0,"prev":66.0,"disability":"No","peer":"Positive"},{"id":258,"gender":"Male","school":"Public","score":66.0,"attend":73.0,"hours":19.0,"motiv":"High","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":0.0,"prev":72.0,"disability":"Yes","peer":"Positive"},{"id":259,"gender":"Male","school":"Public","score":66.0,"attend":62.0,"hours":21.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":4.0,"prev":58.0,"disability":"No","peer":"Neutral"},{"id":260,"gender":"Female","school":"Public","score":65.0,"attend":74.0,"hours":21.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":1.0,"prev":65.0,"disability":"No","peer":"Neutral"},{"id":261,"gender":"Female","school":"Private","score":65.0,"attend":72.0,"hours":18.0,"motiv":"High","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":0.0,"prev":50.0,"disability":"No","peer":"Negative"},{"id":262,"gender":"Male","school":"Public","score":65.0,"attend":68.0,"hours":27.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":2.0,"prev":84.0,"disability":"No","peer":"Neutral"},{"id":263,"gender":"Male","school":"Public","score":65.0,"attend":72.0,"hours":22.0,"motiv":"High","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":1.0,"prev":94.0,"disability":"No","peer":"Positive"},{"id":264,"gender":"Male","school":"Public","score":65.0,"attend":78.0,"hours":20.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":2,"internet":"Yes","tutor":1.0,"prev":51.0,"disability":"Yes","peer":"Neutral"},{"id":265,"gender":"Male","school":"Public","score":65.0,"attend":76.0,"hours":23.0,"motiv":"Low","risk":"High","risk_score":6,"persona":4,"internet":"No","tutor":3.0,"prev":100.0,"disability":"Yes","peer":"Neutral"},{"id":266,"gender":"Female","school":"Public","score":65.0,"attend":71.0,"hours":21.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":1.0,"prev":63.0,"disability":"No","peer":"Neutral"},{"id":267,"gender":"Male","school":"Public","score":65.0,"attend":89.0,"hours":18.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":1,"internet":"No","tutor":0.0,"prev":96.0,"disability":"No","peer":"Neutral"},{"id":268,"gender":"Male","school":"Public","score":65.0,"attend":64.0,"hours":24.0,"motiv":"High","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":2.0,"prev":98.0,"disability":"No","peer":"Negative"},{"id":269,"gender":"Male","school":"Private","score":65.0,"attend":66.0,"hours":22.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":0.0,"prev":84.0,"disability":"No","peer":"Neutral"},{"id":270,"gender":"Female","school":"Public","score":65.0,"attend":65.0,"hours":23.0,"motiv":"High","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":77.0,"disability":"Yes","peer":"Negative"},{"id":271,"gender":"Female","school":"Public","score":65.0,"attend":74.0,"hours":19.0,"motiv":"High","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":1.0,"prev":63.0,"disability":"No","peer":"Negative"},{"id":272,"gender":"Female","school":"Public","score":65.0,"attend":64.0,"hours":23.0,"motiv":"High","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":1.0,"prev":97.0,"disability":"No","peer":"Neutral"},{"id":273,"gender":"Male","school":"Private","score":65.0,"attend":76.0,"hours":30.0,"motiv":"Low","risk":"High","risk_score":5,"persona":2,"internet":"Yes","tutor":0.0,"prev":72.0,"disability":"No","peer":"Negative"},{"id":274,"gender":"Female","school":"Public","score":65.0,"attend":97.0,"hours":18.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":1,"internet":"No","tutor":2.0,"prev":52.0,"disability":"No","peer":"Neutral"},{"id":275,"gender":"Male","school":"Public","score":65.0,"attend":64.0,"hours":30.0,"motiv":"Low","risk":"High","risk_score":6,"persona":3,"internet":"No","tutor":2.0,"prev":51.0,"disability":"No","peer":"Neutral"},{"id":276,"gender":"Male","school":"Public","score":65.0,"attend":67.0,"hours":17.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":0.0,"prev":100.0,"disability":"No","peer":"Negative"},{"id":277,"gender":"Female","school":"Public","score":65.0,"attend":68.0,"hours":21.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":0.0,"prev":73.0,"disability":"No","peer":"Positive"},{"id":278,"gender":"Male","school":"Private","score":65.0,"attend":71.0,"hours":22.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":0.0,"prev":77.0,"disability":"Yes","peer":"Positive"},{"id":279,"gender":"Female","school":"Public","score":65.0,"attend":76.0,"hours":26.0,"motiv":"Low","risk":"High","risk_score":5,"persona":2,"internet":"Yes","tutor":1.0,"prev":51.0,"disability":"No","peer":"Negative"},{"id":280,"gender":"Male","school":"Public","score":65.0,"attend":83.0,"hours":12.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":1.0,"prev":100.0,"disability":"No","peer":"Positive"},{"id":281,"gender":"Male","school":"Public","score":65.0,"attend":73.0,"hours":21.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":2.0,"prev":54.0,"disability":"No","peer":"Positive"},{"id":282,"gender":"Female","school":"Private","score":65.0,"attend":77.0,"hours":16.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":2,"internet":"Yes","tutor":2.0,"prev":64.0,"disability":"No","peer":"Positive"},{"id":283,"gender":"Male","school":"Private","score":65.0,"attend":71.0,"hours":14.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":2.0,"prev":93.0,"disability":"No","peer":"Negative"},{"id":284,"gender":"Female","school":"Public","score":65.0,"attend":84.0,"hours":15.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":2,"internet":"Yes","tutor":1.0,"prev":50.0,"disability":"No","peer":"Neutral"},{"id":285,"gender":"Female","school":"Private","score":65.0,"attend":70.0,"hours":12.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":1.0,"prev":86.0,"disability":"No","peer":"Positive"},{"id":286,"gender":"Female","school":"Public","score":65.0,"attend":74.0,"hours":18.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":3.0,"prev":80.0,"disability":"Yes","peer":"Positive"},{"id":287,"gender":"Male","school":"Private","score":65.0,"attend":69.0,"hours":18.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":3.0,"prev":56.0,"disability":"No","peer":"Positive"},{"id":288,"gender":"Female","school":"Public","score":65.0,"attend":63.0,"hours":31.0,"motiv":"High","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":0.0,"prev":74.0,"disability":"No","peer":"Negative"},{"id":289,"gender":"Male","school":"Public","score":65.0,"attend":64.0,"hours":17.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":3.0,"prev":93.0,"disability":"Yes","peer":"Neutral"},{"id":290,"gender":"Female","school":"Public","score":65.0,"attend":72.0,"hours":27.0,"motiv":"Low","risk":"High","risk_score":5,"persona":2,"internet":"Yes","tutor":0.0,"prev":59.0,"disability":"No","peer":"Negative"},{"id":291,"gender":"Male","school":"Public","score":65.0,"attend":73.0,"hours":21.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":1.0,"prev":60.0,"disability":"No","peer":"Positive"},{"id":292,"gender":"Male","school":"Public","score":65.0,"attend":80.0,"hours":20.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":2,"internet":"Yes","tutor":0.0,"prev":79.0,"disability":"No","peer":"Negative"},{"id":293,"gender":"Female","school":"Public","score":65.0,"attend":69.0,"hours":26.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":2.0,"prev":50.0,"disability":"No","peer":"Positive"},{"id":294,"gender":"Male","school":"Public","score":65.0,"attend":65.0,"hours":21.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":3.0,"prev":93.0,"disability":"Yes","peer":"Neutral"},{"id":295,"gender":"Male","school":"Public","score":65.0,"attend":72.0,"hours":25.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":2,"internet":"Yes","tutor":1.0,"prev":57.0,"disability":"No","peer":"Negative"},{"id":296,"gender":"Male","school":"Private","score":64.0,"attend":64.0,"hours":27.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":67.0,"disability":"No","peer":"Neutral"},{"id":297,"gender":"Male","school":"Private","score":64.0,"attend":72.0,"hours":24.0,"motiv":"Unknown","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":1.0,"prev":58.0,"disability":"No","peer":"Negative"},{"id":298,"gender":"Male","school":"Private","score":64.0,"attend":80.0,"hours":20.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":2,"internet":"No","tutor":2.0,"prev":53.0,"disability":"Yes","peer":"Negative"},{"id":299,"gender":"Male","school":"Private","score":64.0,"attend":70.0,"hours":17.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":2.0,"prev":59.0,"disability":"No","peer":"Positive"},{"id":300,"gender":"Female","school":"Public","score":64.0,"attend":89.0,"hours":15.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":1,"internet":"Yes","tutor":2.0,"prev":63.0,"disability":"No","peer":"Negative"},{"id":301,"gender":"Male","school":"Public","score":64.0,"attend":66.0,"hours":25.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":2.0,"prev":80.0,"disability":"No","peer":"Positive"},{"id":302,"gender":"Female","school":"Public","score":64.0,"attend":73.0,"hours":15.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":2,"internet":"Yes","tutor":2.0,"prev":58.0,"disability":"No","peer":"Positive"},{"id":303,"gender":"Male","school":"Private","score":64.0,"attend":69.0,"hours":17.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":1.0,"prev":94.0,"disability":"No","peer":"Positive"},{"id":304,"gender":"Male","school":"Public","score":64.0,"attend":82.0,"hours":17.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":1.0,"prev":54.0,"disability":"No","peer":"Positive"},{"id":305,"gender":"Male","school":"Public","score":64.0,"attend":92.0,"hours":18.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":1,"internet":"Yes","tutor":0.0,"prev":63.0,"disability":"Yes","peer":"Neutral"},{"id":306,"gender":"Female","school":"Public","score":64.0,"attend":62.0,"hours":15.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":2.0,"prev":97.0,"disability":"No","peer":"Positive"},{"id":307,"gender":"Female","school":"Public","score":64.0,"attend":77.0,"hours":18.0,"motiv":"Low","risk":"High","risk_score":5,"persona":2,"internet":"No","tutor":2.0,"prev":65.0,"disability":"No","peer":"Positive"},{"id":308,"gender":"Female","school":"Public","score":64.0,"attend":78.0,"hours":19.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":0.0,"prev":98.0,"disability":"No","peer":"Neutral"},{"id":309,"gender":"Female","school":"Private","score":64.0,"attend":62.0,"hours":23.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":1.0,"prev":69.0,"disability":"No","peer":"Positive"},{"id":310,"gender":"Male","school":"Public","score":64.0,"attend":60.0,"hours":23.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":1.0,"prev":60.0,"disability":"No","peer":"Positive"},{"id":311,"gender":"Female","school":"Public","score":64.0,"attend":73.0,"hours":16.0,"motiv":"High","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":0.0,"prev":88.0,"disability":"No","peer":"Negative"},{"id":312,"gender":"Female","school":"Public","score":64.0,"attend":73.0,"hours":11.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":2,"internet":"Yes","tutor":3.0,"prev":67.0,"disability":"No","peer":"Neutral"},{"id":313,"gender":"Female","school":"Public","score":64.0,"attend":66.0,"hours":17.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":1.0,"prev":78.0,"disability":"No","peer":"Neutral"},{"id":314,"gender":"Female","school":"Private","score":64.0,"attend":90.0,"hours":6.0,"motiv":"Low","risk":"High","risk_score":6,"persona":1,"internet":"Yes","tutor":1.0,"prev":75.0,"disability":"Yes","peer":"Negative"},{"id":315,"gender":"Male","school":"Private","score":64.0,"attend":81.0,"hours":15.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":0.0,"prev":93.0,"disability":"No","peer":"Positive"},{"id":316,"gender":"Male","school":"Public","score":64.0,"attend":79.0,"hours":10.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":2,"internet":"No","tutor":3.0,"prev":68.0,"disability":"No","peer":"Negative"},{"id":317,"gender":"Male","school":"Private","score":64.0,"attend":79.0,"hours":14.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":0.0,"prev":72.0,"disability":"No","peer":"Neutral"},{"id":318,"gender":"Female","school":"Public","score":64.0,"attend":69.0,"hours":15.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":0.0,"prev":83.0,"disability":"No","peer":"Neutral"},{"id":319,"gender":"Female","school":"Public","score":64.0,"attend":83.0,"hours":3.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":4,"internet":"Yes","tutor":1.0,"prev":92.0,"disability":"No","peer":"Positive"},{"id":320,"gender":"Female","school":"Public","score":64.0,"attend":72.0,"hours":19.0,"motiv":"Low","risk":"High","risk_score":5,"persona":2,"internet":"No","tutor":1.0,"prev":70.0,"disability":"No","peer":"Positive"},{"id":321,"gender":"Male","school":"Public","score":64.0,"attend":68.0,"hours":13.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":2.0,"prev":85.0,"disability":"No","peer":"Neutral"},{"id":322,"gender":"Male","school":"Public","score":64.0,"attend":70.0,"hours":8.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"No","tutor":6.0,"prev":82.0,"disability":"No","peer":"Neutral"},{"id":323,"gender":"Female","school":"Private","score":64.0,"attend":69.0,"hours":8.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":2.0,"prev":95.0,"disability":"No","peer":"Neutral"},{"id":324,"gender":"Female","school":"Private","score":64.0,"attend":87.0,"hours":11.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":1,"internet":"Yes","tutor":2.0,"prev":57.0,"disability":"No","peer":"Neutral"},{"id":325,"gender":"Male","school":"Public","score":64.0,"attend":68.0,"hours":20.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":1.0,"prev":60.0,"disability":"No","peer":"Positive"},{"id":326,"gender":"Male","school":"Private","score":64.0,"attend":61.0,"hours":24.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":0.0,"prev":74.0,"disability":"No","peer":"Positive"},{"id":327,"gender":"Female","school":"Public","score":64.0,"attend":85.0,"hours":15.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":1.0,"prev":61.0,"disability":"No","peer":"Neutral"},{"id":328,"gender":"Male","school":"Public","score":64.0,"attend":62.0,"hours":15.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":3.0,"prev":60.0,"disability":"No","peer":"Positive"},{"id":329,"gender":"Male","school":"Public","score":64.0,"attend":75.0,"hours":22.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"No","tutor":2.0,"prev":86.0,"disability":"Yes","peer":"Neutral"},{"id":330,"gender":"Female","school":"Public","score":64.0,"attend":75.0,"hours":25.0,"motiv":"Low","risk":"High","risk_score":5,"persona":2,"internet":"Yes","tutor":1.0,"prev":74.0,"disability":"Yes","peer":"Neutral"},{"id":331,"gender":"Female","school":"Public","score":64.0,"attend":85.0,"hours":15.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":0.0,"prev":55.0,"disability":"No","peer":"Positive"},{"id":332,"gender":"Female","school":"Private","score":64.0,"attend":98.0,"hours":7.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":1,"internet":"Yes","tutor":0.0,"prev":65.0,"disability":"No","peer":"Neutral"},{"id":333,"gender":"Female","school":"Private","score":64.0,"attend":63.0,"hours":22.0,"motiv":"High","risk":"Medium","risk_score":3,"persona":3,"internet":"Yes","tutor":1.0,"prev":68.0,"disability":"No","peer":"Neutral"},{"id":334,"gender":"Female","school":"Private","score":64.0,"attend":81.0,"hours":21.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":2.0,"prev":67.0,"disability":"No","peer":"Neutral"},{"id":335,"gender":"Male","school":"Public","score":64.0,"attend":61.0,"hours":31.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":59.0,"disability":"No","peer":"Neutral"},{"id":336,"gender":"Male","school":"Public","score":64.0,"attend":87.0,"hours":10.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":1,"internet":"Yes","tutor":2.0,"prev":74.0,"disability":"No","peer":"Neutral"},{"id":337,"gender":"Female","school":"Private","score":64.0,"attend":71.0,"hours":29.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":2.0,"prev":68.0,"disability":"Yes","peer":"Positive"},{"id":338,"gender":"Female","school":"Private","score":64.0,"attend":71.0,"hours":11.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":1.0,"prev":86.0,"disability":"No","peer":"Neutral"},{"id":339,"gender":"Female","school":"Public","score":63.0,"attend":66.0,"hours":23.0,"motiv":"Low","risk":"High","risk_score":6,"persona":3,"internet":"Yes","tutor":1.0,"prev":79.0,"disability":"Yes","peer":"Neutral"},{"id":340,"gender":"Male","school":"Public","score":63.0,"attend":90.0,"hours":10.0,"motiv":"Low","risk":"Medium","risk_score":3,"persona":1,"internet":"Yes","tutor":0.0,"prev":56.0,"disability":"No","peer":"Neutral"},{"id":341,"gender":"Female","school":"Public","score":63.0,"attend":63.0,"hours":28.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":2.0,"prev":51.0,"disability":"No","peer":"Negative"},{"id":342,"gender":"Male","school":"Private","score":63.0,"attend":73.0,"hours":14.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":2,"internet":"Yes","tutor":0.0,"prev":77.0,"disability":"No","peer":"Positive"},{"id":343,"gender":"Male","school":"Public","score":63.0,"attend":67.0,"hours":21.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":1.0,"prev":83.0,"disability":"No","peer":"Neutral"},{"id":344,"gender":"Male","school":"Public","score":63.0,"attend":77.0,"hours":8.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":0.0,"prev":91.0,"disability":"No","peer":"Neutral"},{"id":345,"gender":"Male","school":"Public","score":63.0,"attend":71.0,"hours":19.0,"motiv":"Medium","risk":"Medium","risk_score":3,"persona":3,"internet":"Yes","tutor":2.0,"prev":74.0,"disability":"No","peer":"Neutral"},{"id":346,"gender":"Male","school":"Public","score":63.0,"attend":64.0,"hours":24.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":2.0,"prev":60.0,"disability":"No","peer":"Negative"},{"id":347,"gender":"Male","school":"Public","score":63.0,"attend":64.0,"hours":16.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":1.0,"prev":88.0,"disability":"No","peer":"Neutral"},{"id":348,"gender":"Female","school":"Public","score":63.0,"attend":61.0,"hours":19.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":0.0,"prev":88.0,"disability":"No","peer":"Neutral"},{"id":349,"gender":"Female","school":"Private","score":63.0,"attend":61.0,"hours":17.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":1.0,"prev":89.0,"disability":"No","peer":"Positive"},{"id":350,"gender":"Female","school":"Public","score":63.0,"attend":82.0,"hours":14.0,"motiv":"Medium","risk":"Low","risk_score":2,"persona":4,"internet":"Yes","tutor":1.0,"prev":85.0,"disability":"No","peer":"Positive"},{"id":351,"gender":"Female","school":"Public","score":63.0,"attend":66.0,"hours":14.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":1.0,"prev":88.0,"disability":"Yes","peer":"Positive"},{"id":352,"gender":"Female","school":"Public","score":63.0,"attend":63.0,"hours":14.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":2.0,"prev":59.0,"disability":"No","peer":"Positive"},{"id":353,"gender":"Male","school":"Public","score":63.0,"attend":65.0,"hours":24.0,"motiv":"Low","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":0.0,"prev":90.0,"disability":"No","peer":"Positive"},{"id":354,"gender":"Male","school":"Private","score":63.0,"attend":67.0,"hours":25.0,"motiv":"Low","risk":"High","risk_score":7,"persona":3,"internet":"No","tutor":1.0,"prev":74.0,"disability":"Yes","peer":"Neutral"},{"id":355,"gender":"Female","school":"Public","score":63.0,"attend":60.0,"hours":19.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":1.0,"prev":91.0,"disability":"Yes","peer":"Positive"},{"id":356,"gender":"Male","school":"Public","score":63.0,"attend":61.0,"hours":13.0,"motiv":"High","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":1.0,"prev":80.0,"disability":"No","peer":"Negative"},{"id":357,"gender":"Female","school":"Private","score":63.0,"attend":71.0,"hours":10.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":0.0,"prev":87.0,"disability":"Yes","peer":"Positive"},{"id":358,"gender":"Female","school":"Public","score":63.0,"attend":65.0,"hours":22.0,"motiv":"High","risk":"High","risk_score":6,"persona":3,"internet":"No","tutor":2.0,"prev":61.0,"disability":"Yes","peer":"Negative"},{"id":359,"gender":"Male","school":"Public","score":63.0,"attend":64.0,"hours":18.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":1.0,"prev":92.0,"disability":"No","peer":"Positive"},{"id":360,"gender":"Male","school":"Public","score":63.0,"attend":68.0,"hours":17.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":0.0,"prev":70.0,"disability":"No","peer":"Positive"},{"id":361,"gender":"Male","school":"Public","score":63.0,"attend":70.0,"hours":22.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":1.0,"prev":56.0,"disability":"No","peer":"Negative"},{"id":362,"gender":"Female","school":"Private","score":63.0,"attend":61.0,"hours":23.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":2.0,"prev":81.0,"disability":"No","peer":"Negative"},{"id":363,"gender":"Male","school":"Private","score":63.0,"attend":64.0,"hours":19.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":0.0,"prev":65.0,"disability":"No","peer":"Positive"},{"id":364,"gender":"Male","school":"Private","score":63.0,"attend":75.0,"hours":15.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":2,"internet":"Yes","tutor":1.0,"prev":60.0,"disability":"No","peer":"Positive"},{"id":365,"gender":"Female","school":"Private","score":62.0,"attend":74.0,"hours":14.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":3.0,"prev":57.0,"disability":"No","peer":"Neutral"},{"id":366,"gender":"Male","school":"Public","score":62.0,"attend":64.0,"hours":14.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":62.0,"disability":"No","peer":"Positive"},{"id":367,"gender":"Male","school":"Public","score":62.0,"attend":72.0,"hours":12.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":2.0,"prev":57.0,"disability":"Yes","peer":"Neutral"},{"id":368,"gender":"Male","school":"Private","score":62.0,"attend":72.0,"hours":16.0,"motiv":"Low","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":0.0,"prev":80.0,"disability":"No","peer":"Positive"},{"id":369,"gender":"Male","school":"Public","score":62.0,"attend":61.0,"hours":13.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":62.0,"disability":"No","peer":"Positive"},{"id":370,"gender":"Male","school":"Public","score":62.0,"attend":61.0,"hours":19.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"No","tutor":0.0,"prev":84.0,"disability":"No","peer":"Neutral"},{"id":371,"gender":"Female","school":"Public","score":62.0,"attend":64.0,"hours":15.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":71.0,"disability":"No","peer":"Neutral"},{"id":372,"gender":"Male","school":"Public","score":62.0,"attend":69.0,"hours":22.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":0.0,"prev":70.0,"disability":"No","peer":"Neutral"},{"id":373,"gender":"Male","school":"Private","score":62.0,"attend":74.0,"hours":9.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":1.0,"prev":91.0,"disability":"No","peer":"Neutral"},{"id":374,"gender":"Male","school":"Public","score":62.0,"attend":60.0,"hours":25.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":0.0,"prev":72.0,"disability":"No","peer":"Neutral"},{"id":375,"gender":"Male","school":"Public","score":62.0,"attend":65.0,"hours":8.0,"motiv":"Medium","risk":"High","risk_score":6,"persona":4,"internet":"Yes","tutor":4.0,"prev":99.0,"disability":"No","peer":"Negative"},{"id":376,"gender":"Male","school":"Public","score":62.0,"attend":63.0,"hours":12.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":4,"internet":"Yes","tutor":1.0,"prev":96.0,"disability":"No","peer":"Negative"},{"id":377,"gender":"Female","school":"Private","score":62.0,"attend":68.0,"hours":12.0,"motiv":"Low","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":0.0,"prev":63.0,"disability":"No","peer":"Neutral"},{"id":378,"gender":"Female","school":"Public","score":62.0,"attend":65.0,"hours":21.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":2.0,"prev":51.0,"disability":"No","peer":"Neutral"},{"id":379,"gender":"Female","school":"Public","score":62.0,"attend":70.0,"hours":14.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":0.0,"prev":59.0,"disability":"Yes","peer":"Positive"},{"id":380,"gender":"Male","school":"Public","score":62.0,"attend":67.0,"hours":12.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":0.0,"prev":100.0,"disability":"No","peer":"Neutral"},{"id":381,"gender":"Female","school":"Private","score":62.0,"attend":63.0,"hours":22.0,"motiv":"Low","risk":"High","risk_score":7,"persona":3,"internet":"No","tutor":2.0,"prev":53.0,"disability":"No","peer":"Negative"},{"id":382,"gender":"Male","school":"Public","score":61.0,"attend":62.0,"hours":21.0,"motiv":"Low","risk":"High","risk_score":6,"persona":3,"internet":"Yes","tutor":2.0,"prev":65.0,"disability":"No","peer":"Positive"},{"id":383,"gender":"Male","school":"Public","score":61.0,"attend":66.0,"hours":17.0,"motiv":"Low","risk":"High","risk_score":7,"persona":3,"internet":"Yes","tutor":0.0,"prev":74.0,"disability":"No","peer":"Negative"},{"id":384,"gender":"Female","school":"Public","score":61.0,"attend":81.0,"hours":16.0,"motiv":"Medium","risk":"Medium","risk_score":4,"persona":3,"internet":"Yes","tutor":0.0,"prev":73.0,"disability":"Yes","peer":"Neutral"},{"id":385,"gender":"Male","school":"Private","score":61.0,"attend":76.0,"hours":9.0,"motiv":"High","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":73.0,"disability":"Yes","peer":"Positive"},{"id":386,"gender":"Female","school":"Public","score":61.0,"attend":63.0,"hours":17.0,"motiv":"Low","risk":"High","risk_score":7,"persona":3,"internet":"Yes","tutor":1.0,"prev":70.0,"disability":"No","peer":"Negative"},{"id":387,"gender":"Female","school":"Public","score":61.0,"attend":61.0,"hours":17.0,"motiv":"High","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":0.0,"prev":94.0,"disability":"No","peer":"Positive"},{"id":388,"gender":"Female","school":"Private","score":61.0,"attend":71.0,"hours":13.0,"motiv":"High","risk":"Medium","risk_score":4,"persona":4,"internet":"Yes","tutor":0.0,"prev":86.0,"disability":"No","peer":"Negative"},{"id":389,"gender":"Female","school":"Public","score":60.0,"attend":71.0,"hours":19.0,"motiv":"Low","risk":"High","risk_score":6,"persona":3,"internet":"Yes","tutor":0.0,"prev":56.0,"disability":"Yes","peer":"Neutral"},{"id":390,"gender":"Male","school":"Public","score":60.0,"attend":61.0,"hours":14.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":76.0,"disability":"No","peer":"Neutral"},{"id":391,"gender":"Female","school":"Public","score":59.0,"attend":61.0,"hours":17.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":1.0,"prev":55.0,"disability":"No","peer":"Neutral"},{"id":392,"gender":"Male","school":"Private","score":59.0,"attend":66.0,"hours":8.0,"motiv":"High","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":0.0,"prev":71.0,"disability":"No","peer":"Neutral"},{"id":393,"gender":"Male","school":"Public","score":59.0,"attend":64.0,"hours":11.0,"motiv":"Medium","risk":"High","risk_score":5,"persona":3,"internet":"Yes","tutor":2.0,"prev":75.0,"disability":"No","peer":"Neutral"},{"id":394,"gender":"Male","school":"Public","score":59.0,"attend":75.0,"hours":2.0,"motiv":"Low","risk":"High","risk_score":6,"persona":3,"internet":"Yes","tutor":3.0,"prev":55.0,"disability":"No","peer":"Neutral"},{"id":395,"gender":"Female","school":"Public","score":58.0,"attend":68.0,"hours":10.0,"motiv":"Low","risk":"High","risk_score":7,"persona":3,"internet":"Yes","tutor":0.0,"prev":63.0,"disability":"No","peer":"Negative"},{"id":396,"gender":"Male","school":"Public","score":58.0,"attend":69.0,"hours":7.0,"motiv":"Medium","risk":"High","risk_score":7,"persona":3,"internet":"No","tutor":1.0,"prev":75.0,"disability":"No","peer":"Positive"},{"id":397,"gender":"Female","school":"Public","score":57.0,"attend":64.0,"hours":6.0,"motiv":"Medium","risk":"High","risk_score":8,"persona":4,"internet":"No","tutor":3.0,"prev":80.0,"disability":"No","peer":"Negative"},{"id":398,"gender":"Male","school":"Private","score":56.0,"attend":61.0,"hours":10.0,"motiv":"Medium","risk":"High","risk_score":7,"persona":3,"internet":"No","tutor":0.0,"prev":67.0,"disability":"No","peer":"Negative"}],"personas":[{"name":"Driven Achiever","icon":"🚀","color":"#7C3AED","description":"High study hours, excellent attendance, strong motivation. These students consistently perform at the top.","strategies":["Offer advanced challenge projects and enrichment tasks to maintain engagement.","Assign peer mentoring roles to reinforce their own learning through teaching.","Provide access to competitions (Olympiads, subject fairs) and external programs.","Give autonomy in project-based learning — they thrive with creative freedom.","Regularly celebrate milestones to sustain intrinsic motivation long-term."]},{"name":"Consistent Worker","icon":"📚","color":"#0EA5E9","description":"Steady attendance and moderate study hours. Reliable performers who respond well to structured learning.","strategies":["Use structured study plans and weekly goal-setting exercises.","Introduce spaced repetition tools (flashcards, quizzes) for retention.","Leverage collaborative study groups — they excel when paired with peers.","Offer regular, specific feedback to help them identify precise gaps.","Introduce slightly harder problems progressively to build confidence."]},{"name":"Passive Coaster","icon":"🌊","color":"#F59E0B","description":"Average attendance and minimal study effort. These students coast without clear academic direction.","strategies":["Connect curriculum topics to real-world interests and career relevance.","Use gamified learning (points, leaderboards) to spark engagement.","Check in one-on-one to understand hidden barriers or personal challenges.","Break tasks into short, achievable micro-goals to build momentum.","Introduce choice in assignments to restore a sense of ownership."]},{"name":"Struggling Learner","icon":"🆘","color":"#EF4444","description":"Low attendance, lower previous scores, and limited resources. High risk of falling behind without support.","strategies":["Assign a dedicated mentor or tutor for weekly one-on-one sessions.","Coordinate with parents/guardians to reinforce learning at home.","Use multi-modal teaching (videos, hands-on activities) to suit diverse styles.","Ensure access to school resources: library, devices, tutoring programs.","Create safe, judgment-free classroom environments to reduce anxiety."]},{"name":"Potential Bloomer","icon":"🌱","color":"#10B981","description":"High previous scores but lower current engagement or attendance. Untapped potential waiting to be unlocked.","strategies":["Investigate recent disengagement — personal, social, or academic triggers.","Reignite curiosity with exploratory, discovery-based learning activities.","Connect them with inspiring role models or alumni in their interest area.","Flexible deadlines and project alternatives reduce pressure triggers.","Offer leadership roles (class rep, project lead) to rebuild confidence."]}]};
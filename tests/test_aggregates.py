@@ -0,0 +1,26 @@
+import math
+
+from conftest import pp, students
+
+
+def test_groups_match_a_row_loop():
+    data = students()
+    by_school = {}
+    for school, score in zip(data['School_Type'], data['Exam_Score']):
+        by_school.setdefault(data.levels['School_Type'][school], []).append(score)
+    result = pp.aggregate(data, {'by_school': pp.AGGREGATES['by_school']})['by_school']
+    assert list(result) == list(by_school)  # first-seen order
+    for school, scores in by_school.items():
+        assert result[school]['count'] == len(scores)
+        assert result[school]['avg_score'] == round(sum(scores) / len(scores), 2)
+
+
+def test_nan_scores_land_in_the_overflow_bin():
+    data = students()
+    spec = {'score_dist': pp.AGGREGATES['score_dist']}
+    scores = data['Exam_Score']
+    before = list(pp.aggregate(data, spec)['score_dist'].values())
+    scores[scores.index(70.0)] = math.nan
+    after = list(pp.aggregate(data, spec)['score_dist'].values())
+    assert after[-1]['count'] == before[-1]['count'] + 1
+    assert sum(g['count'] for g in after) == sum(g['count'] for g in before)
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from conftest import STUDENTS_CSV, pp
+import bench
+
+
+def run(wall, stages):
+    return {'wall_s': wall, 'stages': {name: {'wall_s': s} for name, s in stages.items()}}
+
+
+BASELINE = {'runs': {'10000': run(2.0, {'load': 1.0, 'kmeans': 0.5, 'cube': 0.02})}}
+
+
+def test_regressions_flag_slow_stages_only():
+    results = {'runs': {'10000': run(2.2, {'load': 1.1, 'kmeans': 0.8, 'cube': 0.04}),
+                        '100000': run(50.0, {'load': 40.0})}}
+    found = bench.regressions(results, BASELINE, 0.25, 0.05)
+    # kmeans is 60% slower; load and the total are within 25%, the cube is
+    # slower by less than min_seconds, and 100k has no baseline
+    assert len(found) == 1 and found[0].startswith('10000 rows, kmeans: 0.500s → 0.800s')
+
+
+def test_run_exits_1_on_a_regression(tmp_path, monkeypatch, capsys):
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text(json.dumps(BASELINE), encoding='utf-8')
+    slow = run(2.0, {'load': 1.0, 'kmeans': 1.0, 'cube': 0.02})
+    monkeypatch.setattr(bench, 'run_size', lambda n, workers: {**slow, 'peak_rss_mb': 1, 'output_bytes': {}})
+    args = ['run', '--sizes', '10k', '--out', str(tmp_path / 'out.json'), '--baseline', str(baseline)]
+    with pytest.raises(SystemExit) as exit_info:
+        bench.main(args)
+    assert exit_info.value.code == 1
+    assert 'REGRESSION 10000 rows, kmeans' in capsys.readouterr().out
+
+    monkeypatch.setattr(bench, 'run_size', lambda n, workers: {**BASELINE['runs']['10000'], 'peak_rss_mb': 1,
+                                                                'output_bytes': {}})
+    bench.main(args)
+    assert 'No stage regressed' in capsys.readouterr().out
+
+
+def test_synthetic_rows_are_reproducible_and_clean(tmp_path):
+    path = str(tmp_path / 'syn.csv')
+    bench.generate(300, path, seed=3)
+    assert list(bench.synthesize(300, seed=3)) == list(bench.synthesize(300, seed=3))
+    data = pp.clean(pp.load_csv(path))
+    assert 0 < len(data) <= 300
+    assert set(data.levels['School_Type']) == {'Public', 'Private'}
+
+
+def test_measure_reports_every_stage(monkeypatch):
+    for name in ('OUT_PATH', 'ROSTER_PATH'):
+        monkeypatch.setattr(pp, name, getattr(pp, name))  # measure() redirects them
+    result = bench.measure(STUDENTS_CSV)
+    assert result['rows'] == len(pp.clean(pp.load_csv(STUDENTS_CSV)))
+    assert {'load', 'rules', 'kmeans', 'tables', 'serialize'} <= result['stages'].keys()
+    assert set(result['output_bytes']) == {'data.js', 'roster.js'}
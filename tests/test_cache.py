@@ -0,0 +1,57 @@
+import os
+import shutil
+
+import pytest
+
+from conftest import STUDENTS_CSV, pp
+
+
+@pytest.fixture
+def paths(tmp_path):
+    csv_path, cache_path = str(tmp_path / 's.csv'), str(tmp_path / 's.cache')
+    shutil.copy(STUDENTS_CSV, csv_path)
+    return csv_path, cache_path
+
+
+def cached_run(paths, capsys):
+    result = pp.run_in_memory(paths[0], 0, {}, 1, paths[1])
+    return result, 'mapped cleaned columns' in capsys.readouterr().out
+
+
+def later_mtime(path, st):
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_second_run_maps_the_cache(in_memory, paths, capsys):
+    (output, _), hit = cached_run(paths, capsys)
+    assert not hit and os.path.exists(paths[1])
+    (cached, _), hit = cached_run(paths, capsys)
+    assert hit
+    assert cached == output == in_memory[0]
+
+
+def test_touched_file_still_hits(paths, capsys):
+    cached_run(paths, capsys)
+    later_mtime(paths[0], os.stat(paths[0]))
+    assert cached_run(paths, capsys)[1]
+
+
+def test_same_size_edit_invalidates(in_memory, paths, capsys):
+    cached_run(paths, capsys)
+    st = os.stat(paths[0])
+    with open(paths[0], 'rb') as f:
+        data = f.read()
+    # The first student's Exam_Score 67 → 76: same size, different content
+    first = data.index(b'\n') + 1
+    end = data.index(b'\n', first) + 1
+    assert data[end - 5:end] == b',67\r\n'
+    with open(paths[0], 'wb') as f:
+        f.write(data[:end - 5] + b',76\r\n' + data[end:])
+    later_mtime(paths[0], st)
+    assert os.stat(paths[0]).st_size == st.st_size
+
+    (output, _), hit = cached_run(paths, capsys)
+    assert not hit
+    assert output['kpis']['avg_score'] > in_memory[0]['kpis']['avg_score']
+    (cached, _), hit = cached_run(paths, capsys)
+    assert hit and cached == output
@@ -0,0 +1,42 @@
+import math
+
+import pytest
+
+from conftest import pp, students
+
+
+def reference_pearson(xs, ys):
+    n = len(xs)
+    mx, my = sum(xs) / n, sum(ys) / n
+    sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    return sxy / math.sqrt(sum((x - mx) ** 2 for x in xs) * sum((y - my) ** 2 for y in ys))
+
+
+def test_merged_blocks_match_pearson():
+    data = students()
+    vectors = pp.feature_vectors(data)
+    merged = pp.CoMoments(len(vectors))
+    for start in range(0, len(data), 37):
+        merged.update([v[start:start + 37] for v in vectors])
+    for i, v in enumerate(vectors):
+        assert merged.corr(i, len(vectors) - 1) == pytest.approx(reference_pearson(v, vectors[-1]), abs=1e-12)
+
+
+def test_spearman_is_pearson_over_average_ranks():
+    data = students()
+    vectors = pp.feature_vectors(data)
+    ranks = []
+    for v in vectors:
+        order = sorted(v)
+        ranks.append([order.index(x) + (order.count(x) + 1) / 2 for x in v])
+    expected = [[reference_pearson(a, b) for b in ranks] for a in ranks]
+    assert pp.spearman_matrix(data) == [pytest.approx(row, abs=1e-12) for row in expected]
+
+
+def test_spearman_leaves_nan_unranked():
+    data = students()
+    data['Exam_Score'][0] = math.nan
+    last = len(pp.CORRELATION_NAMES) - 1
+    matrix = pp.spearman_matrix(data)
+    assert math.isnan(matrix[0][last])
+    assert not math.isnan(matrix[0][1])
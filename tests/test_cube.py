@@ -0,0 +1,35 @@
+import itertools
+
+import pytest
+
+from conftest import columns, pp, students
+
+
+def test_filtered_cells_add_up_to_the_matching_rows(in_memory):
+    output, roster = in_memory
+    cube, rows = output['cube'], columns(roster)
+    dims = list(pp.CUBE_DIMS)
+    fields = {'school': 'School_Type', 'gender': 'Gender', 'motiv': 'Motivation_Level'}
+    choices = [['All'] + cube['dims'][f] for f in fields]
+    for picked in itertools.product(*choices):
+        filters = {f: v for f, v in zip(fields, picked) if v != 'All'}
+        cells = [c for c in cube['cells']
+                 if all(cube['dims'][f][c[dims.index(f)]] == v for f, v in filters.items())]
+        matching = [i for i in range(len(roster))
+                    if all(rows[fields[f]][i] == v for f, v in filters.items())]
+        count = sum(c[len(dims)] for c in cells)
+        assert count == len(matching), filters
+        score = sum(c[len(dims) + 1 + cube['sums'].index('score')] for c in cells)
+        assert score == pytest.approx(sum(rows['Exam_Score'][i] for i in matching))
+
+
+def test_merged_cubes_match_one_pass():
+    data = students()
+    pp.score_rows(data)
+    whole, merged = pp.Cube(), pp.Cube()
+    whole.update(data)
+    for block in data.blocks(50):
+        part = pp.Cube()
+        part.update(block)
+        merged.merge(part)
+    assert merged.result(data.levels) == whole.result(data.levels)
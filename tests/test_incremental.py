@@ -0,0 +1,57 @@
+import json
+import os
+
+from conftest import STUDENTS_CSV, assert_matches_in_memory, pp
+
+
+def run(tmp_path):
+    paths = [str(tmp_path / name) for name in ('s.csv', 's.json', 'roster')]
+    output, roster, state = pp.run_incremental(*paths, 64, 0, {})
+    state.save(paths[1])
+    return output, roster
+
+
+def write(tmp_path, lines, mode='w'):
+    with open(tmp_path / 's.csv', mode, encoding='utf-8') as f:
+        f.writelines(lines)
+
+
+def read_lines():
+    with open(STUDENTS_CSV, encoding='utf-8') as f:
+        return f.readlines()
+
+
+def test_appended_rows_match_in_memory(in_memory, tmp_path, capsys):
+    lines = read_lines()
+    write(tmp_path, lines[:150])
+    run(tmp_path)
+    write(tmp_path, lines[150:], 'a')
+    result = run(tmp_path)
+    assert 'Resuming from byte' in capsys.readouterr().out
+    assert_matches_in_memory(result, in_memory)
+    with open(tmp_path / 's.json', encoding='utf-8') as f:
+        assert 'roster' not in json.load(f)  # roster rows live in the roster log only
+
+
+def test_rows_past_the_snapshot_are_cut_from_the_log(in_memory, tmp_path):
+    lines = read_lines()
+    write(tmp_path, lines[:150])
+    run(tmp_path)
+    # As if a run had appended rows and stopped before saving its snapshot
+    with open(tmp_path / 'roster' / 'Exam_Score.col', 'ab') as f:
+        f.write(bytes(80))
+    write(tmp_path, lines[150:], 'a')
+    assert_matches_in_memory(run(tmp_path), in_memory)
+
+
+def test_edited_rows_trigger_a_rebuild(in_memory, tmp_path, capsys):
+    lines = read_lines()
+    write(tmp_path, lines)
+    run(tmp_path)
+    size = os.path.getsize(tmp_path / 's.csv')
+    # Same size, different content: the first student's score 67 → 76
+    write(tmp_path, [lines[0], lines[1].replace(',67\n', ',76\n')] + lines[2:])
+    assert os.path.getsize(tmp_path / 's.csv') == size
+    output, _ = run(tmp_path)
+    assert 'rebuilding' in capsys.readouterr().out
+    assert output['kpis']['avg_score'] != in_memory[0]['kpis']['avg_score']
@@ -0,0 +1,23 @@
+import json
+import pstats
+
+import pytest
+
+from conftest import pp
+
+
+@pytest.mark.parametrize('flags, mode', [([], 'in-memory'), (['--chunk-size', '100'], 'streaming')])
+def test_report_covers_every_stage(outputs, flags, mode):
+    report_path, profile_path = str(outputs / 'report.json'), str(outputs / 'run.prof')
+    pp.main(['--workers', '1', '--report', report_path, '--profile', profile_path] + flags)
+    with open(report_path, encoding='utf-8') as f:
+        report = json.load(f)
+    assert report['mode'] == mode
+    stages = report['stages']
+    expected = ({'load', 'normalize', 'rules', 'kmeans', 'aggregates', 'cube'} if mode == 'in-memory'
+                else {'stream', 'cluster', 'correlations'})
+    assert expected | {'tables', 'serialize'} <= stages.keys()
+    assert all(st['wall_s'] >= 0 for st in stages.values())
+    assert stages['tables']['rows'] == report['rows']
+    assert [t['best'] for t in report['kmeans']].count(True) == 1
+    assert pstats.Stats(profile_path).total_calls > 0
@@ -0,0 +1,44 @@
+from conftest import pp, students
+
+
+def normalized():
+    data, _ = pp.normalize(students(), pp.CLUSTER_FEATURES)
+    return data
+
+
+def test_restarts_give_the_same_result_for_any_worker_count():
+    data = normalized()
+    serial = pp.kmeans(data, k=5, iters=40, n_init=4, workers=1)
+    pooled = pp.kmeans(data, k=5, iters=40, n_init=4, workers=3)
+    assert pooled == serial
+
+
+def test_best_restart_keeps_the_lowest_inertia_and_the_earliest_on_ties():
+    runs = [(3.0, 'a', [[0.0]], None), (1.0, 'b', [[1.0]], None), (1.0, 'c', [[2.0]], None)]
+    trace = []
+    assert pp.best_restart([7, 8, 9], runs, trace) == ('b', [[1.0]])
+    assert [(t['seed'], t['best']) for t in trace] == [(7, False), (8, True), (9, False)]
+
+
+def test_kmeans_keeps_the_best_of_independent_restarts():
+    data = normalized()
+    seeds = pp.restart_seeds(42, 4)
+    runs = [pp._kmeans_run(data.norm, 5, 40, pp.KMEANS_TOL, s, 'k-means++', None) for s in seeds]
+    assert len({tuple(map(tuple, centers)) for _, _, centers, _ in runs}) > 1
+    assert pp.kmeans(data, k=5, iters=40, n_init=4) == pp.best_restart(seeds, runs)
+
+
+def test_trace_records_every_restart():
+    trace = []
+    labels, centers = pp.kmeans(normalized(), k=5, iters=40, n_init=3, trace=trace)
+    assert [t['seed'] for t in trace] == pp.restart_seeds(42, 3)
+    assert sum(t['best'] for t in trace) == 1
+    assert all(0 < len(t['iterations']) <= 40 for t in trace)
+    assert len(centers) == 5 and set(labels) <= set(range(5))
+
+
+def test_minibatch_labels_every_row():
+    data = normalized()
+    labels, centers = pp.kmeans(data, k=5, iters=40, n_init=2, batch_size=64)
+    assert len(labels) == len(data)
+    assert len(centers) == 5
@@ -0,0 +1,34 @@
+import gzip
+
+from conftest import STUDENTS_CSV, pp
+
+
+def test_compact_roster_round_trips_to_the_legacy_rows(in_memory, outputs):
+    output, roster = in_memory
+    pp.write_legacy(output, roster)
+    legacy = pp.read_js(pp.OUT_PATH)
+    pp.write_compact(output, roster)
+
+    summary = pp.read_js(pp.OUT_PATH)
+    assert 'all_students' not in summary and 'risk_table' not in summary
+    assert summary['roster']['count'] == len(roster)
+    index = pp.RosterIndex.from_compact(pp.read_js(pp.ROSTER_PATH))
+    assert [index.row(pos) for pos in range(index.count)] == legacy['all_students']
+
+
+def test_precompressed_copies_decompress_to_the_original(in_memory, outputs):
+    pp.write_compact(*in_memory)
+    written = pp.precompress([pp.OUT_PATH], ['gzip'])
+    assert written == [pp.OUT_PATH + '.gz']
+    with gzip.open(written[0], 'rb') as f, open(pp.OUT_PATH, 'rb') as g:
+        assert f.read() == g.read()
+
+
+def test_streamed_roster_writes_the_same_roster_js(in_memory, outputs):
+    # The streamed roster's columns are memoryviews over the roster log
+    pp.write_compact(*pp.run_streaming(STUDENTS_CSV, 64, 0, {}, work_dir=str(outputs / 'work')))
+    with open(pp.ROSTER_PATH, encoding='utf-8') as f:
+        streamed = f.read()
+    pp.write_compact(*in_memory)
+    with open(pp.ROSTER_PATH, encoding='utf-8') as f:
+        assert f.read() == streamed
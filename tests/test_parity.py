@@ -0,0 +1,34 @@
+"""
+The optimized pipeline must keep producing what the original row-by-row
+script produced for the same CSV.
+"""
+
+import os
+
+import pytest
+
+from conftest import BASELINE_JS, ROOT, pp
+
+# Deliberately changed since the original: K-Means seeding and restarts, and
+# the scatter sample (stratified per filter combination)
+CHANGED_KEYS = {'centers', 'scatter'}
+
+
+def assert_matches(current, baseline):
+    for key in baseline.keys() - CHANGED_KEYS:
+        assert current[key] == baseline[key], key
+
+
+def legacy(output, roster):
+    pp.write_legacy(output, roster)
+    return pp.read_js(pp.OUT_PATH)
+
+
+def test_legacy_output_matches_baseline(in_memory, outputs):
+    assert_matches(legacy(*in_memory), pp.read_js(BASELINE_JS))
+
+
+@pytest.mark.skipif(not os.path.exists(pp.CSV_PATH), reason='Student_data.csv is not bundled')
+def test_legacy_output_matches_bundled_data_js(outputs):
+    current = legacy(*pp.run_in_memory(os.path.join(ROOT, 'Student_data.csv'), 0, {}, 1))
+    assert_matches(current, pp.read_js(os.path.join(ROOT, 'data.js')))
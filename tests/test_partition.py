@@ -0,0 +1,58 @@
+import itertools
+
+import pytest
+
+from conftest import STUDENTS_CSV, columns, pp
+
+
+def cells_by_label(cube):
+    # Cube cells keyed by decoded dimension labels (shard rollups code levels
+    # in their own first-seen order)
+    dims = list(pp.CUBE_DIMS)
+    return {tuple(cube['dims'][f][c[i]] for i, f in enumerate(dims)): c[len(dims):] for c in cube['cells']}
+
+
+def rows(roster):
+    cols = columns(roster)
+    return sorted(zip(*cols.values()))
+
+
+@pytest.fixture(scope='module')
+def by_school(tmp_path_factory):
+    return pp.run_partitioned(STUDENTS_CSV, 'School_Type', 64, 0, {}, 1, str(tmp_path_factory.mktemp('work')))
+
+
+def test_rollup_matches_in_memory(in_memory, by_school):
+    shards, output, roster = by_school
+    expected, expected_roster = in_memory
+    for key in [k for k in expected if k.startswith('by_')] + ['kpis', 'score_dist', 'attend_score',
+                                                                'hour_score', 'correlations']:
+        assert output[key] == expected[key], key
+    assert cells_by_label(output['cube']) == cells_by_label(expected['cube'])
+    assert rows(roster) == rows(expected_roster)
+
+
+def test_shards_split_the_rows_by_value(in_memory, by_school):
+    shards, output, _ = by_school
+    assert [name for name, _, _ in shards] == sorted(in_memory[0]['by_school'])
+    for name, shard, roster in shards:
+        assert set(columns(roster)['School_Type']) == {name}
+        assert shard['kpis']['total'] == in_memory[0]['by_school'][name]['count']
+
+
+def test_byte_ranges_number_rows_uniquely(tmp_path, monkeypatch):
+    monkeypatch.setattr(pp, 'PARTITION_RANGE_BYTES', 4096)
+    header, ranges = pp.csv_ranges(STUDENTS_CSV, 10)
+    numbers = []
+    for start, end in ranges:
+        for state in pp._partition_task(STUDENTS_CSV, header, 'School_Type', start, end, 64, str(tmp_path)).values():
+            numbers += [i for heap in state.scatter.sample.values() for _, i, _ in heap]
+    assert len(numbers) == len(set(numbers)) == len(pp.clean(pp.load_csv(STUDENTS_CSV)))
+
+
+def test_ranges_do_not_change_the_rollup(by_school, tmp_path, monkeypatch):
+    monkeypatch.setattr(pp, 'PARTITION_RANGE_BYTES', 4096)
+    _, output, roster = pp.run_partitioned(STUDENTS_CSV, 'School_Type', 64, 0, {}, 1, str(tmp_path))
+    for key in itertools.chain(['kpis', 'cube', 'clusters'], (k for k in output if k.startswith('by_'))):
+        assert output[key] == by_school[1][key], key
+    assert rows(roster) == rows(by_school[2])
@@ -0,0 +1,40 @@
+from conftest import STUDENTS_CSV, assert_quantiles_close, columns, pp
+
+
+def test_workers_do_not_change_output():
+    serial = pp.run_in_memory(STUDENTS_CSV, 40, {}, 1)
+    pooled = pp.run_in_memory(STUDENTS_CSV, 40, {}, 4)
+    assert pooled[0] == serial[0]
+    assert columns(pooled[1]) == columns(serial[1])
+
+
+def test_pipeline_restarts_match_kmeans():
+    data = pp.clean(pp.load_csv(STUDENTS_CSV))
+    pp.normalize(data, pp.CLUSTER_FEATURES)
+    ctx = {'data': data, 'handle': data, 'workers': 1, 'stages': {}}
+    runs = [task(*args) for task, args in pp._plan_kmeans(ctx)]
+    labels, centers = pp._merge_kmeans(ctx, runs)
+    assert (list(labels), centers) == pp.kmeans(data, k=5, iters=40, n_init=pp.KMEANS_RESTARTS)
+
+
+def test_aggregate_blocks_merge_to_the_one_block_result(in_memory, monkeypatch):
+    monkeypatch.setattr(pp, 'AGGREGATE_BLOCK', 64)
+    serial = pp.run_in_memory(STUDENTS_CSV, 0, {}, 1)
+    pooled = pp.run_in_memory(STUDENTS_CSV, 0, {}, 3)
+    assert pooled[0] == serial[0]
+    # Only the sketches depend on where the blocks split
+    assert_quantiles_close(serial[0]['quantiles'], in_memory[0]['quantiles'])
+    for key in in_memory[0].keys() - {'quantiles'}:
+        assert serial[0][key] == in_memory[0][key], key
+
+
+def test_row_stages_split_across_workers(monkeypatch):
+    monkeypatch.setattr(pp, 'AGGREGATE_BLOCK', 100)
+    ctx = {'data': pp.clean(pp.load_csv(STUDENTS_CSV)), 'handle': None, 'workers': 4, 'stages': {}}
+    n = len(ctx['data'])
+    for plan, expected in [(pp._plan_rules, -(-n // 4)), (pp.PIPELINE['aggregates'].plan, 100),
+                           (pp.PIPELINE['cube'].plan, 100)]:
+        ranges = [args[1:] for _, args in plan(ctx)]
+        assert ranges[0] == (0, expected) and ranges[-1][1] == n
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    assert len(pp._plan_kmeans(ctx)) == pp.KMEANS_RESTARTS
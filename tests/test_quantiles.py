@@ -0,0 +1,33 @@
+import random
+
+from conftest import pp
+
+PROBS = [i / 20 for i in range(21)]
+
+
+def merged(values, parts):
+    sketch = pp.QuantileSketch()
+    for i in range(parts):
+        part = pp.QuantileSketch()
+        part.extend(values[i::parts])
+        sketch.merge(pp.QuantileSketch.from_state(part.to_state()))
+    return sketch
+
+
+def test_merged_sketch_rank_error_is_bounded():
+    # Values 0..n-1 in random order, so a value is its own rank
+    n = 20_000
+    values = list(map(float, range(n)))
+    random.Random(7).shuffle(values)
+    sketch = merged(values, 10)
+    assert sketch.n == n
+    assert sum(map(len, sketch.levels)) < sketch.max_size
+    out = sketch.quantiles(PROBS)
+    assert (out[0], out[-1]) == (0.0, n - 1.0)
+    assert max(abs(v - q * n) for q, v in zip(PROBS, out)) <= 2 * n / pp.SKETCH_K
+
+
+def test_small_inputs_are_exact():
+    values = [3.0, 1.0, 2.0, 5.0, 4.0]
+    assert merged(values, 2).quantiles([0, 0.5, 1]) == [1.0, 3.0, 5.0]
+    assert pp.QuantileSketch().quantiles([0.5]) == [0.0]
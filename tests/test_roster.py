@@ -0,0 +1,66 @@
+import itertools
+import json
+
+import pytest
+
+from conftest import fetch, pp
+
+QUERY_FILTERS = [{}, {'risk': 'High'}, {'school': 'Private', 'gender': 'Female'},
+                 {'motiv': 'Low', 'internet': 'Yes'}, {'persona': '3'}, {'school': 'Nowhere'}]
+
+
+def sorted_rows(index, filters, sort, desc):
+    # Reference: filter every row, then Python's stable sort
+    rows = [index.row(pos) for pos in range(index.count)]
+    rows = [r for r in rows if all(str(r[f]) == v for f, v in filters.items())]
+    key = pp.ROSTER_SORTS[sort] or (lambda v: v)
+    return sorted(rows, key=lambda r: key(r[sort]), reverse=desc)
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_query_matches_stable_sort(in_memory, compact):
+    index = pp.compact_roster(in_memory[1])
+    if compact:
+        index = pp.RosterIndex.from_compact(json.loads(json.dumps(index.to_compact())))
+    for filters, sort, desc in itertools.product(QUERY_FILTERS, pp.ROSTER_SORTS, (False, True)):
+        expected = sorted_rows(index, filters, sort, desc)
+        for page in (1, 3):
+            result = index.query(filters, sort, desc, page, 40)
+            assert result['total'] == len(expected)
+            assert result['rows'] == expected[(page - 1) * 40:page * 40], (filters, sort, desc, page)
+
+
+def test_views_are_bounded(in_memory):
+    index = pp.compact_roster(in_memory[1])
+    for sort, desc, persona in itertools.product(pp.ROSTER_SORTS, (False, True), range(5)):
+        index.query({'persona': str(persona)}, sort, desc, 2, 10)
+    assert len(index._views) == pp.ROSTER_VIEWS
+
+
+@pytest.mark.parametrize('page, size', [(0, 50), (-5, 50), (1, 0)])
+def test_query_rejects_pages_below_one(in_memory, page, size):
+    with pytest.raises(ValueError):
+        pp.compact_roster(in_memory[1]).query(page=page, size=size)
+
+
+def test_api_serves_roster_pages(api):
+    status, body = fetch(api + '/api/roster?risk=High&sort=score&order=asc&page=2&size=5')
+    page = json.loads(body)
+    assert status == 200
+    assert (page['page'], page['size'], len(page['rows'])) == (2, 5, 5)
+    assert all(r['risk'] == 'High' for r in page['rows'])
+    assert [r['score'] for r in page['rows']] == sorted(r['score'] for r in page['rows'])
+
+
+@pytest.mark.parametrize('query', ['page=-5', 'page=0', 'page=x', 'size=-1', 'sort=nope'])
+def test_api_rejects_bad_queries(api, query):
+    status, body = fetch(api + '/api/roster?' + query)
+    assert status == 400 and 'error' in json.loads(body)
+
+
+def test_only_dashboard_files_are_served(api):
+    assert fetch(api + '/data.js')[0] == 200
+    for path in ['/Student_data.csv', '/../preprocess.py', '/%2e%2e/preprocess.py', '/tests/conftest.py']:
+        assert fetch(api + path)[0] == 404, path
+    assert pp.servable('/') and pp.servable('/roster.js') and pp.servable('/shards/Public.data.js')
+    assert not pp.servable('/data.state.json') and not pp.servable('/shards/x.csv')
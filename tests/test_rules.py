@@ -0,0 +1,111 @@
+import itertools
+import json
+import os
+
+import pytest
+
+from conftest import ROOT, STUDENTS_CSV, pp
+
+
+# The original row-wise rules, as they were before PointRules/DecisionTable
+def reference_risk(row):
+    score = 0
+    if row['Attendance'] < 70.0:
+        score += 2
+    elif row['Attendance'] < 80.0:
+        score += 1
+    if row['Motivation_Level'] == 'Low':
+        score += 2
+    elif row['Motivation_Level'] == 'Medium':
+        score += 1
+    if row['Exam_Score'] < 62.0:
+        score += 2
+    elif row['Exam_Score'] < 67.0:
+        score += 1
+    if row['Internet_Access'] == 'No':
+        score += 1
+    if row['Learning_Disabilities'] == 'Yes':
+        score += 1
+    if row['Hours_Studied'] < 10.0:
+        score += 1
+    if row['Peer_Influence'] == 'Negative':
+        score += 1
+    return score, 'High' if score >= 5 else ('Medium' if score >= 3 else 'Low')
+
+
+def reference_persona(row):
+    score, attend, prev = row['Exam_Score'], row['Attendance'], row['Previous_Scores']
+    if score < 63:
+        return 4 if prev >= 78 else 3
+    if score < 70:
+        if attend >= 85:
+            return 1
+        if prev >= 80 and score < prev - 8:
+            return 4
+        if attend >= 75:
+            return 2
+        return 3 if attend < 72 else 2
+    if score < 75:
+        if attend >= 82:
+            return 0
+        if attend >= 72:
+            return 1
+        return 4 if prev >= 78 else 3
+    return 0
+
+
+def boundary_rows():
+    # A fixture row with the rule columns set to every combination of values
+    # on, just below and just above the rule bounds
+    rows = pp.load_csv(STUDENTS_CSV)
+    header, template = next(rows), next(rows)
+    scores = [55, 61.5, 62, 62.5, 63, 66, 67, 69.5, 70, 74, 75, 101, 'nan']
+    attends = [60, 69, 70, 71.5, 72, 74, 75, 79, 80, 82, 84.5, 85, 100]
+    prevs = [50, 70, 77.5, 78, 79, 80, 85, 100]
+    levels = itertools.cycle(itertools.product(['Low', 'Medium', 'High'], ['Yes', 'No'], ['No', 'Yes'],
+                                               ['Negative', 'Neutral', 'Positive']))
+    columns = ['Exam_Score', 'Attendance', 'Previous_Scores', 'Hours_Studied', 'Motivation_Level',
+               'Internet_Access', 'Learning_Disabilities', 'Peer_Influence']
+    yield header
+    for numbers, hours, cats in zip(itertools.product(scores, attends, prevs),
+                                    itertools.cycle([9, 9.5, 10, 20]), levels):
+        row = list(template)
+        for c, v in zip(columns, [*numbers, hours, *cats]):
+            row[header.index(c)] = str(v)
+        yield row
+
+
+def table_rows(table):
+    for i in range(len(table)):
+        yield {c: table.levels[c][table[c][i]] if c in table.levels else table[c][i] for c in table.columns}
+
+
+@pytest.mark.parametrize('source', ['students', 'boundaries'])
+def test_rule_tables_match_row_rules(source):
+    table = pp.clean(pp.load_csv(STUDENTS_CSV) if source == 'students' else boundary_rows())
+    scores, labels = pp.compute_risk(table)
+    personas = pp.assign_persona_by_score(table)
+    expected = [(*reference_risk(r), reference_persona(r)) for r in table_rows(table)]
+    assert [(s, pp.RISK_LEVELS[l], p) for s, l, p in zip(scores, labels, personas)] == expected
+
+
+def test_dashboard_default_rules_match_rules_spec():
+    with open(os.path.join(ROOT, 'app.js'), encoding='utf-8') as f:
+        text = f.read()
+    start = text.index('const DEFAULT_RULES = ') + len('const DEFAULT_RULES = ')
+    table = json.loads(text[start:text.index('};', start) + 1])
+    assert table == json.loads(json.dumps(pp.rules_spec()))
+
+
+@pytest.mark.parametrize('points, error', [
+    ({'Attendance': -1}, 'non-negative'),
+    ({'Attendance': 1.5}, 'non-negative'),
+    ({'Attendance': 120}, 'lane'),
+])
+def test_point_rules_reject_points_outside_a_lane(points, error):
+    (column, value), = points.items()
+    spec = {'points': [{'column': column, 'below': [[70.0, value]]},
+                       {'column': 'Hours_Studied', 'below': [[10.0, 10]]}],
+            'labels': [5, 3, 0]}
+    with pytest.raises(ValueError, match=error):
+        pp.PointRules(spec)
@@ -0,0 +1,43 @@
+from conftest import pp, students
+
+
+def scored():
+    data = students()
+    pp.score_rows(data)
+    return data
+
+
+def grid_of(data, step=None):
+    grid = pp.ScatterGrid()
+    for start in range(0, len(data), step or len(data)):
+        part = pp.ScatterGrid()
+        part.update(data.slice(start, start + (step or len(data))), start)
+        grid.merge(part)
+    return grid
+
+
+def test_any_split_merges_to_the_same_grid():
+    data = scored()
+    whole, merged = grid_of(data), grid_of(data, 37)
+    assert merged.cells == whole.cells
+    assert {k: sorted(h) for k, h in merged.sample.items()} == {k: sorted(h) for k, h in whole.sample.items()}
+    assert merged.points(data.levels) == whole.points(data.levels)
+
+
+def test_tiers_count_every_row():
+    data = scored()
+    tiers = grid_of(data).tiers()
+    assert [t['size'] for t in tiers] == pp.SCATTER_TIERS
+    for tier in tiers:
+        assert sum(pp.unpack_array(tier['cells']['count'])) == len(data)
+
+
+def test_sample_is_capped_but_keeps_every_high_risk_combination():
+    data = scored()
+    points = grid_of(data).points(data.levels)
+    high = {key for key in zip(*[data[c] for c in pp.CUBE_DIMS.values()]) if pp.RISK_LEVELS[key[-1]] == 'High'}
+    budget = min(pp.SCATTER_POINTS, len(data) // pp.SCATTER_ROWS_PER_POINT)
+    assert len(points) <= budget + len(high)
+    shown = {(p['school'], p['gender'], p['motiv'], p['persona']) for p in points if p['risk'] == 'High'}
+    assert shown == {(data.levels['School_Type'][s], data.levels['Gender'][g],
+                      data.levels['Motivation_Level'][m], p) for s, g, m, p, _ in high}
@@ -0,0 +1,67 @@
+import csv
+import json
+
+import pytest
+
+from conftest import STUDENTS_CSV, fetch, pp
+
+# Fixture rows 7-57 hold the dirty values, which clean() would drop
+FIRST_CLEAN_LINE = 60
+
+
+def upload(tmp_path):
+    with open(STUDENTS_CSV, encoding='utf-8') as f:
+        lines = f.readlines()
+    path = tmp_path / 'upload.csv'
+    path.write_text(''.join(lines[:1] + lines[FIRST_CLEAN_LINE:]), encoding='utf-8')
+    return path
+
+
+def expected(path):
+    # The pipeline's persona and risk columns for the same rows
+    data = pp.clean(pp.load_csv(str(path)))
+    pp.score_rows(data)
+    return data
+
+
+def test_score_cli_writes_the_pipeline_labels(tmp_path, capsys):
+    src, dst = upload(tmp_path), tmp_path / 'scored.csv'
+    pp.main(['score', str(src), str(dst)])
+    assert f"Scored {len(expected(src))} students" in capsys.readouterr().out
+
+    data = expected(src)
+    with open(dst, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == pp.SCORE_HEADER
+    assert rows[1:] == [[str(i), pp.PERSONA_PROFILES[p]['name'], str(s), pp.SCORE_RISK_TEXT[r]]
+                        for i, (p, s, r) in enumerate(zip(data['persona'], data['risk_score'],
+                                                          data['risk_label']), 1)]
+
+
+def test_score_cli_names_a_missing_column(tmp_path):
+    src = tmp_path / 'bad.csv'
+    src.write_text('Attendance,Exam_Score\n90,70\n', encoding='utf-8')
+    with pytest.raises(SystemExit, match='missing required column: Hours_Studied'):
+        pp.main(['score', str(src), str(tmp_path / 'out.csv')])
+
+
+def test_api_scores_an_upload(api, tmp_path):
+    src = upload(tmp_path)
+    status, body = fetch(api + '/api/score', src.read_bytes())
+    result, data = json.loads(body), expected(src)
+    assert status == 200
+    assert result['count'] == len(data)
+    assert result['persona'] == list(data['persona'])
+    assert result['risk_score'] == list(data['risk_score'])
+    assert [result['risk_levels'][r] for r in result['risk']] == \
+        [pp.RISK_LEVELS[r] for r in data['risk_label']]
+
+
+def test_api_rejects_an_upload_without_the_rule_columns(api):
+    status, body = fetch(api + '/api/score', b'Attendance,Exam_Score\n90,70\n')
+    assert status == 400
+    assert 'Hours_Studied' in json.loads(body)['error']
+
+
+def test_api_answers_404_to_other_posts(api):
+    assert fetch(api + '/api/roster', b'x')[0] == 404
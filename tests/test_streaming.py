@@ -0,0 +1,25 @@
+import pytest
+
+from conftest import STUDENTS_CSV, assert_matches_in_memory, pp
+
+
+@pytest.mark.parametrize('chunk_size', [64, 1000])
+def test_streaming_matches_in_memory(in_memory, chunk_size):
+    assert_matches_in_memory(pp.run_streaming(STUDENTS_CSV, chunk_size, 0, {}), in_memory)
+
+
+def test_roster_columns_are_spilled_to_the_work_dir(tmp_path):
+    pp.run_streaming(STUDENTS_CSV, 64, 0, {}, 1, str(tmp_path))
+    whole = pp.clean(pp.load_csv(STUDENTS_CSV))
+    pp.score_rows(whole)
+    for name in pp.ROSTER_COLUMNS:
+        size = (tmp_path / 'roster' / (name + '.col')).stat().st_size
+        assert size == len(whole) * whole[name].itemsize, name
+
+
+def test_chunks_concatenate_to_the_whole_table():
+    chunks = list(pp.clean_chunks(pp.load_csv(STUDENTS_CSV), 50))
+    assert all(len(c) <= 50 for c in chunks)
+    whole = pp.clean(pp.load_csv(STUDENTS_CSV))
+    for name in pp.NUMERIC_COLUMNS:
+        assert [x for c in chunks for x in c[name]] == list(whole[name])
@@ -0,0 +1,28 @@
+import itertools
+import random
+
+from conftest import pp
+
+FILTERS = [{}, {'risk': 'High'}, {'school': 'Private', 'motiv': 'Low'}, {'school': 'Nowhere'}]
+
+
+def test_top_k_matches_a_stable_sort():
+    rng = random.Random(5)
+    values = [rng.randint(0, 9) for _ in range(300)]
+    for k, desc in itertools.product([1, 10, 299, 300, 400], (False, True)):
+        expected = sorted(range(300), key=values.__getitem__, reverse=desc)[:k]
+        assert pp.top_k(values.__getitem__, range(300), k, desc) == expected
+
+
+def test_index_top_matches_the_first_page(in_memory):
+    index = pp.compact_roster(in_memory[1])
+    for filters, sort, desc in itertools.product(FILTERS, pp.ROSTER_SORTS, (False, True)):
+        first = index.query(filters, sort, desc, 1, 25)['rows']
+        assert index.top(filters, sort, desc, 25) == [r['id'] - 1 for r in first], (filters, sort, desc)
+
+
+def test_data_js_carries_the_first_rows_of_the_default_view(in_memory, outputs):
+    pp.write_compact(*in_memory, k=30)
+    top = pp.read_js(pp.OUT_PATH)['roster']['top']
+    page = pp.compact_roster(in_memory[1]).query(top['filters'], top['sort'], top['desc'], 1, 30)
+    assert top['rows'] == page['rows'] and top['total'] == page['total']